@@ -57,6 +57,10 @@ class RigifyArmatureLayer(bpy.types.PropertyGroup):
     row = bpy.props.IntProperty(name="Layer Row", default=1, min=1, max=32)
 
 
+def update_dev_reload(self, context):
+    utils.set_dev_reload(self.rigify_dev_reload)
+
+
 ##### REGISTER #####
 
 def register():
@@ -76,9 +80,17 @@ def register():
     IDStore.rigify_collection = bpy.props.EnumProperty(items=rig_lists.col_enum_list, default="All", name="Rigify Active Collection", description="The selected rig collection")
     IDStore.rigify_types = bpy.props.CollectionProperty(type=RigifyName)
     IDStore.rigify_active_type = bpy.props.IntProperty(name="Rigify Active Type", description="The selected rig type")
+    IDStore.rigify_dev_reload = bpy.props.BoolProperty(name="Reload Changed Rig Types", default=False, description="Reload rig type and metarig modules when their files change, for developing them", update=update_dev_reload)
 
-    # Add rig parameters
+    # Add rig parameters, from the manifest when possible, so that the rig
+    # types don't need to be imported.
     for rig in rig_lists.rig_list:
+        utils.set_rig_parameter_names(rig, rig_lists.manifest["rigs"][rig]["parameter_names"])
+        parameters = rig_lists.get_rig_parameters(rig)
+        if parameters is not None:
+            for name, prop in parameters:
+                setattr(RigifyParameters, name, prop)
+            continue
         r = utils.get_rig_type(rig)
         try:
             r.add_parameters(RigifyParameters)
@@ -94,6 +106,7 @@ def unregister():
     del IDStore.rigify_collection
     del IDStore.rigify_types
     del IDStore.rigify_active_type
+    del IDStore.rigify_dev_reload
 
     bpy.utils.unregister_class(RigifyName)
     bpy.utils.unregister_class(RigifyParameters)
@@ -0,0 +1,272 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Regenerates the rigs of many .blend files from the command line.
+
+    blender -b --python rigify/batch.py -- [options] FILE_OR_DIR [...]
+
+    Every .blend file given (directories are searched recursively) is opened
+    in its own background Blender process, with up to --jobs of them running
+    at once.  Each metarig in the file's active scene is generated, and if
+    all of them were generated without errors, the file is saved.  Otherwise
+    the file is reported as failed and left untouched.  A summary of the time
+    taken and the errors hit for each file is printed at the end, and the exit
+    code is non-zero if any file failed.
+
+    Options:
+        -j, --jobs N      Number of Blender processes to run at once.
+        --full-rebuild    Rebuild every rig from scratch.
+        --output DIR      Save the files to DIR instead of overwriting them.
+        --profile DIR     Write a generation profile of every rig to DIR.
+        --blender PATH    Blender executable to run the files with.
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+import traceback
+import subprocess
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parse_args(argv):
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    else:
+        argv = []
+
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python batch.py --",
+        description="Regenerate the Rigify rigs of many .blend files.",
+        )
+    parser.add_argument("paths", nargs="*", metavar="FILE_OR_DIR")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--full-rebuild", action="store_true")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--profile", default="")
+    parser.add_argument("--blender", default="")
+    # Used internally, to run a single file in a worker process.
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result", default="", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def find_blend_files(paths):
+    """ Returns the .blend files in the given list of files and directories.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    if name.endswith(".blend"):
+                        files += [os.path.join(root, name)]
+        else:
+            files += [path]
+    return [os.path.abspath(f) for f in files]
+
+
+#=============================================
+# Worker process, running inside Blender
+#=============================================
+
+def load_rigify():
+    """ Imports and registers the Rigify package this script is part of.
+    """
+    import bpy
+    directory = os.path.dirname(os.path.abspath(__file__))
+    name = os.path.basename(directory)
+    if os.path.dirname(directory) not in sys.path:
+        sys.path.insert(0, os.path.dirname(directory))
+    rigify = importlib.import_module(name)
+    if not hasattr(bpy.types.PoseBone, "rigify_type"):
+        rigify.register()
+    return importlib.import_module(name + ".generate")
+
+
+def is_metarig(obj):
+    """ Returns True if the object is a metarig, that is, an armature with
+        rig types assigned to its bones which isn't itself a generated rig.
+    """
+    if obj.type != 'ARMATURE' or "rig_id" in obj.data:
+        return False
+    for pb in obj.pose.bones:
+        if pb.rigify_type != "":
+            return True
+    return False
+
+
+def run_worker(args):
+    """ Generates the metarigs of the .blend file Blender was started with,
+        and saves it if they all generated.  The results are written as JSON to args.result.
+    """
+    import bpy
+    context = bpy.context
+    filepath = bpy.data.filepath
+    result = {"file": filepath, "metarigs": [], "error": ""}
+
+    try:
+        generate = load_rigify()
+        metarigs = [obj for obj in context.scene.objects if is_metarig(obj)]
+        for metarig in metarigs:
+            name = metarig.name
+            profile_path = ""
+            if args.profile:
+                base = os.path.splitext(os.path.basename(filepath))[0]
+                profile_path = os.path.join(args.profile, base + "-" + bpy.path.clean_name(name))
+
+            start = time.time()
+            error = ""
+            try:
+                if context.object and context.object.mode != 'OBJECT':
+                    bpy.ops.object.mode_set(mode='OBJECT')
+                for obj in context.selected_objects:
+                    obj.select = False
+                metarig.select = True
+                context.scene.objects.active = metarig
+                generate.generate_rig(context, metarig, args.full_rebuild, profile_path)
+            except Exception as e:
+                error = str(e) or e.__class__.__name__
+                traceback.print_exc()
+            result["metarigs"] += [{"name": name, "time": time.time() - start, "error": error}]
+
+        # A half-generated rig must not overwrite the file, so it is only
+        # saved when every metarig generated cleanly.
+        if is_failed(result):
+            print("Not saving %s, as not every metarig was generated" % filepath)
+        else:
+            if args.output:
+                filepath = os.path.join(args.output, os.path.basename(filepath))
+            bpy.ops.wm.save_as_mainfile(filepath=filepath, check_existing=False)
+    except Exception as e:
+        result["error"] = str(e) or e.__class__.__name__
+        traceback.print_exc()
+
+    with open(args.result, 'w') as f:
+        json.dump(result, f)
+
+
+#=============================================
+# Batch process, running the workers
+#=============================================
+
+def find_blender(args):
+    if args.blender:
+        return args.blender
+    try:
+        import bpy
+    except ImportError:
+        raise SystemExit("batch.py: run this from Blender, or pass --blender")
+    return bpy.app.binary_path
+
+
+def run_file(blender, filepath, args):
+    """ Runs a worker process on one .blend file, and returns its result.
+    """
+    handle, result_path = tempfile.mkstemp(suffix=".json", prefix="rigify-batch-")
+    os.close(handle)
+
+    command = [
+        blender, "-b", "--factory-startup", "-noaudio", filepath,
+        "--python", os.path.abspath(__file__),
+        "--", "--worker", "--result", result_path,
+        ]
+    if args.full_rebuild:
+        command += ["--full-rebuild"]
+    if args.output:
+        command += ["--output", args.output]
+    if args.profile:
+        command += ["--profile", args.profile]
+
+    start = time.time()
+    process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    elapsed = time.time() - start
+
+    try:
+        with open(result_path) as f:
+            result = json.load(f)
+    except (IOError, ValueError):
+        result = {"file": filepath, "metarigs": [], "error": "Blender exited with code %d" % process.returncode}
+    finally:
+        os.remove(result_path)
+
+    result["file"] = filepath
+    result["time"] = elapsed
+    result["log"] = process.stdout
+    print("%s %s (%.2fs)" % ("Failed" if is_failed(result) else "Generated", filepath, elapsed))
+    return result
+
+
+def is_failed(result):
+    return result["error"] != "" or any(m["error"] != "" for m in result["metarigs"])
+
+
+def print_summary(results, elapsed):
+    print("\nRigify batch generation")
+    print("-" * 60)
+    for result in results:
+        status = "FAILED" if is_failed(result) else "ok"
+        print("%-6s %8.2fs  %s" % (status, result["time"], result["file"]))
+        for m in result["metarigs"]:
+            print("       %8.2fs    %s%s" % (m["time"], m["name"], "  ERROR: " + m["error"] if m["error"] else ""))
+        if result["error"]:
+            print("                  ERROR: " + result["error"])
+            # The end of the log usually shows what went wrong.
+            for line in result["log"].splitlines()[-10:]:
+                print("                  | " + line)
+    failed = len([r for r in results if is_failed(r)])
+    print("-" * 60)
+    print("%d files, %d failed, %.2fs" % (len(results), failed, elapsed))
+    return failed
+
+
+def run_batch(args):
+    blender = find_blender(args)
+    files = find_blend_files(args.paths)
+    if not files:
+        raise SystemExit("batch.py: no .blend files given")
+    for directory in (args.output, args.profile):
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+    args.output = os.path.abspath(args.output) if args.output else ""
+    args.profile = os.path.abspath(args.profile) if args.profile else ""
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(lambda f: run_file(blender, f, args), files))
+    failed = print_summary(results, time.time() - start)
+    return 1 if failed else 0
+
+
+def main():
+    args = parse_args(sys.argv)
+    if args.worker:
+        run_worker(args)
+    else:
+        sys.exit(run_batch(args))
+
+
+if __name__ == "__main__":
+    main()
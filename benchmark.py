@@ -0,0 +1,539 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Benchmarks rig generation, to tell whether a change made it faster or
+    slower.
+
+    blender -b --factory-startup --python rigify/benchmark.py -- [options]
+    python rigify/benchmark.py --compare BASELINE RESULTS [--threshold T]
+
+    Every metarig in metarigs/ and the sample metarig of every rig type that
+    has one is built in an empty scene, and generated once to warm up, then
+    --repeat more times with a full rebuild.  For each of them the wall time
+    of the timed generations, the mode switches, bones, constraints and
+    drivers of the warm-up generation, and the peak Python memory use of one
+    more generation are written as JSON to --output.
+
+    With --scaling, synthetic metarigs of --sizes bones are generated
+    instead, to see how generation scales to production sized armatures:
+    one long chain of each of the chain rig types, many basic.copy bones,
+    and many super_limb arms.  How the time and memory of each rig type grow
+    with the bone count is printed, and plotted to an SVG file next to the
+    results.  --plot redraws the plot of saved results, without Blender.
+
+    With --compare (which doesn't need Blender), or with --baseline after a
+    run, the results are compared to a saved baseline.  A case is flagged if
+    its median time or peak memory grew by more than --threshold (a fraction,
+    0.1 by default), if it switches modes more often, or if it started
+    failing.  The exit code is non-zero if anything was flagged.
+
+    Options:
+        -k, --repeat N    Number of timed generations of each case.
+        --filter TEXT     Only run the cases whose name contains TEXT.
+        --output FILE     Where to write the results.
+        --baseline FILE   Results to compare the new results to.
+        --compare A B     Compare saved results B to baseline A, and exit.
+        --threshold T     Allowed relative growth of time and memory.
+        --scaling         Run the synthetic scaling cases.
+        --sizes N,N,...   Bone counts of the synthetic metarigs.
+        --plot RESULTS    Plot saved scaling results, and exit.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import traceback
+import contextlib
+from io import StringIO
+from math import log
+from statistics import median
+
+RESULTS_VERSION = 1
+
+# Rig types of the synthetic metarigs of --scaling
+SCALING_TYPES = (
+    "pitchipoy.tentacle",
+    "pitchipoy.simple_tentacle",
+    "basic.copy_chain",
+    "spine",
+    "basic.copy",
+    "pitchipoy.limbs.super_limb",
+    )
+
+
+def parse_args(argv):
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    elif "bpy" not in sys.modules:
+        argv = argv[1:]
+    else:
+        argv = []
+
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python benchmark.py --",
+        description="Benchmark the generation of the Rigify metarigs.",
+        )
+    parser.add_argument("-k", "--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--output", default="rigify_benchmark.json")
+    parser.add_argument("--baseline", default="")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "RESULTS"))
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--scaling", action="store_true")
+    parser.add_argument("--sizes", default="10,50,200,500,1000,2000")
+    parser.add_argument("--plot", metavar="RESULTS", default="")
+    return parser.parse_args(argv)
+
+
+#=============================================
+# Running the benchmarks, inside Blender
+#=============================================
+
+def load_rigify():
+    """ Imports and registers the Rigify package this script is part of.
+    """
+    import bpy
+    directory = os.path.dirname(os.path.abspath(__file__))
+    name = os.path.basename(directory)
+    if os.path.dirname(directory) not in sys.path:
+        sys.path.insert(0, os.path.dirname(directory))
+    rigify = importlib.import_module(name)
+    if not hasattr(bpy.types.PoseBone, "rigify_type"):
+        rigify.register()
+    return rigify
+
+
+def get_cases(rigify):
+    """ Returns the benchmark cases, as (name, function) pairs.  The
+        function adds the bones of the case's metarig to an armature.
+    """
+    utils = rigify.utils
+    cases = []
+    for name in rigify.metarig_menu.metarigs:
+        cases += [("metarig:" + name, lambda obj, name=name: utils.create_metarig(obj, name))]
+    for name in rigify.rig_lists.rig_list:
+        if rigify.rig_lists.manifest["rigs"][name]["create_sample"]:
+            cases += [("sample:" + name, lambda obj, name=name: utils.get_rig_type(name).create_sample(obj))]
+    return cases
+
+
+def create_synthetic_metarig(obj, rig_type, size):
+    """ Adds a synthetic metarig of about size bones to an armature.  The
+        chain rig types get one chain of size bones on a base bone,
+        basic.copy gets size separate bones, and super_limb gets an arm for
+        every three bones.
+    """
+    import bpy
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = obj.data.edit_bones
+    rig_bones = []
+
+    if rig_type == "basic.copy":
+        for i in range(size):
+            bone = edit_bones.new("prop.%04d" % i)
+            bone.head = ((i % 50) * 0.2, (i // 50) * 0.2, 0.0)
+            bone.tail = ((i % 50) * 0.2, (i // 50) * 0.2, 0.1)
+            rig_bones += [bone.name]
+    elif rig_type == "pitchipoy.limbs.super_limb":
+        # Slightly bent, so the IK chains know which way to bend
+        joints = ((0.0, 0.0, 0.0), (0.0, 0.02, -0.3), (0.0, 0.0, -0.6), (0.0, 0.0, -0.7))
+        for i in range(max(1, size // 3)):
+            x, y = (i % 20) * 0.5, (i // 20) * 0.5
+            parent = None
+            for j, part in enumerate(("upper_arm", "forearm", "hand")):
+                bone = edit_bones.new("%s.%04d.L" % (part, i))
+                bone.head = (x + joints[j][0], y + joints[j][1], joints[j][2])
+                bone.tail = (x + joints[j + 1][0], y + joints[j + 1][1], joints[j + 1][2])
+                if parent is not None:
+                    bone.parent = parent
+                    bone.use_connect = True
+                else:
+                    rig_bones += [bone.name]
+                parent = bone
+    else:
+        # The tentacle rigs need the chain to have a parent
+        parent = edit_bones.new("base")
+        parent.head = (0.0, 0.0, -0.1)
+        parent.tail = (0.0, 0.0, 0.0)
+        for i in range(size):
+            bone = edit_bones.new("chain.%04d" % i)
+            bone.head = (0.0, 0.0, i * 0.1)
+            bone.tail = (0.0, 0.0, (i + 1) * 0.1)
+            bone.parent = parent
+            bone.use_connect = i > 0
+            parent = bone
+        rig_bones += ["chain.0000"]
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    for name in rig_bones:
+        obj.pose.bones[name].rigify_type = rig_type
+
+
+def get_scaling_cases(sizes):
+    """ Returns the synthetic benchmark cases of --scaling, named
+        "synthetic:<rig type>:<size>", as (name, function) pairs.
+    """
+    cases = []
+    for rig_type in SCALING_TYPES:
+        for size in sizes:
+            create = lambda obj, rig_type=rig_type, size=size: create_synthetic_metarig(obj, rig_type, size)
+            cases += [("synthetic:%s:%d" % (rig_type, size), create)]
+    return cases
+
+
+def clear_scene(context):
+    """ Removes all the objects from the scene, along with their data, so
+        that every case starts from the same state.
+    """
+    import bpy
+    if context.object and context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for obj in list(context.scene.objects):
+        context.scene.objects.unlink(obj)
+    for collection in (bpy.data.objects, bpy.data.armatures, bpy.data.meshes):
+        for block in list(collection):
+            if block.users == 0:
+                collection.remove(block)
+
+
+def create_metarig(context, create):
+    """ Adds an armature to the scene, and fills it with a metarig.
+    """
+    import bpy
+    bpy.ops.object.armature_add()
+    obj = context.active_object
+    obj.name = "metarig"
+    bpy.ops.object.mode_set(mode='EDIT')
+    bones = obj.data.edit_bones
+    bones.remove(bones[0])
+    create(obj)
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return obj
+
+
+def generate(context, rigify, metarig, full_rebuild):
+    """ Generates the rig of the metarig, with its output hidden.
+    """
+    if context.object and context.object.mode != 'OBJECT':
+        import bpy
+        bpy.ops.object.mode_set(mode='OBJECT')
+    context.scene.objects.active = metarig
+    metarig.select = True
+    with contextlib.redirect_stdout(StringIO()):
+        rigify.generate.generate_rig(context, metarig, full_rebuild)
+
+
+def run_case(context, rigify, create, repeat):
+    """ Benchmarks the generation of one metarig, and returns the results.
+    """
+    import tracemalloc
+    profiler = rigify.profiler
+    result = {"error": ""}
+    try:
+        clear_scene(context)
+        start = time.perf_counter()
+        metarig = create_metarig(context, create)
+        result["create_time"] = time.perf_counter() - start
+        result["metarig_bones"] = len(metarig.data.bones)
+
+        # The first generation creates the rig object, and loads the rig
+        # types, so it is only used for counting.
+        prof = profiler.Profiler()
+        with prof:
+            generate(context, rigify, metarig, True)
+        for counter in ("mode switches", "bones", "constraints", "drivers"):
+            result[counter.replace(" ", "_")] = prof.counters.get(counter, 0)
+
+        times = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            generate(context, rigify, metarig, True)
+            times += [time.perf_counter() - start]
+        result["times"] = times
+        result["min"] = min(times)
+        result["median"] = median(times)
+
+        # Tracing memory slows everything down, so it gets a run of its own.
+        tracemalloc.start()
+        try:
+            generate(context, rigify, metarig, True)
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        result["error"] = str(e) or e.__class__.__name__
+        traceback.print_exc()
+    return result
+
+
+def get_max_rss():
+    """ Returns the peak memory use of the whole process in bytes, or None
+        where it isn't available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux gives kilobytes, macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_benchmarks(args):
+    import bpy
+    context = bpy.context
+    rigify = load_rigify()
+    results = {
+        "version": RESULTS_VERSION,
+        "blender": bpy.app.version_string,
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "cases": {},
+        }
+
+    if args.scaling:
+        cases = get_scaling_cases([int(size) for size in args.sizes.split(",")])
+    else:
+        cases = get_cases(rigify)
+
+    start = time.time()
+    for name, create in cases:
+        if args.filter not in name:
+            continue
+        result = run_case(context, rigify, create, args.repeat)
+        results["cases"][name] = result
+        if result["error"]:
+            print("%-45s FAILED: %s" % (name, result["error"]))
+        else:
+            print("%-45s %8.3fs  %5d mode switches  %8.1f MB" % (
+                name, result["median"], result["mode_switches"], result["peak_memory"] / 1048576.0))
+    results["time"] = time.time() - start
+    results["max_rss"] = get_max_rss()
+    clear_scene(context)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=1, sort_keys=True)
+    print("Rigify: wrote benchmark results to " + os.path.abspath(args.output))
+
+    if args.scaling:
+        print_scaling(results)
+        write_scaling_plot(results, os.path.splitext(args.output)[0] + ".svg")
+    return results
+
+
+#=============================================
+# Scaling results, with or without Blender
+#=============================================
+
+def get_scaling_series(results):
+    """ Returns the synthetic cases of the results by rig type, as lists
+        of (metarig bones, median time, peak memory), sorted by bone count.
+    """
+    series = {}
+    for name, result in results["cases"].items():
+        if not name.startswith("synthetic:") or result["error"]:
+            continue
+        rig_type = name.split(":")[1]
+        point = (result["metarig_bones"], result["median"], result["peak_memory"])
+        series.setdefault(rig_type, []).append(point)
+    for points in series.values():
+        points.sort()
+    return series
+
+
+def get_exponent(xs, ys):
+    """ Returns the exponent k of the power law y = a * x^k that fits the
+        points best, which is 1 for linear growth.
+    """
+    points = [(log(x), log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, y in points) / len(points)
+    my = sum(y for x, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, y in points)
+    if sxx == 0.0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+
+def print_scaling(results):
+    """ Prints how the time and memory of each rig type grow with the bone
+        count.  Growth clearly faster than linear is marked.
+    """
+    print("\nRigify generation scaling (time ~ bones^k)")
+    print("-" * 78)
+    print("%-32s %7s %10s %10s %7s %7s" % ("rig type", "bones", "time", "memory", "k time", "k mem"))
+    for rig_type, points in sorted(get_scaling_series(results).items()):
+        bones = [p[0] for p in points]
+        k_time = get_exponent(bones, [p[1] for p in points])
+        k_memory = get_exponent(bones, [p[2] for p in points])
+        marks = []
+        for i, (n, t, m) in enumerate(points):
+            print("%-32s %7d %9.3fs %8.1fMB" % (rig_type if i == 0 else "", n, t, m / 1048576.0))
+        for label, k in (("time", k_time), ("memory", k_memory)):
+            if k is not None and k > 1.25:
+                marks += ["super-linear " + label]
+        print("%-32s %7s %10s %10s %7s %7s  %s" % (
+            "", "", "", "",
+            "%.2f" % k_time if k_time is not None else "-",
+            "%.2f" % k_memory if k_memory is not None else "-",
+            ", ".join(marks)))
+    for name, result in sorted(results["cases"].items()):
+        if name.startswith("synthetic:") and result["error"]:
+            print("%-40s FAILED: %s" % (name[len("synthetic:"):], result["error"]))
+    print("-" * 78)
+
+
+PLOT_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f")
+
+
+def write_scaling_plot(results, path):
+    """ Writes log-log plots of generation time and peak memory against
+        the metarig bone count, one line per rig type, as an SVG file.
+        A dashed line of slope 1 shows linear growth for comparison.
+    """
+    series = get_scaling_series(results)
+    if not series:
+        return
+    width, height, margin = 480, 360, 60
+    svg = ['<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" font-family="sans-serif" font-size="11">' % (width * 2, height + 120)]
+
+    for panel, (title, column, unit, scale) in enumerate((("Generation time", 1, "s", 1.0),
+                                                          ("Peak memory", 2, "MB", 1.0 / 1048576.0))):
+        points = [(p[0], p[column] * scale) for ps in series.values() for p in ps if p[0] > 0 and p[column] > 0]
+        if not points:
+            continue
+        x0, x1 = log(min(p[0] for p in points), 10), log(max(p[0] for p in points), 10)
+        y0, y1 = log(min(p[1] for p in points), 10), log(max(p[1] for p in points), 10)
+        x1, y1 = max(x1, x0 + 1.0), max(y1, y0 + 1.0)
+        left = panel * width + margin
+        plot_w, plot_h = width - margin * 1.5, height - margin * 1.5
+
+        def project(x, y):
+            return (left + (log(x, 10) - x0) / (x1 - x0) * plot_w,
+                    margin * 0.5 + plot_h - (log(y, 10) - y0) / (y1 - y0) * plot_h)
+
+        svg += ['<rect x="%.1f" y="%.1f" width="%.1f" height="%.1f" fill="none" stroke="#888"/>' % (left, margin * 0.5, plot_w, plot_h)]
+        svg += ['<text x="%.1f" y="%.1f" text-anchor="middle" font-size="13">%s (%s) vs. metarig bones, log-log</text>' % (left + plot_w / 2, margin * 0.4, title, unit)]
+        for decade in range(int(x0), int(x1) + 2):
+            if x0 <= decade <= x1:
+                x, y = project(10 ** decade, 10 ** y0)
+                svg += ['<text x="%.1f" y="%.1f" text-anchor="middle">%g</text>' % (x, y + 14, 10 ** decade)]
+        for decade in range(int(y0) - 1, int(y1) + 2):
+            if y0 <= decade <= y1:
+                x, y = project(10 ** x0, 10 ** decade)
+                svg += ['<text x="%.1f" y="%.1f" text-anchor="end">%g</text>' % (x - 4, y + 4, 10 ** decade)]
+
+        # Linear reference through the smallest point
+        first = min(points)
+        a = project(*first)
+        b = project(first[0] * 10 ** (x1 - x0), first[1] * 10 ** (x1 - x0))
+        svg += ['<line x1="%.1f" y1="%.1f" x2="%.1f" y2="%.1f" stroke="#aaa" stroke-dasharray="4,4"/>' % (a + b)]
+
+        for i, (rig_type, ps) in enumerate(sorted(series.items())):
+            color = PLOT_COLORS[i % len(PLOT_COLORS)]
+            xy = [project(p[0], p[column] * scale) for p in ps if p[0] > 0 and p[column] > 0]
+            svg += ['<polyline fill="none" stroke="%s" stroke-width="2" points="%s"/>' % (color, " ".join("%.1f,%.1f" % p for p in xy))]
+            svg += ['<circle cx="%.1f" cy="%.1f" r="3" fill="%s"/>' % (x, y, color) for x, y in xy]
+
+    for i, rig_type in enumerate(sorted(series)):
+        x, y = margin + (i % 3) * 300, height + 30 + (i // 3) * 18
+        svg += ['<rect x="%d" y="%d" width="12" height="12" fill="%s"/>' % (x, y - 10, PLOT_COLORS[i % len(PLOT_COLORS)])]
+        svg += ['<text x="%d" y="%d">%s</text>' % (x + 18, y, rig_type)]
+    svg += ['</svg>']
+
+    with open(path, 'w') as f:
+        f.write("\n".join(svg) + "\n")
+    print("Rigify: wrote scaling plot to " + os.path.abspath(path))
+
+
+#=============================================
+# Comparing results, with or without Blender
+#=============================================
+
+def compare_results(baseline, results, threshold):
+    """ Prints how each case changed from the baseline, and returns the
+        number of regressions.
+    """
+    regressions = 0
+    print("\nRigify benchmark, compared to the baseline")
+    print("-" * 78)
+    print("%-40s %9s %9s %7s  %s" % ("case", "baseline", "new", "change", ""))
+    for name in sorted(set(baseline["cases"]) | set(results["cases"])):
+        old = baseline["cases"].get(name)
+        new = results["cases"].get(name)
+        flags = []
+        if new is None:
+            print("%-40s missing from the results" % name)
+            continue
+        if new["error"]:
+            if old is None or not old["error"]:
+                flags += ["now fails"]
+            print("%-40s %9s %9s %7s  %s" % (name, "", "FAILED", "", ", ".join(flags)))
+            regressions += len(flags)
+            continue
+        if old is None or old["error"]:
+            print("%-40s %9s %8.3fs %7s  new" % (name, "", new["median"], ""))
+            continue
+
+        change = new["median"] / old["median"] - 1.0 if old["median"] else 0.0
+        if change > threshold:
+            flags += ["slower"]
+        if new["mode_switches"] > old["mode_switches"]:
+            flags += ["mode switches %d -> %d" % (old["mode_switches"], new["mode_switches"])]
+        if old["peak_memory"] and new["peak_memory"] / old["peak_memory"] - 1.0 > threshold:
+            flags += ["memory %.1f -> %.1f MB" % (old["peak_memory"] / 1048576.0, new["peak_memory"] / 1048576.0)]
+        print("%-40s %8.3fs %8.3fs %+6.1f%%  %s" % (name, old["median"], new["median"], change * 100.0, ", ".join(flags)))
+        regressions += len(flags)
+    print("-" * 78)
+    print("%d regressions (threshold %.0f%%)" % (regressions, threshold * 100.0))
+    return regressions
+
+
+def load_results(path):
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise SystemExit("benchmark.py: %s is not a results file of this version" % path)
+    return results
+
+
+def main():
+    args = parse_args(sys.argv)
+    if args.plot:
+        results = load_results(args.plot)
+        print_scaling(results)
+        write_scaling_plot(results, os.path.splitext(args.plot)[0] + ".svg")
+        return
+    if args.compare:
+        baseline, results = [load_results(path) for path in args.compare]
+    else:
+        results = run_benchmarks(args)
+        if not args.baseline:
+            return
+        baseline = load_results(args.baseline)
+    sys.exit(1 if compare_results(baseline, results, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
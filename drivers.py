@@ -0,0 +1,338 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Conversion of scripted drivers to ones that don't need Python.
+
+    Scripted drivers run a Python expression every time they are evaluated,
+    which is slow, and they don't work at all when auto-running scripts is
+    disabled.  Many of the expressions rigs use are really a sum, minimum or
+    maximum of their variables, possibly scaled and offset:
+
+        "1.0 - isolate"   ->  SUM of isolate, generator coefficients (1, -1)
+        "follow / 2"      ->  SUM of follow, generator coefficients (0, 0.5)
+        "min(a, b)"       ->  MIN of a and b
+
+    optimize_driver() turns such drivers into the equivalent SUM, MIN or
+    MAX driver, using the generator modifier every driver F-curve starts
+    with for the scale and offset.  The expressions of the other drivers are
+    rewritten to the simple subset newer versions of Blender evaluate
+    without Python where they can be, and the reason they still need Python
+    is returned, so that they can be reported.
+"""
+
+import ast
+import math
+
+# Functions and constants of the simple expression subset.
+SIMPLE_FUNCTIONS = {
+    "radians", "degrees", "abs", "fabs", "floor", "ceil", "trunc", "int",
+    "sin", "cos", "tan", "asin", "acos", "atan", "atan2",
+    "exp", "log", "sqrt", "pow", "min", "max",
+    }
+SIMPLE_CONSTANTS = {"pi": math.pi, "True": 1.0, "False": 0.0}
+
+SIMPLE_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Call, ast.IfExp,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.UnaryOp, ast.UAdd, ast.USub, ast.Not,
+    ast.BoolOp, ast.And, ast.Or,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    )
+
+BINARY_OPERATORS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/"}
+UNARY_OPERATORS = {ast.UAdd: "+", ast.USub: "-", ast.Not: "not "}
+BOOLEAN_OPERATORS = {ast.And: " and ", ast.Or: " or "}
+COMPARE_OPERATORS = {ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}
+
+# Relative difference below which two coefficients are considered equal.
+EPSILON = 1e-9
+
+
+def is_constant(node):
+    # Num and NameConstant became Constant in Python 3.8
+    return type(node).__name__ in ("Num", "NameConstant", "Constant")
+
+
+def get_constant(node):
+    return node.value if hasattr(node, "value") else node.n
+
+
+#=============================================
+# Expression analysis
+#=============================================
+
+def get_linear_form(node, variables):
+    """ Returns the expression as a dictionary of the coefficient of each
+        variable, with the constant term under None, if the expression is
+        linear in the variables.  Returns None otherwise.
+    """
+    if is_constant(node):
+        value = get_constant(node)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        return {None: float(value)}
+    if isinstance(node, ast.Name):
+        if node.id in variables:
+            return {node.id: 1.0}
+        if node.id in SIMPLE_CONSTANTS:
+            return {None: SIMPLE_CONSTANTS[node.id]}
+        return None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        form = get_linear_form(node.operand, variables)
+        if form is None or isinstance(node.op, ast.UAdd):
+            return form
+        return {key: -value for key, value in form.items()}
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    left = get_linear_form(node.left, variables)
+    right = get_linear_form(node.right, variables)
+    if left is None or right is None:
+        return None
+    if isinstance(node.op, (ast.Add, ast.Sub)):
+        sign = 1.0 if isinstance(node.op, ast.Add) else -1.0
+        form = dict(left)
+        for key, value in right.items():
+            form[key] = form.get(key, 0.0) + sign * value
+        return form
+    if isinstance(node.op, ast.Mult):
+        # One side has to be a constant
+        if set(left) == {None}:
+            left, right = right, left
+        if set(right) != {None}:
+            return None
+        return {key: value * right[None] for key, value in left.items()}
+    if isinstance(node.op, ast.Div):
+        if set(right) != {None} or right[None] == 0.0:
+            return None
+        return {key: value / right[None] for key, value in left.items()}
+    return None
+
+
+def get_python_reason(tree, variables):
+    """ Returns why an expression needs Python, or None if it is in the
+        simple expression subset.
+    """
+    for node in ast.walk(tree):
+        if is_constant(node):
+            if not isinstance(get_constant(node), (bool, int, float)):
+                return "uses a non-numeric constant"
+        elif not isinstance(node, SIMPLE_NODES):
+            return "uses " + type(node).__name__
+        elif isinstance(node, ast.Name) and node.id not in variables \
+             and node.id not in SIMPLE_CONSTANTS and node.id not in SIMPLE_FUNCTIONS:
+            return "uses '%s'" % node.id
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in SIMPLE_FUNCTIONS:
+                return "calls a function outside the simple subset"
+            if node.keywords or getattr(node, "starargs", None) or getattr(node, "kwargs", None) \
+               or any(type(arg).__name__ == "Starred" for arg in node.args):
+                return "uses keyword or variable arguments"
+    return None
+
+
+class SimpleExpressionTransformer(ast.NodeTransformer):
+    """ Rewrites the parts of an expression that have an equivalent in the
+        simple expression subset: x ** y becomes pow(x, y), and math.f(x)
+        becomes f(x).
+    """
+    def __init__(self):
+        self.changed = False
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            self.changed = True
+            return ast.copy_location(ast.Call(func=ast.Name(id="pow", ctx=ast.Load()),
+                                              args=[node.left, node.right], keywords=[]), node)
+        return node
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if isinstance(node.value, ast.Name) and node.value.id == "math" \
+           and (node.attr in SIMPLE_FUNCTIONS or node.attr == "pi"):
+            self.changed = True
+            return ast.copy_location(ast.Name(id=node.attr, ctx=ast.Load()), node)
+        return node
+
+
+def to_string(node):
+    """ Writes an expression of the simple subset back out as text.
+        Compound operands are always put in parentheses.
+    """
+    def operand(node):
+        text = to_string(node)
+        if isinstance(node, (ast.BinOp, ast.BoolOp, ast.Compare, ast.IfExp)) \
+           or (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not)):
+            return "(" + text + ")"
+        return text
+
+    if is_constant(node):
+        return repr(get_constant(node))
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.BinOp):
+        return operand(node.left) + " " + BINARY_OPERATORS[type(node.op)] + " " + operand(node.right)
+    if isinstance(node, ast.UnaryOp):
+        return UNARY_OPERATORS[type(node.op)] + operand(node.operand)
+    if isinstance(node, ast.BoolOp):
+        return BOOLEAN_OPERATORS[type(node.op)].join(operand(value) for value in node.values)
+    if isinstance(node, ast.Compare):
+        text = operand(node.left)
+        for op, right in zip(node.ops, node.comparators):
+            text += " " + COMPARE_OPERATORS[type(op)] + " " + operand(right)
+        return text
+    if isinstance(node, ast.IfExp):
+        return operand(node.body) + " if " + operand(node.test) + " else " + operand(node.orelse)
+    if isinstance(node, ast.Call):
+        return node.func.id + "(" + ", ".join(to_string(arg) for arg in node.args) + ")"
+    raise ValueError("not a simple expression: " + type(node).__name__)
+
+
+#=============================================
+# Drivers
+#=============================================
+
+def is_close(a, b):
+    return abs(a - b) <= EPSILON * max(1.0, abs(a), abs(b))
+
+
+def get_identity_generator(fcurve):
+    """ Returns the generator modifier of a driver F-curve if it is the
+        only modifier and leaves the driver value as it is, None if the
+        F-curve has no modifiers, and False otherwise.
+    """
+    modifiers = list(fcurve.modifiers)
+    if not modifiers:
+        return None
+    mod = modifiers[0]
+    if len(modifiers) > 1 or mod.type != 'GENERATOR' or mod.mode != 'POLYNOMIAL' \
+       or mod.poly_order != 1 or mod.use_additive or mod.mute \
+       or mod.use_restricted_range or mod.use_influence \
+       or not is_close(mod.coefficients[0], 0.0) or not is_close(mod.coefficients[1], 1.0):
+        return False
+    return mod
+
+
+def convert_linear_driver(fcurve, form, variables):
+    """ Turns a driver whose expression is linear in its variables into a
+        SUM driver, if every variable has the same coefficient.  Returns
+        True if the driver was converted.
+    """
+    scale = form.get(variables[0], 0.0)
+    offset = form.get(None, 0.0)
+    if scale == 0.0 or any(not is_close(form.get(name, 0.0), scale) for name in variables):
+        return False
+
+    if not (is_close(scale, 1.0) and is_close(offset, 0.0)):
+        # The scale and offset go in a generator modifier, which is only
+        # equivalent if nothing else shapes the F-curve.
+        if len(fcurve.keyframe_points) > 0:
+            return False
+        mod = get_identity_generator(fcurve)
+        if mod is False:
+            return False
+        if mod is None:
+            mod = fcurve.modifiers.new('GENERATOR')
+        mod.mode = 'POLYNOMIAL'
+        mod.poly_order = 1
+        mod.coefficients[0] = offset
+        mod.coefficients[1] = scale
+
+    fcurve.driver.type = 'SUM'
+    return True
+
+
+def convert_min_max_driver(fcurve, node, variables):
+    """ Turns a driver whose expression is min() or max() of exactly its
+        variables into a MIN or MAX driver.  Returns True if the driver was
+        converted.
+    """
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name) \
+       or node.func.id not in ("min", "max") or node.keywords or len(node.args) < 2:
+        return False
+    args = node.args
+    if not all(isinstance(arg, ast.Name) and arg.id in variables for arg in args) \
+       or set(arg.id for arg in args) != set(variables):
+        return False
+    fcurve.driver.type = node.func.id.upper()
+    return True
+
+
+def optimize_driver(fcurve):
+    """ Converts a scripted driver into an equivalent one that doesn't run
+        Python, or failing that, rewrites its expression to the simple
+        subset where possible.
+        Returns None if the driver doesn't need Python, and a description
+        of why it does otherwise.
+    """
+    driver = fcurve.driver
+    if driver.type != 'SCRIPTED':
+        return None
+    if driver.use_self:
+        return "uses self"
+
+    variables = [var.name for var in driver.variables]
+    try:
+        tree = ast.parse(driver.expression.strip(), mode='eval')
+    except SyntaxError:
+        return "invalid expression"
+
+    if variables:
+        form = get_linear_form(tree.body, set(variables))
+        if form is not None and convert_linear_driver(fcurve, form, variables):
+            return None
+        if convert_min_max_driver(fcurve, tree.body, variables):
+            return None
+
+    transformer = SimpleExpressionTransformer()
+    tree = transformer.visit(tree)
+    reason = get_python_reason(tree, set(variables))
+    if reason is None:
+        if transformer.changed:
+            driver.expression = to_string(tree.body)
+        return "simple expression"
+    return reason
+
+
+def optimize_drivers(id_data):
+    """ Optimizes all the drivers of an object or armature.  Returns the
+        drivers that still need Python, as (data_path, array_index,
+        expression, reason) tuples.
+    """
+    python_drivers = []
+    if id_data.animation_data is None:
+        return python_drivers
+    for fcurve in id_data.animation_data.drivers:
+        reason = optimize_driver(fcurve)
+        if reason is not None:
+            python_drivers += [(fcurve.data_path, fcurve.array_index, fcurve.driver.expression, reason)]
+    return python_drivers
+
+
+def report_python_drivers(python_drivers):
+    """ Returns a report of the drivers that still need Python.
+    """
+    if not python_drivers:
+        return "Rigify: no drivers need Python."
+    lines = ["Rigify: %d drivers need Python:" % len(python_drivers)]
+    for data_path, index, expression, reason in python_drivers:
+        lines += ["    %s[%d]: %s  (%s)" % (data_path, index, expression, reason)]
+    return "\n".join(lines)
@@ -20,18 +20,23 @@
 
 import bpy
 import re
-import time
+import json
+import hashlib
 import traceback
 import sys
 from rna_prop_ui import rna_idprop_ui_prop_get
 
 from .utils import MetarigError, new_bone, get_rig_type
-from .utils import ORG_PREFIX, MCH_PREFIX, DEF_PREFIX, WGT_PREFIX, ROOT_NAME, make_original_name
+from .utils import ORG_PREFIX, MCH_PREFIX, DEF_PREFIX, WGT_PREFIX, ROOT_NAME, make_original_name, strip_org
 from .utils import RIG_DIR
-from .utils import create_root_widget
+from .utils import create_root_widget, clear_widget_registry, get_bone_widget
 from .utils import random_id
-from .utils import copy_attributes
-from .rig_ui_template import UI_SLIDERS, layers_ui, UI_REGISTER
+from .utils import BoneTopology, set_topology, get_topology
+from .utils import get_rig_parameter_names
+from .utils import copy_attributes, copy_collection_attributes
+from .rig_ui_template import UI_SLIDERS, limbs_ui, layers_ui, UI_REGISTER
+from . import profiler
+from .drivers import optimize_drivers, report_python_drivers
 
 RIG_MODULE = "rigs"
 ORG_LAYER = [n == 31 for n in range(0, 32)]  # Armature layer that original bones should be moved to.
@@ -39,23 +44,64 @@ MCH_LAYER = [n == 30 for n in range(0, 32)]  # Armature layer that mechanism bon
 DEF_LAYER = [n == 29 for n in range(0, 32)]  # Armature layer that deformation bones should be moved to.
 ROOT_LAYER = [n == 28 for n in range(0, 32)]  # Armature layer that root bone should be moved to.
 
-
-class Timer:
-    def __init__(self):
-        self.timez = time.time()
-
-    def tick(self, string):
-        t = time.time()
-        print(string + "%.3f" % (t - self.timez))
-        self.timez = t
+# Edit bone settings that are copied from the metarig to the original bones
+# of the generated rig, apart from parenting.
+EDIT_BONE_ATTRIBUTES = [
+    'head', 'tail', 'roll', 'layers',
+    'use_deform', 'use_inherit_rotation', 'use_inherit_scale',
+    'use_local_location', 'use_relative_parent', 'use_envelope_multiply',
+    'use_cyclic_offset', 'show_wire', 'hide', 'hide_select', 'lock',
+    'select', 'select_head', 'select_tail',
+    'bbone_segments', 'bbone_in', 'bbone_out', 'bbone_x', 'bbone_z',
+    'envelope_distance', 'envelope_weight', 'head_radius', 'tail_radius',
+    ]
+
+# The stages of rig generation, in the order they are run, with the mode the
+# armature is in while each of them runs.  A rig implements whichever of these
+# methods it needs.  Rigs that implement none of them are treated as legacy
+# rigs, and their generate() method is run in the legacy stage.
+LEGACY_STAGE = 'generate'
+RIG_STAGES = [
+    ('prepare', 'OBJECT'),     # Gather data that is only available outside of edit mode.
+    (LEGACY_STAGE, 'EDIT'),    # Legacy rigs, which switch modes as they please.
+    ('edit_bones', 'EDIT'),    # Create, position and parent bones.
+    ('pose_setup', 'OBJECT'),  # Pose bone settings, custom properties and constraints.
+    ('drivers', 'OBJECT'),     # Drivers, which may depend on properties of other rigs.
+    ('widgets', 'OBJECT'),     # Widgets and bone shapes.
+    ('finalize', 'OBJECT'),    # Anything that needs all other rigs to be generated.
+]
 
 
 # TODO: generalize to take a group as input instead of an armature.
-def generate_rig(context, metarig):
+def generate_rig(context, metarig, full_rebuild=False, profile_path=""):
     """ Generates a rig from a metarig.
+        If the rig was generated from this metarig before, only the rigs
+        whose part of the metarig has changed are regenerated, unless
+        full_rebuild is True.
+        If profile_path is given, the generation is profiled, and the
+        results are written to profile_path + ".json", and as a Chrome
+        trace to profile_path + ".trace.json".
+    """
+    if not profile_path:
+        build_rig(context, metarig, full_rebuild)
+        return
+
+    profile_path = bpy.path.abspath(profile_path)
+    prof = profiler.Profiler()
+    try:
+        with prof:
+            with profiler.span("Generate rig", metarig=metarig.name):
+                build_rig(context, metarig, full_rebuild)
+    finally:
+        prof.write_json(profile_path + ".json")
+        prof.write_chrome_trace(profile_path + ".trace.json")
+        print("Rigify: wrote generation profile to " + profile_path + ".json")
+
 
+def build_rig(context, metarig, full_rebuild):
+    """ Does the actual work of generate_rig().
     """
-    t = Timer()
+    clear_widget_registry()
 
     # Random string with time appended so that
     # different rigs don't collide id's
@@ -91,52 +137,278 @@ def generate_rig(context, metarig):
 
     obj.data.pose_position = 'POSE'
 
-    # Get rid of anim data in case the rig already existed
-    print("Clear rig animation data.")
-    obj.animation_data_clear()
-
     # Select generated rig object
     metarig.select = False
     obj.select = True
     scene.objects.active = obj
 
-    # Remove all bones from the generated rig armature.
-    bpy.ops.object.mode_set(mode='EDIT')
-    for bone in obj.data.edit_bones:
-        obj.data.edit_bones.remove(bone)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    # Figure out which rigs need to be generated.  Everything is rebuilt
+    # from scratch unless only some of the rigs' metarig bones changed.
+    with profiler.span("Find changed rigs"):
+        fingerprints = get_rig_fingerprints(metarig)
+        changed_rigs = None
+        if not full_rebuild:
+            changed_rigs = get_changed_rigs(obj, metarig, fingerprints)
+
+    if changed_rigs is None:
+        print("Rebuild rig.")
+        with profiler.span("Duplicate metarig"):
+            duplicate_metarig(context, metarig, obj)
+        rig_names = list(fingerprints["rigs"].keys())
+        generation = {"structure": fingerprints["structure"], "rigs": {}}
+    else:
+        print("Regenerate rigs: " + ", ".join(sorted(changed_rigs)))
+        rig_id = obj.data["rig_id"]
+        generation = get_generation(obj)
+        with profiler.span("Remove changed rigs"):
+            orphans = remove_rigs(context, metarig, obj, generation, changed_rigs)
+        rig_names = changed_rigs
 
-    # Create temporary duplicates for merging
-    temp_rig_1 = metarig.copy()
-    temp_rig_1.data = metarig.data.copy()
-    scene.objects.link(temp_rig_1)
+    #----------------------------------
+    # Make a list of the original bones so we can keep track of them.
+    original_bones = [make_original_name(bone.name) for bone in metarig.data.bones]
 
-    temp_rig_2 = metarig.copy()
-    temp_rig_2.data = obj.data
-    scene.objects.link(temp_rig_2)
+    # Index the hierarchy of the original bones once, for all the rigs
+    # to share.
+    topology = BoneTopology(obj, metarig.data.bones, make_original_name)
+    set_topology(topology)
 
-    # Select the temp rigs for merging
-    for objt in scene.objects:
-        objt.select = False  # deselect all objects
-    temp_rig_1.select = True
-    temp_rig_2.select = True
-    scene.objects.active = temp_rig_2
+    # Create a sorted list of the original bones, sorted in the order we're
+    # going to traverse them for rigging.
+    # (root-most -> leaf-most, alphabetical)
+    bones_sorted = topology.sorted_names()
+
+    #----------------------------------
+    # Create the root bone.
+    if changed_rigs is None:
+        bpy.ops.object.mode_set(mode='EDIT')
+        root_bone = new_bone(obj, ROOT_NAME)
+        obj.data.edit_bones[root_bone].head = (0, 0, 0)
+        obj.data.edit_bones[root_bone].tail = (0, 1, 0)
+        obj.data.edit_bones[root_bone].roll = 0
+        bpy.ops.object.mode_set(mode='OBJECT')
+        obj.data.bones[root_bone].layers = ROOT_LAYER
+        # Put the rig_name in the armature custom properties
+        rna_idprop_ui_prop_get(obj.data, "rig_id", create=True)
+        obj.data["rig_id"] = rig_id
+    else:
+        root_bone = ROOT_NAME
+    #----------------------------------
+    try:
+        # Collect/initialize all the rigs.
+        rigs = []
+        rig_keys = []
+        with profiler.span("Initialize rigs"):
+            for bone in bones_sorted:
+                if strip_org(bone) not in rig_names:
+                    continue
+                if obj.mode != 'EDIT':
+                    bpy.ops.object.mode_set(mode='EDIT')
+                bone_rigs = get_bone_rigs(obj, bone)
+                rigs += bone_rigs
+                rig_keys += [strip_org(bone)] * len(bone_rigs)
+
+        # Generate all the rigs, one stage at a time.  What each rig adds is
+        # tracked so that it can be regenerated on its own later, which a
+        # full rebuild skips.
+        rig_bones = None
+        if not full_rebuild:
+            rig_bones = {}
+            for name, bones in get_rig_bones(metarig)[0].items():
+                rig_bones[name] = [make_original_name(bone) for bone in bones]
+        with profiler.span("Generate rigs"):
+            rig_results = run_rig_stages(context, obj, rigs, rig_keys, rig_bones)
+    except Exception as e:
+        # Cleanup if something goes wrong
+        print("Rigify: failed to generate rig.")
+        metarig.data.pose_position = rest_backup
+        obj.data.pose_position = 'POSE'
+        bpy.ops.object.mode_set(mode='OBJECT')
+        set_topology(None)
+
+        # The rig is only partially generated, so make sure the next
+        # generation rebuilds it from scratch.
+        if "rigify_generation" in obj.data:
+            del obj.data["rigify_generation"]
+
+        # Continue the exception
+        raise e
+
+    with profiler.span("Finish rig"):
+        # Remember what each rig generated, so it can be regenerated on its own
+        for name in rig_names:
+            generation["rigs"][name] = {
+                "fingerprint": fingerprints["rigs"][name],
+                "ui": [],
+                "limbs": [],
+                "bones": [],
+                "constraints": [],
+                }
+        for name, result in zip(rig_keys, rig_results):
+            for key in ("ui", "limbs", "bones", "constraints"):
+                generation["rigs"][name][key] += result[key]
+        if full_rebuild:
+            # Nothing was tracked, so the next generation rebuilds everything
+            if "rigify_generation" in obj.data:
+                del obj.data["rigify_generation"]
+        else:
+            obj.data["rigify_generation"] = json.dumps(generation)
+
+        # Gather the ui scripts and limbs of all the rigs, including the ones
+        # that weren't regenerated.
+        ui_scripts = []
+        limbs = []
+        for bone in bones_sorted:
+            if strip_org(bone) in generation["rigs"]:
+                ui_scripts += generation["rigs"][strip_org(bone)]["ui"]
+                limbs += generation["rigs"][strip_org(bone)]["limbs"]
+
+        #----------------------------------
+        bpy.ops.object.mode_set(mode='OBJECT')
 
-    # Merge the temporary rigs
-    bpy.ops.object.join()
+        # Get a list of all the bones in the armature
+        bones = [bone.name for bone in obj.data.bones]
 
-    # Delete the second temp rig
-    bpy.ops.object.delete()
+        bpy.ops.object.mode_set(mode='EDIT')
 
-    # Select the generated rig
+        # Restore the parents of bones that were parented to regenerated bones.
+        if changed_rigs is not None:
+            for bone, (parent, use_connect) in orphans.items():
+                if bone in obj.data.edit_bones and parent in obj.data.edit_bones:
+                    obj.data.edit_bones[bone].parent = obj.data.edit_bones[parent]
+                    obj.data.edit_bones[bone].use_connect = use_connect
+
+        # Parent any free-floating bones to the root.
+        for bone in bones:
+            if obj.data.edit_bones[bone].parent is None:
+                obj.data.edit_bones[bone].use_connect = False
+                obj.data.edit_bones[bone].parent = obj.data.edit_bones[root_bone]
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Lock transforms on non-control bones, make the deforming bones
+        # deform, and move the non-control bones to their layers.
+        layers = set_bone_flags(obj, original_bones)
+
+        # Copy the metarig drivers, now that their targets exist
+        if changed_rigs is None:
+            copy_metarig_drivers(metarig, obj)
+        else:
+            rig_bones = get_rig_bones(metarig)[0]
+            copy_metarig_drivers(metarig, obj, [bone for name in changed_rigs for bone in rig_bones[name]])
+
+        # Convert the drivers of the rig into ones that don't need
+        # Python where possible, and report the rest.
+        with profiler.span("Optimize drivers"):
+            python_drivers = optimize_drivers(obj) + optimize_drivers(obj.data)
+            profiler.count("python_drivers", len(python_drivers))
+        print(report_python_drivers(python_drivers))
+
+        # Create root bone widget
+        create_root_widget(obj, "root")
+
+        # Assign shapes to bones
+        # Object's with name WGT-<bone_name> get used as that bone's shape.
+        for bone in bones:
+            widget = get_bone_widget(context.scene, bone)
+            if widget is not None:
+                obj.pose.bones[bone].custom_shape = widget
+        # Reveal all the layers with control bones on them
+        vis_layers = [any(layers[i::32]) for i in range(0, 32)]
+        for i in range(0, 32):
+            vis_layers[i] = vis_layers[i] and not (ORG_LAYER[i] or MCH_LAYER[i] or DEF_LAYER[i])
+        obj.data.layers = vis_layers
+
+        # Ensure the collection of layer names exists
+        for i in range(1 + len(metarig.data.rigify_layers), 29):
+            metarig.data.rigify_layers.add()
+
+        # Create list of layer name/row pairs
+        layer_layout = []
+        for l in metarig.data.rigify_layers:
+            print( l.name )
+            layer_layout += [(l.name, l.row)]
+
+        # Generate the UI script
+        if "rig_ui.py" in bpy.data.texts:
+            script = bpy.data.texts["rig_ui.py"]
+            script.clear()
+        else:
+            script = bpy.data.texts.new("rig_ui.py")
+        script.write(UI_SLIDERS % rig_id)
+        for s in ui_scripts:
+            script.write("\n        " + s.replace("\n", "\n        ") + "\n")
+        script.write(limbs_ui(limbs))
+        script.write(layers_ui(vis_layers, layer_layout))
+        script.write(UI_REGISTER)
+        script.use_module = True
+
+        # Run UI script
+        exec(script.as_string(), {})
+
+    #----------------------------------
+    # Deconfigure
+    bpy.ops.object.mode_set(mode='OBJECT')
+    metarig.data.pose_position = rest_backup
+    obj.data.pose_position = 'POSE'
+    set_topology(None)
+
+
+def duplicate_metarig(context, metarig, obj):
+    """ Replaces the bones of the rig object with a copy of the metarig
+        bones, with the ORG prefix added to their names.
+    """
+    scene = context.scene
+
+    # Get rid of anim data in case the rig already existed
+    print("Clear rig animation data.")
+    obj.animation_data_clear()
+    obj.data.animation_data_clear()
+
+    # Read the metarig bones.  Bone roll is only available in edit mode.
+    scene.objects.active = metarig
+    bpy.ops.object.mode_set(mode='EDIT')
+    metarig_bones = []
+    for edit_bone in metarig.data.edit_bones:
+        parent = edit_bone.parent.name if edit_bone.parent else None
+        attributes = {}
+        for attr in EDIT_BONE_ATTRIBUTES:
+            value = getattr(edit_bone, attr)
+            if attr in ('head', 'tail', 'layers'):
+                value = tuple(value)
+            attributes[attr] = value
+        metarig_bones.append((edit_bone.name, parent, edit_bone.use_connect, attributes))
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Replace the bones of the generated rig armature with copies of the
+    # metarig bones, named as original bones.
     for objt in scene.objects:
         objt.select = False  # deselect all objects
     obj.select = True
     scene.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    eb = obj.data.edit_bones
+    for bone in eb:
+        eb.remove(bone)
+    # Leave edit mode before adding the new bones, so the pose channels of
+    # the old bones, with their constraints and custom properties, are
+    # dropped rather than reused by the new bones of the same name.
+    bpy.ops.object.mode_set(mode='OBJECT')
+    bpy.ops.object.mode_set(mode='EDIT')
+    eb = obj.data.edit_bones
+    for name, parent, use_connect, attributes in metarig_bones:
+        edit_bone = eb.new(make_original_name(name))
+        for attr, value in attributes.items():
+            setattr(edit_bone, attr, value)
+    for name, parent, use_connect, attributes in metarig_bones:
+        if parent is not None:
+            edit_bone = eb[make_original_name(name)]
+            edit_bone.parent = eb[make_original_name(parent)]
+            edit_bone.use_connect = use_connect
+    bpy.ops.object.mode_set(mode='OBJECT')
 
     # Copy over bone properties
     for bone in metarig.data.bones:
-        bone_gen = obj.data.bones[bone.name]
+        bone_gen = obj.data.bones[make_original_name(bone.name)]
 
         # B-bone stuff
         bone_gen.bbone_segments = bone.bbone_segments
@@ -145,268 +417,735 @@ def generate_rig(context, metarig):
 
     # Copy over the pose_bone properties
     for bone in metarig.pose.bones:
-        bone_gen = obj.pose.bones[bone.name]
-
-        # Rotation mode and transform locks
-        bone_gen.rotation_mode = bone.rotation_mode
-        bone_gen.lock_rotation = tuple(bone.lock_rotation)
-        bone_gen.lock_rotation_w = bone.lock_rotation_w
-        bone_gen.lock_rotations_4d = bone.lock_rotations_4d
-        bone_gen.lock_location = tuple(bone.lock_location)
-        bone_gen.lock_scale = tuple(bone.lock_scale)
-
-        # rigify_type and rigify_parameters
-        bone_gen.rigify_type = bone.rigify_type
-        for prop in dir(bone_gen.rigify_parameters):
-            if (not prop.startswith("_")) \
-            and (not prop.startswith("bl_")) \
-            and (prop != "rna_type"):
-                try:
-                    setattr(bone_gen.rigify_parameters, prop, \
-                            getattr(bone.rigify_parameters, prop))
-                except AttributeError:
-                    print("FAILED TO COPY PARAMETER: " + str(prop))
-
-        # Custom properties
-        for prop in bone.keys():
-            try:
-                bone_gen[prop] = bone[prop]
-            except KeyError:
-                pass
-
-        # Constraints
-        for con1 in bone.constraints:
-            con2 = bone_gen.constraints.new(type=con1.type)
-            copy_attributes(con1, con2)
-
-            # Set metarig target to rig target
-            if "target" in dir(con2):
-                if con2.target == metarig:
-                    con2.target = obj
-
-    # Copy drivers
-    if metarig.animation_data:
-        for d1 in metarig.animation_data.drivers:
-            d2 = obj.driver_add(d1.data_path)
-            copy_attributes(d1, d2)
-            copy_attributes(d1.driver, d2.driver)
-
-            # Remove default modifiers, variables, etc.
-            for m in d2.modifiers:
-                d2.modifiers.remove(m)
-            for v in d2.driver.variables:
-                d2.driver.variables.remove(v)
-
-            # Copy modifiers
-            for m1 in d1.modifiers:
-                m2 = d2.modifiers.new(type=m1.type)
-                copy_attributes(m1, m2)
-
-            # Copy variables
-            for v1 in d1.driver.variables:
-                v2 = d2.driver.variables.new()
-                copy_attributes(v1, v2)
-                for i in range(len(v1.targets)):
-                    copy_attributes(v1.targets[i], v2.targets[i])
-                    # Switch metarig targets to rig targets
-                    if v2.targets[i].id == metarig:
-                        v2.targets[i].id = obj
-
-                    # Mark targets that may need to be altered after rig generation
-                    tar = v2.targets[i]
-                    # If a custom property
-                    if v2.type == 'SINGLE_PROP' \
-                    and re.match('^pose.bones\["[^"\]]*"\]\["[^"\]]*"\]$', tar.data_path):
-                        tar.data_path = "RIGIFY-" + tar.data_path
-
-            # Copy key frames
-            for i in range(len(d1.keyframe_points)):
-                d2.keyframe_points.add()
-                k1 = d1.keyframe_points[i]
-                k2 = d2.keyframe_points[i]
-                copy_attributes(k1, k2)
-
-    t.tick("Duplicate rig: ")
-    #----------------------------------
-    # Make a list of the original bones so we can keep track of them.
-    original_bones = [bone.name for bone in obj.data.bones]
+        copy_pose_bone_settings(metarig, obj, bone, obj.pose.bones[make_original_name(bone.name)])
+
+
+def set_bone_flags(obj, original_bones):
+    """ Sorts the bones of the rig by their prefix, and sets their transform
+        locks, deform flag and layers accordingly, for all bones at once:
+        - Bones with any prefix (ORG-, MCH-, DEF-, ...) get all their
+          transforms locked.
+        - Only DEF- bones deform.
+        - Original bones go on the ORG layer, and MCH- and DEF- bones on
+          their own layers.
+        Returns the layers of all the bones afterwards, as one flat list of
+        32 values per bone.
+    """
+    prefixed = re.compile("[A-Z][A-Z][A-Z]-")
+    original_bones = set(original_bones)
+    bones = obj.data.bones
+    pose_bones = obj.pose.bones
+    count = len(bones)
+
+    # Transform locks
+    lock_location = [False] * (3 * count)
+    lock_rotation = [False] * (3 * count)
+    lock_rotation_w = [False] * count
+    lock_scale = [False] * (3 * count)
+    pose_bones.foreach_get("lock_location", lock_location)
+    pose_bones.foreach_get("lock_rotation", lock_rotation)
+    pose_bones.foreach_get("lock_rotation_w", lock_rotation_w)
+    pose_bones.foreach_get("lock_scale", lock_scale)
+    for i, pose_bone in enumerate(pose_bones):
+        if prefixed.match(pose_bone.name):
+            lock_location[3 * i:3 * i + 3] = (True, True, True)
+            lock_rotation[3 * i:3 * i + 3] = (True, True, True)
+            lock_rotation_w[i] = True
+            lock_scale[3 * i:3 * i + 3] = (True, True, True)
+    pose_bones.foreach_set("lock_location", lock_location)
+    pose_bones.foreach_set("lock_rotation", lock_rotation)
+    pose_bones.foreach_set("lock_rotation_w", lock_rotation_w)
+    pose_bones.foreach_set("lock_scale", lock_scale)
+
+    # Deform flag and layers
+    use_deform = [False] * count
+    layers = [False] * (32 * count)
+    bones.foreach_get("layers", layers)
+    for i, bone in enumerate(bones):
+        name = bone.name
+        if name.startswith(DEF_PREFIX):
+            use_deform[i] = True
+            layers[32 * i:32 * i + 32] = DEF_LAYER
+        elif name.startswith(MCH_PREFIX):
+            layers[32 * i:32 * i + 32] = MCH_LAYER
+        elif name in original_bones:
+            layers[32 * i:32 * i + 32] = ORG_LAYER
+    bones.foreach_set("use_deform", use_deform)
+    bones.foreach_set("layers", layers)
+
+    return layers
+
+
+def copy_metarig_drivers(metarig, obj, bones=None):
+    """ Copies the drivers of the metarig to the rig, pointing them at the
+        rig's bones instead of the metarig's.  If bones is given, only the
+        drivers of those metarig bones are copied.
+        Custom property targets point at the generated bone with the same
+        name as the metarig bone if it has the property, e.g. because a rig
+        moved the property to a control, and at the original bone otherwise,
+        so this has to be called after the rigs are generated.
+    """
+    if not metarig.animation_data:
+        return
 
-    # Add the ORG_PREFIX to the original bones.
-    bpy.ops.object.mode_set(mode='OBJECT')
-    for i in range(0, len(original_bones)):
-        obj.data.bones[original_bones[i]].name = make_original_name(original_bones[i])
-        original_bones[i] = make_original_name(original_bones[i])
+    # Where each metarig bone ends up in the rig
+    bone_map = {}
+    for bone in metarig.data.bones:
+        bone_map[bone.name] = make_original_name(bone.name)
+
+    for d1 in metarig.animation_data.drivers:
+        bone = get_path_bone(d1.data_path)
+        if bones is not None and bone not in bones:
+            continue
+
+        data_path = remap_bone_path(d1.data_path, bone_map)
+        d2 = obj.driver_add(data_path)
+        copy_attributes(d1, d2)
+        copy_attributes(d1.driver, d2.driver)
+        d2.data_path = data_path
+
+        # Remove default modifiers, variables, etc.
+        for m in list(d2.modifiers):
+            d2.modifiers.remove(m)
+        for v in list(d2.driver.variables):
+            d2.driver.variables.remove(v)
+
+        # Copy modifiers
+        for m1 in d1.modifiers:
+            m2 = d2.modifiers.new(type=m1.type)
+            copy_attributes(m1, m2)
+
+        # Copy variables, switching metarig targets to rig targets
+        for v1 in d1.driver.variables:
+            v2 = d2.driver.variables.new()
+            copy_attributes(v1, v2)
+            for t1, t2 in zip(v1.targets, v2.targets):
+                copy_attributes(t1, t2)
+                if t2.id != metarig:
+                    continue
+                t2.id = obj
+                t2.data_path = remap_bone_path(t1.data_path, bone_map, obj if v2.type == 'SINGLE_PROP' else None)
+                if t2.bone_target in bone_map:
+                    t2.bone_target = bone_map[t2.bone_target]
+
+        # Copy key frames
+        d2.keyframe_points.add(len(d1.keyframe_points))
+        copy_collection_attributes(d1.keyframe_points, d2.keyframe_points)
+
+
+def copy_pose_bone_settings(metarig, obj, bone, bone_gen):
+    """ Copies the settings, rig type, custom properties and constraints of
+        a metarig pose bone to a pose bone of the rig.
+    """
+    # Rotation mode and transform locks
+    bone_gen.rotation_mode = bone.rotation_mode
+    bone_gen.lock_rotation = tuple(bone.lock_rotation)
+    bone_gen.lock_rotation_w = bone.lock_rotation_w
+    bone_gen.lock_rotations_4d = bone.lock_rotations_4d
+    bone_gen.lock_location = tuple(bone.lock_location)
+    bone_gen.lock_scale = tuple(bone.lock_scale)
+
+    # rigify_type and rigify_parameters
+    bone_gen.rigify_type = bone.rigify_type
+    for prop in get_rig_parameter_names(bone_gen.rigify_parameters, bone.rigify_type):
+        try:
+            setattr(bone_gen.rigify_parameters, prop, \
+                    getattr(bone.rigify_parameters, prop))
+        except AttributeError:
+            print("FAILED TO COPY PARAMETER: " + str(prop))
 
-    # Create a sorted list of the original bones, sorted in the order we're
-    # going to traverse them for rigging.
-    # (root-most -> leaf-most, alphabetical)
-    bones_sorted = []
-    for name in original_bones:
-        bones_sorted += [name]
-    bones_sorted.sort()  # first sort by names
-    bones_sorted.sort(key=lambda bone: len(obj.pose.bones[bone].parent_recursive))  # then parents before children
+    # Custom properties
+    for prop in bone.keys():
+        try:
+            bone_gen[prop] = bone[prop]
+        except KeyError:
+            pass
+
+    # Constraints
+    for con1 in bone.constraints:
+        con2 = bone_gen.constraints.new(type=con1.type)
+        copy_attributes(con1, con2)
+
+        # Set metarig target to rig target
+        if "target" in dir(con2):
+            if con2.target == metarig:
+                con2.target = obj
+                if con2.subtarget != "":
+                    con2.subtarget = make_original_name(con2.subtarget)
+
+
+def get_rig_bones(metarig):
+    """ Returns a dictionary mapping the name of every metarig bone that has
+        a rig type to the names of the metarig bones that rig is made of:
+        the bone itself, and all the bones under it that aren't part of
+        another rig.  Also returns the list of bones that aren't part of
+        any rig.
+    """
+    rig_bones = {}
+    loose_bones = []
+
+    def add_bones(bone, rig_name):
+        if metarig.pose.bones[bone.name].rigify_type.replace(" ", "") != "":
+            rig_name = bone.name
+            rig_bones[rig_name] = []
+        if rig_name is None:
+            loose_bones.append(bone.name)
+        else:
+            rig_bones[rig_name].append(bone.name)
+        for child in bone.children:
+            add_bones(child, rig_name)
 
-    t.tick("Make list of org bones: ")
-    #----------------------------------
-    # Create the root bone.
-    bpy.ops.object.mode_set(mode='EDIT')
-    root_bone = new_bone(obj, ROOT_NAME)
-    obj.data.edit_bones[root_bone].head = (0, 0, 0)
-    obj.data.edit_bones[root_bone].tail = (0, 1, 0)
-    obj.data.edit_bones[root_bone].roll = 0
-    bpy.ops.object.mode_set(mode='OBJECT')
-    obj.data.bones[root_bone].layers = ROOT_LAYER
-    # Put the rig_name in the armature custom properties
-    rna_idprop_ui_prop_get(obj.data, "rig_id", create=True)
-    obj.data["rig_id"] = rig_id
+    for bone in metarig.data.bones:
+        if bone.parent is None:
+            add_bones(bone, None)
 
-    t.tick("Create root bone: ")
-    #----------------------------------
+    return rig_bones, loose_bones
+
+
+def fingerprint_value(value):
+    """ Returns a hashable, repr-stable version of a property value.
+    """
+    if isinstance(value, float):
+        return round(value, 5)
+    elif isinstance(value, (bool, int, str)) or value is None:
+        return value
+    elif isinstance(value, bpy.types.ID):
+        return value.name
+    elif hasattr(value, "to_dict"):
+        return fingerprint_value(value.to_dict())
+    elif hasattr(value, "to_list"):
+        return fingerprint_value(value.to_list())
+    elif isinstance(value, dict):
+        return tuple((k, fingerprint_value(value[k])) for k in sorted(value.keys()))
+    elif hasattr(value, "__len__") and not hasattr(value, "bl_rna"):
+        return tuple(fingerprint_value(v) for v in value)
+    else:
+        return repr(value)
+
+
+def fingerprint_attributes(a):
+    """ Returns the attributes of a struct the same way copy_attributes()
+        sees them, ready for fingerprinting.
+    """
+    attributes = []
+    for key in dir(a):
+        if not key.startswith("_") \
+        and not key.startswith("error_") \
+        and key not in {"group", "is_valid", "rna_type", "bl_rna"}:
+            value = getattr(a, key, None)
+            if not callable(value):
+                attributes += [(key, fingerprint_value(value))]
+    return tuple(attributes)
+
+
+def fingerprint_bone(metarig, bone_name):
+    """ Returns everything about a metarig bone that can affect the rig
+        generated from it, ready for fingerprinting.
+    """
+    bone = metarig.data.bones[bone_name]
+    pose_bone = metarig.pose.bones[bone_name]
+
+    params = []
+    for prop in sorted(get_rig_parameter_names(pose_bone.rigify_parameters, pose_bone.rigify_type)):
+        value = getattr(pose_bone.rigify_parameters, prop, None)
+        if not callable(value):
+            params += [(prop, fingerprint_value(value))]
+
+    return (
+        bone.name,
+        bone.parent.name if bone.parent else None,
+        bone.use_connect,
+        fingerprint_value(bone.head_local),
+        fingerprint_value(bone.tail_local),
+        fingerprint_value(bone.matrix_local),
+        bone.bbone_segments,
+        fingerprint_value(bone.bbone_in),
+        fingerprint_value(bone.bbone_out),
+        fingerprint_value(bone.layers),
+        pose_bone.rotation_mode,
+        fingerprint_value(pose_bone.lock_location),
+        fingerprint_value(pose_bone.lock_rotation),
+        pose_bone.lock_rotation_w,
+        pose_bone.lock_rotations_4d,
+        fingerprint_value(pose_bone.lock_scale),
+        pose_bone.rigify_type,
+        tuple(params),
+        tuple((key, fingerprint_value(pose_bone[key])) for key in sorted(pose_bone.keys()) \
+              if key not in {"rigify_type", "rigify_parameters"}),
+        tuple((con.type, fingerprint_attributes(con)) for con in pose_bone.constraints),
+        )
+
+
+def fingerprint(data):
+    return hashlib.sha1(repr(data).encode("utf-8")).hexdigest()
+
+
+def get_rig_fingerprints(metarig):
+    """ Fingerprints the metarig.  Returns a dictionary with a fingerprint
+        of every rig in the metarig, and a fingerprint of everything else,
+        i.e. of the bones that aren't part of any rig, of which bones belong
+        to which rig, and of the metarig drivers.
+    """
+    rig_bones, loose_bones = get_rig_bones(metarig)
+
+    rigs = {}
+    for name, bones in rig_bones.items():
+        rigs[name] = fingerprint([fingerprint_bone(metarig, bone) for bone in bones])
+
+    structure = [sorted((name, sorted(bones)) for name, bones in rig_bones.items())]
+    structure += [fingerprint_bone(metarig, bone) for bone in loose_bones]
+    if metarig.animation_data:
+        for d in metarig.animation_data.drivers:
+            structure += [(d.data_path, d.array_index, fingerprint_attributes(d.driver))]
+            structure += [tuple(fingerprint_attributes(t) for v in d.driver.variables for t in v.targets)]
+
+    return {"structure": fingerprint(structure), "rigs": rigs}
+
+
+def get_generation(obj):
+    """ Returns what was recorded about the last generation of the rig,
+        or None if it wasn't generated by Rigify.
+    """
+    if obj.type != 'ARMATURE' or "rigify_generation" not in obj.data:
+        return None
     try:
-        # Collect/initialize all the rigs.
-        rigs = []
-        for bone in bones_sorted:
-            bpy.ops.object.mode_set(mode='EDIT')
-            rigs += get_bone_rigs(obj, bone)
-        t.tick("Initialize rigs: ")
+        return json.loads(obj.data["rigify_generation"])
+    except ValueError:
+        return None
+
+
+def get_changed_rigs(obj, metarig, fingerprints):
+    """ Returns the names of the rigs that need to be regenerated because
+        they changed since the rig object was last generated, or None if
+        the whole rig needs to be rebuilt.
+        Rigs below a changed rig in the bone hierarchy are regenerated too,
+        since they may depend on its bones, and so are rigs that added
+        constraints to the original bones of a rig that is regenerated, or
+        that share an added constraint with one.
+    """
+    generation = get_generation(obj)
+    if generation is None or "rig_id" not in obj.data:
+        return None
+    if generation["structure"] != fingerprints["structure"]:
+        return None
+    if set(generation["rigs"].keys()) != set(fingerprints["rigs"].keys()):
+        return None
+
+    # All of the original bones must still be there
+    for bone in metarig.data.bones:
+        if make_original_name(bone.name) not in obj.data.bones:
+            return None
+
+    changed = set()
+    for name, rig_fingerprint in fingerprints["rigs"].items():
+        # Rigs generated before limbs were recorded are regenerated too
+        if generation["rigs"][name]["fingerprint"] != rig_fingerprint \
+        or "limbs" not in generation["rigs"][name]:
+            changed.add(name)
+
+    rig_bones, loose_bones = get_rig_bones(metarig)
+    bone_rigs = {}
+    for name, bones in rig_bones.items():
+        for bone in bones:
+            bone_rigs[bone] = name
+
+    while True:
+        changed_bones = set()
+        changed_constraints = set()
+        for name in changed:
+            changed_bones.update(make_original_name(bone) for bone in rig_bones[name])
+            changed_constraints.update(tuple(con) for con in generation["rigs"][name]["constraints"])
+
+        dependent = set()
+        for name in rig_bones.keys():
+            parent = metarig.data.bones[name].parent
+            if name in changed:
+                continue
+            elif parent is not None and bone_rigs.get(parent.name) in changed:
+                dependent.add(name)
+            else:
+                for bone, con in generation["rigs"][name]["constraints"]:
+                    if bone in changed_bones or (bone, con) in changed_constraints:
+                        dependent.add(name)
+                        break
 
-        # Generate all the rigs.
-        ui_scripts = []
-        for rig in rigs:
-            # Go into editmode in the rig armature
-            bpy.ops.object.mode_set(mode='OBJECT')
-            context.scene.objects.active = obj
-            obj.select = True
-            bpy.ops.object.mode_set(mode='EDIT')
-            scripts = rig.generate()
-            if scripts != None:
-                ui_scripts += [scripts[0]]
-        t.tick("Generate rigs: ")
-    except Exception as e:
-        # Cleanup if something goes wrong
-        print("Rigify: failed to generate rig.")
-        metarig.data.pose_position = rest_backup
-        obj.data.pose_position = 'POSE'
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if not dependent:
+            break
+        changed |= dependent
 
-        # Continue the exception
-        raise e
+    return sorted(changed)
 
-    #----------------------------------
-    bpy.ops.object.mode_set(mode='OBJECT')
 
-    # Get a list of all the bones in the armature
-    bones = [bone.name for bone in obj.data.bones]
+def get_path_bone(data_path):
+    """ Returns the name of the bone an animation data path points into,
+        or None if it doesn't point into a bone.
+    """
+    match = re.match('^(pose\.)?bones\["([^"\]]*)"\]', data_path)
+    if match is None:
+        return None
+    return match.group(2)
+
+
+def remap_bone_path(data_path, bone_map, obj=None):
+    """ Returns the given animation data path, with the name of the bone it
+        points into, if any, replaced according to bone_map.
+        If obj is given, and the path is to a custom property of a bone that
+        has a bone of the same name in obj with that property, the path
+        points to that bone instead.
+    """
+    bone = get_path_bone(data_path)
+    if bone not in bone_map:
+        return data_path
+    start = data_path.index('["') + 2
+    rest = data_path[start + len(bone):]
+
+    if obj is not None and bone in obj.pose.bones:
+        prop = re.match('^"\]\["([^"\]]*)"\]$', rest)
+        if prop is not None and prop.group(1) in obj.pose.bones[bone].keys():
+            return data_path
 
-    # Parent any free-floating bones to the root.
+    return data_path[:start] + bone_map[bone] + rest
+
+
+def remove_drivers(id_data, bones, constraints):
+    """ Removes the drivers of an object or armature that drive properties
+        of the given bones, or of the given (bone name, constraint name)
+        constraints.
+    """
+    if id_data.animation_data is None:
+        return
+    con_paths = tuple('pose.bones["%s"].constraints["%s"]' % tuple(con) for con in constraints)
+    for fcurve in list(id_data.animation_data.drivers):
+        if get_path_bone(fcurve.data_path) in bones \
+        or fcurve.data_path.startswith(con_paths):
+            id_data.driver_remove(fcurve.data_path, fcurve.array_index)
+
+
+def remove_rigs(context, metarig, obj, generation, rig_names):
+    """ Removes everything the given rigs generated, and resets their
+        original bones to how they are in the metarig, so that the rigs
+        can be generated again.
+        Returns a dictionary of the other bones that were parented to a
+        removed bone, with the name of their parent and use_connect.
+    """
+    rig_bones, loose_bones = get_rig_bones(metarig)
+    generated_bones = set()
+    original_bones = []
+    for name in rig_names:
+        generated_bones.update(generation["rigs"][name]["bones"])
+        original_bones += [make_original_name(bone) for bone in rig_bones[name]]
+
+    # Constraints the rigs added to the original bones of other rigs
+    constraints = []
+    for name in rig_names:
+        for bone, con in generation["rigs"][name]["constraints"]:
+            if bone not in original_bones:
+                constraints.append((bone, con))
+
+    # Get the rest pose of the original bones from the metarig.  Bone
+    # roll is only available in edit mode.
+    context.scene.objects.active = metarig
     bpy.ops.object.mode_set(mode='EDIT')
-    for bone in bones:
-        if obj.data.edit_bones[bone].parent is None:
-            obj.data.edit_bones[bone].use_connect = False
-            obj.data.edit_bones[bone].parent = obj.data.edit_bones[root_bone]
+    rest = {}
+    for name in original_bones:
+        edit_bone = metarig.data.edit_bones[strip_org(name)]
+        rest[name] = (edit_bone.head.copy(), edit_bone.tail.copy(), edit_bone.roll)
     bpy.ops.object.mode_set(mode='OBJECT')
+    context.scene.objects.active = obj
 
-    # Lock transforms on all non-control bones
-    r = re.compile("[A-Z][A-Z][A-Z]-")
-    for bone in bones:
-        if r.match(bone):
-            pb = obj.pose.bones[bone]
-            pb.lock_location = (True, True, True)
-            pb.lock_rotation = (True, True, True)
-            pb.lock_rotation_w = True
-            pb.lock_scale = (True, True, True)
-
-    # Every bone that has a name starting with "DEF-" make deforming.  All the
-    # others make non-deforming.
-    for bone in bones:
-        if obj.data.bones[bone].name.startswith(DEF_PREFIX):
-            obj.data.bones[bone].use_deform = True
+    # Remove the generated bones, remembering the parents of other rigs'
+    # bones that depend on them.
+    bpy.ops.object.mode_set(mode='EDIT')
+    eb = obj.data.edit_bones
+    orphans = {}
+    for bone in eb:
+        if bone.name not in generated_bones \
+        and bone.parent is not None \
+        and bone.parent.name in generated_bones:
+            orphans[bone.name] = (bone.parent.name, bone.use_connect)
+    for name in generated_bones:
+        if name in eb:
+            eb.remove(eb[name])
+
+    # Reset the original bones
+    for name in original_bones:
+        bone = metarig.data.bones[strip_org(name)]
+        edit_bone = eb[name]
+        edit_bone.use_connect = False
+        if bone.parent is None:
+            edit_bone.parent = None
         else:
-            obj.data.bones[bone].use_deform = False
-
-    # Alter marked driver targets
-    if obj.animation_data:
-        for d in obj.animation_data.drivers:
-            for v in d.driver.variables:
-                for tar in v.targets:
-                    if tar.data_path.startswith("RIGIFY-"):
-                        temp, bone, prop = tuple([x.strip('"]') for x in tar.data_path.split('["')])
-                        if bone in obj.data.bones \
-                        and prop in obj.pose.bones[bone].keys():
-                            tar.data_path = tar.data_path[7:]
-                        else:
-                            tar.data_path = 'pose.bones["%s"]["%s"]' % (make_original_name(bone), prop)
-
-    # Move all the original bones to their layer.
-    for bone in original_bones:
-        obj.data.bones[bone].layers = ORG_LAYER
-
-    # Move all the bones with names starting with "MCH-" to their layer.
-    for bone in bones:
-        if obj.data.bones[bone].name.startswith(MCH_PREFIX):
-            obj.data.bones[bone].layers = MCH_LAYER
-
-    # Move all the bones with names starting with "DEF-" to their layer.
-    for bone in bones:
-        if obj.data.bones[bone].name.startswith(DEF_PREFIX):
-            obj.data.bones[bone].layers = DEF_LAYER
-
-    # Create root bone widget
-    create_root_widget(obj, "root")
-
-    # Assign shapes to bones
-    # Object's with name WGT-<bone_name> get used as that bone's shape.
-    for bone in bones:
-        wgt_name = (WGT_PREFIX + obj.data.bones[bone].name)[:63]  # Object names are limited to 63 characters... arg
-        if wgt_name in context.scene.objects:
-            # Weird temp thing because it won't let me index by object name
-            for ob in context.scene.objects:
-                if ob.name == wgt_name:
-                    obj.pose.bones[bone].custom_shape = ob
-                    break
-            # This is what it should do:
-            # obj.pose.bones[bone].custom_shape = context.scene.objects[wgt_name]
-    # Reveal all the layers with control bones on them
-    vis_layers = [False for n in range(0, 32)]
-    for bone in bones:
-        for i in range(0, 32):
-            vis_layers[i] = vis_layers[i] or obj.data.bones[bone].layers[i]
-    for i in range(0, 32):
-        vis_layers[i] = vis_layers[i] and not (ORG_LAYER[i] or MCH_LAYER[i] or DEF_LAYER[i])
-    obj.data.layers = vis_layers
-
-    # Ensure the collection of layer names exists
-    for i in range(1 + len(metarig.data.rigify_layers), 29):
-        metarig.data.rigify_layers.add()
-
-    # Create list of layer name/row pairs
-    layer_layout = []
-    for l in metarig.data.rigify_layers:
-        print( l.name )
-        layer_layout += [(l.name, l.row)]
-
-    # Generate the UI script
-    if "rig_ui.py" in bpy.data.texts:
-        script = bpy.data.texts["rig_ui.py"]
-        script.clear()
-    else:
-        script = bpy.data.texts.new("rig_ui.py")
-    script.write(UI_SLIDERS % rig_id)
-    for s in ui_scripts:
-        script.write("\n        " + s.replace("\n", "\n        ") + "\n")
-    script.write(layers_ui(vis_layers, layer_layout))
-    script.write(UI_REGISTER)
-    script.use_module = True
-
-    # Run UI script
-    exec(script.as_string(), {})
-
-    t.tick("The rest: ")
-    #----------------------------------
-    # Deconfigure
+            edit_bone.parent = eb[make_original_name(bone.parent.name)]
+        edit_bone.head, edit_bone.tail, edit_bone.roll = rest[name]
+    for name in original_bones:
+        eb[name].use_connect = metarig.data.bones[strip_org(name)].use_connect
     bpy.ops.object.mode_set(mode='OBJECT')
-    metarig.data.pose_position = rest_backup
-    obj.data.pose_position = 'POSE'
+
+    for bone, con in constraints:
+        pose_bone = obj.pose.bones[bone]
+        if con in pose_bone.constraints:
+            pose_bone.constraints.remove(pose_bone.constraints[con])
+
+    for name in original_bones:
+        bone = metarig.data.bones[strip_org(name)]
+        bone_gen = obj.data.bones[name]
+        bone_gen.bbone_segments = bone.bbone_segments
+        bone_gen.bbone_in = bone.bbone_in
+        bone_gen.bbone_out = bone.bbone_out
+        bone_gen.layers = tuple(bone.layers)
+
+        pose_bone = obj.pose.bones[name]
+        for con in list(pose_bone.constraints):
+            pose_bone.constraints.remove(con)
+        for key in list(pose_bone.keys()):
+            if key not in {"rigify_type", "rigify_parameters"}:
+                del pose_bone[key]
+        copy_pose_bone_settings(metarig, obj, metarig.pose.bones[bone.name], pose_bone)
+
+    # Remove the drivers of everything that was removed or reset
+    bones = generated_bones.union(original_bones)
+    remove_drivers(obj, bones, constraints)
+    remove_drivers(obj.data, bones, constraints)
+
+    return orphans
+
+
+def is_staged_rig(rig):
+    """ Returns True if the rig implements any of the generation stages,
+        as opposed to a single legacy generate() method.
+    """
+    for stage, mode in RIG_STAGES:
+        if stage != LEGACY_STAGE and hasattr(rig, stage):
+            return True
+    return False
+
+
+def get_bone_names(obj):
+    """ Returns the names of the bones of an armature in its current mode.
+    """
+    if obj.mode == 'EDIT':
+        return set(obj.data.edit_bones.keys())
+    else:
+        return set(obj.data.bones.keys())
+
+
+def get_org_constraints(obj, org_bones):
+    """ Returns the (bone name, constraint name) pairs of the constraints
+        on the given bones.
+    """
+    constraints = set()
+    for name in org_bones:
+        for con in obj.pose.bones[name].constraints:
+            constraints.add((name, con.name))
+    return constraints
+
+
+def get_bone_list(obj):
+    """ Returns the bones of an armature in its current mode.
+    """
+    return obj.data.edit_bones if obj.mode == 'EDIT' else obj.data.bones
+
+
+def get_bone_list_state(obj):
+    """ Returns the mode of an armature, its number of bones, and in edit
+        mode the name of the last one, for get_new_bone_names().
+    """
+    bones = get_bone_list(obj)
+    count = len(bones)
+    last = None
+    if obj.mode == 'EDIT' and count:
+        last = bones[count - 1].name
+    return obj.mode, count, last
+
+
+def get_new_bone_names(obj, state):
+    """ Returns the names of the bones added to an armature since
+        get_bone_list_state() returned state, or None if they can't be
+        told from the end of the bone list.
+        New edit bones are added to the end of the list, so as long as the
+        armature stayed in edit mode and its old last bone is where it was,
+        the new bones are the ones after it.  Bones can't be added outside
+        of edit mode.
+    """
+    mode, count, last = state
+    if obj.mode != mode:
+        return None
+    bones = get_bone_list(obj)
+    new_count = len(bones)
+    if mode != 'EDIT':
+        return [] if new_count == count else None
+    if new_count < count or (count and bones[count - 1].name != last):
+        return None
+    return [bone.name for bone in bones[count:]]
+
+
+def get_nearby_bones(obj, rig_bones, rig_names):
+    """ Returns the rig each original bone belongs to, and for each of the
+        given rigs, the original bones it is likely to add constraints to:
+        its own, and those of the rig its bone is parented to.
+    """
+    owners = {}
+    for name, bones in rig_bones.items():
+        for bone in bones:
+            owners[bone] = name
+    topology = get_topology(obj)
+    nearby_bones = []
+    for name in rig_names:
+        bones = list(rig_bones.get(name, []))
+        parent = None
+        if topology is not None:
+            parent = topology.parent.get(make_original_name(name))
+        if parent is not None:
+            bones += rig_bones.get(owners.get(parent), [parent])
+        nearby_bones += [bones]
+    return owners, nearby_bones
+
+
+def get_rig_type_name(rig):
+    """ Returns the rig type of a rig instance, as it is written in the
+        metarig (e.g. "pitchipoy.limbs.super_limb").
+    """
+    module = rig.__class__.__module__
+    prefix = RIG_MODULE + "."
+    if prefix in module:
+        return module[module.index(prefix) + len(prefix):]
+    return module
+
+
+def count_rig_data(obj):
+    """ Returns the number of constraints and drivers on an armature, for
+        profiling.
+    """
+    constraints = 0
+    for pb in obj.pose.bones:
+        constraints += len(pb.constraints)
+    drivers = 0
+    for id_data in (obj, obj.data):
+        if id_data.animation_data:
+            drivers += len(id_data.animation_data.drivers)
+    return constraints, drivers
+
+
+def run_rig_stages(context, obj, rigs, rig_names=None, rig_bones=None):
+    """ Runs the generation stages of the given rigs.  Every rig's stage
+        is run before any rig's next stage, so the armature only changes
+        mode between stages.
+        rig_names optionally gives the metarig bone of each rig, which is
+        used to label it when profiling.
+        rig_bones optionally maps the metarig bone of every rig of the
+        metarig to the original bones that rig is made of.  Without it,
+        what the rigs add to the armature isn't tracked.
+        Returns a dictionary for each rig, with the ui scripts and limbs it
+        returned, the names of the bones it created, and the constraints it
+        added to original bones.
+    """
+    results = [{"ui": [], "limbs": [], "bones": set(), "constraints": set()} for rig in rigs]
+    staged = [is_staged_rig(rig) for rig in rigs]
+    rig_types = [get_rig_type_name(rig) for rig in rigs]
+    if rig_names is None:
+        rig_names = rig_types
+
+    tracking = rig_bones is not None
+    if tracking:
+        bone_names = get_bone_names(obj)
+        org_bones = [name for name in bone_names if name.startswith(ORG_PREFIX)]
+        org_constraints = get_org_constraints(obj, org_bones)
+        owners, nearby_bones = get_nearby_bones(obj, rig_bones, rig_names)
+
+    profiling = profiler.is_profiling()
+    if profiling:
+        bone_count = len(get_bone_list(obj))
+        constraint_count, driver_count = count_rig_data(obj)
+
+    for stage, mode in RIG_STAGES:
+        tracking_constraints = tracking and stage != 'edit_bones'
+        ran = []
+        attributed = set()
+
+        with profiler.span(stage, "stage"):
+            for i, rig in enumerate(rigs):
+                if staged[i] == (stage == LEGACY_STAGE) or not hasattr(rig, stage):
+                    continue
+
+                # Legacy rigs expect the armature to have just entered edit
+                # mode, so that its bone data is up to date.  Staged rigs only
+                # need the right mode, which is already set unless a previous
+                # rig misbehaved.
+                if stage == LEGACY_STAGE \
+                or context.scene.objects.active != obj or obj.mode != mode:
+                    bpy.ops.object.mode_set(mode='OBJECT')
+                    context.scene.objects.active = obj
+                    obj.select = True
+                    bpy.ops.object.mode_set(mode=mode)
+
+                if tracking:
+                    bone_state = get_bone_list_state(obj)
+                if tracking_constraints:
+                    nearby_constraints = get_org_constraints(obj, nearby_bones[i])
+                    ran += [i]
+
+                with profiler.span(rig_names[i], "rig", type=rig_types[i], stage=stage):
+                    scripts = getattr(rig, stage)()
+
+                    # Keep track of what the rig added to the armature
+                    if tracking:
+                        new_bones = get_new_bone_names(obj, bone_state)
+                        if new_bones is None:
+                            new_bone_names = get_bone_names(obj)
+                            new_bones = new_bone_names - bone_names
+                            bone_names = new_bone_names
+                        else:
+                            bone_names.update(new_bones)
+                        results[i]["bones"].update(new_bones)
+                    if tracking_constraints:
+                        added = get_org_constraints(obj, nearby_bones[i]) - nearby_constraints
+                        results[i]["constraints"] |= added
+                        attributed |= added
+
+                    if profiling:
+                        count = len(get_bone_list(obj))
+                        profiler.count("bones", max(0, count - bone_count))
+                        bone_count = count
+
+                    # Constraints and drivers can't be counted in edit mode,
+                    # so anything added there is counted at the next rig.
+                    if profiling and obj.mode != 'EDIT':
+                        constraints, drivers = count_rig_data(obj)
+                        profiler.count("constraints", max(0, constraints - constraint_count))
+                        profiler.count("drivers", max(0, drivers - driver_count))
+                        constraint_count, driver_count = constraints, drivers
+
+                if scripts is not None:
+                    results[i]["ui"] += [scripts[0]]
+                    if len(scripts) > 1:
+                        results[i]["limbs"] += scripts[1].get("limbs", [])
+
+            # Rigs are only checked for constraints on the original bones
+            # near them.  Any other constraint added in this stage could have
+            # come from any of the stage's rigs but the bone's own, so it is
+            # recorded for all of them, and get_changed_rigs() regenerates
+            # them together.
+            if ran:
+                stage_constraints = get_org_constraints(obj, org_bones)
+                for con in stage_constraints - org_constraints - attributed:
+                    for i in ran:
+                        if rig_names[i] != owners.get(con[0]):
+                            results[i]["constraints"].add(con)
+                org_constraints = stage_constraints
+
+    # Leave out anything that was removed again
+    if tracking:
+        bone_names = get_bone_names(obj)
+        org_constraints = get_org_constraints(obj, org_bones)
+    for result in results:
+        if tracking:
+            result["bones"] = sorted(result["bones"] & bone_names)
+            result["constraints"] = sorted(result["constraints"] & org_constraints)
+        else:
+            result["bones"] = []
+            result["constraints"] = []
+
+    return results
 
 
 def get_bone_rigs(obj, bone_name, halt_on_missing=False):
@@ -434,6 +1173,7 @@ def get_bone_rigs(obj, bone_name, halt_on_missing=False):
                 print('print_exc():')
                 traceback.print_exc(file=sys.stdout)
         else:
+            rig.topology = get_topology(obj)
             rigs += [rig]
     return rigs
 
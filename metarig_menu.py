@@ -27,8 +27,9 @@ from . import utils
 
 
 def get_metarig_list(path):
-    """ Searches for metarig modules, and returns a list of the
-        imported modules.
+    """ Searches for metarigs, both .json files and python modules, and
+        returns a list of their names.  They aren't loaded until a metarig
+        is added.
     """
     metarigs = []
     MODULE_DIR = os.path.dirname(__file__)
@@ -41,20 +42,18 @@ def get_metarig_list(path):
         # Is it a directory?
         if os.path.isdir(os.path.join(SEARCH_DIR_ABS, f)):
             continue
-        elif not f.endswith(".py"):
+        elif not f.endswith(".py") and not f.endswith(".json"):
             continue
         elif f == "__init__.py":
             continue
         else:
-            module_name = f[:-3]
-            try:
-                metarigs += [utils.get_metarig_module(module_name)]
-            except (ImportError):
-                pass
+            name = os.path.splitext(f)[0]
+            if name not in metarigs:
+                metarigs += [name]
     return metarigs
 
 
-def make_metarig_add_execute(m):
+def make_metarig_add_execute(name):
     """ Create an execute method for a metarig creation operator.
     """
     def execute(self, context):
@@ -69,7 +68,12 @@ def make_metarig_add_execute(m):
         bones.remove(bones[0])
 
         # Create metarig
-        m.create(obj)
+        try:
+            utils.create_metarig(obj, name)
+        except (ImportError, IOError, ValueError) as e:
+            bpy.ops.object.mode_set(mode='OBJECT')
+            self.report({'ERROR'}, "Rigify: could not load metarig '%s': %s" % (name, e))
+            return {'CANCELLED'}
 
         bpy.ops.object.mode_set(mode='OBJECT')
         return {'FINISHED'}
@@ -85,20 +89,18 @@ def make_metarig_menu_func(bl_idname, text):
     return metarig_menu
 
 
-# Get the metarig modules
+# Get the metarig module names
 metarigs = get_metarig_list("")
 
 # Create metarig add Operators
 metarig_ops = []
-for m in metarigs:
-    name = m.__name__.rsplit('.', 1)[1]
-
+for name in metarigs:
     # Dynamically construct an Operator
     T = type("Add_" + name + "_Metarig", (bpy.types.Operator,), {})
     T.bl_idname = "object.armature_" + name + "_metarig_add"
     T.bl_label = "Add " + name.replace("_", " ").capitalize() + " (metarig)"
     T.bl_options = {'REGISTER', 'UNDO'}
-    T.execute = make_metarig_add_execute(m)
+    T.execute = make_metarig_add_execute(name)
 
     metarig_ops.append((T, name))
 
@@ -0,0 +1,97 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Offline model of the Blender API, for running Rigify without Blender.
+
+    The fake bpy, mathutils and rna_prop_ui modules model just enough of
+    Blender 2.7x for the generator and the rig types to run headless, in
+    plain Python, and tally every modelled operation in stats:
+
+        import offline
+        rigify = offline.load_rigify()
+        ... add a metarig, as in benchmark.py ...
+        prof = offline.profile_generation(rigify, bpy.context, metarig)
+        prof.write_json("rig_profile.json")
+
+    conformance.py checks the model against real Blender runs.
+"""
+
+import importlib.util
+import os
+import sys
+
+from . import fake_mathutils
+from . import fake_bpy
+from . import fake_rna_prop_ui
+
+stats = fake_bpy.stats
+reset_stats = fake_bpy.reset_stats
+reset = fake_bpy.reset
+
+
+def install():
+    """ Registers the fake modules as bpy, mathutils and rna_prop_ui.
+        Does nothing when running inside Blender.
+    """
+    if "bpy" in sys.modules and not getattr(sys.modules["bpy"], "_rigify_offline", False):
+        return False
+    fake_bpy._rigify_offline = True
+    sys.modules["bpy"] = fake_bpy
+    sys.modules["bpy.props"] = fake_bpy.props
+    sys.modules["bpy.types"] = fake_bpy.types
+    sys.modules["bpy.utils"] = fake_bpy.utils
+    sys.modules["mathutils"] = fake_mathutils
+    sys.modules["rna_prop_ui"] = fake_rna_prop_ui
+    return True
+
+
+def load_rigify(path=None, name="rigify"):
+    """ Imports the addon at path as a top level package and registers it.
+    """
+    install()
+    if name in sys.modules:
+        return sys.modules[name]
+    if path is None:
+        path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(name, os.path.join(path, "__init__.py"),
+                                                  submodule_search_locations=[path])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    module.register()
+    return module
+
+
+def profile_generation(rigify, context, metarig, full_rebuild=False):
+    """ Generates the rig of a metarig with Rigify's profiler active, and
+        returns the profiler.  Besides the usual counters, each generation
+        step, stage and rig gets a "bpy.<operation>" counter for every kind
+        of bpy operation it performed.
+    """
+    profiler = rigify.profiler
+    prof = profiler.Profiler()
+    fake_bpy.count_hook = lambda key, n: profiler.count("bpy." + key, n)
+    try:
+        with prof:
+            with profiler.span("Generate rig", metarig=metarig.name):
+                rigify.generate.generate_rig(context, metarig, full_rebuild)
+    finally:
+        fake_bpy.count_hook = None
+    return prof
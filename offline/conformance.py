@@ -0,0 +1,332 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Checks the offline model of the Blender API against real Blender.
+
+    blender -b --factory-startup --python rigify/offline/conformance.py -- --write reference.json
+    python rigify/offline/conformance.py --compare reference.json
+
+    The benchmark cases (every shipped metarig, and the sample of every rig
+    type) are generated, and the resulting rigs are reduced to a digest of
+    everything visible through the API: the bones, pose bones, constraints,
+    custom properties, drivers, widget meshes and rig UI script.  Run in
+    Blender, the digests are written as a reference file.  Run with plain
+    Python, the rigs are generated with the offline model instead, and
+    compared to the reference.  Every difference is printed, and the exit
+    code is non-zero if there are any.
+
+    Properties the reference has but the model doesn't are reported as not
+    modelled, which doesn't count as a difference.
+
+    Options:
+        --write PATH      Write the digests of this run to PATH.
+        --compare PATH    Compare the digests of this run to those in PATH.
+        --filter TEXT     Only run the cases whose name contains TEXT.
+        --profile DIR     Write the operation counts of every offline
+                          generation to DIR.
+        --tolerance X     Largest difference allowed between floats.
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+import importlib
+
+DIGEST_VERSION = 1
+
+# Properties which depend on the UI state rather than on what the rig
+# types did.
+SKIP_PROPERTIES = {
+    "rna_type", "select", "select_head", "select_tail", "show_expanded",
+    "active", "is_valid", "is_proxy_local", "error_location", "error_rotation",
+    }
+
+# Pose channels are evaluated by Blender, but not by the model.
+EVALUATED_PROPERTIES = {"head", "tail", "length", "matrix", "matrix_channel", "matrix_basis"}
+
+
+def parse_args(argv):
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    elif "bpy" not in sys.modules:
+        argv = argv[1:]
+    else:
+        argv = []
+
+    parser = argparse.ArgumentParser(
+        prog="conformance.py",
+        description="Check the offline model of the Blender API against real Blender.",
+        )
+    parser.add_argument("--write", default="")
+    parser.add_argument("--compare", default="")
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--profile", default="")
+    parser.add_argument("--tolerance", type=float, default=1e-4)
+    return parser.parse_args(argv)
+
+
+def load_rigify():
+    """ Loads Rigify, in Blender if this is running in it, and with the
+        offline model otherwise.  Returns the rigify package and a flag
+        telling whether the model is used.
+    """
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if "bpy" in sys.modules:
+        if os.path.dirname(directory) not in sys.path:
+            sys.path.insert(0, os.path.dirname(directory))
+        name = os.path.basename(directory)
+        rigify = importlib.import_module(name)
+        import bpy
+        if not hasattr(bpy.types.PoseBone, "rigify_type"):
+            rigify.register()
+        return rigify, False
+
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    import offline
+    return offline.load_rigify(directory), True
+
+
+#=============================================
+# Digests
+#=============================================
+
+def get_value(value):
+    """ Turns a property value into something JSON can store.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "bl_rna") and hasattr(value, "name"):
+        return value.name
+    if hasattr(value, "__len__"):
+        return [get_value(v) for v in value]
+    return str(value)
+
+
+def get_properties(struct, skip=()):
+    """ Returns the values of the writable RNA properties of a struct.
+    """
+    result = {}
+    for prop in struct.bl_rna.properties:
+        name = prop.identifier
+        if prop.is_readonly or prop.type == 'COLLECTION' or name in SKIP_PROPERTIES or name in skip:
+            continue
+        try:
+            value = getattr(struct, name)
+        except AttributeError:
+            continue
+        if name == "layers":
+            value = [i for i, on in enumerate(value) if on]
+        result[name] = get_value(value)
+    return result
+
+
+def get_custom_properties(struct):
+    result = {}
+    for key in struct.keys():
+        if key.startswith("rigify_") or key == "_RNA_UI":
+            continue
+        result[key] = get_value(struct[key])
+    return result
+
+
+def get_drivers(owner):
+    """ Returns the drivers of an ID block, keyed by path and index.
+    """
+    result = {}
+    if owner.animation_data is None:
+        return result
+    for fcurve in owner.animation_data.drivers:
+        driver = fcurve.driver
+        variables = {}
+        for var in driver.variables:
+            variables[var.name] = {
+                "type": var.type,
+                "targets": [get_properties(t) for t in var.targets],
+                }
+        key = "%s[%d]" % (fcurve.data_path, fcurve.array_index)
+        result[key] = {
+            "type": driver.type,
+            "expression": driver.expression if driver.type == 'SCRIPTED' else "",
+            "variables": variables,
+            "keyframes": [get_value(k.co) for k in fcurve.keyframe_points],
+            "modifiers": [get_properties(m) for m in fcurve.modifiers],
+            }
+    return result
+
+
+def get_digest(bpy, rig):
+    """ Returns a digest of a generated rig and the objects that came
+        with it.
+    """
+    rig_id = rig.data.get("rig_id", "")
+    bones = {}
+    for bone in rig.data.bones:
+        pose_bone = rig.pose.bones[bone.name]
+        bones[bone.name] = {
+            "bone": dict(get_properties(bone),
+                         head_local=get_value(bone.head_local),
+                         tail_local=get_value(bone.tail_local),
+                         matrix_local=get_value(bone.matrix_local)),
+            "pose": get_properties(pose_bone, EVALUATED_PROPERTIES),
+            "constraints": [dict(get_properties(c), type=c.type) for c in pose_bone.constraints],
+            "props": get_custom_properties(pose_bone),
+            }
+
+    widgets = {}
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH' and obj.users > 0:
+            widgets[obj.name] = {
+                "vertices": [get_value(v.co) for v in obj.data.vertices],
+                "edges": len(obj.data.edges),
+                }
+
+    text = bpy.data.texts.get("rig_ui.py")
+    return {
+        "bones": bones,
+        "drivers": dict(get_drivers(rig), **{"data." + k: v for k, v in get_drivers(rig.data).items()}),
+        "widgets": widgets,
+        "layers": [i for i, on in enumerate(rig.data.layers) if on],
+        "ui": text.as_string().replace(rig_id, "RIG_ID") if text and rig_id else "",
+        }
+
+
+#=============================================
+# Comparison
+#=============================================
+
+def compare(reference, value, tolerance, path, report):
+    """ Compares a digest to the reference, adding the differences to
+        report as (kind, path, message) tuples.
+    """
+    if isinstance(reference, dict) and isinstance(value, dict):
+        for key in sorted(set(reference) | set(value)):
+            sub = path + "/" + key
+            if key not in value:
+                report += [("unmodelled", sub, "")]
+            elif key not in reference:
+                report += [("mismatch", sub, "not in the reference")]
+            else:
+                compare(reference[key], value[key], tolerance, sub, report)
+    elif isinstance(reference, list) and isinstance(value, list):
+        if len(reference) != len(value):
+            report += [("mismatch", path, "%d items, expected %d" % (len(value), len(reference)))]
+        else:
+            for i, (a, b) in enumerate(zip(reference, value)):
+                compare(a, b, tolerance, "%s[%d]" % (path, i), report)
+    elif isinstance(reference, float) or isinstance(value, float):
+        if isinstance(reference, bool) or isinstance(value, bool) \
+           or not isinstance(reference, (int, float)) or not isinstance(value, (int, float)) \
+           or not math.isclose(reference, value, abs_tol=tolerance):
+            report += [("mismatch", path, "%r, expected %r" % (value, reference))]
+    elif reference != value:
+        if isinstance(reference, str) and isinstance(value, str) and "\n" in reference:
+            line = next(i for i, (a, b) in enumerate(zip(reference.splitlines() + [""], value.splitlines() + [""])) if a != b)
+            report += [("mismatch", path, "differs from line %d" % (line + 1))]
+        else:
+            report += [("mismatch", path, "%r, expected %r" % (value, reference))]
+
+
+def compare_digests(reference, digests, tolerance):
+    """ Prints the differences between two sets of digests, and returns the
+        number of mismatches.
+    """
+    mismatches = 0
+    for name in sorted(digests):
+        if name not in reference:
+            print("%-40s not in the reference" % name)
+            continue
+        report = []
+        compare(reference[name], digests[name], tolerance, "", report)
+        bad = [r for r in report if r[0] == "mismatch"]
+        unmodelled = len(report) - len(bad)
+        print("%-40s %s%s" % (name, "%d differences" % len(bad) if bad else "ok",
+                              ", %d not modelled" % unmodelled if unmodelled else ""))
+        for kind, path, message in bad[:20]:
+            print("    %s: %s" % (path, message))
+        if len(bad) > 20:
+            print("    ... and %d more" % (len(bad) - 20))
+        mismatches += len(bad)
+    return mismatches
+
+
+#=============================================
+# Main
+#=============================================
+
+def run_cases(args, rigify, is_offline):
+    import bpy
+    benchmark = importlib.import_module(rigify.__name__ + ".benchmark")
+    context = bpy.context
+    digests = {}
+    for name, create in benchmark.get_cases(rigify):
+        if args.filter not in name:
+            continue
+        benchmark.clear_scene(context)
+        metarig = benchmark.create_metarig(context, create)
+        try:
+            if is_offline and args.profile:
+                import offline
+                context.scene.objects.active = metarig
+                prof = offline.profile_generation(rigify, context, metarig)
+                prof.write_json(os.path.join(args.profile, name.replace(":", "-") + ".json"))
+            else:
+                benchmark.generate(context, rigify, metarig, False)
+            rig = next(obj for obj in context.scene.objects
+                       if obj.type == 'ARMATURE' and "rig_id" in obj.data)
+            digests[name] = get_digest(bpy, rig)
+        except Exception as e:
+            digests[name] = {"error": str(e) or e.__class__.__name__}
+    return digests
+
+
+def main():
+    args = parse_args(sys.argv)
+    if not args.write and not args.compare:
+        raise SystemExit("conformance.py: give --write or --compare")
+    if args.profile and not os.path.isdir(args.profile):
+        os.makedirs(args.profile)
+
+    rigify, is_offline = load_rigify()
+    digests = run_cases(args, rigify, is_offline)
+
+    if args.write:
+        import bpy
+        with open(args.write, 'w') as f:
+            json.dump({
+                "version": DIGEST_VERSION,
+                "blender": bpy.app.version_string,
+                "cases": digests,
+                }, f, indent=1, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            reference = json.load(f)
+        if reference.get("version") != DIGEST_VERSION:
+            raise SystemExit("conformance.py: %s has an unsupported version" % args.compare)
+        print("Comparing to %s (Blender %s)" % (args.compare, reference["blender"]))
+        if compare_digests(reference["cases"], digests, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2605 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" In-memory stand-in for the subset of bpy that Rigify uses.
+
+    It models armature objects, edit/pose bones, constraints, drivers,
+    widget meshes and the mode switching that ties them together closely
+    enough for the generator and the rig types to run outside of Blender.
+    Every modelled operation is tallied in `stats`, so the cost of a rig
+    can be measured as a count of operations rather than wall time.
+
+    This is not a general purpose replacement for bpy: it follows
+    Blender 2.7x behaviour only where Rigify depends on it.
+"""
+
+import copy as _copy
+import math
+import re
+import sys
+import tempfile
+from collections import Counter, OrderedDict
+
+from .fake_mathutils import Vector, Matrix, Quaternion, Euler
+
+MAX_ID_NAME = 63
+
+# Operation tallies, see reset_stats()
+stats = Counter()
+
+# Called as count_hook(key, n) for every tallied operation, if set
+count_hook = None
+
+
+def reset_stats():
+    """ Clears the operation counters.
+    """
+    stats.clear()
+
+
+def _count(key, n=1):
+    stats[key] += n
+    if count_hook is not None:
+        count_hook(key, n)
+
+
+#=============================================
+# Properties
+#=============================================
+
+class _PropDef(tuple):
+    """ A deferred property definition.  Like in Blender 2.7x this is a
+        (function, keywords) tuple, and it becomes a descriptor once it is
+        assigned to a struct class.
+    """
+    def __new__(cls, function, keywords):
+        return tuple.__new__(cls, (function, keywords))
+
+    @property
+    def function(self):
+        return self[0]
+
+    @property
+    def keywords(self):
+        return self[1]
+
+
+class _PropDescriptor:
+    def __init__(self, name, kind, keywords):
+        self.name = name
+        self.kind = kind
+        self.keywords = keywords
+
+    def default(self, owner):
+        kw = self.keywords
+        if self.kind == "PointerProperty":
+            return kw["type"]()
+        if self.kind == "CollectionProperty":
+            return _PropCollection(kw["type"])
+        if "default" in kw:
+            value = kw["default"]
+            if isinstance(value, (set, list, tuple)) and self.kind != "EnumProperty":
+                return list(value)
+            return value
+        if self.kind == "BoolProperty":
+            return False
+        if self.kind in ("IntProperty", "FloatProperty"):
+            return 0 if self.kind == "IntProperty" else 0.0
+        if self.kind == "StringProperty":
+            return ""
+        if self.kind.endswith("VectorProperty"):
+            size = kw.get("size", 3)
+            return [False if self.kind.startswith("Bool") else 0.0] * size
+        if self.kind == "EnumProperty":
+            items = kw.get("items", ())
+            if callable(items):
+                items = items(owner, context)
+            if kw.get("options") and "ENUM_FLAG" in kw["options"]:
+                return set()
+            return items[0][0] if items else ""
+        return None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        store = instance._idprops
+        if self.name not in store:
+            value = self.default(instance)
+            if self.kind in ("PointerProperty", "CollectionProperty"):
+                store[self.name] = value
+            return value
+        return store[self.name]
+
+    def __set__(self, instance, value):
+        if self.kind == "EnumProperty":
+            items = self.keywords.get("items", ())
+            if not callable(items) and value not in [i[0] for i in items]:
+                raise TypeError("enum \"%s\" not found in (%s)" % (value, ", ".join("'%s'" % i[0] for i in items)))
+        elif self.kind == "BoolVectorProperty" or self.kind == "FloatVectorProperty":
+            value = list(value)
+        elif self.kind in ("PointerProperty", "CollectionProperty"):
+            raise AttributeError("bpy_struct: attribute \"%s\" from \"%s\" is read-only" % (self.name, type(instance).__name__))
+        _count("rna.set")
+        instance._idprops[self.name] = value
+
+
+def _make_prop_function(kind):
+    def prop(**keywords):
+        return _PropDef(prop, keywords)
+    prop.__name__ = kind
+    return prop
+
+
+class _PropsModule:
+    pass
+
+
+props = _PropsModule()
+for _kind in ("BoolProperty", "BoolVectorProperty", "IntProperty", "IntVectorProperty",
+              "FloatProperty", "FloatVectorProperty", "StringProperty", "EnumProperty",
+              "PointerProperty", "CollectionProperty", "RemoveProperty"):
+    setattr(props, _kind, _make_prop_function(_kind))
+
+
+class _StructMeta(type):
+    """ Turns deferred property definitions assigned to a class into
+        descriptors, the way RNA registration does.
+    """
+    def __new__(mcls, name, bases, namespace):
+        cls = type.__new__(mcls, name, bases, {k: v for k, v in namespace.items() if not isinstance(v, _PropDef)})
+        for k, v in namespace.items():
+            if isinstance(v, _PropDef):
+                setattr(cls, k, v)
+        return cls
+
+    def __setattr__(cls, name, value):
+        if isinstance(value, _PropDef):
+            value = _PropDescriptor(name, value.function.__name__, value.keywords)
+        type.__setattr__(cls, name, value)
+
+
+#=============================================
+# RNA base
+#=============================================
+
+class _RNAProperty:
+    def __init__(self, identifier, type, is_readonly=False, array_length=0, fixed_type=None):
+        self.identifier = identifier
+        self.type = type
+        self.is_readonly = is_readonly
+        self.array_length = array_length
+        self.fixed_type = fixed_type
+        self.name = identifier
+
+
+class _BlRNA:
+    def __init__(self, cls):
+        self.identifier = cls.__name__
+        self.cls = cls
+
+    @property
+    def properties(self):
+        result = []
+        for klass in reversed(self.cls.__mro__):
+            for ident, spec in klass.__dict__.get("_rna_props", {}).items():
+                result.append(_RNAProperty(ident, *spec))
+        seen = set()
+        unique = []
+        for p in result:
+            if p.identifier not in seen:
+                seen.add(p.identifier)
+                unique.append(p)
+        return unique
+
+    def __eq__(self, other):
+        return isinstance(other, _BlRNA) and other.cls is self.cls
+
+    def __hash__(self):
+        return hash(self.cls)
+
+
+class _BlRNADescriptor:
+    def __get__(self, instance, owner):
+        return _BlRNA(owner)
+
+
+class bpy_struct(metaclass=_StructMeta):
+    """ Base for every modelled RNA struct.
+    """
+    # identifier -> (type, is_readonly, array_length)
+    _rna_props = OrderedDict([("rna_type", ("POINTER", True))])
+    bl_rna = _BlRNADescriptor()
+
+    def __init__(self):
+        object.__setattr__(self, "_idprops", OrderedDict())
+
+    @property
+    def rna_type(self):
+        return self.bl_rna
+
+    # Custom (ID) properties
+    def __getitem__(self, key):
+        return self._idprops[key]
+
+    def __setitem__(self, key, value):
+        _count("idprop.set")
+        if isinstance(value, bpy_struct):
+            value = _copy_group(value)
+        elif isinstance(value, (dict, list)):
+            value = _copy.deepcopy(value)
+        self._idprops[key] = value
+
+    def __delitem__(self, key):
+        del self._idprops[key]
+
+    def __contains__(self, key):
+        return key in self._idprops
+
+    def keys(self):
+        return list(self._idprops.keys())
+
+    def values(self):
+        return list(self._idprops.values())
+
+    def items(self):
+        return list(self._idprops.items())
+
+    def get(self, key, default=None):
+        return self._idprops.get(key, default)
+
+    # Animation
+    def path_from_id(self, prop=""):
+        base = self._path_from_id()
+        if prop:
+            if prop.startswith("["):
+                return base + prop
+            return (base + "." + prop) if base else prop
+        return base
+
+    def _path_from_id(self):
+        raise ValueError("%s.path_from_id() does not support path creation for this type" % type(self).__name__)
+
+    @property
+    def id_data(self):
+        return self._id_data()
+
+    def _id_data(self):
+        return None
+
+    def driver_add(self, path, index=-1):
+        id_data = self.id_data
+        full_path = self.path_from_id(path)
+        value = _resolve_value(self, path)
+        if index == -1 and isinstance(value, (list, tuple, Vector, Quaternion, Euler)):
+            return [id_data._driver_add(full_path, i, value[i]) for i in range(len(value))]
+        if index >= 0:
+            value = value[index]
+        return id_data._driver_add(full_path, max(index, 0), value)
+
+    def driver_remove(self, path, index=-1):
+        id_data = self.id_data
+        full_path = self.path_from_id(path)
+        ad = id_data.animation_data
+        if ad is None:
+            return False
+        found = False
+        for fc in list(ad.drivers):
+            if fc.data_path == full_path and (index == -1 or fc.array_index == index):
+                ad.drivers.remove(fc)
+                found = True
+        return found
+
+    def keyframe_insert(self, data_path, index=-1, frame=None, group=""):
+        id_data = self.id_data
+        full_path = self.path_from_id(data_path)
+        if frame is None:
+            frame = context.scene.frame_current
+        value = _resolve_value(self, data_path)
+        ad = id_data.animation_data_create()
+        if ad.action is None:
+            ad.action = data.actions.new(id_data.name + "Action")
+        indices = range(len(value)) if (index == -1 and hasattr(value, "__len__")) else [max(index, 0)]
+        for i in indices:
+            fc = ad.action.fcurves.find(full_path, i) or ad.action.fcurves.new(full_path, i, group)
+            v = value[i] if hasattr(value, "__len__") else value
+            fc.keyframe_points.insert(frame, float(v))
+        return True
+
+
+def _resolve_value(struct, path):
+    if path.startswith('["'):
+        return struct[path[2:-2]]
+    m = re.match(r'^pose\.bones\["([^"\]]*)"\](.*)$', path)
+    if m:
+        rest = m.group(2)
+        pb = struct.pose.bones[m.group(1)]
+        return _resolve_value(pb, rest[1:] if rest.startswith('.') else rest)
+    return getattr(struct, path)
+
+
+def _copy_group(group):
+    new = type(group)()
+    for k, v in group._idprops.items():
+        if isinstance(v, bpy_struct):
+            v = _copy_group(v)
+        else:
+            v = _copy.deepcopy(v)
+        new._idprops[k] = v
+    return new
+
+
+class _PropCollection:
+    """ Generic bpy_prop_collection with name lookup.
+    """
+    def __init__(self, item_type=None, items=None):
+        self._items = items if items is not None else []
+        self._item_type = item_type
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __bool__(self):
+        return len(self._items) > 0
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, slice)):
+            return self._items[key]
+        for item in self._items:
+            if getattr(item, "name", None) == key:
+                return item
+        raise KeyError("bpy_prop_collection[key]: key \"%s\" not found" % key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(getattr(item, "name", None) == key for item in self._items)
+        return any(item is key for item in self._items)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [item.name for item in self._items]
+
+    def values(self):
+        return list(self._items)
+
+    def items(self):
+        return [(item.name, item) for item in self._items]
+
+    def find(self, key):
+        for i, item in enumerate(self._items):
+            if getattr(item, "name", None) == key:
+                return i
+        return -1
+
+    def add(self):
+        item = self._item_type()
+        self._items.append(item)
+        return item
+
+    def remove(self, index):
+        del self._items[index]
+
+    def clear(self):
+        del self._items[:]
+
+    def foreach_get(self, attr, seq):
+        _count("foreach_get")
+        i = 0
+        for item in self._items:
+            value = getattr(item, attr)
+            if hasattr(value, "__len__") and not isinstance(value, str):
+                for v in value:
+                    seq[i] = v
+                    i += 1
+            else:
+                seq[i] = value
+                i += 1
+
+    def foreach_set(self, attr, seq):
+        _count("foreach_set")
+        seq = list(seq)
+        if not self._items:
+            return
+        sample = getattr(self._items[0], attr)
+        if hasattr(sample, "__len__") and not isinstance(sample, str):
+            n = len(sample)
+            if len(seq) != n * len(self._items):
+                raise RuntimeError("internal error setting the array")
+            for j, item in enumerate(self._items):
+                setattr(item, attr, seq[j * n:(j + 1) * n])
+        else:
+            if len(seq) != len(self._items):
+                raise RuntimeError("internal error setting the array")
+            for item, v in zip(self._items, seq):
+                setattr(item, attr, type(sample)(v) if isinstance(sample, (bool, int, float)) else v)
+
+
+#=============================================
+# ID datablocks
+#=============================================
+
+def _unique_name(name, taken):
+    name = _clip_name(name)
+    if name not in taken:
+        return name
+    base = re.sub(r"\.\d{3}$", "", name)
+    i = 1
+    while True:
+        suffix = ".%03d" % i
+        candidate = _clip_name(base, MAX_ID_NAME - len(suffix)) + suffix
+        if candidate not in taken:
+            return candidate
+        i += 1
+
+
+def _clip_name(name, limit=MAX_ID_NAME):
+    encoded = name.encode("utf-8")
+    if len(encoded) <= limit:
+        return name
+    return encoded[:limit].decode("utf-8", "ignore")
+
+
+class ID(bpy_struct):
+    _rna_props = OrderedDict([("name", ("STRING", False))])
+
+    def __init__(self, name):
+        bpy_struct.__init__(self)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "animation_data", None)
+        object.__setattr__(self, "users", 0)
+        object.__setattr__(self, "use_fake_user", False)
+
+    def __repr__(self):
+        return "bpy.data.%s[%r]" % (self._collection_name, self.name)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        coll = getattr(data, self._collection_name)
+        taken = set(i.name for i in coll if i is not self)
+        object.__setattr__(self, "_name", _unique_name(value, taken))
+
+    def _id_data(self):
+        return self
+
+    def _path_from_id(self):
+        return ""
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            object.__setattr__(self, "animation_data", AnimData(self))
+        return self.animation_data
+
+    def animation_data_clear(self):
+        object.__setattr__(self, "animation_data", None)
+
+    def _driver_add(self, path, index, value):
+        _count("driver_add")
+        ad = self.animation_data_create()
+        fc = ad.drivers.find(path, index)
+        if fc is not None:
+            return fc
+        fc = FCurve(path, index)
+        fc.driver = Driver()
+        if isinstance(value, bool):
+            fc.driver.expression = "True" if value else "False"
+        elif isinstance(value, int):
+            fc.driver.expression = "%d" % value
+        elif isinstance(value, float):
+            fc.driver.expression = "%.3f" % value
+        fc.modifiers.new(type='GENERATOR')
+        ad.drivers._items.append(fc)
+        return fc
+
+    def user_clear(self):
+        object.__setattr__(self, "users", 0)
+
+    def copy(self):
+        new = _copy.copy(self)
+        object.__setattr__(new, "_idprops", _copy.deepcopy(self._idprops))
+        coll = getattr(data, self._collection_name)
+        object.__setattr__(new, "_name", _unique_name(self.name, set(coll.keys())))
+        coll._items.append(new)
+        return new
+
+
+class _IDCollection(_PropCollection):
+    def __init__(self, id_type, collection_name):
+        _PropCollection.__init__(self)
+        self._id_type = id_type
+        self._collection_name = collection_name
+
+    def _new(self, name, *args):
+        _count("%s.new" % self._collection_name)
+        item = self._id_type(_unique_name(name, set(self.keys())), *args)
+        self._items.append(item)
+        return item
+
+    def new(self, name, *args, **kwargs):
+        return self._new(name, *args)
+
+    def remove(self, item, do_unlink=True):
+        _count("%s.remove" % self._collection_name)
+        self._items.remove(item)
+        if isinstance(item, Object):
+            for scene in data.scenes:
+                if item in scene.objects._items:
+                    scene.objects._items.remove(item)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self._items:
+                if item._name == key:
+                    return item
+            raise KeyError("bpy_prop_collection[key]: key \"%s\" not found" % key)
+        return self._items[key]
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(item._name == key for item in self._items)
+        return any(item is key for item in self._items)
+
+
+class AnimData(bpy_struct):
+    def __init__(self, id_data):
+        bpy_struct.__init__(self)
+        self._owner = id_data
+        self.drivers = _Drivers()
+        self.action = None
+
+    def _id_data(self):
+        return self._owner
+
+
+class _Drivers(_PropCollection):
+    def find(self, data_path, index=0):
+        for fc in self._items:
+            if fc.data_path == data_path and fc.array_index == index:
+                return fc
+        return None
+
+    def from_existing(self, src_driver=None):
+        fc = _copy.deepcopy(src_driver)
+        self._items.append(fc)
+        return fc
+
+    def remove(self, fcurve):
+        self._items.remove(fcurve)
+
+
+class Text(ID):
+    _collection_name = "texts"
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self._body = []
+        self.use_module = False
+
+    def clear(self):
+        self._body = []
+
+    def write(self, text):
+        self._body.append(text)
+
+    def as_string(self):
+        return "".join(self._body)
+
+
+class Action(ID):
+    _collection_name = "actions"
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.fcurves = _ActionFCurves()
+
+
+class _ActionFCurves(_PropCollection):
+    def new(self, data_path, index=0, action_group=""):
+        if self.find(data_path, index) is not None:
+            raise RuntimeError("F-Curve '%s[%d]' already exists in action" % (data_path, index))
+        fc = FCurve(data_path, index)
+        fc.group = action_group
+        self._items.append(fc)
+        return fc
+
+    def find(self, data_path, index=0):
+        for fc in self._items:
+            if fc.data_path == data_path and fc.array_index == index:
+                return fc
+        return None
+
+    def remove(self, fcurve):
+        self._items.remove(fcurve)
+
+
+#=============================================
+# F-Curves and drivers
+#=============================================
+
+class Keyframe(bpy_struct):
+    _rna_props = OrderedDict([
+        ("select_control_point", ("BOOLEAN", False)),
+        ("select_left_handle", ("BOOLEAN", False)),
+        ("select_right_handle", ("BOOLEAN", False)),
+        ("handle_left_type", ("ENUM", False)),
+        ("handle_right_type", ("ENUM", False)),
+        ("interpolation", ("ENUM", False)),
+        ("type", ("ENUM", False)),
+        ("easing", ("ENUM", False)),
+        ("back", ("FLOAT", False)),
+        ("amplitude", ("FLOAT", False)),
+        ("period", ("FLOAT", False)),
+        ("co", ("FLOAT", False, 2)),
+        ("handle_left", ("FLOAT", False, 2)),
+        ("handle_right", ("FLOAT", False, 2)),
+    ])
+
+    def __init__(self, frame=0.0, value=0.0):
+        bpy_struct.__init__(self)
+        self._co = Vector((frame, value))
+        self._handle_left = Vector((frame - 1.0, value))
+        self._handle_right = Vector((frame + 1.0, value))
+        self.select_control_point = False
+        self.select_left_handle = False
+        self.select_right_handle = False
+        self.handle_left_type = 'AUTO_CLAMPED'
+        self.handle_right_type = 'AUTO_CLAMPED'
+        self.interpolation = 'BEZIER'
+        self.type = 'KEYFRAME'
+        self.easing = 'AUTO'
+        self.back = 1.70158
+        self.amplitude = 0.8
+        self.period = 4.1
+
+    def _vec(name):
+        def get(self):
+            return getattr(self, name)
+
+        def set(self, value):
+            getattr(self, name)[:] = tuple(value)
+        return property(get, set)
+    co = _vec("_co")
+    handle_left = _vec("_handle_left")
+    handle_right = _vec("_handle_right")
+    del _vec
+
+
+class _KeyframePoints(_PropCollection):
+    def add(self, count=1):
+        _count("keyframe_points.add")
+        self._items.extend(Keyframe() for i in range(count))
+
+    def insert(self, frame, value, options=set()):
+        _count("keyframe_points.insert")
+        for k in self._items:
+            if k.co[0] == frame:
+                k.co[1] = value
+                return k
+        k = Keyframe(frame, value)
+        self._items.append(k)
+        self._items.sort(key=lambda k: k.co[0])
+        return k
+
+    def remove(self, keyframe, fast=False):
+        self._items.remove(keyframe)
+
+
+class FModifier(bpy_struct):
+    _rna_props = OrderedDict([
+        ("mode", ("ENUM", False)),
+        ("active", ("BOOLEAN", False)),
+        ("mute", ("BOOLEAN", False)),
+        ("show_expanded", ("BOOLEAN", False)),
+        ("use_additive", ("BOOLEAN", False)),
+        ("use_restricted_range", ("BOOLEAN", False)),
+        ("use_influence", ("BOOLEAN", False)),
+        ("poly_order", ("INT", False)),
+        ("coefficients", ("FLOAT", False, 2)),
+        ("type", ("ENUM", True)),
+    ])
+
+    def __init__(self, type):
+        bpy_struct.__init__(self)
+        self.type = type
+        self.mode = 'POLYNOMIAL'
+        self.active = True
+        self.mute = False
+        self.show_expanded = True
+        self.use_additive = False
+        self.use_restricted_range = False
+        self.use_influence = False
+        self.poly_order = 1
+        self.coefficients = [0.0, 1.0]
+
+
+class _FModifiers(_PropCollection):
+    def new(self, type):
+        m = FModifier(type)
+        self._items.append(m)
+        return m
+
+    def remove(self, modifier):
+        self._items.remove(modifier)
+
+
+class DriverTarget(bpy_struct):
+    _rna_props = OrderedDict([
+        ("id_type", ("ENUM", False)),
+        ("id", ("POINTER", False)),
+        ("data_path", ("STRING", False)),
+        ("bone_target", ("STRING", False)),
+        ("transform_type", ("ENUM", False)),
+        ("transform_space", ("ENUM", False)),
+    ])
+
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self.id_type = 'OBJECT'
+        self.id = None
+        self.data_path = ""
+        self.bone_target = ""
+        self.transform_type = 'LOC_X'
+        self.transform_space = 'WORLD_SPACE'
+
+
+_TARGET_COUNTS = {'SINGLE_PROP': 1, 'TRANSFORMS': 1, 'ROTATION_DIFF': 2, 'LOC_DIFF': 2}
+
+
+class DriverVariable(bpy_struct):
+    _rna_props = OrderedDict([
+        ("name", ("STRING", False)),
+        ("type", ("ENUM", False)),
+        ("targets", ("COLLECTION", True)),
+        ("is_name_valid", ("BOOLEAN", True)),
+    ])
+
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self.name = "var"
+        self._targets = [DriverTarget() for i in range(2)]
+        self._type = 'SINGLE_PROP'
+
+    @property
+    def type(self):
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        if value not in _TARGET_COUNTS:
+            raise TypeError("enum \"%s\" not found" % value)
+        self._type = value
+        if value != 'SINGLE_PROP':
+            for t in self._targets:
+                t.id_type = 'OBJECT'
+
+    @property
+    def targets(self):
+        return _PropCollection(DriverTarget, self._targets[:_TARGET_COUNTS[self._type]])
+
+    @property
+    def is_name_valid(self):
+        return True
+
+
+class _DriverVariables(_PropCollection):
+    def new(self):
+        v = DriverVariable()
+        self._items.append(v)
+        return v
+
+    def remove(self, variable):
+        self._items.remove(variable)
+
+
+class Driver(bpy_struct):
+    _rna_props = OrderedDict([
+        ("type", ("ENUM", False)),
+        ("expression", ("STRING", False)),
+        ("use_self", ("BOOLEAN", False)),
+        ("show_debug_info", ("BOOLEAN", False)),
+        ("is_valid", ("BOOLEAN", False)),
+        ("variables", ("COLLECTION", True)),
+    ])
+
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self.type = 'SCRIPTED'
+        self.expression = ""
+        self.use_self = False
+        self.show_debug_info = False
+        self.is_valid = True
+        self.variables = _DriverVariables()
+
+    def __setattr__(self, name, value):
+        if name == "variables" and getattr(self, name, None) is not None:
+            raise AttributeError("bpy_struct: attribute \"variables\" from \"Driver\" is read-only")
+        bpy_struct.__setattr__(self, name, value)
+
+
+class FCurve(bpy_struct):
+    _rna_props = OrderedDict([
+        ("data_path", ("STRING", False)),
+        ("array_index", ("INT", False)),
+        ("group", ("POINTER", False)),
+        ("extrapolation", ("ENUM", False)),
+        ("color_mode", ("ENUM", False)),
+        ("color", ("FLOAT", False, 3)),
+        ("lock", ("BOOLEAN", False)),
+        ("mute", ("BOOLEAN", False)),
+        ("hide", ("BOOLEAN", False)),
+        ("select", ("BOOLEAN", False)),
+        ("use_auto_handle_clamp", ("BOOLEAN", False)),
+        ("is_valid", ("BOOLEAN", False)),
+        ("driver", ("POINTER", True)),
+        ("keyframe_points", ("COLLECTION", True)),
+        ("modifiers", ("COLLECTION", True)),
+    ])
+
+    def __init__(self, data_path, index=0):
+        bpy_struct.__init__(self)
+        self.data_path = data_path
+        self.array_index = index
+        self.group = None
+        self.extrapolation = 'CONSTANT'
+        self.color_mode = 'AUTO_RAINBOW'
+        self.color = [0.0, 0.0, 0.0]
+        self.lock = False
+        self.mute = False
+        self.hide = False
+        self.select = False
+        self.use_auto_handle_clamp = True
+        self.is_valid = True
+        self.driver = None
+        self.keyframe_points = _KeyframePoints(Keyframe)
+        self.modifiers = _FModifiers()
+
+    def __setattr__(self, name, value):
+        # Read-only in Blender once the fcurve exists
+        if name in ("driver", "keyframe_points", "modifiers") and getattr(self, name, None) is not None:
+            raise AttributeError("bpy_struct: attribute \"%s\" from \"FCurve\" is read-only" % name)
+        bpy_struct.__setattr__(self, name, value)
+
+    def update(self):
+        self.keyframe_points._items.sort(key=lambda k: k.co[0])
+
+    def evaluate(self, frame):
+        pts = self.keyframe_points._items
+        if not pts:
+            return 0.0
+        if frame <= pts[0].co[0]:
+            return pts[0].co[1]
+        for a, b in zip(pts, pts[1:]):
+            if a.co[0] <= frame <= b.co[0]:
+                t = (frame - a.co[0]) / ((b.co[0] - a.co[0]) or 1.0)
+                return a.co[1] + (b.co[1] - a.co[1]) * t
+        return pts[-1].co[1]
+
+
+#=============================================
+# Constraints
+#=============================================
+
+_CON_COMMON = OrderedDict([
+    ("name", "Constraint"),
+    ("mute", False),
+    ("influence", 1.0),
+    ("owner_space", 'WORLD'),
+    ("target_space", 'WORLD'),
+    ("show_expanded", True),
+    ("active", True),
+    ("is_proxy_local", False),
+])
+
+_CON_TARGET = OrderedDict([("target", None), ("subtarget", "")])
+
+_CON_TYPES = {
+    'COPY_LOCATION': ("Copy Location", OrderedDict([
+        ("use_x", True), ("use_y", True), ("use_z", True),
+        ("invert_x", False), ("invert_y", False), ("invert_z", False),
+        ("use_offset", False), ("head_tail", 0.0), ("use_bbone_shape", False)])),
+    'COPY_ROTATION': ("Copy Rotation", OrderedDict([
+        ("use_x", True), ("use_y", True), ("use_z", True),
+        ("invert_x", False), ("invert_y", False), ("invert_z", False),
+        ("use_offset", False)])),
+    'COPY_SCALE': ("Copy Scale", OrderedDict([
+        ("use_x", True), ("use_y", True), ("use_z", True),
+        ("use_offset", False), ("use_add", False)])),
+    'COPY_TRANSFORMS': ("Copy Transforms", OrderedDict([
+        ("head_tail", 0.0), ("use_bbone_shape", False)])),
+    'STRETCH_TO': ("Stretch To", OrderedDict([
+        ("head_tail", 0.0), ("use_bbone_shape", False), ("rest_length", 0.0),
+        ("bulge", 1.0), ("use_bulge_min", False), ("use_bulge_max", False),
+        ("bulge_min", 1.0), ("bulge_max", 1.0), ("bulge_smooth", 0.0),
+        ("volume", 'VOLUME_XZX'), ("keep_axis", 'PLANE_X')])),
+    'DAMPED_TRACK': ("Damped Track", OrderedDict([
+        ("head_tail", 0.0), ("use_bbone_shape", False), ("track_axis", 'TRACK_Y')])),
+    'IK': ("IK", OrderedDict([
+        ("pole_target", None), ("pole_subtarget", ""), ("pole_angle", 0.0),
+        ("chain_count", 0), ("iterations", 500), ("use_tail", True),
+        ("use_stretch", True), ("use_location", True), ("use_rotation", False),
+        ("weight", 1.0), ("orient_weight", 0.25), ("ik_type", 'COPY_POSE'),
+        ("reference_axis", 'BONE'), ("lock_location_x", False),
+        ("lock_location_y", False), ("lock_location_z", False),
+        ("lock_rotation_x", False), ("lock_rotation_y", False),
+        ("lock_rotation_z", False), ("limit_mode", 'LIMITDIST_INSIDE'),
+        ("distance", 0.0)])),
+    'LIMIT_ROTATION': ("Limit Rotation", OrderedDict([
+        ("use_limit_x", False), ("use_limit_y", False), ("use_limit_z", False),
+        ("min_x", 0.0), ("max_x", 0.0), ("min_y", 0.0), ("max_y", 0.0),
+        ("min_z", 0.0), ("max_z", 0.0), ("use_transform_limit", False)])),
+    'LIMIT_LOCATION': ("Limit Location", OrderedDict([
+        ("use_min_x", False), ("use_min_y", False), ("use_min_z", False),
+        ("use_max_x", False), ("use_max_y", False), ("use_max_z", False),
+        ("min_x", 0.0), ("max_x", 0.0), ("min_y", 0.0), ("max_y", 0.0),
+        ("min_z", 0.0), ("max_z", 0.0), ("use_transform_limit", False)])),
+    'LIMIT_SCALE': ("Limit Scale", OrderedDict([
+        ("use_min_x", False), ("use_min_y", False), ("use_min_z", False),
+        ("use_max_x", False), ("use_max_y", False), ("use_max_z", False),
+        ("min_x", 0.0), ("max_x", 0.0), ("min_y", 0.0), ("max_y", 0.0),
+        ("min_z", 0.0), ("max_z", 0.0), ("use_transform_limit", False)])),
+    'LIMIT_DISTANCE': ("Limit Distance", OrderedDict([
+        ("head_tail", 0.0), ("use_bbone_shape", False), ("distance", 0.0),
+        ("limit_mode", 'LIMITDIST_INSIDE'), ("use_transform_limit", False)])),
+    'MAINTAIN_VOLUME': ("Maintain Volume", OrderedDict([
+        ("free_axis", 'SAMEVOL_Y'), ("volume", 1.0)])),
+    'CHILD_OF': ("Child Of", OrderedDict([
+        ("use_location_x", True), ("use_location_y", True), ("use_location_z", True),
+        ("use_rotation_x", True), ("use_rotation_y", True), ("use_rotation_z", True),
+        ("use_scale_x", True), ("use_scale_y", True), ("use_scale_z", True),
+        ("inverse_matrix", None)])),
+    'TRANSFORM': ("Transformation", OrderedDict([
+        ("use_motion_extrapolate", False), ("map_from", 'LOCATION'), ("map_to", 'LOCATION'),
+        ("map_to_x_from", 'X'), ("map_to_y_from", 'Y'), ("map_to_z_from", 'Z'),
+        ("from_min_x", 0.0), ("from_max_x", 0.0), ("from_min_y", 0.0), ("from_max_y", 0.0),
+        ("from_min_z", 0.0), ("from_max_z", 0.0), ("to_min_x", 0.0), ("to_max_x", 0.0),
+        ("to_min_y", 0.0), ("to_max_y", 0.0), ("to_min_z", 0.0), ("to_max_z", 0.0)])),
+    'LOCKED_TRACK': ("Locked Track", OrderedDict([
+        ("head_tail", 0.0), ("track_axis", 'TRACK_Y'), ("lock_axis", 'LOCK_Z')])),
+    'TRACK_TO': ("Track To", OrderedDict([
+        ("head_tail", 0.0), ("track_axis", 'TRACK_Y'), ("up_axis", 'UP_Z'),
+        ("use_target_z", False)])),
+}
+
+_CON_NO_TARGET = {'LIMIT_ROTATION', 'LIMIT_LOCATION', 'LIMIT_SCALE', 'MAINTAIN_VOLUME'}
+
+
+class Constraint(bpy_struct):
+    def __init__(self, owner, type):
+        bpy_struct.__init__(self)
+        if type not in _CON_TYPES:
+            raise TypeError("Constraint.new(): enum \"%s\" not found" % type)
+        label, fields = _CON_TYPES[type]
+        attrs = OrderedDict(_CON_COMMON)
+        attrs["name"] = label
+        if type not in _CON_NO_TARGET:
+            attrs.update(_CON_TARGET)
+        attrs.update(fields)
+        object.__setattr__(self, "_owner", owner)
+        object.__setattr__(self, "_type", type)
+        object.__setattr__(self, "_attrs", attrs)
+
+    @property
+    def type(self):
+        return self._type
+
+    @property
+    def bl_rna(self):
+        return _ConstraintRNA(self)
+
+    def __getattr__(self, name):
+        attrs = object.__getattribute__(self, "_attrs")
+        if name in attrs:
+            value = attrs[name]
+            if name in ("target", "pole_target") and value is not None and value.name not in data.objects:
+                return None
+            return value
+        raise AttributeError("'%s' object has no attribute '%s'" % (self._type, name))
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        attrs = self._attrs
+        if name not in attrs:
+            raise AttributeError("bpy_struct: attribute \"%s\" from \"%s\" is read-only" % (name, self._type))
+        _count("rna.set")
+        if name == "name":
+            # Constraint names are kept unique per owner, like in Blender
+            siblings = self._owner.constraints._items
+            value = _unique_name(value, set(c._attrs["name"] for c in siblings if c is not self))
+        attrs[name] = value
+
+    def __dir__(self):
+        return list(self._attrs.keys()) + ["type", "bl_rna", "rna_type", "driver_add", "driver_remove", "path_from_id"]
+
+    def _id_data(self):
+        return self._owner.id_data
+
+    def _path_from_id(self):
+        return self._owner._path_from_id() + '.constraints["%s"]' % self.name
+
+
+class _ConstraintRNA:
+    def __init__(self, con):
+        self.identifier = con._type
+        self._con = con
+
+    @property
+    def properties(self):
+        result = [_RNAProperty("rna_type", "POINTER", True), _RNAProperty("type", "ENUM", True)]
+        for k, v in self._con._attrs.items():
+            if isinstance(v, bool):
+                t = "BOOLEAN"
+            elif isinstance(v, int):
+                t = "INT"
+            elif isinstance(v, float):
+                t = "FLOAT"
+            elif isinstance(v, str) and k in ("name", "subtarget", "pole_subtarget"):
+                t = "STRING"
+            elif isinstance(v, str):
+                t = "ENUM"
+            else:
+                t = "POINTER"
+            result.append(_RNAProperty(k, t, k in ("active", "is_proxy_local") and False))
+        return result
+
+    def __eq__(self, other):
+        return isinstance(other, _ConstraintRNA) and other.identifier == self.identifier
+
+    def __hash__(self):
+        return hash(("CONSTRAINT", self.identifier))
+
+
+class _Constraints(_PropCollection):
+    def __init__(self, owner):
+        _PropCollection.__init__(self)
+        self._owner = owner
+
+    def new(self, type):
+        _count("constraints.new")
+        con = Constraint(self._owner, type)
+        names = set(c.name for c in self._items)
+        con._attrs["name"] = _unique_name(con.name, names)
+        self._items.append(con)
+        return con
+
+    def remove(self, constraint):
+        self._items.remove(constraint)
+
+
+#=============================================
+# Bones
+#=============================================
+
+def _vec_roll_to_mat3(vec, roll):
+    """ Port of Blender's vec_roll_to_mat3().  Returns a 3x3 matrix whose
+        Y axis points along vec, rolled around it by roll.
+    """
+    nor = Vector(vec).normalized()
+    x, y, z = nor
+    theta = 1.0 + y
+    b = [[0.0] * 3 for i in range(3)]  # column-major, b[col][row]
+    if theta > 1.0e-5 or ((x or z) and theta > 1.0e-9):
+        b[0][1] = -x
+        b[1][0] = x
+        b[1][1] = y
+        b[1][2] = z
+        b[2][1] = -z
+        if theta > 1.0e-5:
+            b[0][0] = 1 - x * x / theta
+            b[2][2] = 1 - z * z / theta
+            b[2][0] = b[0][2] = -x * z / theta
+        else:
+            theta = x * x + z * z
+            b[0][0] = (x + z) * (x - z) / -theta
+            b[2][2] = -b[0][0]
+            b[2][0] = b[0][2] = 2.0 * x * z / theta
+    else:
+        b = [[-1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [0.0, 0.0, 1.0]]
+    bmat = Matrix([[b[c][r] for c in range(3)] for r in range(3)])
+    rmat = Matrix.Rotation(roll, 3, nor)
+    return rmat * bmat
+
+
+def _mat3_to_roll(mat):
+    vec = Vector([mat[r][1] for r in range(3)])
+    vecmat = _vec_roll_to_mat3(vec, 0.0)
+    rollmat = vecmat.inverted() * mat
+    return math.atan2(rollmat[0][2], rollmat[2][2])
+
+
+class _BoneRecord:
+    """ Armature-level storage for one bone, shared by Bone and EditBone.
+    """
+    FLAGS = OrderedDict([
+        ("use_connect", False),
+        ("use_deform", True),
+        ("use_inherit_rotation", True),
+        ("use_inherit_scale", True),
+        ("use_local_location", True),
+        ("use_relative_parent", False),
+        ("use_envelope_multiply", False),
+        ("use_cyclic_offset", True),
+        ("show_wire", False),
+        ("hide", False),
+        ("hide_select", False),
+        ("select", False),
+        ("select_head", False),
+        ("select_tail", False),
+        ("lock", False),
+        ("bbone_segments", 1),
+        ("bbone_in", 1.0),
+        ("bbone_out", 1.0),
+        ("bbone_x", 0.1),
+        ("bbone_z", 0.1),
+        ("envelope_distance", 0.25),
+        ("envelope_weight", 1.0),
+        ("head_radius", 0.1),
+        ("tail_radius", 0.1),
+    ])
+
+    def __init__(self, name):
+        self.name = name
+        self.head = Vector((0.0, 0.0, 0.0))
+        self.tail = Vector((0.0, 1.0, 0.0))
+        self.roll = 0.0
+        self.parent = None
+        self.layers = [i == 0 for i in range(32)]
+        for k, v in self.FLAGS.items():
+            setattr(self, k, v)
+        self.idprops = OrderedDict()
+
+    def copy(self):
+        r = _BoneRecord(self.name)
+        r.head = self.head.copy()
+        r.tail = self.tail.copy()
+        r.roll = self.roll
+        r.parent = self.parent
+        r.layers = list(self.layers)
+        for k in self.FLAGS:
+            setattr(r, k, getattr(self, k))
+        r.idprops = _copy.deepcopy(self.idprops)
+        return r
+
+
+def _make_flag_property(name):
+    def get(self):
+        return getattr(self._rec, name)
+
+    def set(self, value):
+        _count("rna.set")
+        setattr(self._rec, name, type(_BoneRecord.FLAGS[name])(value))
+    return property(get, set)
+
+
+class _BoneBase(bpy_struct):
+    _rna_props = OrderedDict([("name", ("STRING", False))] +
+                             [(k, ("BOOLEAN" if isinstance(v, bool) else ("INT" if isinstance(v, int) else "FLOAT"), False)) for k, v in _BoneRecord.FLAGS.items()] +
+                             [("layers", ("BOOLEAN", False, 32))])
+
+    for _name in _BoneRecord.FLAGS:
+        locals()[_name] = _make_flag_property(_name)
+    del _name
+
+    def __init__(self, armature, rec):
+        object.__setattr__(self, "_arm", armature)
+        object.__setattr__(self, "_rec", rec)
+
+    @property
+    def _idprops(self):
+        return self._rec.idprops
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._rec is self._rec
+
+    def __hash__(self):
+        return id(self._rec)
+
+    def __repr__(self):
+        return "bpy.data.armatures[%r].%s[%r]" % (self._arm.name, self._coll_name, self.name)
+
+    def _id_data(self):
+        return self._arm
+
+    @property
+    def layers(self):
+        return _LiveArray(self._rec.layers)
+
+    @layers.setter
+    def layers(self, value):
+        _count("rna.set")
+        value = [bool(v) for v in value]
+        if len(value) != 32:
+            raise ValueError("bpy_struct: layers expected 32 items")
+        self._rec.layers[:] = value
+
+    @property
+    def basename(self):
+        return self.name.split(".")[0]
+
+    @property
+    def parent_recursive(self):
+        result = []
+        p = self.parent
+        while p is not None:
+            result.append(p)
+            p = p.parent
+        return result
+
+    @property
+    def children_recursive(self):
+        result = []
+        for c in self.children:
+            result.append(c)
+            result.extend(c.children_recursive)
+        return result
+
+    def parent_index(self, parent_test):
+        i = 0
+        p = self.parent
+        while p is not None:
+            i += 1
+            if p == parent_test:
+                return i
+            p = p.parent
+        return 0
+
+    @property
+    def x_axis(self):
+        return self.matrix.to_3x3() * Vector((1.0, 0.0, 0.0))
+
+    @property
+    def y_axis(self):
+        return self.matrix.to_3x3() * Vector((0.0, 1.0, 0.0))
+
+    @property
+    def z_axis(self):
+        return self.matrix.to_3x3() * Vector((0.0, 0.0, 1.0))
+
+    @property
+    def vector(self):
+        return self.tail - self.head
+
+    @property
+    def center(self):
+        return (self.head + self.tail) * 0.5
+
+
+class _LiveArray(list):
+    """ List view that writes back into its source, like bpy_prop_array.
+    """
+    def __init__(self, source):
+        list.__init__(self, source)
+        self._source = source
+
+    def __setitem__(self, i, value):
+        list.__setitem__(self, i, value)
+        self._source[i] = value
+
+
+class EditBone(_BoneBase):
+    _coll_name = "edit_bones"
+
+    @property
+    def name(self):
+        return self._rec.name
+
+    @name.setter
+    def name(self, value):
+        self._arm._rename_bone(self._rec, value)
+
+    @property
+    def head(self):
+        return _BoneVector(self, "head")
+
+    @head.setter
+    def head(self, value):
+        _count("rna.set")
+        self._rec.head[:] = tuple(value)
+        self._transform_update()
+
+    @property
+    def tail(self):
+        return _BoneVector(self, "tail")
+
+    @tail.setter
+    def tail(self, value):
+        _count("rna.set")
+        self._rec.tail[:] = tuple(value)
+        self._transform_update()
+
+    @property
+    def roll(self):
+        return self._rec.roll
+
+    @roll.setter
+    def roll(self, value):
+        _count("rna.set")
+        self._rec.roll = float(value)
+
+    @property
+    def parent(self):
+        p = self._rec.parent
+        return EditBone(self._arm, p) if p is not None else None
+
+    @parent.setter
+    def parent(self, value):
+        _count("rna.set")
+        if value is None:
+            self._rec.parent = None
+            self._rec.use_connect = False
+            return
+        # Refuse cycles like Blender does
+        p = value._rec
+        while p is not None:
+            if p is self._rec:
+                return
+            p = p.parent
+        self._rec.parent = value._rec
+        if self._rec.use_connect:
+            self._rec.head[:] = tuple(value._rec.tail)
+
+    @property
+    def use_connect(self):
+        return self._rec.use_connect
+
+    @use_connect.setter
+    def use_connect(self, value):
+        _count("rna.set")
+        self._rec.use_connect = bool(value)
+        if value and self._rec.parent is not None:
+            self._rec.head[:] = tuple(self._rec.parent.tail)
+
+    @property
+    def children(self):
+        return [EditBone(self._arm, r) for r in self._arm._edit_records if r.parent is self._rec]
+
+    def _transform_update(self):
+        rec = self._rec
+        if rec.parent is not None and rec.use_connect:
+            rec.parent.tail[:] = tuple(rec.head)
+        for child in self._arm._edit_records:
+            if child.parent is rec and child.use_connect:
+                child.head[:] = tuple(rec.tail)
+
+    @property
+    def length(self):
+        return (self._rec.tail - self._rec.head).length
+
+    @length.setter
+    def length(self, value):
+        d = (self._rec.tail - self._rec.head).normalized()
+        self.tail = self._rec.head + d * value
+
+    @property
+    def matrix(self):
+        m = _vec_roll_to_mat3(self._rec.tail - self._rec.head, self._rec.roll).to_4x4()
+        m.translation = self._rec.head
+        return m
+
+    @matrix.setter
+    def matrix(self, mat):
+        _count("rna.set")
+        mat = Matrix(mat)
+        length = self.length
+        m3 = mat.to_3x3().normalized()
+        head = mat.translation
+        y = Vector([m3[r][1] for r in range(3)])
+        self._rec.head[:] = tuple(head)
+        self._rec.tail[:] = tuple(head + y * length)
+        self._rec.roll = _mat3_to_roll(m3)
+        self._transform_update()
+
+    def translate(self, vec):
+        self.head = self._rec.head + Vector(vec)
+        self.tail = self._rec.tail + Vector(vec)
+
+    def transform(self, matrix, scale=True, roll=True):
+        z_vec = self.matrix.to_3x3() * Vector((0.0, 0.0, 1.0))
+        self.tail = Matrix(matrix) * self._rec.tail
+        self.head = Matrix(matrix) * self._rec.head
+        if roll:
+            self.align_roll(Matrix(matrix).to_3x3() * z_vec)
+
+    def align_roll(self, vector):
+        vector = Vector(vector)
+        nor = self._rec.tail - self._rec.head
+        mat = _vec_roll_to_mat3(nor, 0.0)
+        z = Vector([mat[r][2] for r in range(3)])
+        if vector.length > 0 and vector.angle(z, 0.0) > 1.0e-7:
+            proj = vector.project(nor)
+            align_proj = vector - proj
+            roll = align_proj.angle(z, 0.0)
+            if z.cross(align_proj).dot(nor) < 0.0:
+                roll = -roll
+            self._rec.roll = roll
+
+
+class _BoneVector(Vector):
+    """ Vector bound to an edit bone's head or tail, so in-place edits
+        (bone.head[:] = ..., bone.head.x = ...) write back.
+    """
+    __slots__ = ("_bone", "_attr")
+
+    def __init__(self, bone, attr):
+        Vector.__init__(self, getattr(bone._rec, attr))
+        object.__setattr__(self, "_bone", bone)
+        object.__setattr__(self, "_attr", attr)
+
+    def _write(self):
+        setattr(self._bone, self._attr, Vector(self._v))
+
+    def __setitem__(self, i, value):
+        Vector.__setitem__(self, i, value)
+        self._write()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in ("x", "y", "z"):
+            self._write()
+
+    def __iadd__(self, other):
+        Vector.__iadd__(self, other)
+        self._write()
+        return self
+
+    def __isub__(self, other):
+        Vector.__isub__(self, other)
+        self._write()
+        return self
+
+    def __imul__(self, other):
+        Vector.__imul__(self, other)
+        self._write()
+        return self
+
+
+class Bone(_BoneBase):
+    _coll_name = "bones"
+
+    @property
+    def name(self):
+        return self._rec.name
+
+    @name.setter
+    def name(self, value):
+        self._arm._rename_bone(self._rec, value)
+
+    @property
+    def parent(self):
+        p = self._rec.parent
+        return Bone(self._arm, p) if p is not None else None
+
+    @property
+    def use_connect(self):
+        return self._rec.use_connect
+
+    @property
+    def children(self):
+        return _PropCollection(Bone, [Bone(self._arm, r) for r in self._arm._records if r.parent is self._rec])
+
+    @property
+    def head_local(self):
+        return self._rec.head.copy()
+
+    @property
+    def tail_local(self):
+        return self._rec.tail.copy()
+
+    @property
+    def matrix_local(self):
+        m = _vec_roll_to_mat3(self._rec.tail - self._rec.head, self._rec.roll).to_4x4()
+        m.translation = self._rec.head
+        return m
+
+    @property
+    def matrix(self):
+        m = _vec_roll_to_mat3(self._rec.tail - self._rec.head, self._rec.roll)
+        if self._rec.parent is not None:
+            pm = _vec_roll_to_mat3(self._rec.parent.tail - self._rec.parent.head, self._rec.parent.roll)
+            m = pm.inverted() * m
+        return m
+
+    @property
+    def head(self):
+        if self._rec.parent is None:
+            return self._rec.head.copy()
+        p = self._rec.parent
+        pm = _vec_roll_to_mat3(p.tail - p.head, p.roll)
+        return pm.inverted() * (self._rec.head - p.tail)
+
+    @property
+    def tail(self):
+        if self._rec.parent is None:
+            return self._rec.tail.copy()
+        p = self._rec.parent
+        pm = _vec_roll_to_mat3(p.tail - p.head, p.roll)
+        return pm.inverted() * (self._rec.tail - p.tail)
+
+    @property
+    def length(self):
+        return (self._rec.tail - self._rec.head).length
+
+    @property
+    def x_axis(self):
+        return self.matrix_local.to_3x3() * Vector((1.0, 0.0, 0.0))
+
+    @property
+    def y_axis(self):
+        return self.matrix_local.to_3x3() * Vector((0.0, 1.0, 0.0))
+
+    @property
+    def z_axis(self):
+        return self.matrix_local.to_3x3() * Vector((0.0, 0.0, 1.0))
+
+    def _path_from_id(self):
+        return 'bones["%s"]' % self.name
+
+
+class _EditBones(_PropCollection):
+    def __init__(self, armature):
+        self._arm = armature
+
+    @property
+    def _items(self):
+        if self._arm._edit_records is None:
+            return []
+        return [EditBone(self._arm, r) for r in self._arm._edit_records]
+
+    def __len__(self):
+        return len(self._arm._edit_records or [])
+
+    def __getitem__(self, key):
+        # Index without wrapping every bone, as Blender only wraps the
+        # bones it returns.
+        if isinstance(key, int):
+            return EditBone(self._arm, (self._arm._edit_records or [])[key])
+        if isinstance(key, slice):
+            return [EditBone(self._arm, r) for r in (self._arm._edit_records or [])[key]]
+        for r in self._arm._edit_records or []:
+            if r.name == key:
+                return EditBone(self._arm, r)
+        raise KeyError("bpy_prop_collection[key]: key \"%s\" not found" % key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(r.name == key for r in self._arm._edit_records or [])
+        return _PropCollection.__contains__(self, key)
+
+    def new(self, name):
+        if self._arm._edit_records is None:
+            raise RuntimeError("EditBones.new(): armature is not in edit mode")
+        _count("edit_bones.new")
+        rec = _BoneRecord(_unique_bone_name(name, set(r.name for r in self._arm._edit_records)))
+        self._arm._edit_records.append(rec)
+        return EditBone(self._arm, rec)
+
+    def remove(self, bone):
+        _count("edit_bones.remove")
+        recs = self._arm._edit_records
+        rec = bone._rec
+        for r in recs:
+            if r.parent is rec:
+                r.parent = rec.parent
+                r.use_connect = False
+        recs.remove(rec)
+
+    @property
+    def active(self):
+        return self._arm._active_edit_bone
+
+    @active.setter
+    def active(self, bone):
+        self._arm._active_edit_bone = bone
+
+
+class _Bones(_PropCollection):
+    def __init__(self, armature):
+        self._arm = armature
+
+    @property
+    def _items(self):
+        return [Bone(self._arm, r) for r in self._arm._ordered_records()]
+
+    def __len__(self):
+        return len(self._arm._records)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for r in self._arm._records:
+                if r.name == key:
+                    return Bone(self._arm, r)
+            raise KeyError("bpy_prop_collection[key]: key \"%s\" not found" % key)
+        return _PropCollection.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(r.name == key for r in self._arm._records)
+        return _PropCollection.__contains__(self, key)
+
+    @property
+    def active(self):
+        return None
+
+
+def _unique_bone_name(name, taken):
+    name = _clip_name(name)
+    if name not in taken:
+        return name
+    base = re.sub(r"\.\d{3}$", "", name)
+    i = 1
+    while True:
+        suffix = ".%03d" % i
+        candidate = _clip_name(base, MAX_ID_NAME - len(suffix)) + suffix
+        if candidate not in taken:
+            return candidate
+        i += 1
+
+
+class Armature(ID):
+    _collection_name = "armatures"
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self._records = []
+        self._edit_records = None
+        self._active_edit_bone = None
+        self._version = 0
+        self.layers = [i == 0 for i in range(32)]
+        self.pose_position = 'POSE'
+        self.draw_type = 'OCTAHEDRAL'
+        self.show_axes = False
+        self.show_names = False
+        self.use_mirror_x = False
+        self.bones = _Bones(self)
+        self.edit_bones = _EditBones(self)
+
+    def _ordered_records(self):
+        """ Depth-first order, matching how Blender walks the bone tree.
+        """
+        result = []
+        children = {}
+        for r in self._records:
+            children.setdefault(id(r.parent) if r.parent is not None else None, []).append(r)
+
+        def walk(r):
+            result.append(r)
+            for c in children.get(id(r), []):
+                walk(c)
+        for r in children.get(None, []):
+            walk(r)
+        return result
+
+    def _enter_edit(self):
+        mapping = {}
+        recs = []
+        for r in self._ordered_records():
+            c = r.copy()
+            mapping[id(r)] = c
+            recs.append(c)
+        for c in recs:
+            if c.parent is not None:
+                c.parent = mapping[id(c.parent)]
+        self._edit_records = recs
+        self._edit_origin = {id(c): r for r, c in ((r, mapping[id(r)]) for r in self._records)}
+
+    def _exit_edit(self):
+        recs = self._edit_records
+        self._edit_records = None
+        self._records = recs
+        self._version += 1
+        # Like ED_armature_from_edit(), rebuild the pose of every user right
+        # away, so the channels of removed bones are gone even if a bone of
+        # the same name is added in a later edit session.
+        for ob in data.objects:
+            if ob.data is self and ob._pose is not None:
+                ob._pose._sync()
+
+    def _rename_bone(self, rec, new_name):
+        old_name = rec.name
+        if new_name == old_name:
+            return
+        records = self._edit_records if self._edit_records is not None else self._records
+        new_name = _unique_bone_name(new_name, set(r.name for r in records if r is not rec))
+        rec.name = new_name
+        _count("bone.rename")
+        # Keep the object level data in sync, like ED_armature_bone_rename()
+        for ob in data.objects:
+            if ob.data is self and ob._pose is not None:
+                for pb in ob._pose._channels:
+                    if pb._name == old_name:
+                        pb._name = new_name
+                ob._pose._names = None
+        for ob in data.objects:
+            if ob._pose is not None:
+                for pb in ob._pose._channels:
+                    for con in pb.constraints:
+                        for t, s in (("target", "subtarget"), ("pole_target", "pole_subtarget")):
+                            if t in con._attrs and con._attrs[t] is not None \
+                               and con._attrs[t].data is self and con._attrs[s] == old_name:
+                                con._attrs[s] = new_name
+        old_path = 'pose.bones["%s"]' % old_name
+        new_path = 'pose.bones["%s"]' % new_name
+        old_bpath = 'bones["%s"]' % old_name
+        new_bpath = 'bones["%s"]' % new_name
+        for coll in (data.objects, data.armatures):
+            for owner in coll:
+                ad = owner.animation_data
+                if ad is None:
+                    continue
+                users = [ob for ob in data.objects if ob.data is self]
+                for fc in ad.drivers:
+                    if owner in users and fc.data_path.startswith(old_path):
+                        fc.data_path = new_path + fc.data_path[len(old_path):]
+                    if owner is self and fc.data_path.startswith(old_bpath):
+                        fc.data_path = new_bpath + fc.data_path[len(old_bpath):]
+                    for var in fc.driver.variables:
+                        for tar in var.targets:
+                            if tar.id in users:
+                                if tar.data_path.startswith(old_path):
+                                    tar.data_path = new_path + tar.data_path[len(old_path):]
+                                if tar.bone_target == old_name:
+                                    tar.bone_target = new_name
+
+
+#=============================================
+# Pose
+#=============================================
+
+class PoseBone(bpy_struct):
+    _rna_props = OrderedDict([
+        ("name", ("STRING", False)),
+        ("location", ("FLOAT", False, 3)),
+        ("rotation_quaternion", ("FLOAT", False, 4)),
+        ("rotation_euler", ("FLOAT", False, 3)),
+        ("rotation_axis_angle", ("FLOAT", False, 4)),
+        ("scale", ("FLOAT", False, 3)),
+        ("rotation_mode", ("ENUM", False)),
+        ("lock_location", ("BOOLEAN", False, 3)),
+        ("lock_rotation", ("BOOLEAN", False, 3)),
+        ("lock_rotation_w", ("BOOLEAN", False)),
+        ("lock_rotations_4d", ("BOOLEAN", False)),
+        ("lock_scale", ("BOOLEAN", False, 3)),
+        ("custom_shape", ("POINTER", False)),
+        ("custom_shape_transform", ("POINTER", False)),
+        ("bone_group", ("POINTER", False)),
+        ("ik_stretch", ("FLOAT", False)),
+    ])
+
+    _ARRAYS = OrderedDict([
+        ("location", (0.0, 0.0, 0.0)),
+        ("rotation_quaternion", (1.0, 0.0, 0.0, 0.0)),
+        ("rotation_euler", (0.0, 0.0, 0.0)),
+        ("rotation_axis_angle", (0.0, 0.0, 1.0, 0.0)),
+        ("scale", (1.0, 1.0, 1.0)),
+        ("lock_location", (False, False, False)),
+        ("lock_rotation", (False, False, False)),
+        ("lock_scale", (False, False, False)),
+    ])
+
+    _SCALARS = OrderedDict([
+        ("rotation_mode", 'QUATERNION'),
+        ("lock_rotation_w", False),
+        ("lock_rotations_4d", False),
+        ("custom_shape", None),
+        ("custom_shape_transform", None),
+        ("custom_shape_scale", 1.0),
+        ("use_custom_shape_bone_size", True),
+        ("bone_group", None),
+        ("ik_stretch", 0.0),
+        ("lock_ik_x", False), ("lock_ik_y", False), ("lock_ik_z", False),
+        ("use_ik_limit_x", False), ("use_ik_limit_y", False), ("use_ik_limit_z", False),
+        ("ik_min_x", 0.0), ("ik_max_x", 0.0), ("ik_min_y", 0.0), ("ik_max_y", 0.0),
+        ("ik_min_z", 0.0), ("ik_max_z", 0.0),
+        ("ik_stiffness_x", 0.0), ("ik_stiffness_y", 0.0), ("ik_stiffness_z", 0.0),
+    ])
+
+    def __init__(self, obj, name):
+        bpy_struct.__init__(self)
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_values", OrderedDict())
+        for k, v in self._ARRAYS.items():
+            self._values[k] = _LiveArray(list(v)) if isinstance(v[0], bool) else Vector(v)
+        self._values["rotation_quaternion"] = Quaternion()
+        self._values["rotation_euler"] = Euler()
+        for k, v in self._SCALARS.items():
+            self._values[k] = v
+        object.__setattr__(self, "constraints", _Constraints(self))
+
+    def __getattr__(self, name):
+        values = object.__getattribute__(self, "_values")
+        if name in values:
+            return values[name]
+        raise AttributeError("'PoseBone' object has no attribute '%s'" % name)
+
+    def __setattr__(self, name, value):
+        cls_attr = getattr(type(self), name, None)
+        if name.startswith("_") or isinstance(cls_attr, (property, _PropDescriptor)):
+            object.__setattr__(self, name, value)
+            return
+        if name in self._values:
+            _count("rna.set")
+            if name in self._ARRAYS:
+                cur = self._values[name]
+                value = list(value)
+                if len(value) != len(cur):
+                    raise ValueError("bpy_struct: %s expected %d items" % (name, len(cur)))
+                if name == "rotation_quaternion":
+                    self._values[name] = Quaternion(value)
+                elif name == "rotation_euler":
+                    self._values[name] = Euler(value)
+                elif isinstance(cur, Vector):
+                    self._values[name] = Vector(value)
+                else:
+                    self._values[name] = _LiveArray([bool(v) for v in value])
+            else:
+                if name == "rotation_mode" and value not in ('QUATERNION', 'XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX', 'AXIS_ANGLE'):
+                    raise TypeError("bpy_struct: item.attr = val: enum \"%s\" not found" % value)
+                self._values[name] = value
+            return
+        raise AttributeError("bpy_struct: attribute \"%s\" from \"PoseBone\" is read-only" % name)
+
+    def __dir__(self):
+        return list(self._values.keys()) + ["name", "bone", "parent", "children", "constraints", "matrix"]
+
+    def __eq__(self, other):
+        return isinstance(other, PoseBone) and other._obj is self._obj and other._name == self._name
+
+    def __hash__(self):
+        return hash((id(self._obj), self._name))
+
+    def __repr__(self):
+        return "bpy.data.objects[%r].pose.bones[%r]" % (self._obj.name, self._name)
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self.bone.name = value
+
+    def _id_data(self):
+        return self._obj
+
+    def _path_from_id(self):
+        return 'pose.bones["%s"]' % self._name
+
+    @property
+    def bone(self):
+        return self._obj.data.bones[self._name]
+
+    @property
+    def parent(self):
+        p = self.bone.parent
+        return self._obj.pose.bones[p.name] if p is not None else None
+
+    @property
+    def children(self):
+        return [self._obj.pose.bones[c.name] for c in self.bone.children]
+
+    @property
+    def parent_recursive(self):
+        result = []
+        p = self.parent
+        while p is not None:
+            result.append(p)
+            p = p.parent
+        return result
+
+    @property
+    def matrix_basis(self):
+        v = self._values
+        if v["rotation_mode"] == 'QUATERNION':
+            rot = Quaternion(v["rotation_quaternion"]).to_matrix()
+        elif v["rotation_mode"] == 'AXIS_ANGLE':
+            a = v["rotation_axis_angle"]
+            rot = Matrix.Rotation(a[0], 3, (a[1], a[2], a[3]))
+        else:
+            rot = Euler(v["rotation_euler"]).to_matrix()
+        s = v["scale"]
+        m = rot * Matrix([[s[0], 0, 0], [0, s[1], 0], [0, 0, s[2]]])
+        m = m.to_4x4()
+        m.translation = v["location"]
+        return m
+
+    @property
+    def matrix(self):
+        bone = self.bone
+        rest = bone.matrix_local
+        parent = self.parent
+        if parent is None:
+            return rest * self.matrix_basis
+        prest = parent.bone.matrix_local
+        basis = self.matrix_basis
+        if not bone.use_local_location:
+            # Location is in the parent's space
+            q = (prest.inverted() * rest).to_quaternion()
+            basis.translation = q.inverted() * basis.to_translation()
+        return parent.matrix * (prest.inverted() * rest) * basis
+
+    @property
+    def head(self):
+        return self.matrix.translation
+
+    @property
+    def tail(self):
+        return self.matrix * Vector((0.0, self.bone.length, 0.0))
+
+    @property
+    def length(self):
+        return self.bone.length
+
+    @property
+    def vector(self):
+        return self.tail - self.head
+
+    @property
+    def x_axis(self):
+        return self.matrix.to_3x3() * Vector((1.0, 0.0, 0.0))
+
+    @property
+    def y_axis(self):
+        return self.matrix.to_3x3() * Vector((0.0, 1.0, 0.0))
+
+    @property
+    def z_axis(self):
+        return self.matrix.to_3x3() * Vector((0.0, 0.0, 1.0))
+
+
+class _PoseBones(_PropCollection):
+    def __init__(self, pose):
+        self._pose = pose
+
+    @property
+    def _items(self):
+        self._pose._sync()
+        return list(self._pose._channels)
+
+    def __getitem__(self, key):
+        self._pose._sync()
+        if isinstance(key, str):
+            pb = self._pose._by_name().get(key)
+            if pb is None:
+                raise KeyError("bpy_prop_collection[key]: key \"%s\" not found" % key)
+            return pb
+        return self._pose._channels[key]
+
+    def __contains__(self, key):
+        self._pose._sync()
+        if isinstance(key, str):
+            return key in self._pose._by_name()
+        return key in self._pose._channels
+
+
+class Pose(bpy_struct):
+    def __init__(self, obj):
+        bpy_struct.__init__(self)
+        self._obj = obj
+        self._channels = []
+        self._version = -1
+        # Name lookup table, like Blender's chanhash
+        self._names = None
+        self.bones = _PoseBones(self)
+        self.bone_groups = _PropCollection()
+
+    def _by_name(self):
+        if self._names is None:
+            self._names = {pb._name: pb for pb in self._channels}
+        return self._names
+
+    def _sync(self):
+        arm = self._obj.data
+        if self._version == arm._version and len(self._channels) == len(arm._records):
+            return
+        existing = self._by_name()
+        channels = []
+        for rec in arm._ordered_records():
+            pb = existing.get(rec.name)
+            if pb is None:
+                pb = PoseBone(self._obj, rec.name)
+            channels.append(pb)
+        self._channels = channels
+        self._names = None
+        self._version = arm._version
+
+
+#=============================================
+# Objects, meshes, scenes
+#=============================================
+
+class Mesh(ID):
+    _collection_name = "meshes"
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.vertices = _MeshElements(MeshVertex)
+        self.edges = _MeshElements(MeshEdge)
+        self.polygons = _MeshElements(MeshPolygon)
+        self.loops = _MeshElements(MeshLoop)
+
+    def from_pydata(self, vertices, edges, faces):
+        _count("mesh.from_pydata")
+        self.vertices.add(len(vertices))
+        for v, co in zip(self.vertices, vertices):
+            v.co = co
+        self.edges.add(len(edges))
+        for e, vi in zip(self.edges, edges):
+            e.vertices = vi
+        for f in faces:
+            start = len(self.loops)
+            self.loops.add(len(f))
+            for l, vi in zip(self.loops._items[start:], f):
+                l.vertex_index = vi
+            self.polygons.add(1)
+            p = self.polygons._items[-1]
+            p.loop_start = start
+            p.loop_total = len(f)
+
+    def update(self, calc_edges=False):
+        _count("mesh.update")
+
+
+class MeshVertex(bpy_struct):
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self._co = Vector((0.0, 0.0, 0.0))
+
+    @property
+    def co(self):
+        return self._co
+
+    @co.setter
+    def co(self, value):
+        self._co = Vector(value)
+
+
+class MeshEdge(bpy_struct):
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self.vertices = [0, 0]
+
+
+class MeshLoop(bpy_struct):
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self.vertex_index = 0
+
+
+class MeshPolygon(bpy_struct):
+    def __init__(self):
+        bpy_struct.__init__(self)
+        self.loop_start = 0
+        self.loop_total = 0
+
+    @property
+    def vertices(self):
+        return []
+
+
+class _MeshElements(_PropCollection):
+    def add(self, count):
+        self._items.extend(self._item_type() for i in range(count))
+
+
+class Object(ID):
+    _collection_name = "objects"
+
+    def __init__(self, name, object_data):
+        ID.__init__(self, name)
+        object.__setattr__(self, "data", object_data)
+        object.__setattr__(self, "_pose", None)
+        if isinstance(object_data, Armature):
+            self.type = 'ARMATURE'
+        elif isinstance(object_data, Mesh):
+            self.type = 'MESH'
+        else:
+            self.type = 'EMPTY'
+        self.mode = 'OBJECT'
+        self.select = False
+        self.hide = False
+        self.hide_select = False
+        self.hide_render = False
+        self.layers = [i == 0 for i in range(20)]
+        self.location = Vector((0.0, 0.0, 0.0))
+        self.rotation_mode = 'XYZ'
+        self.rotation_euler = Euler()
+        self.rotation_quaternion = Quaternion()
+        self.scale = Vector((1.0, 1.0, 1.0))
+        self.draw_type = 'TEXTURED'
+        self.show_x_ray = False
+        self.parent = None
+        self.parent_type = 'OBJECT'
+        self.parent_bone = ""
+        self.constraints = _Constraints(self)
+        self.modifiers = _Modifiers()
+        self.vertex_groups = _PropCollection()
+
+    def __setattr__(self, name, value):
+        if name == "data":
+            object.__setattr__(self, "_pose", None)
+        if name == "location" or name == "scale":
+            value = Vector(value)
+        elif name == "rotation_euler":
+            value = Euler(value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def pose(self):
+        if self.type != 'ARMATURE':
+            return None
+        if self._pose is None:
+            object.__setattr__(self, "_pose", Pose(self))
+        return self._pose
+
+    @property
+    def matrix_world(self):
+        if self.rotation_mode == 'QUATERNION':
+            rot = Quaternion(self.rotation_quaternion).to_matrix()
+        else:
+            rot = Euler(self.rotation_euler).to_matrix()
+        s = self.scale
+        m = (rot * Matrix([[s[0], 0, 0], [0, s[1], 0], [0, 0, s[2]]])).to_4x4()
+        m.translation = self.location
+        if self.parent is not None:
+            m = self.parent.matrix_world * m
+        return m
+
+    @matrix_world.setter
+    def matrix_world(self, mat):
+        loc, rot, scale = Matrix(mat).decompose()
+        self.location = loc
+        self.rotation_euler = rot.to_euler()
+        self.scale = scale
+
+    def copy(self):
+        new = ID.copy(self)
+        object.__setattr__(new, "_pose", None)
+        if self._pose is not None:
+            new_pose = Pose(new)
+            for pb in self.pose.bones:
+                c = PoseBone(new, pb._name)
+                object.__setattr__(c, "_values", _copy.deepcopy(pb._values))
+                object.__setattr__(c, "_idprops", OrderedDict((k, _copy_group(v) if isinstance(v, bpy_struct) else _copy.deepcopy(v)) for k, v in pb._idprops.items()))
+                cons = _Constraints(c)
+                for con in pb.constraints:
+                    nc = Constraint(c, con.type)
+                    nc._attrs.update(con._attrs)
+                    cons._items.append(nc)
+                object.__setattr__(c, "constraints", cons)
+                new_pose._channels.append(c)
+            new_pose._version = self.data._version
+            object.__setattr__(new, "_pose", new_pose)
+        object.__setattr__(new, "animation_data", None)
+        if self.animation_data is not None:
+            ad = new.animation_data_create()
+            for fc in self.animation_data.drivers:
+                ad.drivers._items.append(_copy_fcurve(fc, self, new))
+        return new
+
+    def _path_from_id(self):
+        return ""
+
+
+def _copy_fcurve(fc, old_id, new_id):
+    memo = {id(old_id): new_id}
+    for ob in data.objects:
+        if ob is not old_id:
+            memo[id(ob)] = ob
+    for coll in (data.armatures, data.meshes):
+        for d in coll:
+            memo[id(d)] = d
+    return _copy.deepcopy(fc, memo)
+
+
+class Modifier(bpy_struct):
+    def __init__(self, name, type):
+        bpy_struct.__init__(self)
+        self.name = name
+        self.type = type
+        self.levels = 1
+        self.render_levels = 2
+        self.show_viewport = True
+        self.show_render = True
+
+
+class _Modifiers(_PropCollection):
+    def new(self, name, type):
+        m = Modifier(name, type)
+        self._items.append(m)
+        return m
+
+    def remove(self, modifier):
+        self._items.remove(modifier)
+
+
+class _SceneObjects(_PropCollection):
+    def __init__(self):
+        _PropCollection.__init__(self)
+        self.active = None
+
+    def link(self, obj):
+        _count("scene.objects.link")
+        if obj in self._items:
+            raise RuntimeError("Object '%s' already in scene" % obj.name)
+        self._items.append(obj)
+
+    def unlink(self, obj):
+        self._items.remove(obj)
+
+
+class Scene(ID):
+    _collection_name = "scenes"
+
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.objects = _SceneObjects()
+        self.frame_current = 1
+        self.frame_start = 1
+        self.frame_end = 250
+        self.layers = [i == 0 for i in range(20)]
+
+    def frame_set(self, frame, subframe=0.0):
+        _count("scene.frame_set")
+        self.frame_current = frame
+        _evaluate_animation(self)
+
+    def update(self):
+        _count("scene.update")
+
+
+def _evaluate_animation(scene):
+    """ Applies action F-Curves to their properties.  Drivers are not
+        evaluated.
+    """
+    for ob in scene.objects:
+        ad = ob.animation_data
+        if ad is None or ad.action is None:
+            continue
+        for fc in ad.action.fcurves:
+            value = fc.evaluate(scene.frame_current)
+            m = re.match(r'^pose\.bones\["([^"]+)"\]\.(\w+)$', fc.data_path)
+            if m and m.group(1) in ob.pose.bones:
+                pb = ob.pose.bones[m.group(1)]
+                arr = list(getattr(pb, m.group(2)))
+                arr[fc.array_index] = value
+                setattr(pb, m.group(2), arr)
+
+
+#=============================================
+# bpy.data / bpy.context / bpy.ops
+#=============================================
+
+class _Data:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.objects = _IDCollection(Object, "objects")
+        self.armatures = _IDCollection(Armature, "armatures")
+        self.meshes = _IDCollection(Mesh, "meshes")
+        self.texts = _IDCollection(Text, "texts")
+        self.actions = _IDCollection(Action, "actions")
+        self.scenes = _IDCollection(Scene, "scenes")
+        self.scenes._new("Scene")
+        self.filepath = ""
+        self.is_dirty = False
+
+    @property
+    def objects_by_name(self):
+        return {o.name: o for o in self.objects}
+
+
+data = _Data()
+
+
+class _EditPrefs:
+    use_global_undo = True
+    keyframe_new_interpolation_type = 'BEZIER'
+    keyframe_new_handle_type = 'AUTO_CLAMPED'
+
+
+class _UserPreferences:
+    edit = _EditPrefs()
+    addons = {}
+
+
+class WindowManager(bpy_struct):
+    pass
+
+
+class _Context:
+    def __init__(self):
+        self.user_preferences = _UserPreferences()
+        self.window_manager = WindowManager()
+
+    @property
+    def scene(self):
+        return data.scenes[0]
+
+    @property
+    def active_object(self):
+        return self.scene.objects.active
+
+    object = active_object
+
+    @property
+    def mode(self):
+        ob = self.active_object
+        if ob is None:
+            return 'OBJECT'
+        if ob.mode == 'EDIT':
+            return 'EDIT_ARMATURE' if ob.type == 'ARMATURE' else 'EDIT_MESH'
+        return ob.mode
+
+    @property
+    def armature(self):
+        ob = self.active_object
+        return ob.data if ob is not None and ob.type == 'ARMATURE' else None
+
+    @property
+    def selected_objects(self):
+        return [o for o in self.scene.objects if o.select]
+
+    @property
+    def active_pose_bone(self):
+        return None
+
+    @property
+    def selected_pose_bones(self):
+        return []
+
+
+context = _Context()
+
+
+def reset():
+    """ Discards all data and returns to an empty scene.
+    """
+    data.reset()
+    reset_stats()
+    context.window_manager = WindowManager()
+
+
+class _ObjectOps:
+    def mode_set(self, mode='OBJECT', toggle=False):
+        _count("mode_set")
+        ob = context.active_object
+        if ob is None:
+            raise RuntimeError("Operator bpy.ops.object.mode_set.poll() failed, context is incorrect")
+        if mode == ob.mode:
+            return {'FINISHED'}
+        _count("mode_switch")
+        if ob.mode == 'EDIT' and ob.type == 'ARMATURE':
+            ob.data._exit_edit()
+            _count("armature.rebuild")
+        if mode == 'EDIT':
+            if ob.type == 'ARMATURE':
+                ob.data._enter_edit()
+            elif ob.type != 'MESH':
+                raise RuntimeError("Operator bpy.ops.object.mode_set.poll() failed, context is incorrect")
+        if mode == 'POSE' and ob.type != 'ARMATURE':
+            raise TypeError("Operator bpy.ops.object.mode_set.poll() failed, context is incorrect")
+        ob.mode = mode
+        return {'FINISHED'}
+
+    def armature_add(self, **kwargs):
+        scene = context.scene
+        arm = data.armatures.new("Armature")
+        ob = data.objects.new("Armature", arm)
+        scene.objects.link(ob)
+        for o in scene.objects:
+            o.select = False
+        ob.select = True
+        scene.objects.active = ob
+        ob.mode = 'EDIT'
+        arm._enter_edit()
+        b = arm.edit_bones.new("Bone")
+        b.tail = (0.0, 0.0, 1.0)
+        arm._exit_edit()
+        ob.mode = 'OBJECT'
+        return {'FINISHED'}
+
+    def join(self):
+        _count("object.join")
+        scene = context.scene
+        target = scene.objects.active
+        for src in [o for o in scene.objects if o.select and o is not target]:
+            if src.type != 'ARMATURE':
+                continue
+            tarm = target.data
+            taken = set(r.name for r in tarm._records)
+            mapping = {}
+            for rec in src.data._ordered_records():
+                c = rec.copy()
+                c.name = _unique_bone_name(rec.name, taken)
+                taken.add(c.name)
+                mapping[id(rec)] = c
+                tarm._records.append(c)
+            for rec in src.data._records:
+                c = mapping[id(rec)]
+                if c.parent is not None:
+                    c.parent = mapping[id(rec.parent)]
+            tarm._version += 1
+            names = {rec.name: mapping[id(rec)].name for rec in src.data._records}
+            for pb in src.pose.bones:
+                tpb = target.pose.bones[names[pb.name]]
+                object.__setattr__(tpb, "_values", _copy.deepcopy(pb._values))
+                object.__setattr__(tpb, "_idprops", OrderedDict((k, _copy_group(v) if isinstance(v, bpy_struct) else _copy.deepcopy(v)) for k, v in pb._idprops.items()))
+                for con in pb.constraints:
+                    nc = tpb.constraints.new(con.type)
+                    nc._attrs.update(con._attrs)
+                    for t, s in (("target", "subtarget"), ("pole_target", "pole_subtarget")):
+                        if t in nc._attrs and nc._attrs[t] is src:
+                            nc._attrs[t] = target
+                            nc._attrs[s] = names.get(nc._attrs[s], nc._attrs[s])
+            data.objects.remove(src)
+        return {'FINISHED'}
+
+    def delete(self, use_global=False):
+        scene = context.scene
+        for o in [o for o in scene.objects if o.select]:
+            data.objects.remove(o)
+        if scene.objects.active not in scene.objects._items:
+            scene.objects.active = None
+        return {'FINISHED'}
+
+    def select_all(self, action='TOGGLE'):
+        for o in context.scene.objects:
+            o.select = (action == 'SELECT')
+        return {'FINISHED'}
+
+
+class _Ops:
+    def __init__(self):
+        self.object = _ObjectOps()
+
+
+ops = _Ops()
+
+
+#=============================================
+# bpy.types / bpy.utils / bpy.app
+#=============================================
+
+class _RegisterableMeta(_StructMeta):
+    pass
+
+
+class _Registerable(metaclass=_RegisterableMeta):
+    def __init__(self):
+        object.__setattr__(self, "_idprops", OrderedDict())
+
+    def report(self, type, message):
+        print("%s: %s" % ("/".join(sorted(type)), message))
+
+
+class Operator(_Registerable):
+    pass
+
+
+class Panel(_Registerable):
+    pass
+
+
+class Menu(_Registerable):
+    _draw_funcs = []
+
+    @classmethod
+    def append(cls, func):
+        cls._draw_funcs.append(func)
+
+    @classmethod
+    def remove(cls, func):
+        cls._draw_funcs.remove(func)
+
+
+class UIList(_Registerable):
+    pass
+
+
+class AddonPreferences(_Registerable):
+    pass
+
+
+class PropertyGroup(bpy_struct):
+    def __dir__(self):
+        names = ["bl_rna", "rna_type", "name"]
+        for klass in type(self).__mro__:
+            names.extend(k for k, v in vars(klass).items() if isinstance(v, _PropDescriptor))
+        return sorted(set(names))
+
+
+class _Types:
+    pass
+
+
+types = _Types()
+for _cls in (Operator, Panel, Menu, UIList, AddonPreferences, PropertyGroup,
+             Object, Armature, Mesh, Text, Action, Scene, ID, bpy_struct,
+             Bone, EditBone, PoseBone, Constraint, FCurve, Driver,
+             DriverVariable, DriverTarget, Keyframe, FModifier, WindowManager):
+    setattr(types, _cls.__name__, _cls)
+types.INFO_MT_armature_add = type("INFO_MT_armature_add", (Menu,), {"_draw_funcs": []})
+
+
+class _Utils:
+    def __init__(self):
+        self.registered = []
+
+    def register_class(self, cls):
+        _count("register_class")
+        self.registered.append(cls)
+
+    def unregister_class(self, cls):
+        if cls in self.registered:
+            self.registered.remove(cls)
+
+    def user_resource(self, resource_type, path="", create=False):
+        import os
+        p = os.path.join(tempfile.gettempdir(), "rigify_offline", resource_type.lower(), path)
+        if create:
+            os.makedirs(p, exist_ok=True)
+        return p
+
+
+utils = _Utils()
+
+
+class _App:
+    version = (2, 77, 0)
+    version_string = "2.77 (offline)"
+    background = True
+    binary_path = ""
+    tempdir = tempfile.gettempdir()
+    driver_namespace = {}
+
+    class handlers:
+        load_post = []
+        save_pre = []
+
+
+app = _App()
+
+
+class _Path:
+    @staticmethod
+    def abspath(path):
+        if path.startswith("//"):
+            return path[2:]
+        return path
+
+    @staticmethod
+    def display_name(name):
+        return name.replace("_", " ").title()
+
+
+path = _Path()
@@ -0,0 +1,668 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Pure-Python stand-in for the parts of Blender's mathutils module that
+    Rigify uses.  Follows the Blender 2.7x conventions: '*' is the matrix
+    product, and Vector * Vector is the dot product.
+"""
+
+import math
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+#=============================================
+# Vector
+#=============================================
+
+class Vector:
+    __slots__ = ("_v",)
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self._v = [float(x) for x in seq]
+
+    # Sequence protocol
+    def __len__(self):
+        return len(self._v)
+
+    def __iter__(self):
+        return iter(self._v)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self._v[i])
+        return self._v[i]
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            values = [float(x) for x in value]
+            if len(values) != len(self._v[i]):
+                raise ValueError("Vector slice assignment: size mismatch")
+            self._v[i] = values
+        else:
+            self._v[i] = float(value)
+
+    def __repr__(self):
+        return "Vector((%s))" % ", ".join("%.4f" % x for x in self._v)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return False
+
+    def __hash__(self):
+        return hash(tuple(self._v))
+
+    # Component access
+    def _get(i):
+        return property(lambda self: self._v[i], lambda self, v: self._v.__setitem__(i, float(v)))
+    x = _get(0)
+    y = _get(1)
+    z = _get(2)
+    w = _get(3)
+    del _get
+
+    # Arithmetic
+    def __add__(self, other):
+        return Vector([a + b for a, b in zip(self._v, other)])
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return Vector([a - b for a, b in zip(self._v, other)])
+
+    def __rsub__(self, other):
+        return Vector([b - a for a, b in zip(self._v, other)])
+
+    def __neg__(self):
+        return Vector([-a for a in self._v])
+
+    def __mul__(self, other):
+        if _is_number(other):
+            return Vector([a * other for a in self._v])
+        if isinstance(other, Vector):
+            return self.dot(other)
+        if isinstance(other, Matrix):
+            # Row vector times matrix
+            n = len(self._v)
+            return Vector([sum(self._v[r] * other[r][c] for r in range(n)) for c in range(other.col_size)])
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if _is_number(other):
+            return Vector([a * other for a in self._v])
+        return NotImplemented
+
+    def __truediv__(self, other):
+        return Vector([a / other for a in self._v])
+
+    def __iadd__(self, other):
+        self._v = [a + b for a, b in zip(self._v, other)]
+        return self
+
+    def __isub__(self, other):
+        self._v = [a - b for a, b in zip(self._v, other)]
+        return self
+
+    def __imul__(self, other):
+        self._v = [a * other for a in self._v]
+        return self
+
+    def __itruediv__(self, other):
+        self._v = [a / other for a in self._v]
+        return self
+
+    # Methods
+    @property
+    def length(self):
+        return math.sqrt(sum(a * a for a in self._v))
+
+    @length.setter
+    def length(self, value):
+        l = self.length
+        if l != 0.0:
+            self._v = [a * value / l for a in self._v]
+
+    magnitude = length
+
+    @property
+    def length_squared(self):
+        return sum(a * a for a in self._v)
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self._v, other))
+
+    def cross(self, other):
+        a = self._v
+        b = list(other)
+        return Vector((a[1] * b[2] - a[2] * b[1],
+                       a[2] * b[0] - a[0] * b[2],
+                       a[0] * b[1] - a[1] * b[0]))
+
+    def normalize(self):
+        l = self.length
+        if l != 0.0:
+            self._v = [a / l for a in self._v]
+
+    def normalized(self):
+        v = self.copy()
+        v.normalize()
+        return v
+
+    def angle(self, other, fallback=None):
+        l1 = self.length
+        l2 = Vector(other).length
+        if l1 == 0.0 or l2 == 0.0:
+            if fallback is not None:
+                return fallback
+            raise ValueError("Vector.angle(other): zero length vectors have no valid angle")
+        return math.acos(max(-1.0, min(1.0, self.dot(other) / (l1 * l2))))
+
+    def project(self, other):
+        other = Vector(other)
+        return other * (self.dot(other) / other.dot(other))
+
+    def lerp(self, other, factor):
+        return Vector([a + (b - a) * factor for a, b in zip(self._v, other)])
+
+    def copy(self):
+        return Vector(self._v)
+
+    __copy__ = copy
+
+    def to_tuple(self, precision=-1):
+        if precision < 0:
+            return tuple(self._v)
+        return tuple(round(a, precision) for a in self._v)
+
+    def to_3d(self):
+        return Vector((self._v + [0.0, 0.0, 0.0])[:3])
+
+    def to_4d(self):
+        return Vector((self._v + [0.0, 0.0, 0.0])[:3] + [1.0])
+
+    def zero(self):
+        self._v = [0.0] * len(self._v)
+
+    def rotation_difference(self, other):
+        a = self.normalized()
+        b = Vector(other).normalized()
+        axis = a.cross(b)
+        if axis.length < 1e-12:
+            if a.dot(b) > 0:
+                return Quaternion()
+            # 180 degrees around any perpendicular axis
+            axis = a.cross(Vector((1, 0, 0)))
+            if axis.length < 1e-6:
+                axis = a.cross(Vector((0, 1, 0)))
+        return Quaternion(axis.normalized(), a.angle(b))
+
+
+#=============================================
+# Matrix
+#=============================================
+
+class Matrix:
+    """ Row-major matrix, indexed as m[row][col] like Blender's.
+    """
+    __slots__ = ("_m",)
+
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[float(r == c) for c in range(4)] for r in range(4)]
+        self._m = [Vector(row) for row in rows]
+
+    @property
+    def row_size(self):
+        return len(self._m)
+
+    @property
+    def col_size(self):
+        return len(self._m[0])
+
+    def __len__(self):
+        return len(self._m)
+
+    def __getitem__(self, i):
+        return self._m[i]
+
+    def __setitem__(self, i, value):
+        self._m[i] = Vector(value)
+
+    def __iter__(self):
+        return iter(self._m)
+
+    def __repr__(self):
+        return "Matrix((%s))" % ",\n        ".join(repr(tuple(round(a, 4) for a in r)) for r in self._m)
+
+    def __eq__(self, other):
+        try:
+            return all(Vector(a) == Vector(b) for a, b in zip(self._m, other))
+        except TypeError:
+            return False
+
+    @property
+    def row(self):
+        return self._m
+
+    @property
+    def col(self):
+        return [Vector([r[c] for r in self._m]) for c in range(self.col_size)]
+
+    # Constructors
+    @classmethod
+    def Identity(cls, size):
+        return cls([[float(r == c) for c in range(size)] for r in range(size)])
+
+    @classmethod
+    def Translation(cls, vec):
+        m = cls.Identity(4)
+        for i in range(3):
+            m[i][3] = vec[i]
+        return m
+
+    @classmethod
+    def Scale(cls, factor, size, axis=None):
+        m = cls.Identity(size)
+        if axis is None:
+            for i in range(min(size, 3)):
+                m[i][i] = factor
+        else:
+            axis = Vector(axis).normalized()
+            for r in range(3):
+                for c in range(3):
+                    m[r][c] += (factor - 1.0) * axis[r] * axis[c]
+        return m
+
+    @classmethod
+    def Rotation(cls, angle, size, axis):
+        if isinstance(axis, str):
+            axis = {'X': (1, 0, 0), 'Y': (0, 1, 0), 'Z': (0, 0, 1)}[axis]
+        axis = Vector(axis).normalized()
+        x, y, z = axis
+        c = math.cos(angle)
+        s = math.sin(angle)
+        t = 1.0 - c
+        rot = [[t * x * x + c,     t * x * y - s * z, t * x * z + s * y],
+               [t * x * y + s * z, t * y * y + c,     t * y * z - s * x],
+               [t * x * z - s * y, t * y * z + s * x, t * z * z + c]]
+        m = cls.Identity(size)
+        for r in range(min(size, 3)):
+            for c2 in range(min(size, 3)):
+                m[r][c2] = rot[r][c2]
+        return m
+
+    # Products
+    def __mul__(self, other):
+        if _is_number(other):
+            return Matrix([[a * other for a in r] for r in self._m])
+        if isinstance(other, Matrix):
+            n = other.row_size
+            return Matrix([[sum(self._m[r][k] * other[k][c] for k in range(n)) for c in range(other.col_size)] for r in range(self.row_size)])
+        if isinstance(other, Quaternion):
+            return NotImplemented
+        v = list(other)
+        if len(v) == self.col_size:
+            return Vector([sum(self._m[r][c] * v[c] for c in range(len(v))) for r in range(self.row_size)])
+        if len(v) == 3 and self.col_size == 4:
+            v4 = v + [1.0]
+            return Vector([sum(self._m[r][c] * v4[c] for c in range(4)) for r in range(3)])
+        raise ValueError("Matrix * Vector: size mismatch")
+
+    def __rmul__(self, other):
+        if _is_number(other):
+            return self * other
+        return NotImplemented
+
+    def __add__(self, other):
+        return Matrix([[a + b for a, b in zip(r1, r2)] for r1, r2 in zip(self._m, other)])
+
+    def __sub__(self, other):
+        return Matrix([[a - b for a, b in zip(r1, r2)] for r1, r2 in zip(self._m, other)])
+
+    # Methods
+    def copy(self):
+        return Matrix(self._m)
+
+    __copy__ = copy
+
+    def identity(self):
+        self._m = Matrix.Identity(self.row_size)._m
+
+    def transposed(self):
+        return Matrix(self.col)
+
+    def transpose(self):
+        self._m = self.transposed()._m
+
+    def determinant(self):
+        m = [list(r) for r in self._m]
+        n = len(m)
+        det = 1.0
+        for i in range(n):
+            p = max(range(i, n), key=lambda r: abs(m[r][i]))
+            if abs(m[p][i]) < 1e-15:
+                return 0.0
+            if p != i:
+                m[i], m[p] = m[p], m[i]
+                det = -det
+            det *= m[i][i]
+            for r in range(i + 1, n):
+                f = m[r][i] / m[i][i]
+                for c in range(i, n):
+                    m[r][c] -= f * m[i][c]
+        return det
+
+    def inverted(self, fallback=None):
+        n = self.row_size
+        m = [list(r) + [float(r_i == c) for c in range(n)] for r_i, r in enumerate(self._m)]
+        for i in range(n):
+            p = max(range(i, n), key=lambda r: abs(m[r][i]))
+            if abs(m[p][i]) < 1e-15:
+                if fallback is not None:
+                    return fallback
+                raise ValueError("Matrix.inverted(): matrix does not have an inverse")
+            m[i], m[p] = m[p], m[i]
+            piv = m[i][i]
+            m[i] = [a / piv for a in m[i]]
+            for r in range(n):
+                if r != i and m[r][i] != 0.0:
+                    f = m[r][i]
+                    m[r] = [a - f * b for a, b in zip(m[r], m[i])]
+        return Matrix([r[n:] for r in m])
+
+    def invert(self):
+        self._m = self.inverted()._m
+
+    def to_3x3(self):
+        return Matrix([[self._m[r][c] for c in range(3)] for r in range(3)])
+
+    def to_4x4(self):
+        m = Matrix.Identity(4)
+        for r in range(min(3, self.row_size)):
+            for c in range(min(3, self.col_size)):
+                m[r][c] = self._m[r][c]
+        if self.row_size == 4:
+            for r in range(3):
+                m[r][3] = self._m[r][3]
+        return m
+
+    @property
+    def translation(self):
+        return Vector([self._m[r][3] for r in range(3)])
+
+    @translation.setter
+    def translation(self, vec):
+        for r in range(3):
+            self._m[r][3] = vec[r]
+
+    def to_translation(self):
+        return self.translation
+
+    def to_scale(self):
+        m = self.to_3x3()
+        s = Vector([m.col[c].length for c in range(3)])
+        if m.determinant() < 0:
+            s = -s
+        return s
+
+    def normalized(self):
+        m = self.to_3x3()
+        cols = [c.normalized() for c in m.col]
+        n = Matrix([[cols[c][r] for c in range(3)] for r in range(3)])
+        if self.row_size == 4:
+            n = n.to_4x4()
+            n.translation = self.translation
+        return n
+
+    def to_quaternion(self):
+        m = self.normalized().to_3x3()
+        tr = m[0][0] + m[1][1] + m[2][2]
+        if tr > 0.0:
+            s = math.sqrt(tr + 1.0) * 2.0
+            w = 0.25 * s
+            x = (m[2][1] - m[1][2]) / s
+            y = (m[0][2] - m[2][0]) / s
+            z = (m[1][0] - m[0][1]) / s
+        elif m[0][0] > m[1][1] and m[0][0] > m[2][2]:
+            s = math.sqrt(1.0 + m[0][0] - m[1][1] - m[2][2]) * 2.0
+            w = (m[2][1] - m[1][2]) / s
+            x = 0.25 * s
+            y = (m[0][1] + m[1][0]) / s
+            z = (m[0][2] + m[2][0]) / s
+        elif m[1][1] > m[2][2]:
+            s = math.sqrt(1.0 + m[1][1] - m[0][0] - m[2][2]) * 2.0
+            w = (m[0][2] - m[2][0]) / s
+            x = (m[0][1] + m[1][0]) / s
+            y = 0.25 * s
+            z = (m[1][2] + m[2][1]) / s
+        else:
+            s = math.sqrt(1.0 + m[2][2] - m[0][0] - m[1][1]) * 2.0
+            w = (m[1][0] - m[0][1]) / s
+            x = (m[0][2] + m[2][0]) / s
+            y = (m[1][2] + m[2][1]) / s
+            z = 0.25 * s
+        q = Quaternion((w, x, y, z))
+        if q.w < 0:
+            q = -q
+        return q
+
+    def to_euler(self, order='XYZ', compat=None):
+        return self.to_quaternion().to_euler(order)
+
+    def decompose(self):
+        return self.translation, self.to_quaternion(), self.to_scale()
+
+
+#=============================================
+# Quaternion / Euler
+#=============================================
+
+class Quaternion:
+    __slots__ = ("_q",)
+
+    def __init__(self, seq=(1.0, 0.0, 0.0, 0.0), angle=None):
+        if angle is not None:
+            axis = Vector(seq).normalized()
+            s = math.sin(angle / 2.0)
+            self._q = [math.cos(angle / 2.0), axis[0] * s, axis[1] * s, axis[2] * s]
+        else:
+            self._q = [float(x) for x in seq]
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        return iter(self._q)
+
+    def __getitem__(self, i):
+        return self._q[i]
+
+    def __setitem__(self, i, value):
+        self._q[i] = float(value)
+
+    def __repr__(self):
+        return "Quaternion((%s))" % ", ".join("%.4f" % x for x in self._q)
+
+    def __neg__(self):
+        return Quaternion([-a for a in self._q])
+
+    def _get(i):
+        return property(lambda self: self._q[i], lambda self, v: self._q.__setitem__(i, float(v)))
+    w = _get(0)
+    x = _get(1)
+    y = _get(2)
+    z = _get(3)
+    del _get
+
+    def __mul__(self, other):
+        if isinstance(other, Quaternion):
+            w1, x1, y1, z1 = self._q
+            w2, x2, y2, z2 = other._q
+            return Quaternion((w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                               w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                               w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                               w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2))
+        if _is_number(other):
+            return Quaternion([a * other for a in self._q])
+        return self.to_matrix() * Vector(other)
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self._q, other))
+
+    def copy(self):
+        return Quaternion(self._q)
+
+    def normalized(self):
+        l = math.sqrt(sum(a * a for a in self._q))
+        return Quaternion([a / l for a in self._q])
+
+    def inverted(self):
+        l2 = sum(a * a for a in self._q)
+        w, x, y, z = self._q
+        return Quaternion((w / l2, -x / l2, -y / l2, -z / l2))
+
+    def conjugated(self):
+        w, x, y, z = self._q
+        return Quaternion((w, -x, -y, -z))
+
+    @property
+    def angle(self):
+        return 2.0 * math.acos(max(-1.0, min(1.0, self.normalized().w)))
+
+    @property
+    def axis(self):
+        q = self.normalized()
+        s = math.sqrt(max(0.0, 1.0 - q.w * q.w))
+        if s < 1e-9:
+            return Vector((1.0, 0.0, 0.0))
+        return Vector((q.x / s, q.y / s, q.z / s))
+
+    def to_axis_angle(self):
+        return self.axis, self.angle
+
+    def to_matrix(self):
+        w, x, y, z = self.normalized()._q
+        return Matrix([[1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                       [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                       [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)]])
+
+    def to_euler(self, order='XYZ', compat=None):
+        m = self.to_matrix()
+        if order != 'XYZ':
+            # Only the default order is modelled exactly; others are
+            # approximated through XYZ, which is enough for offline use.
+            pass
+        sy = math.sqrt(m[0][0] ** 2 + m[1][0] ** 2)
+        if sy > 1e-6:
+            x = math.atan2(m[2][1], m[2][2])
+            y = math.atan2(-m[2][0], sy)
+            z = math.atan2(m[1][0], m[0][0])
+        else:
+            x = math.atan2(-m[1][2], m[1][1])
+            y = math.atan2(-m[2][0], sy)
+            z = 0.0
+        return Euler((x, y, z), order)
+
+    def to_quaternion(self):
+        return self.copy()
+
+    def rotation_difference(self, other):
+        return self.inverted() * other
+
+    def slerp(self, other, factor):
+        cos = self.dot(other)
+        other = Quaternion(other)
+        if cos < 0:
+            cos = -cos
+            other = -other
+        if cos > 0.9995:
+            q = Quaternion([a + (b - a) * factor for a, b in zip(self._q, other)])
+            return q.normalized()
+        theta = math.acos(cos)
+        s = math.sin(theta)
+        f1 = math.sin((1 - factor) * theta) / s
+        f2 = math.sin(factor * theta) / s
+        return Quaternion([a * f1 + b * f2 for a, b in zip(self._q, other)])
+
+
+class Euler:
+    __slots__ = ("_e", "order")
+
+    def __init__(self, seq=(0.0, 0.0, 0.0), order='XYZ'):
+        self._e = [float(x) for x in seq]
+        self.order = order
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter(self._e)
+
+    def __getitem__(self, i):
+        return self._e[i]
+
+    def __setitem__(self, i, value):
+        self._e[i] = float(value)
+
+    def __repr__(self):
+        return "Euler((%s), '%s')" % (", ".join("%.4f" % x for x in self._e), self.order)
+
+    def _get(i):
+        return property(lambda self: self._e[i], lambda self, v: self._e.__setitem__(i, float(v)))
+    x = _get(0)
+    y = _get(1)
+    z = _get(2)
+    del _get
+
+    def copy(self):
+        return Euler(self._e, self.order)
+
+    def to_matrix(self):
+        x, y, z = self._e
+        return Matrix.Rotation(z, 3, 'Z') * Matrix.Rotation(y, 3, 'Y') * Matrix.Rotation(x, 3, 'X')
+
+    def to_quaternion(self):
+        return self.to_matrix().to_quaternion()
+
+    def make_compatible(self, other):
+        # Per-axis wrap to the nearest equivalent angle, like Blender's
+        # compatible_eul().
+        for i in range(3):
+            d = self._e[i] - other[i]
+            while d > math.pi:
+                self._e[i] -= 2 * math.pi
+                d -= 2 * math.pi
+            while d < -math.pi:
+                self._e[i] += 2 * math.pi
+                d += 2 * math.pi
+
+
+class Color(Vector):
+    __slots__ = ()
+
+    def _get(i):
+        return property(lambda self: self._v[i], lambda self, v: self._v.__setitem__(i, float(v)))
+    r = _get(0)
+    g = _get(1)
+    b = _get(2)
+    del _get
@@ -0,0 +1,60 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Stand-in for Blender's rna_prop_ui module.
+"""
+
+
+class _IDGroup(dict):
+    """ Dictionary with a name, like an IDPropertyGroup.
+    """
+    def __init__(self, name):
+        dict.__init__(self)
+        self.name = name
+
+
+def rna_idprop_ui_get(item, create=True):
+    try:
+        return item['_RNA_UI']
+    except KeyError:
+        if create:
+            item['_RNA_UI'] = {}
+            return item['_RNA_UI']
+        return None
+
+
+def rna_idprop_ui_prop_get(item, prop, create=True):
+    rna_ui = rna_idprop_ui_get(item, create)
+    if rna_ui is None:
+        return None
+    try:
+        return rna_ui[prop]
+    except KeyError:
+        rna_ui[prop] = _IDGroup(prop)
+        return rna_ui[prop]
+
+
+def rna_idprop_ui_prop_clear(item, prop, remove=True):
+    rna_ui = rna_idprop_ui_get(item, False)
+    if rna_ui is None:
+        return
+    rna_ui.pop(prop, None)
+    if remove and prop in item:
+        del item[prop]
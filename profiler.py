@@ -0,0 +1,234 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# <pep8 compliant>
+
+""" Profiling of rig generation.
+
+    Generation code marks what it is doing with span() and count().  Both do
+    nothing unless a Profiler is active, so they can be left in place:
+
+        with profiler.span("Generate rigs"):
+            ...
+            profiler.count("bones", 3)
+
+    To profile something, run it inside a Profiler, and write out the results:
+
+        with profiler.Profiler() as prof:
+            generate_rig(context, metarig)
+        prof.write_json("/tmp/rig.json")
+        prof.write_chrome_trace("/tmp/rig.trace.json")
+
+    The trace can be viewed in Chrome's about:tracing, or in Perfetto.
+"""
+
+import bpy
+import time
+import json
+
+# The profiler that is currently recording, if any.
+_active = None
+
+
+class _NullSpan:
+    """ Stand-in for a span when nothing is being profiled.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, category="rigify", **args):
+    """ Returns a context manager that records the time spent inside it as a
+        span with the given name, if a profiler is active.
+    """
+    if _active is None:
+        return _NULL_SPAN
+    return _Span(_active, name, category, args)
+
+
+def count(name, n=1):
+    """ Adds n to the named counter of the active profiler, and of all the
+        spans that are currently open.
+    """
+    if _active is not None and n:
+        _active.count(name, n)
+
+
+def is_profiling():
+    """ Returns True if a profiler is active.
+    """
+    return _active is not None
+
+
+class _Span:
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.counters = {}
+
+    def __enter__(self):
+        self.depth = len(self.profiler.stack)
+        self.profiler.stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        end = time.perf_counter()
+        self.profiler.stack.pop()
+        self.profiler.spans.append({
+            "name": self.name,
+            "category": self.category,
+            "start": self.start - self.profiler.start,
+            "duration": end - self.start,
+            "depth": self.depth,
+            "args": self.args,
+            "counters": self.counters,
+            })
+        return False
+
+
+class _ObjectOpsProxy:
+    """ Stands in for bpy.ops.object, counting mode switches.
+    """
+    def __init__(self, ops):
+        self._ops = ops
+
+    def __getattr__(self, name):
+        return getattr(self._ops, name)
+
+    def mode_set(self, *args, **kwargs):
+        obj = bpy.context.active_object
+        if obj is None or obj.mode != kwargs.get("mode", obj.mode):
+            count("mode switches")
+        return self._ops.mode_set(*args, **kwargs)
+
+
+class _OpsProxy:
+    """ Stands in for bpy.ops while profiling, so that the mode switches of
+        rigs that call bpy.ops.object.mode_set() directly are counted too.
+    """
+    def __init__(self, ops):
+        self._ops = ops
+        self.object = _ObjectOpsProxy(ops.object)
+
+    def __getattr__(self, name):
+        return getattr(self._ops, name)
+
+
+class Profiler:
+    """ Records spans and counters while it is active.
+        Only one profiler can be active at a time.
+    """
+    def __init__(self):
+        self.spans = []
+        self.stack = []
+        self.counters = {}
+        self.start = 0.0
+        self.total = 0.0
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("Rigify: a profiler is already active")
+        _active = self
+        self._ops = bpy.ops
+        bpy.ops = _OpsProxy(self._ops)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        global _active
+        self.total = time.perf_counter() - self.start
+        bpy.ops = self._ops
+        _active = None
+        return False
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+        for s in self.stack:
+            s.counters[name] = s.counters.get(name, 0) + n
+
+    def summary(self, category=None, arg=None):
+        """ Returns the total time and counters of the spans, grouped by
+            category and name, slowest first.
+            If category is given, only spans of that category are included.
+            If arg is given, spans are grouped by the value of that argument
+            instead of by their name.
+        """
+        groups = {}
+        for s in self.spans:
+            if category is not None and s["category"] != category:
+                continue
+            name = s["name"] if arg is None else s["args"].get(arg)
+            key = (s["category"], name)
+            if key not in groups:
+                groups[key] = {
+                    "category": s["category"],
+                    "name": name,
+                    "calls": 0,
+                    "duration": 0.0,
+                    "counters": {},
+                    }
+            group = groups[key]
+            group["calls"] += 1
+            group["duration"] += s["duration"]
+            for counter, n in s["counters"].items():
+                group["counters"][counter] = group["counters"].get(counter, 0) + n
+        return sorted(groups.values(), key=lambda g: -g["duration"])
+
+    def write_json(self, path):
+        """ Writes the spans, counters and summary to a JSON file.
+            Times are in seconds, relative to the start of profiling.
+        """
+        data = {
+            "total": self.total,
+            "counters": self.counters,
+            "summary": self.summary(),
+            "rig_types": self.summary("rig", "type"),
+            "spans": sorted(self.spans, key=lambda s: (s["start"], s["depth"])),
+            }
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+
+    def write_chrome_trace(self, path):
+        """ Writes the spans in the Chrome trace event format.
+        """
+        events = []
+        for s in self.spans:
+            args = dict(s["args"])
+            args.update(s["counters"])
+            events.append({
+                "name": s["name"],
+                "cat": s["category"],
+                "ph": 'X',
+                "ts": s["start"] * 1000000.0,
+                "dur": s["duration"] * 1000000.0,
+                "pid": 1,
+                "tid": 1,
+                "args": args,
+                })
+        events.sort(key=lambda e: (e["ts"], -e["dur"]))
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -17,12 +17,21 @@
 #======================= END GPL LICENSE BLOCK ========================
 
 import os
+import json
+import hashlib
+
+import bpy
 
 from . import utils
 
+MANIFEST_VERSION = 2  # Increase when the format of the manifest changes.
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "rig_manifest.json")
+
 
-def get_rig_list(path):
+def get_rig_list(path, modules=None):
     """ Recursively searches for rig types, and returns a list.
+        If a modules dictionary is given, the module of each rig type is
+        added to it.
     """
     rigs = []
     MODULE_DIR = os.path.dirname(__file__)
@@ -48,9 +57,11 @@ def get_rig_list(path):
             # Check if it's a rig itself
             if hasattr(rig, "Rig"):
                 rigs += [f]
+                if modules is not None:
+                    modules[module_name] = rig
             else:
                 # Check for sub-rigs
-                ls = get_rig_list(os.path.join(path, f, ""))  # "" adds a final slash
+                ls = get_rig_list(os.path.join(path, f, ""), modules)  # "" adds a final slash
                 rigs.extend(["%s.%s" % (f, l) for l in ls])
         elif f.endswith(".py"):
             # Check straight-up python files
@@ -59,6 +70,8 @@ def get_rig_list(path):
             rig = utils.get_rig_type(module_name)
             if hasattr(rig, "Rig"):
                 rigs += [t]
+                if modules is not None:
+                    modules[module_name] = rig
     rigs.sort()
     return rigs
 
@@ -72,7 +85,208 @@ def get_collection_list(rig_list):
     return collection_list
 
 
+#=============================================
+# Rig manifest
+#=============================================
+
+# Finding the rig types means importing every module in the rigs directory,
+# which makes Blender slow to start.  So what registration needs to know
+# about the rig types is kept in a manifest file, which is only rebuilt when
+# the files in the rigs directory change.
+
+class ParameterRecorder:
+    """ Stands in for the RigifyParameters class while a rig type's
+        add_parameters() runs, and records the properties it adds.
+    """
+    def __init__(self):
+        object.__setattr__(self, "parameters", [])
+
+    def __setattr__(self, name, value):
+        self.parameters.append((name, value))
+
+
+def get_rig_files():
+    """ Returns the modification time and size of every python file in the
+        rigs directory, by path relative to it.
+    """
+    rig_dir = os.path.join(os.path.dirname(__file__), utils.RIG_DIR)
+    files = {}
+    for root, dirs, names in os.walk(rig_dir):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+        for name in names:
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                files[os.path.relpath(path, rig_dir)] = [stat.st_mtime, stat.st_size]
+    return files
+
+
+def get_file_hash(path):
+    rig_dir = os.path.join(os.path.dirname(__file__), utils.RIG_DIR)
+    with open(os.path.join(rig_dir, path), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def is_manifest_fresh(manifest, files):
+    """ Returns True if the manifest was made from the given rig files.
+        Files with a new modification time, but the same contents, still
+        count as fresh, and get their time updated in the manifest.
+    """
+    if manifest.get("version") != MANIFEST_VERSION:
+        return False
+    known = manifest["files"]
+    if set(known) != set(files):
+        return False
+    for path, (mtime, size) in files.items():
+        if known[path][:2] == [mtime, size]:
+            continue
+        if known[path][1] != size or known[path][2] != get_file_hash(path):
+            return False
+        known[path][0] = mtime
+    return True
+
+
+def encode_property(value):
+    """ Returns a property declaration, as made by the functions in
+        bpy.props, as JSON compatible data.  Returns None if it can't be
+        stored, e.g. because it has callbacks.
+    """
+    try:
+        function, keywords = value
+        name = function.__name__
+    except (TypeError, ValueError, AttributeError):
+        return None
+    if getattr(bpy.props, name, None) is None:
+        return None
+
+    keywords = dict(keywords)
+    if "options" in keywords:
+        keywords["options"] = sorted(keywords["options"])
+    if not is_plain_data(keywords):
+        return None
+    return [name, keywords]
+
+
+def decode_property(name, keywords):
+    """ Makes a property declaration from the data made by encode_property().
+    """
+    keywords = dict(keywords)
+    for key, value in keywords.items():
+        if key == "options":
+            keywords[key] = set(value)
+        else:
+            keywords[key] = to_tuples(value)
+    return getattr(bpy.props, name)(**keywords)
+
+
+def is_plain_data(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(is_plain_data(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and is_plain_data(v) for k, v in value.items())
+    return False
+
+
+def to_tuples(value):
+    if isinstance(value, list):
+        return tuple(to_tuples(v) for v in value)
+    return value
+
+
+def describe_rig(name, module):
+    """ Returns the manifest entry of a rig type module.
+    """
+    parameters = []
+    parameter_names = []
+    if hasattr(module, "add_parameters"):
+        recorder = ParameterRecorder()
+        try:
+            module.add_parameters(recorder)
+        except Exception:
+            parameters = None
+            parameter_names = None
+        else:
+            parameter_names = [param_name for param_name, value in recorder.parameters]
+            for param_name, value in recorder.parameters:
+                declaration = encode_property(value)
+                if declaration is None:
+                    parameters = None
+                    break
+                parameters += [[param_name] + declaration]
+
+    return {
+        "collection": name.split(".")[0] if "." in name else "",
+        "create_sample": hasattr(module, "create_sample"),
+        "parameters_ui": hasattr(module, "parameters_ui"),
+        # None means add_parameters() has to be called on the module itself.
+        "parameters": parameters,
+        "parameter_names": parameter_names,
+        }
+
+
+def build_manifest(files):
+    """ Imports all the rig types, and returns a manifest describing them.
+    """
+    modules = {}
+    rigs = get_rig_list("", modules)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "files": {},
+        "rig_list": rigs,
+        "rigs": {},
+        }
+    for path, (mtime, size) in files.items():
+        manifest["files"][path] = [mtime, size, get_file_hash(path)]
+    for name in rigs:
+        manifest["rigs"][name] = describe_rig(name, modules[name])
+    return manifest
+
+
+def load_manifest():
+    """ Returns the manifest of the rig types, from the manifest file if it
+        is up to date, and otherwise by importing the rig types.  The file
+        is rewritten if anything changed.
+    """
+    files = get_rig_files()
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+        text = json.dumps(manifest, sort_keys=True)
+    except (IOError, OSError, ValueError):
+        manifest = {}
+        text = ""
+
+    try:
+        fresh = is_manifest_fresh(manifest, files)
+    except (KeyError, TypeError, IndexError, IOError, OSError):
+        fresh = False
+    if not fresh:
+        manifest = build_manifest(files)
+
+    if json.dumps(manifest, sort_keys=True) != text:
+        try:
+            with open(MANIFEST_PATH, 'w') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+        except (IOError, OSError):
+            print("Rigify: could not write the rig manifest to %r" % MANIFEST_PATH)
+    return manifest
+
+
+def get_rig_parameters(rig_type):
+    """ Returns the properties a rig type adds to RigifyParameters, as
+        (name, property) pairs, or None if they are unknown and its
+        add_parameters() has to be called.
+    """
+    parameters = manifest["rigs"][rig_type]["parameters"]
+    if parameters is None:
+        return None
+    return [(name, decode_property(prop, keywords)) for name, prop, keywords in parameters]
+
+
 # Public variables
-rig_list = get_rig_list("")
+manifest = load_manifest()
+rig_list = manifest["rig_list"]
 collection_list = get_collection_list(rig_list)
 col_enum_list = [("All", "All", ""), ("None", "None", "")] + [(c, c, "") for c in collection_list]
@@ -20,7 +20,7 @@
 
 UI_SLIDERS = '''
 import bpy
-from mathutils import Matrix, Vector
+from mathutils import Matrix, Vector, Quaternion, Euler
 from math import acos, pi
 
 rig_id = "%s"
@@ -64,17 +64,19 @@ def rotation_difference(mat1, mat2):
 ## "Visual Transform" helper functions ##
 #########################################
 
-def get_pose_matrix_in_other_space(mat, pose_bone):
+def get_pose_matrix_in_other_space(mat, pose_bone, parent_matrix=None):
     """ Returns the transform matrix relative to pose_bone's current
         transform space.  In other words, presuming that mat is in
         armature space, slapping the returned matrix onto pose_bone
         should give it the armature-space transforms of mat.
+        If parent_matrix is given, it is used instead of the parent's
+        current matrix.
         TODO: try to handle cases with axis-scaled parents better.
     """
     rest = pose_bone.bone.matrix_local.copy()
     rest_inv = rest.inverted()
     if pose_bone.parent:
-        par_mat = pose_bone.parent.matrix.copy()
+        par_mat = pose_bone.parent.matrix.copy() if parent_matrix is None else parent_matrix
         par_inv = par_mat.inverted()
         par_rest = pose_bone.parent.bone.matrix_local.copy()
     else:
@@ -142,6 +144,112 @@ def set_pose_scale(pose_bone, mat):
     pose_bone.scale = mat.to_scale()
 
 
+def get_pose_matrix_from_local(mat, pose_bone, parent_matrix=None):
+    """ Returns the armature-space matrix pose_bone gets from the local
+        transform matrix mat, the inverse of get_pose_matrix_in_other_space().
+        If parent_matrix is given, it is used instead of the parent's
+        current matrix.
+    """
+    rest = pose_bone.bone.matrix_local.copy()
+    if pose_bone.parent:
+        par_mat = pose_bone.parent.matrix.copy() if parent_matrix is None else parent_matrix
+        par_rest = pose_bone.parent.bone.matrix_local.copy()
+    else:
+        par_mat = Matrix()
+        par_rest = Matrix()
+
+    # Location is in the parent's space, see set_pose_translation()
+    if pose_bone.bone.use_local_location == False:
+        mat = mat.copy()
+        q = (par_rest.inverted() * rest).to_quaternion()
+        mat.translation = q.inverted() * mat.to_translation()
+
+    return par_mat * (par_rest.inverted() * (rest * mat))
+
+
+def get_new_pose_matrix(pose_bone, matrices):
+    """ Returns the armature-space matrix pose_bone will have once the
+        pose is evaluated, without evaluating it.  matrices has the new
+        armature-space matrices of the bones changed so far, by name.
+        Other bones keep their transforms relative to their parent, and
+        follow the targets of their Copy Transforms constraints.
+    """
+    if pose_bone.name in matrices:
+        return matrices[pose_bone.name]
+
+    matrix = pose_bone.matrix
+    parent = pose_bone.parent
+    parent_matrix = None
+    if parent:
+        parent_matrix = get_new_pose_matrix(parent, matrices)
+        if parent_matrix != parent.matrix:
+            matrix = parent_matrix * (parent.matrix.inverted() * matrix)
+
+    obj = pose_bone.id_data
+    for con in pose_bone.constraints:
+        if con.type != 'COPY_TRANSFORMS' or con.mute or con.influence == 0.0:
+            continue
+        if con.target != obj or con.subtarget not in obj.pose.bones:
+            continue
+        target = obj.pose.bones[con.subtarget]
+        target_matrix = get_new_pose_matrix(target, matrices)
+        if target_matrix != target.matrix:
+            if con.influence == 1.0:
+                matrix = target_matrix
+            else:
+                own = get_pose_matrix_from_local(pose_bone.matrix_basis, pose_bone, parent_matrix)
+                matrix = own.lerp(target_matrix, con.influence)
+    return matrix
+
+
+def get_rotation_prop(pose_bone):
+    """ Returns the name of the property pose_bone's rotation mode uses.
+    """
+    if pose_bone.rotation_mode == 'QUATERNION':
+        return "rotation_quaternion"
+    elif pose_bone.rotation_mode == 'AXIS_ANGLE':
+        return "rotation_axis_angle"
+    else:
+        return "rotation_euler"
+
+
+def is_driven(pose_bone, prop):
+    """ Returns whether a property of the pose bone has a driver.
+    """
+    anim = pose_bone.id_data.animation_data
+    if anim is None:
+        return False
+    path = pose_bone.path_from_id(prop)
+    for fcurve in anim.drivers:
+        if fcurve.data_path == path:
+            return True
+    return False
+
+
+def set_pose_matrix(pose_bone, mat, matrices, location=True, rotation=True, scale=True):
+    """ Sets pose_bone's transforms so that it gets the armature-space
+        transforms of mat, without evaluating the pose.  matrices has
+        the new armature-space matrices of the bones set so far, by name,
+        and the new matrix of pose_bone is added to it, so that bones can
+        be matched one after the other, parents first.
+        Transforms that are driven are left as they are.
+    """
+    parent_matrix = None
+    if pose_bone.parent:
+        parent_matrix = get_new_pose_matrix(pose_bone.parent, matrices)
+    smat = get_pose_matrix_in_other_space(mat, pose_bone, parent_matrix)
+    rotation_prop = get_rotation_prop(pose_bone)
+
+    if location and not is_driven(pose_bone, "location"):
+        set_pose_translation(pose_bone, smat)
+    if rotation and not is_driven(pose_bone, rotation_prop):
+        set_pose_rotation(pose_bone, smat)
+    if scale and not is_driven(pose_bone, "scale"):
+        set_pose_scale(pose_bone, smat)
+
+    matrices[pose_bone.name] = get_pose_matrix_from_local(pose_bone.matrix_basis, pose_bone, parent_matrix)
+
+
 def match_pose_translation(pose_bone, target_bone):
     """ Matches pose_bone's visual translation to target_bone's visual
         translation.
@@ -179,64 +287,98 @@ def match_pose_scale(pose_bone, target_bone):
 ## IK/FK snapping functions ##
 ##############################
 
-def match_pole_target(ik_first, ik_last, pole, match_bone, length):
-    """ Places an IK chain's pole target to match ik_first's
-        transforms to match_bone.  All bones should be given as pose bones.
-        You need to be in pose mode on the relevant armature object.
-        ik_first: first bone in the IK chain
-        ik_last:  last bone in the IK chain
-        pole:  pole target bone for the IK chain
-        match_bone:  bone to match ik_first to (probably first bone in a matching FK chain)
-        length:  distance pole target should be placed from the chain center
+def get_bend_axis(ik_last):
+    """ Returns the index of the local axis an IK chain bends around,
+        which is the only axis its last bone isn't locked on (X by default).
     """
-    a = ik_first.matrix.to_translation()
-    b = ik_last.matrix.to_translation() + ik_last.vector
+    free = [not ik_last.lock_ik_x, not ik_last.lock_ik_y, not ik_last.lock_ik_z]
+    if free.count(True) == 1:
+        return free.index(True)
+    return 0
 
-    # Vector from the head of ik_first to the
-    # tip of ik_last
-    ikv = b - a
 
-    # Get a vector perpendicular to ikv
-    pv = perpendicular_vector(ikv).normalized() * length
+def get_axis(mat, axis):
+    """ Returns the direction of one of the axes of a matrix.
+    """
+    v = Vector((0, 0, 0))
+    v[axis] = 1
+    return mat.to_3x3() * v
 
-    def set_pole(pvi):
-        """ Set pole target's position based on a vector
-            from the arm center line.
-        """
-        # Translate pvi into armature space
-        ploc = a + (ikv/2) + pvi
 
-        # Set pole target to location
-        mat = get_pose_matrix_in_other_space(Matrix.Translation(ploc), pole)
-        set_pose_translation(pole, mat)
+def project_on_plane(v, normal):
+    """ Returns the vector projected onto the plane with the given normal.
+    """
+    normal = normal.normalized()
+    return v - (normal * v.dot(normal))
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.mode_set(mode='POSE')
 
-    set_pole(pv)
+def signed_angle(v1, v2, axis):
+    """ Returns the angle from v1 to v2 around axis, in radians.
+    """
+    angle = v1.angle(v2, 0.0)
+    if v1.cross(v2).dot(axis) < 0:
+        angle = -angle
+    return angle
 
-    # Get the rotation difference between ik_first and match_bone
-    angle = rotation_difference(ik_first.matrix, match_bone.matrix)
 
-    # Try compensating for the rotation difference in both directions
-    pv1 = Matrix.Rotation(angle, 4, ikv) * pv
-    set_pole(pv1)
-    ang1 = rotation_difference(ik_first.matrix, match_bone.matrix)
+def is_bent(head, elbow, tail):
+    """ Returns whether a chain of two bones is bent by more than a few
+        degrees at the elbow.
+    """
+    v1 = elbow - head
+    v2 = tail - head
+    return v1.cross(v2).length > v1.length * v2.length * 0.05
 
-    pv2 = Matrix.Rotation(-angle, 4, ikv) * pv
-    set_pole(pv2)
-    ang2 = rotation_difference(ik_first.matrix, match_bone.matrix)
 
-    # Do the one with the smaller angle
-    if ang1 < ang2:
-        set_pole(pv1)
+def match_pole_target(ik_first, ik_last, pole, match_first, match_last, length, matrices=None):
+    """ Places an IK chain's pole target so that the IK chain bends the
+        same way as a matching FK chain.  All bones should be given as pose
+        bones.  The position is computed from the FK chain and the rest pose
+        of the IK chain, so the pose doesn't need to be re-evaluated.
+        ik_first: first bone in the IK chain
+        ik_last:  last bone in the IK chain
+        pole:  pole target bone for the IK chain
+        match_first:  first bone of the FK chain to match
+        match_last:  last bone of the FK chain to match
+        length:  distance pole target should be placed from the chain center
+        matrices:  new matrices of bones set before, see set_pose_matrix()
+    """
+    if matrices is None:
+        matrices = {}
+    axis = get_bend_axis(ik_last)
+
+    # In the rest pose, get the angle around the chain from the direction
+    # the chain bends in to the pole, which the IK solver keeps.
+    a = ik_first.bone.head_local
+    ikv = ik_last.bone.tail_local - a
+    rest_axis = project_on_plane(get_axis(ik_first.bone.matrix_local, axis), ikv)
+    rest_elbow = project_on_plane(ik_last.bone.head_local - a, ikv)
+    rest_pole = project_on_plane(pole.bone.head_local - a, ikv)
+    axis_angle = signed_angle(rest_axis, rest_pole, ikv)
+    elbow_angle = signed_angle(rest_elbow, rest_pole, ikv)
+    rest_bent = is_bent(a, ik_last.bone.head_local, ik_last.bone.tail_local)
+
+    # Vector from the head of match_first to the tip of match_last
+    a = match_first.head
+    ikv = match_last.tail - a
+
+    # Turn the direction the FK chain bends in by the same angle.  If
+    # either chain is straight, the bend axis of the first bone is used.
+    if rest_bent and is_bent(a, match_last.head, match_last.tail):
+        pv = Matrix.Rotation(elbow_angle, 4, ikv) * project_on_plane(match_last.head - a, ikv)
+    else:
+        pv = Matrix.Rotation(axis_angle, 4, ikv) * project_on_plane(get_axis(match_first.matrix, axis), ikv)
+
+    ploc = a + (ikv / 2) + (pv.normalized() * length)
+    set_pose_matrix(pole, Matrix.Translation(ploc), matrices, rotation=False, scale=False)
 
 
-def fk2ik_arm(obj, fk, ik):
+def fk2ik_arm(obj, fk, ik, matrices=None):
     """ Matches the fk bones in an arm rig to the ik bones.
         obj: armature object
         fk:  list of fk bone names
         ik:  list of ik bone names
+        matrices:  new matrices of bones set before, see set_pose_matrix()
     """
     uarm  = obj.pose.bones[fk[0]]
     farm  = obj.pose.bones[fk[1]]
@@ -252,24 +394,25 @@ def fk2ik_arm(obj, fk, ik):
         diff = (uarmi.vector.length + farmi.vector.length) / (uarm.vector.length + farm.vector.length)
         uarm['stretch_length'] *= diff
 
+    if matrices is None:
+        matrices = {}
+
     # Upper arm position
-    match_pose_rotation(uarm, uarmi)
-    match_pose_scale(uarm, uarmi)
+    set_pose_matrix(uarm, uarmi.matrix, matrices, location=False)
 
     # Forearm position
-    match_pose_rotation(farm, farmi)
-    match_pose_scale(farm, farmi)
+    set_pose_matrix(farm, farmi.matrix, matrices, location=False)
 
     # Hand position
-    match_pose_rotation(hand, handi)
-    match_pose_scale(hand, handi)
+    set_pose_matrix(hand, handi.matrix, matrices, location=False)
 
 
-def ik2fk_arm(obj, fk, ik):
+def ik2fk_arm(obj, fk, ik, matrices=None):
     """ Matches the ik bones in an arm rig to the fk bones.
         obj: armature object
         fk:  list of fk bone names
         ik:  list of ik bone names
+        matrices:  new matrices of bones set before, see set_pose_matrix()
     """
     uarm  = obj.pose.bones[fk[0]]
     farm  = obj.pose.bones[fk[1]]
@@ -282,20 +425,22 @@ def ik2fk_arm(obj, fk, ik):
     # Stretch
     handi['stretch_length'] = uarm['stretch_length']
 
+    if matrices is None:
+        matrices = {}
+
     # Hand position
-    match_pose_translation(handi, hand)
-    match_pose_rotation(handi, hand)
-    match_pose_scale(handi, hand)
+    set_pose_matrix(handi, hand.matrix, matrices)
 
     # Pole target position
-    match_pole_target(uarmi, farmi, pole, uarm, (uarmi.length + farmi.length))
+    match_pole_target(uarmi, farmi, pole, uarm, farm, (uarmi.length + farmi.length), matrices)
 
 
-def fk2ik_leg(obj, fk, ik):
+def fk2ik_leg(obj, fk, ik, matrices=None):
     """ Matches the fk bones in a leg rig to the ik bones.
         obj: armature object
         fk:  list of fk bone names
         ik:  list of ik bone names
+        matrices:  new matrices of bones set before, see set_pose_matrix()
     """
     thigh  = obj.pose.bones[fk[0]]
     shin   = obj.pose.bones[fk[1]]
@@ -313,28 +458,26 @@ def fk2ik_leg(obj, fk, ik):
         diff = (thighi.vector.length + shini.vector.length) / (thigh.vector.length + shin.vector.length)
         thigh['stretch_length'] *= diff
 
+    if matrices is None:
+        matrices = {}
+
     # Thigh position
-    match_pose_rotation(thigh, thighi)
-    match_pose_scale(thigh, thighi)
+    set_pose_matrix(thigh, thighi.matrix, matrices, location=False)
 
     # Shin position
-    match_pose_rotation(shin, shini)
-    match_pose_scale(shin, shini)
+    set_pose_matrix(shin, shini.matrix, matrices, location=False)
 
     # Foot position
     mat = mfoot.bone.matrix_local.inverted() * foot.bone.matrix_local
-    footmat = get_pose_matrix_in_other_space(mfooti.matrix, foot) * mat
-    set_pose_rotation(foot, footmat)
-    set_pose_scale(foot, footmat)
-    bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.mode_set(mode='POSE')
+    set_pose_matrix(foot, mfooti.matrix * mat, matrices, location=False)
 
 
-def ik2fk_leg(obj, fk, ik):
+def ik2fk_leg(obj, fk, ik, matrices=None):
     """ Matches the ik bones in a leg rig to the fk bones.
         obj: armature object
         fk:  list of fk bone names
         ik:  list of ik bone names
+        matrices:  new matrices of bones set before, see set_pose_matrix()
     """
     thigh    = obj.pose.bones[fk[0]]
     shin     = obj.pose.bones[fk[1]]
@@ -352,17 +495,229 @@ def ik2fk_leg(obj, fk, ik):
     # Clear footroll
     set_pose_rotation(footroll, Matrix())
 
+    if matrices is None:
+        matrices = {}
+
     # Foot position
     mat = mfooti.bone.matrix_local.inverted() * footi.bone.matrix_local
-    footmat = get_pose_matrix_in_other_space(mfoot.matrix, footi) * mat
-    set_pose_translation(footi, footmat)
-    set_pose_rotation(footi, footmat)
-    set_pose_scale(footi, footmat)
-    bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.mode_set(mode='POSE')
+    set_pose_matrix(footi, mfoot.matrix * mat, matrices)
+
+    # With the foot roll cleared, the ik foot mechanism lines up with the
+    # fk one.  The pole target may follow it.
+    matrices[mfooti.name] = mfoot.matrix
 
     # Pole target position
-    match_pole_target(thighi, shini, pole, thigh, (thighi.length + shini.length))
+    match_pole_target(thighi, shini, pole, thigh, shin, (thighi.length + shini.length), matrices)
+
+
+def get_limbs(names):
+    """ Returns the limbs of rig_limbs with the given names, or all of
+        them if no names are given.
+        names: comma separated limb names
+    """
+    names = [name.strip() for name in names.split(",") if name.strip()]
+    if not names:
+        return list(rig_limbs)
+    return [limb for limb in rig_limbs if limb["name"] in names]
+
+
+def snap_limb(obj, limb, direction, matrices=None):
+    """ Snaps one of the limbs of rig_limbs.  The pose isn't evaluated, so
+        any number of limbs can be snapped against the same evaluated pose.
+        obj: armature object
+        limb: limb from rig_limbs
+        direction: 'FK2IK' to match the fk bones to the ik bones,
+                   'IK2FK' to match the ik bones to the fk bones
+        matrices:  new matrices of bones set before, see set_pose_matrix()
+    """
+    fk = limb["fk"]
+    ik = limb["ik"]
+    if limb["type"] == 'arm':
+        if direction == 'FK2IK':
+            fk2ik_arm(obj, fk=fk, ik=ik[:3], matrices=matrices)
+        else:
+            ik2fk_arm(obj, fk=fk, ik=ik, matrices=matrices)
+    else:
+        if direction == 'FK2IK':
+            fk2ik_leg(obj, fk=fk, ik=[ik[0], ik[1], ik[2], ik[5]], matrices=matrices)
+        else:
+            ik2fk_leg(obj, fk=[fk[0], fk[1], fk[3]], ik=[ik[0], ik[1], ik[2], ik[4], ik[3], ik[5]], matrices=matrices)
+
+
+def snap_limbs(obj, limbs, direction):
+    """ Snaps all of the given limbs against the current pose, in one go.
+        The new matrices are shared between the limbs, so a limb that
+        follows another one's bones is matched to where they end up.
+    """
+    matrices = {}
+    for limb in limbs:
+        snap_limb(obj, limb, direction, matrices)
+
+
+def get_limb_channels(obj, limb, direction):
+    """ Returns the channels snap_limb() changes, as (bone name, property)
+        pairs.  Custom properties are given as in a data path.
+    """
+    fk = limb["fk"]
+    ik = limb["ik"]
+    pose_bones = obj.pose.bones
+    if direction == 'FK2IK':
+        channels = [(fk[0], '["stretch_length"]')]
+        for name in fk[:3]:
+            channels += [(name, get_rotation_prop(pose_bones[name])), (name, "scale")]
+    else:
+        channels = [(ik[2], '["stretch_length"]')]
+        channels += [(ik[2], "location"), (ik[2], get_rotation_prop(pose_bones[ik[2]])), (ik[2], "scale")]
+        if limb["type"] == 'leg':
+            channels += [(ik[4], get_rotation_prop(pose_bones[ik[4]]))]
+        channels += [(ik[3], "location")]
+
+    # Driven transforms aren't snapped
+    return [(name, prop) for name, prop in channels if prop.startswith("[") or not is_driven(pose_bones[name], prop)]
+
+
+def get_channel(pose_bone, prop):
+    """ Returns the value of a channel as a tuple of floats.
+    """
+    if prop.startswith("["):
+        return (pose_bone[prop[2:-2]],)
+    return tuple(getattr(pose_bone, prop))
+
+
+def set_channel(pose_bone, prop, value):
+    """ Sets the value of a channel from a tuple of floats.
+    """
+    if prop.startswith("["):
+        pose_bone[prop[2:-2]] = value[0]
+    else:
+        setattr(pose_bone, prop, value)
+
+
+def get_channel_path(pose_bone, prop):
+    """ Returns the data path of a channel, relative to the armature object.
+    """
+    if prop.startswith("["):
+        return pose_bone.path_from_id() + prop
+    return pose_bone.path_from_id(prop)
+
+
+def make_compatible(pose_bone, prop, value, previous):
+    """ Returns the rotation value closest to the previous one that gives the
+        same rotation, so that keyed rotations don't flip between frames.
+    """
+    if previous is None:
+        return value
+    if prop == "rotation_quaternion" and Quaternion(value).dot(Quaternion(previous)) < 0.0:
+        return tuple(-v for v in value)
+    if prop == "rotation_euler":
+        euler = Euler(value, pose_bone.rotation_mode)
+        euler.make_compatible(Euler(previous, pose_bone.rotation_mode))
+        return tuple(euler)
+    return value
+
+
+def key_channel(action, data_path, index, group, frames, values):
+    """ Keys an fcurve of the action with the given values, replacing any keys
+        it has in the frame range.  The whole curve is written at once.
+    """
+    fcurve = action.fcurves.find(data_path, index)
+    if fcurve is None:
+        fcurve = action.fcurves.new(data_path, index=index, action_group=group)
+    points = fcurve.keyframe_points
+
+    # Merge the new keys with the old ones outside the frame range.  Each
+    # key is (co, handle_left, handle_right, interpolation, handle types), as
+    # the keys move to other indices and must take their settings with them.
+    # The new keys get the settings of newly inserted keys.
+    count = len(points)
+    old_co, old_left, old_right = [0.0] * (count * 2), [0.0] * (count * 2), [0.0] * (count * 2)
+    points.foreach_get("co", old_co)
+    points.foreach_get("handle_left", old_left)
+    points.foreach_get("handle_right", old_right)
+    keys = []
+    for i in range(count):
+        if not frames[0] <= old_co[i * 2] <= frames[-1]:
+            point = points[i]
+            co, left, right = (tuple(buffer[i * 2:i * 2 + 2]) for buffer in (old_co, old_left, old_right))
+            keys += [(co, left, right, point.interpolation, point.handle_left_type, point.handle_right_type)]
+
+    prefs = bpy.context.user_preferences.edit
+    interpolation = prefs.keyframe_new_interpolation_type
+    handle_type = prefs.keyframe_new_handle_type
+    keys += [((frame, value), (frame - 1.0, value), (frame + 1.0, value), interpolation, handle_type, handle_type)
+             for frame, value in zip(frames, values)]
+    keys.sort(key=lambda key: key[0][0])
+
+    # Resize the curve to fit.  Removing a key moves the ones after it, so
+    # keys are only ever removed from the end.
+    count = len(keys) - len(points)
+    if count > 0:
+        points.add(count)
+    for i in range(-count):
+        points.remove(points[-1], fast=True)
+
+    # Enums can't be written with foreach_set()
+    for point, key in zip(points, keys):
+        point.interpolation = key[3]
+        point.handle_left_type = key[4]
+        point.handle_right_type = key[5]
+    points.foreach_set("co", [x for key in keys for x in key[0]])
+    points.foreach_set("handle_left", [x for key in keys for x in key[1]])
+    points.foreach_set("handle_right", [x for key in keys for x in key[2]])
+    fcurve.update()
+
+
+def bake_limbs(scene, obj, limbs, direction, frames, key_switch=True):
+    """ Snaps the limbs on every frame of a range, and keys the result.
+        Each frame is evaluated once, with all the limbs snapped against
+        it, and the keys are written after the last frame.
+        scene: scene to change the frame of
+        obj: armature object
+        limbs: limbs from rig_limbs
+        direction: see snap_limb()
+        frames: list of frames to bake, in order
+        key_switch: also key the ik/fk switch of the limbs to the side
+                    that was snapped
+    """
+    pose_bones = obj.pose.bones
+    channels = []
+    for limb in limbs:
+        channels += get_limb_channels(obj, limb, direction)
+    buffers = [[] for channel in channels]
+
+    frame_current = scene.frame_current
+    for frame in frames:
+        scene.frame_set(frame)
+        old_values = [get_channel(pose_bones[name], prop) for name, prop in channels]
+        snap_limbs(obj, limbs, direction)
+
+        # Put the old values back once the snapped ones are buffered, so
+        # that unkeyed channels don't carry over to the next frame.
+        for (name, prop), buffer, old_value in zip(channels, buffers, old_values):
+            pose_bone = pose_bones[name]
+            previous = buffer[-1] if buffer else None
+            buffer.append(make_compatible(pose_bone, prop, get_channel(pose_bone, prop), previous))
+            set_channel(pose_bone, prop, old_value)
+
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    action = obj.animation_data.action
+    if action is None:
+        action = obj.animation_data.action = bpy.data.actions.new(obj.name + "Action")
+
+    for (name, prop), buffer in zip(channels, buffers):
+        data_path = get_channel_path(pose_bones[name], prop)
+        for index in range(len(buffer[0])):
+            key_channel(action, data_path, index, name, frames, [value[index] for value in buffer])
+
+    if key_switch:
+        switch = 0.0 if direction == 'FK2IK' else 1.0
+        for limb in limbs:
+            name = limb["ik"][2]
+            data_path = get_channel_path(pose_bones[name], '["ikfk_switch"]')
+            key_channel(action, data_path, 0, name, [frames[0], frames[-1]], [switch, switch])
+
+    scene.frame_set(frame_current)
 
 
 ##############################
@@ -389,12 +744,7 @@ class Rigify_Arm_FK2IK(bpy.types.Operator):
         return (context.active_object != None and context.mode == 'POSE')
 
     def execute(self, context):
-        use_global_undo = context.user_preferences.edit.use_global_undo
-        context.user_preferences.edit.use_global_undo = False
-        try:
-            fk2ik_arm(context.active_object, fk=[self.uarm_fk, self.farm_fk, self.hand_fk], ik=[self.uarm_ik, self.farm_ik, self.hand_ik])
-        finally:
-            context.user_preferences.edit.use_global_undo = use_global_undo
+        fk2ik_arm(context.active_object, fk=[self.uarm_fk, self.farm_fk, self.hand_fk], ik=[self.uarm_ik, self.farm_ik, self.hand_ik])
         return {'FINISHED'}
 
 
@@ -419,12 +769,7 @@ class Rigify_Arm_IK2FK(bpy.types.Operator):
         return (context.active_object != None and context.mode == 'POSE')
 
     def execute(self, context):
-        use_global_undo = context.user_preferences.edit.use_global_undo
-        context.user_preferences.edit.use_global_undo = False
-        try:
-            ik2fk_arm(context.active_object, fk=[self.uarm_fk, self.farm_fk, self.hand_fk], ik=[self.uarm_ik, self.farm_ik, self.hand_ik, self.pole])
-        finally:
-            context.user_preferences.edit.use_global_undo = use_global_undo
+        ik2fk_arm(context.active_object, fk=[self.uarm_fk, self.farm_fk, self.hand_fk], ik=[self.uarm_ik, self.farm_ik, self.hand_ik, self.pole])
         return {'FINISHED'}
 
 
@@ -450,12 +795,7 @@ class Rigify_Leg_FK2IK(bpy.types.Operator):
         return (context.active_object != None and context.mode == 'POSE')
 
     def execute(self, context):
-        use_global_undo = context.user_preferences.edit.use_global_undo
-        context.user_preferences.edit.use_global_undo = False
-        try:
-            fk2ik_leg(context.active_object, fk=[self.thigh_fk, self.shin_fk, self.foot_fk, self.mfoot_fk], ik=[self.thigh_ik, self.shin_ik, self.foot_ik, self.mfoot_ik])
-        finally:
-            context.user_preferences.edit.use_global_undo = use_global_undo
+        fk2ik_leg(context.active_object, fk=[self.thigh_fk, self.shin_fk, self.foot_fk, self.mfoot_fk], ik=[self.thigh_ik, self.shin_ik, self.foot_ik, self.mfoot_ik])
         return {'FINISHED'}
 
 
@@ -482,12 +822,72 @@ class Rigify_Leg_IK2FK(bpy.types.Operator):
         return (context.active_object != None and context.mode == 'POSE')
 
     def execute(self, context):
-        use_global_undo = context.user_preferences.edit.use_global_undo
-        context.user_preferences.edit.use_global_undo = False
-        try:
-            ik2fk_leg(context.active_object, fk=[self.thigh_fk, self.shin_fk, self.mfoot_fk], ik=[self.thigh_ik, self.shin_ik, self.foot_ik, self.footroll, self.pole, self.mfoot_ik])
-        finally:
-            context.user_preferences.edit.use_global_undo = use_global_undo
+        ik2fk_leg(context.active_object, fk=[self.thigh_fk, self.shin_fk, self.mfoot_fk], ik=[self.thigh_ik, self.shin_ik, self.foot_ik, self.footroll, self.pole, self.mfoot_ik])
+        return {'FINISHED'}
+
+
+class Rigify_Snap_Limbs(bpy.types.Operator):
+    """ Snaps all the IK/FK limbs of the rig at once.
+    """
+    bl_idname = "pose.rigify_snap_limbs_" + rig_id
+    bl_label = "Rigify Snap All Limbs"
+    bl_options = {'UNDO'}
+
+    direction = bpy.props.EnumProperty(
+        name="Direction",
+        items=(('FK2IK', "FK to IK", "Snap the FK controls to the IK chain"),
+               ('IK2FK', "IK to FK", "Snap the IK controls to the FK chain")),
+        )
+    limbs = bpy.props.StringProperty(name="Limbs", description="Comma separated names of the limbs to snap, all of them if empty")
+
+    @classmethod
+    def poll(cls, context):
+        return (context.active_object != None and context.mode == 'POSE')
+
+    def execute(self, context):
+        snap_limbs(context.active_object, get_limbs(self.limbs), self.direction)
+        return {'FINISHED'}
+
+
+class Rigify_Bake_IKFK(bpy.types.Operator):
+    """ Snaps limbs between IK and FK on every frame of a range, and keys
+        the result.
+    """
+    bl_idname = "pose.rigify_bake_ikfk_" + rig_id
+    bl_label = "Rigify Bake IK/FK Snapping"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    direction = bpy.props.EnumProperty(
+        name="Direction",
+        items=(('FK2IK', "FK to IK", "Snap the FK controls to the IK chain"),
+               ('IK2FK', "IK to FK", "Snap the IK controls to the FK chain")),
+        )
+    limbs = bpy.props.StringProperty(name="Limbs", description="Comma separated names of the limbs to bake, all of them if empty")
+    frame_start = bpy.props.IntProperty(name="Start Frame")
+    frame_end = bpy.props.IntProperty(name="End Frame")
+    key_switch = bpy.props.BoolProperty(name="Key IK/FK Switch", default=True, description="Also key the IK/FK switch of the limbs over to the snapped controls")
+
+    @classmethod
+    def poll(cls, context):
+        return (context.active_object != None and context.mode == 'POSE')
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+
+        # Default to the limbs that have selected bones
+        selected = set(bone.name for bone in context.selected_pose_bones or [])
+        names = [limb["name"] for limb in rig_limbs if selected.intersection(limb["fk"] + limb["ik"])]
+        self.limbs = ", ".join(names)
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        limbs = get_limbs(self.limbs)
+        if not limbs or self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "Nothing to bake")
+            return {'CANCELLED'}
+        frames = list(range(self.frame_start, self.frame_end + 1))
+        bake_limbs(context.scene, context.active_object, limbs, self.direction, frames, self.key_switch)
         return {'FINISHED'}
 
 
@@ -529,10 +929,30 @@ class RigUI(bpy.types.Panel):
                 return True
             return False
 
+        if rig_limbs:
+            row = layout.row(align=True)
+            props = row.operator("pose.rigify_snap_limbs_" + rig_id, text="Snap All FK->IK")
+            props.direction = 'FK2IK'
+            props = row.operator("pose.rigify_snap_limbs_" + rig_id, text="Snap All IK->FK")
+            props.direction = 'IK2FK'
+            layout.operator("pose.rigify_bake_ikfk_" + rig_id, text="Bake IK/FK Snapping...")
+            layout.separator()
+
 
 '''
 
 
+def limbs_ui(limbs):
+    """ Turn the limbs the rigs registered into a list for the UI script,
+        which the operators that snap and bake limbs work on.
+    """
+    code = "\n\nrig_limbs = [\n"
+    for limb in limbs:
+        code += "    {'name': %r, 'type': %r, 'fk': %r, 'ik': %r},\n" % (limb["name"], limb["type"], limb["fk"], limb["ik"])
+    code += "    ]\n\n"
+    return code
+
+
 def layers_ui(layers, layout):
     """ Turn a list of booleans + a list of names into a layer UI.
     """
@@ -593,6 +1013,8 @@ def register():
     bpy.utils.register_class(Rigify_Arm_IK2FK)
     bpy.utils.register_class(Rigify_Leg_FK2IK)
     bpy.utils.register_class(Rigify_Leg_IK2FK)
+    bpy.utils.register_class(Rigify_Snap_Limbs)
+    bpy.utils.register_class(Rigify_Bake_IKFK)
     bpy.utils.register_class(RigUI)
     bpy.utils.register_class(RigLayers)
 
@@ -601,6 +1023,8 @@ def unregister():
     bpy.utils.unregister_class(Rigify_Arm_IK2FK)
     bpy.utils.unregister_class(Rigify_Leg_FK2IK)
     bpy.utils.unregister_class(Rigify_Leg_IK2FK)
+    bpy.utils.unregister_class(Rigify_Snap_Limbs)
+    bpy.utils.unregister_class(Rigify_Bake_IKFK)
     bpy.utils.unregister_class(RigUI)
     bpy.utils.unregister_class(RigLayers)
 
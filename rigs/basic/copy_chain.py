@@ -21,7 +21,7 @@
 import bpy
 
 from ...utils import MetarigError
-from ...utils import copy_bone
+from ...utils import copy_edit_bone, copy_bone_properties
 from ...utils import connected_children_names
 from ...utils import strip_org, make_deformer_name
 from ...utils import create_bone_widget
@@ -45,13 +45,12 @@ class Rig:
         if len(self.org_bones) <= 1:
             raise MetarigError("RIGIFY ERROR: Bone '%s': input to rig type must be a chain of 2 or more bones" % (strip_org(bone_name)))
 
-    def generate(self):
-        """ Generate the rig.
-            Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
+        eb = self.obj.data.edit_bones
 
         # Create the deformation and control bone chains.
         # Just copies of the original chain.
@@ -63,8 +62,7 @@ class Rig:
             # Control bone
             if self.make_controls:
                 # Copy
-                ctrl_bone = copy_bone(self.obj, name)
-                eb = self.obj.data.edit_bones
+                ctrl_bone = copy_edit_bone(self.obj, name)
                 ctrl_bone_e = eb[ctrl_bone]
                 # Name
                 ctrl_bone_e.name = strip_org(name)
@@ -83,8 +81,7 @@ class Rig:
             # Deformation bone
             if self.make_deforms:
                 # Copy
-                def_bone = copy_bone(self.obj, name)
-                eb = self.obj.data.edit_bones
+                def_bone = copy_edit_bone(self.obj, name)
                 def_bone_e = eb[def_bone]
                 # Name
                 def_bone_e.name = make_deformer_name(strip_org(name))
@@ -100,11 +97,24 @@ class Rig:
             else:
                 def_chain += [None]
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.ctrl_chain = ctrl_chain
+        self.def_chain = def_chain
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+
+        """
         pb = self.obj.pose.bones
 
+        for org, ctrl, defrm in zip(self.org_bones, self.ctrl_chain, self.def_chain):
+            if self.make_controls:
+                copy_bone_properties(self.obj, org, ctrl)
+            if self.make_deforms:
+                copy_bone_properties(self.obj, org, defrm)
+
         # Constraints for org and def
-        for org, ctrl, defrm in zip(self.org_bones, ctrl_chain, def_chain):
+        for org, ctrl, defrm in zip(self.org_bones, self.ctrl_chain, self.def_chain):
             if self.make_controls:
                 con = pb[org].constraints.new('COPY_TRANSFORMS')
                 con.name = "copy_transforms"
@@ -117,9 +127,12 @@ class Rig:
                 con.target = self.obj
                 con.subtarget = org
 
+    def widgets(self):
+        """ Create the widgets of the rig.
+        """
         # Create control widgets
         if self.make_controls:
-            for bone in ctrl_chain:
+            for bone in self.ctrl_chain:
                 create_bone_widget(self.obj, bone)
 
 
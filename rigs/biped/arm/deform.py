@@ -53,6 +53,11 @@ class Rig:
         # Based on common limb
         self.rubber_hose_limb = limb_common.RubberHoseLimb(obj, self.org_bones[0], self.org_bones[1], self.org_bones[2], use_complex_rig, elbow_base_name, primary_rotation_axis, layers)
 
-    def generate(self):
-        bone_list = self.rubber_hose_limb.generate()
-        return bone_list
+    def edit_bones(self):
+        return self.rubber_hose_limb.edit_bones()
+
+    def pose_setup(self):
+        self.rubber_hose_limb.pose_setup()
+
+    def widgets(self):
+        self.rubber_hose_limb.widgets()
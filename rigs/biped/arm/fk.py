@@ -60,16 +60,28 @@ class Rig:
         # Arm is based on common limb
         self.fk_limb = limb_common.FKLimb(obj, self.org_bones[0], self.org_bones[1], self.org_bones[2], primary_rotation_axis, layers)
 
-    def generate(self):
-        """ Generate the rig.
+    def edit_bones(self):
+        """ Create the bones of the rig, and return the names of the controls.
+            Do NOT modify any of the original bones.
+
+        """
+        bone_list = self.fk_limb.edit_bones()
+        self.controls = bone_list[:3]
+        return self.controls
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
             Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
 
         """
-        bone_list = self.fk_limb.generate()
-        uarm = bone_list[0]
-        farm = bone_list[1]
-        hand = bone_list[2]
+        self.fk_limb.pose_setup()
+
+    def widgets(self):
+        """ Create the widgets of the rig.
+
+        """
+        self.fk_limb.widgets()
+        hand = self.controls[2]
 
         # Create hand widget
         ob = create_widget(self.obj, hand)
@@ -82,5 +94,3 @@ class Rig:
 
             mod = ob.modifiers.new("subsurf", 'SUBSURF')
             mod.levels = 2
-
-        return [uarm, farm, hand]
@@ -61,13 +61,12 @@ class Rig:
         # Arm is based on common limb
         self.ik_limb = limb_common.IKLimb(obj, self.org_bones[0], self.org_bones[1], self.org_bones[2], None, pole_target_base_name, primary_rotation_axis, bend_hint, layers, ikfk_switch)
 
-    def generate(self):
-        """ Generate the rig.
-            Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
+    def edit_bones(self):
+        """ Create the bones of the rig, and return the names of the controls.
+            Do NOT modify any of the original bones.
 
         """
-        bone_list = self.ik_limb.generate()
+        bone_list = self.ik_limb.edit_bones()
         uarm = bone_list[0]
         farm = bone_list[1]
         hand = bone_list[2]
@@ -76,6 +75,23 @@ class Rig:
         # vispole = bone_list[5]
         # vishand = bone_list[6]
 
+        self.controls = [uarm, farm, hand, pole]
+        return self.controls
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+
+        """
+        self.ik_limb.pose_setup()
+
+    def widgets(self):
+        """ Create the widgets of the rig.
+
+        """
+        self.ik_limb.widgets()
+        hand = self.controls[2]
+
         ob = create_widget(self.obj, hand)
         if ob != None:
             verts = [(0.7, 1.5, 0.0), (0.7, -0.25, 0.0), (-0.7, -0.25, 0.0), (-0.7, 1.5, 0.0), (0.7, 0.723, 0.0), (-0.7, 0.723, 0.0), (0.7, 0.0, 0.0), (-0.7, 0.0, 0.0)]
@@ -86,5 +102,3 @@ class Rig:
 
             mod = ob.modifiers.new("subsurf", 'SUBSURF')
             mod.levels = 2
-
-        return [uarm, farm, hand, pole]
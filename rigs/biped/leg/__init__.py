@@ -19,13 +19,9 @@
 # <pep8 compliant>
 
 import bpy
-import imp
+from ....utils import strip_org
 from . import fk, ik, deform
 
-imp.reload(fk)
-imp.reload(ik)
-imp.reload(deform)
-
 script = """
 fk_leg = ["%s", "%s", "%s", "%s"]
 ik_leg = ["%s", "%s", "%s", "%s", "%s", "%s"]
@@ -89,6 +85,7 @@ class Rig:
         """
         self.obj = obj
         self.params = params
+        self.name = strip_org(bone)
 
         # Gather deform rig
         self.deform_rig = deform.Rig(obj, bone, params)
@@ -99,20 +96,48 @@ class Rig:
         # Gather IK rig
         self.ik_rig = ik.Rig(obj, bone, params, ikfk_switch=True)
 
-    def generate(self):
-        """ Generate the rig.
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
+
+        """
+        self.hose_controls = self.deform_rig.edit_bones()
+        self.fk_controls = self.fk_rig.edit_bones()
+        self.ik_controls = self.ik_rig.edit_bones()
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
             Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
 
         """
-        hose_controls = self.deform_rig.generate()
-        fk_controls = self.fk_rig.generate()
-        ik_controls = self.ik_rig.generate()
+        self.deform_rig.pose_setup()
+        self.fk_rig.pose_setup()
+        self.ik_rig.pose_setup()
+
+    def widgets(self):
+        """ Create the widgets of the rig, and return the ui script.
+
+        """
+        self.deform_rig.widgets()
+        self.fk_rig.widgets()
+        self.ik_rig.widgets()
+
+        hose_controls = self.hose_controls
+        fk_controls = self.fk_controls
+        ik_controls = self.ik_controls
         ui_script = script % (fk_controls[0], fk_controls[1], fk_controls[2], fk_controls[3], ik_controls[0], ik_controls[1], ik_controls[2], ik_controls[3], ik_controls[4], ik_controls[5])
         if self.params.use_complex_leg:
             ui_script += hose_script % (hose_controls[0], hose_controls[1], hose_controls[2], hose_controls[3], hose_controls[4])
         ui_script += end_script
-        return [ui_script]
+
+        # Register the limb, so the rig UI can snap and bake it
+        limb = {
+            "name": self.name,
+            "type": 'leg',
+            "fk": fk_controls[:4],
+            "ik": ik_controls[:6],
+            }
+        return [ui_script, {"limbs": [limb]}]
 
 
 def add_parameters(params):
@@ -23,7 +23,7 @@ import bpy
 from .. import limb_common
 
 from ....utils import MetarigError
-from ....utils import copy_bone
+from ....utils import copy_edit_bone, copy_bone_properties
 from ....utils import connected_children_names, has_connected_children
 from ....utils import strip_org, make_deformer_name
 
@@ -79,14 +79,20 @@ class Rig:
         # Based on common limb
         self.rubber_hose_limb = limb_common.RubberHoseLimb(obj, self.org_bones[0], self.org_bones[1], self.org_bones[2], use_complex_rig, knee_base_name, primary_rotation_axis, layers)
 
-    def generate(self):
-        bone_list = self.rubber_hose_limb.generate()
+    def edit_bones(self):
+        bone_list = self.rubber_hose_limb.edit_bones()
 
         # Set up toe
-        bpy.ops.object.mode_set(mode='EDIT')
-        toe = copy_bone(self.obj, self.org_bones[3], make_deformer_name(strip_org(self.org_bones[3])))
+        self.toe = copy_edit_bone(self.obj, self.org_bones[3], make_deformer_name(strip_org(self.org_bones[3])))
         eb = self.obj.data.edit_bones
-        eb[toe].use_connect = False
-        eb[toe].parent = eb[self.org_bones[3]]
+        eb[self.toe].use_connect = False
+        eb[self.toe].parent = eb[self.org_bones[3]]
 
         return bone_list
+
+    def pose_setup(self):
+        self.rubber_hose_limb.pose_setup()
+        copy_bone_properties(self.obj, self.org_bones[3], self.toe)
+
+    def widgets(self):
+        self.rubber_hose_limb.widgets()
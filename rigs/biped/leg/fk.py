@@ -93,27 +93,41 @@ class Rig:
         # Leg is based on common limb
         self.fk_limb = limb_common.FKLimb(obj, self.org_bones[0], self.org_bones[1], self.org_bones[2], primary_rotation_axis, layers)
 
-    def generate(self):
-        """ Generate the rig.
-            Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
+    def edit_bones(self):
+        """ Create the bones of the rig, and return the names of the controls.
+            Do NOT modify any of the original bones.
 
         """
-        ctrl_bones = self.fk_limb.generate()
+        ctrl_bones = self.fk_limb.edit_bones()
         thigh = ctrl_bones[0]
         shin = ctrl_bones[1]
         foot = ctrl_bones[2]
         foot_mch = ctrl_bones[3]
 
         # Position foot control
-        bpy.ops.object.mode_set(mode='EDIT')
         eb = self.obj.data.edit_bones
         foot_e = eb[foot]
         vec = Vector(eb[self.org_bones[3]].vector)
         vec.normalize()
         foot_e.tail = foot_e.head + (vec * foot_e.length)
         foot_e.roll = eb[self.org_bones[3]].roll
-        bpy.ops.object.mode_set(mode='OBJECT')
+
+        self.controls = [thigh, shin, foot, foot_mch]
+        return self.controls
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+
+        """
+        self.fk_limb.pose_setup()
+
+    def widgets(self):
+        """ Create the widgets of the rig.
+
+        """
+        self.fk_limb.widgets()
+        foot = self.controls[2]
 
         # Create foot widget
         ob = create_widget(self.obj, foot)
@@ -126,5 +140,3 @@ class Rig:
 
             mod = ob.modifiers.new("subsurf", 'SUBSURF')
             mod.levels = 2
-
-        return [thigh, shin, foot, foot_mch]
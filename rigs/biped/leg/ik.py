@@ -25,7 +25,7 @@ from .. import limb_common
 
 from ....utils import MetarigError
 from ....utils import align_bone_x_axis
-from ....utils import copy_bone, flip_bone, put_bone
+from ....utils import copy_edit_bone, copy_bone_properties, flip_bone, put_bone
 from ....utils import connected_children_names, has_connected_children
 from ....utils import strip_org, make_mechanism_name, insert_before_lr
 from ....utils import create_widget, create_circle_widget
@@ -93,13 +93,19 @@ class Rig:
         # Leg is based on common limb
         self.ik_limb = limb_common.IKLimb(obj, self.org_bones[0], self.org_bones[1], self.org_bones[2], self.org_bones[2], pole_target_base_name, primary_rotation_axis, bend_hint, self.layers, ikfk_switch)
 
-    def generate(self):
-        """ Generate the rig.
-            Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
+    def copy_bone(self, bone_name, assign_name=''):
+        bone_name_2 = copy_edit_bone(self.obj, bone_name, assign_name)
+        self.copied_bones.append((bone_name, bone_name_2))
+        return bone_name_2
+
+    def edit_bones(self):
+        """ Create the bones of the rig, and return the names of the controls.
+            Do NOT modify any of the original bones.
         """
+        self.copied_bones = []
+
         # Generate base IK limb
-        bone_list = self.ik_limb.generate()
+        bone_list = self.ik_limb.edit_bones()
         thigh = bone_list[0]
         shin = bone_list[1]
         foot = bone_list[2]
@@ -109,24 +115,24 @@ class Rig:
         # visfoot = bone_list[6]
 
         # Build IK foot rig
-        bpy.ops.object.mode_set(mode='EDIT')
         make_rocker = False
         if self.org_bones[5] is not None:
             make_rocker = True
 
         # Create the bones
-        toe = copy_bone(self.obj, self.org_bones[3], strip_org(self.org_bones[3]))
-        toe_parent = copy_bone(self.obj, self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[3] + ".parent")))
-        toe_parent_socket1 = copy_bone(self.obj, self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[3] + ".socket1")))
-        toe_parent_socket2 = copy_bone(self.obj, self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[3] + ".socket2")))
+        toe = self.copy_bone(self.org_bones[3], strip_org(self.org_bones[3]))
+        toe_parent = self.copy_bone(self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[3] + ".parent")))
+        toe_parent_socket1 = self.copy_bone(self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[3] + ".socket1")))
+        toe_parent_socket2 = self.copy_bone(self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[3] + ".socket2")))
 
-        foot_roll = copy_bone(self.obj, self.org_bones[4], strip_org(insert_before_lr(self.org_bones[2], "_roll.ik")))
-        roll1 = copy_bone(self.obj, self.org_bones[4], make_mechanism_name(strip_org(self.org_bones[2] + ".roll.01")))
-        roll2 = copy_bone(self.obj, self.org_bones[4], make_mechanism_name(strip_org(self.org_bones[2] + ".roll.02")))
+        foot_roll = self.copy_bone(self.org_bones[4], strip_org(insert_before_lr(self.org_bones[2], "_roll.ik")))
+        roll1 = self.copy_bone(self.org_bones[4], make_mechanism_name(strip_org(self.org_bones[2] + ".roll.01")))
+        roll2 = self.copy_bone(self.org_bones[4], make_mechanism_name(strip_org(self.org_bones[2] + ".roll.02")))
 
+        rocker1 = rocker2 = None
         if make_rocker:
-            rocker1 = copy_bone(self.obj, self.org_bones[5], make_mechanism_name(strip_org(self.org_bones[2] + ".rocker.01")))
-            rocker2 = copy_bone(self.obj, self.org_bones[5], make_mechanism_name(strip_org(self.org_bones[2] + ".rocker.02")))
+            rocker1 = self.copy_bone(self.org_bones[5], make_mechanism_name(strip_org(self.org_bones[2] + ".rocker.01")))
+            rocker2 = self.copy_bone(self.org_bones[5], make_mechanism_name(strip_org(self.org_bones[2] + ".rocker.02")))
 
         # Get edit bones
         eb = self.obj.data.edit_bones
@@ -209,8 +215,23 @@ class Rig:
             else:
                 flip_bone(self.obj, rocker1)
 
-        # Object mode, get pose bones
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.bones = [foot, foot_roll, roll1, roll2, rocker1, rocker2, toe, toe_parent_socket1, toe_parent_socket2]
+        self.controls = [thigh, shin, foot, pole, foot_roll, foot_mch]
+        return self.controls
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+        """
+        self.ik_limb.pose_setup()
+
+        foot, foot_roll, roll1, roll2, rocker1, rocker2, toe, toe_parent_socket1, toe_parent_socket2 = self.bones
+        make_rocker = self.org_bones[5] is not None
+
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+
+        # Get pose bones
         pb = self.obj.pose.bones
 
         foot_p = pb[foot]
@@ -322,6 +343,13 @@ class Rig:
             foot_roll_p.bone.layers = self.layers
             toe_p.bone.layers = [(i[0] or i[1]) for i in zip(toe_p.bone.layers, self.layers)]  # Both FK and IK layers
 
+    def widgets(self):
+        """ Create the widgets of the rig.
+        """
+        self.ik_limb.widgets()
+        foot, foot_roll = self.bones[:2]
+        toe = self.bones[6]
+
         # Create widgets
         create_circle_widget(self.obj, toe, radius=0.7, head_tail=0.5)
 
@@ -346,5 +374,3 @@ class Rig:
 
             mod = ob.modifiers.new("subsurf", 'SUBSURF')
             mod.levels = 2
-
-        return [thigh, shin, foot, pole, foot_roll, foot_mch]
@@ -23,7 +23,8 @@ from rna_prop_ui import rna_idprop_ui_prop_get
 from mathutils import Vector
 
 from ...utils import angle_on_plane, align_bone_roll, align_bone_z_axis
-from ...utils import new_bone, copy_bone, put_bone, make_nonscaling_child
+from ...utils import new_edit_bone, copy_edit_bone, copy_bone_properties, put_bone
+from ...utils import make_nonscaling_child_edit_bones, constrain_nonscaling_child
 from ...utils import strip_org, make_mechanism_name, make_deformer_name, insert_before_lr
 from ...utils import create_widget, create_limb_widget, create_line_widget, create_sphere_widget
 
@@ -44,34 +45,46 @@ class FKLimb:
         self.layers = layers
         self.primary_rotation_axis = primary_rotation_axis
 
-    def generate(self):
-        bpy.ops.object.mode_set(mode='EDIT')
+    def copy_bone(self, bone_name, assign_name=''):
+        bone_name_2 = copy_edit_bone(self.obj, bone_name, assign_name)
+        self.copied_bones.append((bone_name, bone_name_2))
+        return bone_name_2
+
+    def edit_bones(self):
+        """ Create, position and parent the bones of the limb, and return
+            the names of the controls.
+        """
+        self.copied_bones = []
 
         # Create non-scaling parent bone
         if self.org_parent != None:
             loc = Vector(self.obj.data.edit_bones[self.org_bones[0]].head)
-            parent = make_nonscaling_child(self.obj, self.org_parent, loc, "_fk")
+            self.nonscaling = make_nonscaling_child_edit_bones(self.obj, self.org_parent, loc, "_fk")
+            self.copied_bones += [(self.org_parent, name) for name in self.nonscaling]
+            parent = self.nonscaling[0]
         else:
+            self.nonscaling = None
             parent = None
 
         # Create the control bones
-        ulimb = copy_bone(self.obj, self.org_bones[0], strip_org(insert_before_lr(self.org_bones[0], ".fk")))
-        flimb = copy_bone(self.obj, self.org_bones[1], strip_org(insert_before_lr(self.org_bones[1], ".fk")))
-        elimb = copy_bone(self.obj, self.org_bones[2], strip_org(insert_before_lr(self.org_bones[2], ".fk")))
+        ulimb = self.copy_bone(self.org_bones[0], strip_org(insert_before_lr(self.org_bones[0], ".fk")))
+        flimb = self.copy_bone(self.org_bones[1], strip_org(insert_before_lr(self.org_bones[1], ".fk")))
+        elimb = self.copy_bone(self.org_bones[2], strip_org(insert_before_lr(self.org_bones[2], ".fk")))
 
         # Create the end-limb mechanism bone
-        elimb_mch = copy_bone(self.obj, self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[2])))
+        elimb_mch = self.copy_bone(self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[2])))
 
         # Create the anti-stretch bones
         # These sit between a parent and its child, and counteract the
         # stretching of the parent so that the child is unaffected
-        fantistr = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], "_antistr.fk"))))
-        eantistr = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], "_antistr.fk"))))
+        fantistr = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], "_antistr.fk"))))
+        eantistr = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], "_antistr.fk"))))
 
         # Create the hinge bones
+        socket1 = socket2 = None
         if parent != None:
-            socket1 = copy_bone(self.obj, ulimb, make_mechanism_name(ulimb + ".socket1"))
-            socket2 = copy_bone(self.obj, ulimb, make_mechanism_name(ulimb + ".socket2"))
+            socket1 = self.copy_bone(ulimb, make_mechanism_name(ulimb + ".socket1"))
+            socket2 = self.copy_bone(ulimb, make_mechanism_name(ulimb + ".socket2"))
 
         # Get edit bones
         eb = self.obj.data.edit_bones
@@ -125,8 +138,23 @@ class FKLimb:
             socket1_e.length /= 4
             socket2_e.length /= 3
 
-        # Object mode, get pose bones
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.parent = parent
+        self.bones = [ulimb, flimb, elimb, elimb_mch, fantistr, eantistr, socket1, socket2]
+        return [ulimb, flimb, elimb, elimb_mch]
+
+    def pose_setup(self):
+        """ Set up the pose bones, properties, constraints and drivers of
+            the limb.
+        """
+        ulimb, flimb, elimb, elimb_mch, fantistr, eantistr, socket1, socket2 = self.bones
+        parent = self.parent
+
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+        if self.nonscaling != None:
+            constrain_nonscaling_child(self.obj, *self.nonscaling)
+
+        # Get pose bones
         pb = self.obj.pose.bones
 
         ulimb_p = pb[ulimb]
@@ -277,6 +305,11 @@ class FKLimb:
             flimb_p.bone.layers = self.layers
             elimb_p.bone.layers = self.layers
 
+    def widgets(self):
+        """ Create the control widgets.
+        """
+        ulimb, flimb, elimb = self.bones[:3]
+
         # Create control widgets
         create_limb_widget(self.obj, ulimb)
         create_limb_widget(self.obj, flimb)
@@ -292,8 +325,6 @@ class FKLimb:
             mod = ob.modifiers.new("subsurf", 'SUBSURF')
             mod.levels = 2
 
-        return [ulimb, flimb, elimb, elimb_mch]
-
 
 class IKLimb:
     """ An IK limb rig, with an optional ik/fk switch.
@@ -320,39 +351,51 @@ class IKLimb:
         self.bend_hint = bend_hint
         self.primary_rotation_axis = primary_rotation_axis
 
-    def generate(self):
-        bpy.ops.object.mode_set(mode='EDIT')
+    def copy_bone(self, bone_name, assign_name=''):
+        bone_name_2 = copy_edit_bone(self.obj, bone_name, assign_name)
+        self.copied_bones.append((bone_name, bone_name_2))
+        return bone_name_2
+
+    def edit_bones(self):
+        """ Create, position and parent the bones of the limb, and return
+            the names of the controls.
+        """
+        self.copied_bones = []
 
         # Create non-scaling parent bone
         if self.org_parent != None:
             loc = Vector(self.obj.data.edit_bones[self.org_bones[0]].head)
-            parent = make_nonscaling_child(self.obj, self.org_parent, loc, "_ik")
+            self.nonscaling = make_nonscaling_child_edit_bones(self.obj, self.org_parent, loc, "_ik")
+            self.copied_bones += [(self.org_parent, name) for name in self.nonscaling]
+            parent = self.nonscaling[0]
             if self.pole_parent == None:
                 self.pole_parent = parent
         else:
+            self.nonscaling = None
             parent = None
 
         # Create the bones
-        ulimb = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], ".ik"))))
-        flimb = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".ik"))))
-        elimb = copy_bone(self.obj, self.org_bones[2], strip_org(insert_before_lr(self.org_bones[2], ".ik")))
-        elimb_mch = copy_bone(self.obj, self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[2])))
+        ulimb = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], ".ik"))))
+        flimb = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".ik"))))
+        elimb = self.copy_bone(self.org_bones[2], strip_org(insert_before_lr(self.org_bones[2], ".ik")))
+        elimb_mch = self.copy_bone(self.org_bones[2], make_mechanism_name(strip_org(self.org_bones[2])))
 
-        ulimb_nostr = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], ".nostr.ik"))))
-        flimb_nostr = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".nostr.ik"))))
+        ulimb_nostr = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], ".nostr.ik"))))
+        flimb_nostr = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".nostr.ik"))))
 
-        ulimb_str = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], ".stretch.ik"))))
-        flimb_str = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".stretch.ik"))))
+        ulimb_str = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], ".stretch.ik"))))
+        flimb_str = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".stretch.ik"))))
 
         pole_target_name = self.pole_target_base_name + "." + insert_before_lr(self.org_bones[0], ".ik").split(".", 1)[1]
-        pole = copy_bone(self.obj, self.org_bones[0], pole_target_name)
+        pole = self.copy_bone(self.org_bones[0], pole_target_name)
         if self.pole_parent == self.org_bones[2]:
             self.pole_parent = elimb_mch
+        pole_par = None
         if self.pole_parent != None:
-            pole_par = copy_bone(self.obj, self.pole_parent, make_mechanism_name(insert_before_lr(pole_target_name, "_parent")))
+            pole_par = self.copy_bone(self.pole_parent, make_mechanism_name(insert_before_lr(pole_target_name, "_parent")))
 
-        viselimb = copy_bone(self.obj, self.org_bones[2], "VIS-" + strip_org(insert_before_lr(self.org_bones[2], ".ik")))
-        vispole = copy_bone(self.obj, self.org_bones[1], "VIS-" + strip_org(insert_before_lr(self.org_bones[0], "_pole.ik")))
+        viselimb = self.copy_bone(self.org_bones[2], "VIS-" + strip_org(insert_before_lr(self.org_bones[2], ".ik")))
+        vispole = self.copy_bone(self.org_bones[1], "VIS-" + strip_org(insert_before_lr(self.org_bones[0], "_pole.ik")))
 
         # Get edit bones
         eb = self.obj.data.edit_bones
@@ -441,10 +484,23 @@ class IKLimb:
         plane = (flimb_e.tail - ulimb_e.head).normalized()
         vec1 = ulimb_e.x_axis.normalized()
         vec2 = (pole_e.head - ulimb_e.head).normalized()
-        pole_offset = angle_on_plane(plane, vec1, vec2)
+        self.pole_offset = angle_on_plane(plane, vec1, vec2)
 
-        # Object mode, get pose bones
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.bones = [ulimb, flimb, elimb, elimb_mch, pole, vispole, viselimb, ulimb_nostr, flimb_nostr, ulimb_str, flimb_str, pole_par]
+        return [ulimb, flimb, elimb, elimb_mch, pole, vispole, viselimb]
+
+    def pose_setup(self):
+        """ Set up the pose bones, properties, constraints and drivers of
+            the limb.
+        """
+        ulimb, flimb, elimb, elimb_mch, pole, vispole, viselimb, ulimb_nostr, flimb_nostr, ulimb_str, flimb_str, pole_par = self.bones
+
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+        if self.nonscaling != None:
+            constrain_nonscaling_child(self.obj, *self.nonscaling)
+
+        # Get pose bones
         pb = self.obj.pose.bones
 
         ulimb_p = pb[ulimb]
@@ -605,7 +661,7 @@ class IKLimb:
         con.subtarget = elimb_mch
         con.pole_target = self.obj
         con.pole_subtarget = pole
-        con.pole_angle = pole_offset
+        con.pole_angle = self.pole_offset
         con.chain_count = 2
 
         con = flimb_p.constraints.new('IK')
@@ -735,6 +791,11 @@ class IKLimb:
             viselimb_p.bone.layers = self.layers
             vispole_p.bone.layers = self.layers
 
+    def widgets(self):
+        """ Create the control widgets.
+        """
+        elimb, elimb_mch, pole, vispole, viselimb = self.bones[2:7]
+
         # Create widgets
         create_line_widget(self.obj, vispole)
         create_line_widget(self.obj, viselimb)
@@ -751,8 +812,6 @@ class IKLimb:
             mod = ob.modifiers.new("subsurf", 'SUBSURF')
             mod.levels = 2
 
-        return [ulimb, flimb, elimb, elimb_mch, pole, vispole, viselimb]
-
 
 class RubberHoseLimb:
     def __init__(self, obj, bone1, bone2, bone3, use_complex_limb, junc_base_name, primary_rotation_axis, layers):
@@ -773,23 +832,34 @@ class RubberHoseLimb:
         self.use_complex_limb = use_complex_limb
         self.junc_base_name = junc_base_name
 
-    def generate(self):
-        bpy.ops.object.mode_set(mode='EDIT')
+    def copy_bone(self, bone_name, assign_name=''):
+        bone_name_2 = copy_edit_bone(self.obj, bone_name, assign_name)
+        self.copied_bones.append((bone_name, bone_name_2))
+        return bone_name_2
+
+    def edit_bones(self):
+        """ Create, position and parent the bones of the limb, and return
+            the names of the controls.
+        """
+        self.copied_bones = []
 
         # Create non-scaling parent bone
         if self.org_parent != None:
             loc = Vector(self.obj.data.edit_bones[self.org_bones[0]].head)
-            parent = make_nonscaling_child(self.obj, self.org_parent, loc, "_rh")
+            self.nonscaling = make_nonscaling_child_edit_bones(self.obj, self.org_parent, loc, "_rh")
+            self.copied_bones += [(self.org_parent, name) for name in self.nonscaling]
+            parent = self.nonscaling[0]
         else:
+            self.nonscaling = None
             parent = None
 
         if not self.use_complex_limb:
             # Simple rig
 
             # Create bones
-            ulimb = copy_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0])))
-            flimb = copy_bone(self.obj, self.org_bones[1], make_deformer_name(strip_org(self.org_bones[1])))
-            elimb = copy_bone(self.obj, self.org_bones[2], make_deformer_name(strip_org(self.org_bones[2])))
+            ulimb = self.copy_bone(self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0])))
+            flimb = self.copy_bone(self.org_bones[1], make_deformer_name(strip_org(self.org_bones[1])))
+            elimb = self.copy_bone(self.org_bones[2], make_deformer_name(strip_org(self.org_bones[2])))
 
             # Get edit bones
             eb = self.obj.data.edit_bones
@@ -809,30 +879,7 @@ class RubberHoseLimb:
                 elimb_e.use_connect = False
                 ulimb_e.parent = eb[parent]
 
-            # Object mode, get pose bones
-            bpy.ops.object.mode_set(mode='OBJECT')
-            pb = self.obj.pose.bones
-
-            ulimb_p = pb[ulimb]
-            flimb_p = pb[flimb]
-            elimb_p = pb[elimb]
-
-            # Constrain def bones to org bones
-            con = ulimb_p.constraints.new('COPY_TRANSFORMS')
-            con.name = "def"
-            con.target = self.obj
-            con.subtarget = self.org_bones[0]
-
-            con = flimb_p.constraints.new('COPY_TRANSFORMS')
-            con.name = "def"
-            con.target = self.obj
-            con.subtarget = self.org_bones[1]
-
-            con = elimb_p.constraints.new('COPY_TRANSFORMS')
-            con.name = "def"
-            con.target = self.obj
-            con.subtarget = self.org_bones[2]
-
+            self.bones = [ulimb, flimb, elimb]
             return []
         else:
             # Complex rig
@@ -846,33 +893,33 @@ class RubberHoseLimb:
 
             # Create bones
             # Deformation bones
-            ulimb1 = copy_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(insert_before_lr(self.org_bones[0], ".01"))))
-            ulimb2 = copy_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(insert_before_lr(self.org_bones[0], ".02"))))
-            flimb1 = copy_bone(self.obj, self.org_bones[1], make_deformer_name(strip_org(insert_before_lr(self.org_bones[1], ".01"))))
-            flimb2 = copy_bone(self.obj, self.org_bones[1], make_deformer_name(strip_org(insert_before_lr(self.org_bones[1], ".02"))))
-            elimb = copy_bone(self.obj, self.org_bones[2], make_deformer_name(strip_org(self.org_bones[2])))
+            ulimb1 = self.copy_bone(self.org_bones[0], make_deformer_name(strip_org(insert_before_lr(self.org_bones[0], ".01"))))
+            ulimb2 = self.copy_bone(self.org_bones[0], make_deformer_name(strip_org(insert_before_lr(self.org_bones[0], ".02"))))
+            flimb1 = self.copy_bone(self.org_bones[1], make_deformer_name(strip_org(insert_before_lr(self.org_bones[1], ".01"))))
+            flimb2 = self.copy_bone(self.org_bones[1], make_deformer_name(strip_org(insert_before_lr(self.org_bones[1], ".02"))))
+            elimb = self.copy_bone(self.org_bones[2], make_deformer_name(strip_org(self.org_bones[2])))
 
             # Bones for switchable smooth bbone transition at elbow/knee
-            ulimb2_smoother = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], "_smth.02"))))
-            flimb1_smoother = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], "_smth.01"))))
-            flimb1_pos = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".01"))))
+            ulimb2_smoother = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[0], "_smth.02"))))
+            flimb1_smoother = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], "_smth.01"))))
+            flimb1_pos = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".01"))))
 
             # Elbow/knee junction bone
-            junc = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".junc"))))
+            junc = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(self.org_bones[1], ".junc"))))
 
             # Hose controls
-            uhoseend = new_bone(self.obj, strip_org(insert_before_lr(self.org_bones[0], "_hose_end")))
-            uhose = new_bone(self.obj, strip_org(insert_before_lr(self.org_bones[0], "_hose")))
-            jhose = new_bone(self.obj, self.junc_base_name + "_hose." + lr)
-            fhose = new_bone(self.obj, strip_org(insert_before_lr(self.org_bones[1], "_hose")))
-            fhoseend = new_bone(self.obj, strip_org(insert_before_lr(self.org_bones[1], "_hose_end")))
+            uhoseend = new_edit_bone(self.obj, strip_org(insert_before_lr(self.org_bones[0], "_hose_end")))
+            uhose = new_edit_bone(self.obj, strip_org(insert_before_lr(self.org_bones[0], "_hose")))
+            jhose = new_edit_bone(self.obj, self.junc_base_name + "_hose." + lr)
+            fhose = new_edit_bone(self.obj, strip_org(insert_before_lr(self.org_bones[1], "_hose")))
+            fhoseend = new_edit_bone(self.obj, strip_org(insert_before_lr(self.org_bones[1], "_hose_end")))
 
             # Hose control parents
-            uhoseend_par = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(uhoseend, "_p"))))
-            uhose_par = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(uhose, "_p"))))
-            jhose_par = copy_bone(self.obj, junc, make_mechanism_name(strip_org(insert_before_lr(jhose, "_p"))))
-            fhose_par = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(fhose, "_p"))))
-            fhoseend_par = copy_bone(self.obj, self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(fhoseend, "_p"))))
+            uhoseend_par = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(uhoseend, "_p"))))
+            uhose_par = self.copy_bone(self.org_bones[0], make_mechanism_name(strip_org(insert_before_lr(uhose, "_p"))))
+            jhose_par = self.copy_bone(junc, make_mechanism_name(strip_org(insert_before_lr(jhose, "_p"))))
+            fhose_par = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(fhose, "_p"))))
+            fhoseend_par = self.copy_bone(self.org_bones[1], make_mechanism_name(strip_org(insert_before_lr(fhoseend, "_p"))))
 
             # Get edit bones
             eb = self.obj.data.edit_bones
@@ -1037,9 +1084,48 @@ class RubberHoseLimb:
             fhose_e.length = l
             fhoseend_e.length = l
 
-            # Object mode, get pose bones
-            bpy.ops.object.mode_set(mode='OBJECT')
-            pb = self.obj.pose.bones
+            self.bones = [ulimb1, ulimb2, flimb1, flimb2, elimb, ulimb2_smoother, flimb1_smoother, flimb1_pos, junc,
+                          uhoseend, uhose, jhose, fhose, fhoseend, uhoseend_par, uhose_par, jhose_par, fhose_par, fhoseend_par]
+            return [uhoseend, uhose, jhose, fhose, fhoseend]
+
+    def pose_setup(self):
+        """ Set up the pose bones, properties and constraints of the limb.
+        """
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+        if self.nonscaling != None:
+            constrain_nonscaling_child(self.obj, *self.nonscaling)
+
+        # Get pose bones
+        pb = self.obj.pose.bones
+
+        if not self.use_complex_limb:
+            # Simple rig
+            ulimb, flimb, elimb = self.bones
+
+            ulimb_p = pb[ulimb]
+            flimb_p = pb[flimb]
+            elimb_p = pb[elimb]
+
+            # Constrain def bones to org bones
+            con = ulimb_p.constraints.new('COPY_TRANSFORMS')
+            con.name = "def"
+            con.target = self.obj
+            con.subtarget = self.org_bones[0]
+
+            con = flimb_p.constraints.new('COPY_TRANSFORMS')
+            con.name = "def"
+            con.target = self.obj
+            con.subtarget = self.org_bones[1]
+
+            con = elimb_p.constraints.new('COPY_TRANSFORMS')
+            con.name = "def"
+            con.target = self.obj
+            con.subtarget = self.org_bones[2]
+        else:
+            # Complex rig
+            (ulimb1, ulimb2, flimb1, flimb2, elimb, ulimb2_smoother, flimb1_smoother, flimb1_pos, junc,
+             uhoseend, uhose, jhose, fhose, fhoseend, uhoseend_par, uhose_par, jhose_par, fhose_par, fhoseend_par) = self.bones
 
             ulimb1_p = pb[ulimb1]
             ulimb2_p = pb[ulimb2]
@@ -1285,11 +1371,14 @@ class RubberHoseLimb:
                 fhose_p.bone.layers = layers
                 fhoseend_p.bone.layers = layers
 
-            # Create widgets
+    def widgets(self):
+        """ Create the hose control widgets.
+        """
+        if self.use_complex_limb:
+            uhoseend, uhose, jhose, fhose, fhoseend = self.bones[9:14]
+
             create_sphere_widget(self.obj, uhoseend)
             create_sphere_widget(self.obj, uhose)
             create_sphere_widget(self.obj, jhose)
             create_sphere_widget(self.obj, fhose)
             create_sphere_widget(self.obj, fhoseend)
-
-            return [uhoseend, uhose, jhose, fhose, fhoseend]
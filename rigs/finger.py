@@ -25,7 +25,7 @@ from rna_prop_ui import rna_idprop_ui_prop_get
 from mathutils import Vector
 
 from ..utils import MetarigError
-from ..utils import copy_bone
+from ..utils import copy_edit_bone, copy_bone_properties
 from ..utils import connected_children_names
 from ..utils import strip_org, make_mechanism_name, make_deformer_name
 from ..utils import create_widget, create_limb_widget
@@ -55,25 +55,27 @@ class Rig:
         self.primary_rotation_axis = params.primary_rotation_axis
         self.use_digit_twist = params.use_digit_twist
 
-    def deform(self):
-        """ Generate the deformation rig.
+    def deform_edit_bones(self):
+        """ Create the deformation bones.
             Just a copy of the original bones, except the first digit which is a twist bone.
         """
-        bpy.ops.object.mode_set(mode='EDIT')
-
         # Create the bones
         # First bone is a twist bone
         if self.use_digit_twist:
-            b1a = copy_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0] + ".01")))
-            b1b = copy_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0] + ".02")))
-            b1tip = copy_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(self.org_bones[0] + ".tip")))
+            b1a = copy_edit_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0] + ".01")))
+            b1b = copy_edit_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0] + ".02")))
+            b1tip = copy_edit_bone(self.obj, self.org_bones[0], make_mechanism_name(strip_org(self.org_bones[0] + ".tip")))
+            self.copied_bones += [(self.org_bones[0], b) for b in (b1a, b1b, b1tip)]
+            self.def_twist = (b1a, b1tip)
         else:
-            b1 = copy_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0])))
+            b1 = copy_edit_bone(self.obj, self.org_bones[0], make_deformer_name(strip_org(self.org_bones[0])))
+            self.copied_bones += [(self.org_bones[0], b1)]
 
         # The rest are normal
         bones = []
         for bone in self.org_bones[1:]:
-            bones += [copy_bone(self.obj, bone, make_deformer_name(strip_org(bone)))]
+            bones += [copy_edit_bone(self.obj, bone, make_deformer_name(strip_org(bone)))]
+        self.copied_bones += zip(self.org_bones[1:], bones)
 
         # Position bones
         eb = self.obj.data.edit_bones
@@ -104,10 +106,13 @@ class Rig:
             eb[ba].use_connect = False
             eb[ba].parent = eb[bb]
 
+    def deform_pose_setup(self):
+        """ Set up the constraints of the deformation bones.
+        """
         # Constraints
         if self.use_digit_twist:
-            bpy.ops.object.mode_set(mode='OBJECT')
             pb = self.obj.pose.bones
+            b1a, b1tip = self.def_twist
 
             b1a_p = pb[b1a]
 
@@ -126,22 +131,22 @@ class Rig:
             con.target = self.obj
             con.subtarget = b1tip
 
-    def control(self):
-        """ Generate the control rig.
+    def control_edit_bones(self):
+        """ Create the control bones.
         """
-        bpy.ops.object.mode_set(mode='EDIT')
-
         # Figure out the name for the control bone (remove the last .##)
         ctrl_name = re.sub("([0-9]+\.)", "", strip_org(self.org_bones[0])[::-1], count=1)[::-1]
 
         # Create the bones
-        ctrl = copy_bone(self.obj, self.org_bones[0], ctrl_name)
+        ctrl = copy_edit_bone(self.obj, self.org_bones[0], ctrl_name)
+        self.copied_bones += [(self.org_bones[0], ctrl)]
 
         helpers = []
         bones = []
         for bone in self.org_bones:
-            bones += [copy_bone(self.obj, bone, strip_org(bone))]
-            helpers += [copy_bone(self.obj, bone, make_mechanism_name(strip_org(bone)))]
+            bones += [copy_edit_bone(self.obj, bone, strip_org(bone))]
+            helpers += [copy_edit_bone(self.obj, bone, make_mechanism_name(strip_org(bone)))]
+            self.copied_bones += [(bone, bones[-1]), (bone, helpers[-1])]
 
         # Position bones
         eb = self.obj.data.edit_bones
@@ -166,8 +171,19 @@ class Rig:
 
             prev = b_e
 
+        self.ctrl = ctrl
+        self.ctrl_bones = bones
+        self.helpers = helpers
+
+    def control_pose_setup(self):
+        """ Set up the transform locks, properties and constraints of the
+            control bones.
+        """
+        ctrl = self.ctrl
+        bones = self.ctrl_bones
+        helpers = self.helpers
+
         # Transform locks and rotation mode
-        bpy.ops.object.mode_set(mode='OBJECT')
         pb = self.obj.pose.bones
 
         for bone in bones[1:]:
@@ -181,11 +197,10 @@ class Rig:
         for bone in helpers:
             pb[bone].rotation_mode = 'XYZ'
 
-        # Drivers
+        # Custom properties for the drivers
         i = 1
         val = 1.2 / (len(self.org_bones) - 1)
         for bone in helpers:
-            # Add custom prop
             prop_name = "bend_%02d" % i
             prop = rna_idprop_ui_prop_get(pb[ctrl], prop_name, create=True)
             prop["min"] = 0.0
@@ -197,6 +212,41 @@ class Rig:
             else:
                 pb[ctrl][prop_name] = val
 
+            i += 1
+
+        # Constraints
+        con = pb[helpers[0]].constraints.new('COPY_LOCATION')
+        con.name = "copy_location"
+        con.target = self.obj
+        con.subtarget = ctrl
+
+        con = pb[helpers[0]].constraints.new('COPY_ROTATION')
+        con.name = "copy_rotation"
+        con.target = self.obj
+        con.subtarget = ctrl
+
+        # Constrain org bones to the control bones
+        for (bone, org) in zip(bones, self.org_bones):
+            con = pb[org].constraints.new('COPY_TRANSFORMS')
+            con.name = "copy_transforms"
+            con.target = self.obj
+            con.subtarget = bone
+
+        # Set layers for extra control bones
+        if self.ex_layers:
+            for bone in bones:
+                pb[bone].bone.layers = self.ex_layers
+
+    def control_drivers(self):
+        """ Create the drivers that bend the finger.
+        """
+        ctrl = self.ctrl
+        pb = self.obj.pose.bones
+
+        i = 1
+        for bone in self.helpers:
+            prop_name = "bend_%02d" % i
+
             # Add driver
             if 'X' in self.primary_rotation_axis:
                 fcurve = pb[bone].driver_add("rotation_euler", 0)
@@ -227,31 +277,10 @@ class Rig:
 
             i += 1
 
-        # Constraints
-        con = pb[helpers[0]].constraints.new('COPY_LOCATION')
-        con.name = "copy_location"
-        con.target = self.obj
-        con.subtarget = ctrl
-
-        con = pb[helpers[0]].constraints.new('COPY_ROTATION')
-        con.name = "copy_rotation"
-        con.target = self.obj
-        con.subtarget = ctrl
-
-        # Constrain org bones to the control bones
-        for (bone, org) in zip(bones, self.org_bones):
-            con = pb[org].constraints.new('COPY_TRANSFORMS')
-            con.name = "copy_transforms"
-            con.target = self.obj
-            con.subtarget = bone
-
-        # Set layers for extra control bones
-        if self.ex_layers:
-            for bone in bones:
-                pb[bone].bone.layers = self.ex_layers
-
-        # Create control widgets
-        w = create_widget(self.obj, ctrl)
+    def control_widgets(self):
+        """ Create the control widgets.
+        """
+        w = create_widget(self.obj, self.ctrl)
         if w != None:
             mesh = w.data
             verts = [(0, 0, 0), (0, 1, 0), (0.05, 1, 0), (0.05, 1.1, 0), (-0.05, 1.1, 0), (-0.05, 1, 0)]
@@ -265,16 +294,32 @@ class Rig:
             mesh.from_pydata(verts, edges, [])
             mesh.update()
 
-        for bone in bones:
+        for bone in self.ctrl_bones:
             create_limb_widget(self.obj, bone)
 
-    def generate(self):
-        """ Generate the rig.
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
+        """
+        self.copied_bones = []
+        self.deform_edit_bones()
+        self.control_edit_bones()
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
             Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
         """
-        self.deform()
-        self.control()
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+
+        self.deform_pose_setup()
+        self.control_pose_setup()
+
+    def drivers(self):
+        self.control_drivers()
+
+    def widgets(self):
+        self.control_widgets()
 
 
 def add_parameters(params):
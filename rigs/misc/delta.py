@@ -27,7 +27,7 @@ if False:
     import bpy
 
     from ...utils import MetarigError
-    from ...utils import copy_bone
+    from ...utils import copy_edit_bone, copy_bone_properties
     from ...utils import org_name, make_mechanism_name
 
 
@@ -56,16 +56,13 @@ if False:
             self.org_bones = {"delta": bone, "child": bb[bone].children[0].name}
             self.org_names = [org_name(bone), org_name(bb[bone].children[0].name)]
 
-        def generate(self):
-            """ Generate the rig.
-                Do NOT modify any of the original bones, except for adding constraints.
-                The main armature should be selected and active before this is called.
+        def edit_bones(self):
+            """ Create the delta bone.
+                Do NOT modify any of the original bones.
 
             """
-            bpy.ops.object.mode_set(mode='EDIT')
             eb = self.obj.data.edit_bones
 
-            org_delta = self.org_bones["delta"]
             org_delta_e = eb[self.org_bones["delta"]]
             # org_child = self.org_bones["child"]  # UNUSED
             org_child_e = eb[self.org_bones["child"]]
@@ -75,20 +72,26 @@ if False:
             mat = org_delta_e.matrix * child_mat.invert()
 
             # Create the delta bones.
-            delta_e = eb[copy_bone(self.obj, self.org_bones["delta"])]
+            delta_e = eb[copy_edit_bone(self.obj, self.org_bones["delta"])]
             delta_e.name = make_mechanism_name(self.org_names[0])
-            delta = delta_e.name
+            self.delta = delta_e.name
 
             # Set the delta to the matrix's transforms
-            set_mat(self.obj, delta, mat)
+            set_mat(self.obj, self.delta, mat)
+
+        def pose_setup(self):
+            """ Constrain the original bone to the delta bone.
+
+            """
+            org_delta = self.org_bones["delta"]
 
-            bpy.ops.object.mode_set(mode='OBJECT')
+            copy_bone_properties(self.obj, org_delta, self.delta)
 
             # Constrain org_delta to delta
             con = self.obj.pose.bones[org_delta].constraints.new('COPY_TRANSFORMS')
             con.name = "delta"
             con.target = self.obj
-            con.subtarget = delta
+            con.subtarget = self.delta
 
     def create_sample(obj):
         # generated by rigify.utils.write_metarig
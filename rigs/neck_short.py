@@ -22,7 +22,7 @@ import bpy
 from rna_prop_ui import rna_idprop_ui_prop_get
 
 from ..utils import MetarigError
-from ..utils import copy_bone, new_bone, put_bone
+from ..utils import copy_edit_bone, copy_bone_properties, new_edit_bone, put_bone
 from ..utils import connected_children_names
 from ..utils import strip_org, make_mechanism_name, make_deformer_name
 from ..utils import create_circle_widget
@@ -63,23 +63,27 @@ class Rig:
         if self.obj.data.bones[bone_name].parent:
             self.isolate = True
 
-    def gen_deform(self):
-        """ Generate the deformation rig.
+    def deform_edit_bones(self):
+        """ Create the deformation bones.
 
         """
-        for name in self.org_bones:
-            bpy.ops.object.mode_set(mode='EDIT')
-            eb = self.obj.data.edit_bones
+        eb = self.obj.data.edit_bones
 
+        self.def_bones = []
+        for name in self.org_bones:
             # Create deform bone
-            bone_e = eb[copy_bone(self.obj, name)]
+            bone_e = eb[copy_edit_bone(self.obj, name)]
 
             # Change its name
             bone_e.name = make_deformer_name(strip_org(name))
-            bone_name = bone_e.name
+            self.def_bones += [bone_e.name]
 
-            # Leave edit mode
-            bpy.ops.object.mode_set(mode='OBJECT')
+    def deform_pose_setup(self):
+        """ Constrain the deformation bones to the original bones.
+
+        """
+        for name, bone_name in zip(self.org_bones, self.def_bones):
+            copy_bone_properties(self.obj, name, bone_name)
 
             # Get the pose bone
             bone = self.obj.pose.bones[bone_name]
@@ -90,31 +94,33 @@ class Rig:
             con.target = self.obj
             con.subtarget = name
 
-    def gen_control(self):
-        """ Generate the control rig.
+    def control_edit_bones(self):
+        """ Create the neck and head controls.
 
         """
-        #---------------------------------
-        # Create the neck and head controls
-        bpy.ops.object.mode_set(mode='EDIT')
-
         # Create bones
-        neck_ctrl = copy_bone(self.obj, self.org_bones[0], strip_org(self.org_bones[0]))
-        neck_follow = copy_bone(self.obj, self.org_bones[-1], make_mechanism_name(strip_org(self.org_bones[0] + ".follow")))
-        neck_child = new_bone(self.obj, make_mechanism_name(strip_org(self.org_bones[0] + ".child")))
-
-        head_ctrl = copy_bone(self.obj, self.org_bones[-1], strip_org(self.org_bones[-1]))
-        head_mch = new_bone(self.obj, make_mechanism_name(strip_org(self.org_bones[-1])))
+        neck_ctrl = copy_edit_bone(self.obj, self.org_bones[0], strip_org(self.org_bones[0]))
+        neck_follow = copy_edit_bone(self.obj, self.org_bones[-1], make_mechanism_name(strip_org(self.org_bones[0] + ".follow")))
+        neck_child = new_edit_bone(self.obj, make_mechanism_name(strip_org(self.org_bones[0] + ".child")))
+        self.copied_bones = [(self.org_bones[0], neck_ctrl), (self.org_bones[-1], neck_follow)]
+
+        head_ctrl = copy_edit_bone(self.obj, self.org_bones[-1], strip_org(self.org_bones[-1]))
+        head_mch = new_edit_bone(self.obj, make_mechanism_name(strip_org(self.org_bones[-1])))
+        self.copied_bones += [(self.org_bones[-1], head_ctrl)]
         if self.isolate:
-            head_socket1 = copy_bone(self.obj, self.org_bones[-1], make_mechanism_name(strip_org(self.org_bones[-1] + ".socket1")))
-            head_socket2 = copy_bone(self.obj, self.org_bones[-1], make_mechanism_name(strip_org(self.org_bones[-1] + ".socket2")))
+            head_socket1 = copy_edit_bone(self.obj, self.org_bones[-1], make_mechanism_name(strip_org(self.org_bones[-1] + ".socket1")))
+            head_socket2 = copy_edit_bone(self.obj, self.org_bones[-1], make_mechanism_name(strip_org(self.org_bones[-1] + ".socket2")))
+            self.copied_bones += [(self.org_bones[-1], head_socket1), (self.org_bones[-1], head_socket2)]
+        else:
+            head_socket1 = head_socket2 = None
 
         # Create neck chain bones
         neck = []
         helpers = []
         for name in self.org_bones:
-            neck += [copy_bone(self.obj, name, make_mechanism_name(strip_org(name)))]
-            helpers += [copy_bone(self.obj, neck_child, make_mechanism_name(strip_org(name + ".02")))]
+            neck += [copy_edit_bone(self.obj, name, make_mechanism_name(strip_org(name)))]
+            helpers += [copy_edit_bone(self.obj, neck_child, make_mechanism_name(strip_org(name + ".02")))]
+            self.copied_bones += [(name, neck[-1]), (neck_child, helpers[-1])]
 
         # Fetch edit bones
         eb = self.obj.data.edit_bones
@@ -174,16 +180,29 @@ class Rig:
             put_bone(self.obj, name2, eb[name1].head)
             eb[name2].length = eb[name1].length / 2
 
-        # Switch to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.neck_ctrl = neck_ctrl
+        self.neck_follow = neck_follow
+        self.neck_child = neck_child
+        self.head_ctrl = head_ctrl
+        self.head_mch = head_mch
+        self.head_socket1 = head_socket1
+        self.head_socket2 = head_socket2
+        self.neck = neck
+        self.helpers = helpers
+
+    def control_pose_setup(self):
+        """ Set up the properties and constraints of the controls.
+
+        """
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+
         pb = self.obj.pose.bones
-        neck_ctrl_p = pb[neck_ctrl]
-        neck_follow_p = pb[neck_follow]
-        # neck_child_p = pb[neck_child]  # UNUSED
-        head_ctrl_p = pb[head_ctrl]
+        neck_ctrl_p = pb[self.neck_ctrl]
+        neck_follow_p = pb[self.neck_follow]
+        head_ctrl_p = pb[self.head_ctrl]
         if self.isolate:
-            # head_socket1_p = pb[head_socket1]  # UNUSED
-            head_socket2_p = pb[head_socket2]
+            head_socket2_p = pb[self.head_socket2]
 
         # Custom bone appearance
         neck_ctrl_p.custom_shape_transform = pb[self.org_bones[(len(self.org_bones) - 1) // 2]]
@@ -218,46 +237,25 @@ class Rig:
         con = neck_follow_p.constraints.new('COPY_ROTATION')
         con.name = "copy_rotation"
         con.target = self.obj
-        con.subtarget = head_ctrl
-
-        fcurve = con.driver_add("influence")
-        driver = fcurve.driver
-        var = driver.variables.new()
-        driver.type = 'SCRIPTED'
-        var.name = "follow"
-        var.targets[0].id_type = 'OBJECT'
-        var.targets[0].id = self.obj
-        var.targets[0].data_path = head_ctrl_p.path_from_id() + '["neck_follow"]'
-        driver.expression = "follow / 2"
+        con.subtarget = self.head_ctrl
 
         # Isolate
         if self.isolate:
             con = head_socket2_p.constraints.new('COPY_LOCATION')
             con.name = "copy_location"
             con.target = self.obj
-            con.subtarget = head_socket1
+            con.subtarget = self.head_socket1
 
             con = head_socket2_p.constraints.new('COPY_TRANSFORMS')
             con.name = "copy_transforms"
             con.target = self.obj
-            con.subtarget = head_socket1
-
-            fcurve = con.driver_add("influence")
-            driver = fcurve.driver
-            var = driver.variables.new()
-            driver.type = 'SCRIPTED'
-            var.name = "isolate"
-            var.targets[0].id_type = 'OBJECT'
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = head_ctrl_p.path_from_id() + '["isolate"]'
-            driver.expression = "1.0 - isolate"
+            con.subtarget = self.head_socket1
 
         # Neck chain
         first = True
         prev = None
-        i = 0
-        l = len(neck)
-        for (name1, name2, org_name) in zip(neck, helpers, self.org_bones):
+        l = len(self.neck)
+        for (name1, name2, org_name) in zip(self.neck, self.helpers, self.org_bones):
             con = pb[org_name].constraints.new('COPY_TRANSFORMS')
             con.name = "copy_transforms"
             con.target = self.obj
@@ -266,23 +264,69 @@ class Rig:
             n_con = pb[name2].constraints.new('COPY_TRANSFORMS')
             n_con.name = "neck"
             n_con.target = self.obj
-            n_con.subtarget = neck_child
+            n_con.subtarget = self.neck_child
 
             h_con = pb[name2].constraints.new('COPY_TRANSFORMS')
             h_con.name = "head"
             h_con.target = self.obj
-            h_con.subtarget = head_mch
+            h_con.subtarget = self.head_mch
 
             con = pb[name2].constraints.new('COPY_LOCATION')
             con.name = "anchor"
             con.target = self.obj
             if first:
-                con.subtarget = neck_ctrl
+                con.subtarget = self.neck_ctrl
             else:
                 con.subtarget = prev
                 con.head_tail = 1.0
 
-            # Drivers
+            # Head influence of the last bone isn't driven
+            if name2 == self.helpers[-1]:
+                h_con.influence = 1.0
+
+            first = False
+            prev = name1
+
+    def control_drivers(self):
+        """ Drive the neck follow, isolation and neck chain influences
+            from the head control's properties.
+
+        """
+        pb = self.obj.pose.bones
+        head_ctrl_p = pb[self.head_ctrl]
+
+        # Neck follow
+        con = pb[self.neck_follow].constraints["copy_rotation"]
+        fcurve = con.driver_add("influence")
+        driver = fcurve.driver
+        var = driver.variables.new()
+        driver.type = 'SCRIPTED'
+        var.name = "follow"
+        var.targets[0].id_type = 'OBJECT'
+        var.targets[0].id = self.obj
+        var.targets[0].data_path = head_ctrl_p.path_from_id() + '["neck_follow"]'
+        driver.expression = "follow / 2"
+
+        # Isolate
+        if self.isolate:
+            con = pb[self.head_socket2].constraints["copy_transforms"]
+            fcurve = con.driver_add("influence")
+            driver = fcurve.driver
+            var = driver.variables.new()
+            driver.type = 'SCRIPTED'
+            var.name = "isolate"
+            var.targets[0].id_type = 'OBJECT'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = head_ctrl_p.path_from_id() + '["isolate"]'
+            driver.expression = "1.0 - isolate"
+
+        # Neck chain
+        i = 0
+        l = len(self.neck)
+        for name2 in self.helpers:
+            n_con = pb[name2].constraints["neck"]
+            h_con = pb[name2].constraints["head"]
+
             n = (i + 1) / l
 
             # Neck influence
@@ -297,9 +341,7 @@ class Rig:
             driver.expression = "1.0 if (%.4f > (1.0-ext) or (1.0-ext) == 0.0) else (%.4f / (1.0-ext))" % (n, n)
 
             # Head influence
-            if (i + 1) == l:
-                h_con.influence = 1.0
-            else:
+            if (i + 1) != l:
                 fcurve = h_con.driver_add("influence")
                 driver = fcurve.driver
                 var = driver.variables.new()
@@ -310,27 +352,41 @@ class Rig:
                 var.targets[0].data_path = head_ctrl_p.path_from_id() + '["inf_extent"]'
                 driver.expression = "0.0 if (%.4f <= (1.0-ext)) else ((%.4f - (1.0-ext)) / ext)" % (n, n)
 
-            first = False
-            prev = name1
             i += 1
 
-        # Create control widgets
-        create_circle_widget(self.obj, neck_ctrl, radius=1.0, head_tail=0.5, bone_transform_name=self.org_bones[(len(self.org_bones) - 1) // 2])
-        create_circle_widget(self.obj, head_ctrl, radius=1.0, head_tail=0.5, bone_transform_name=self.org_bones[-1])
+    def control_widgets(self):
+        """ Create the control widgets.
+
+        """
+        create_circle_widget(self.obj, self.neck_ctrl, radius=1.0, head_tail=0.5, bone_transform_name=self.org_bones[(len(self.org_bones) - 1) // 2])
+        create_circle_widget(self.obj, self.head_ctrl, radius=1.0, head_tail=0.5, bone_transform_name=self.org_bones[-1])
 
-        # Return control bones
-        return (head_ctrl, neck_ctrl)
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
+
+        """
+        self.deform_edit_bones()
+        self.control_edit_bones()
 
-    def generate(self):
-        """ Generate the rig.
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
             Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
 
         """
-        self.gen_deform()
-        (head, neck) = self.gen_control()
+        self.deform_pose_setup()
+        self.control_pose_setup()
+
+    def drivers(self):
+        self.control_drivers()
+
+    def widgets(self):
+        """ Create the widgets of the rig, and return the ui script.
+
+        """
+        self.control_widgets()
 
-        script = script1 % (head, neck)
+        script = script1 % (self.head_ctrl, self.neck_ctrl)
         if self.isolate:
             script += script2
         script += script3
@@ -24,8 +24,9 @@ from math import cos, pi
 import bpy
 
 from ..utils import MetarigError
-from ..utils import copy_bone
+from ..utils import copy_edit_bone, copy_bone_properties
 from ..utils import strip_org, deformer
+from ..utils import get_topology
 from ..utils import create_widget
 
 
@@ -34,6 +35,10 @@ def bone_siblings(obj, bone):
         This requires that the bones has a parent.
 
     """
+    topology = get_topology(obj, bone)
+    if topology is not None:
+        return topology.siblings(bone)
+
     parent = obj.data.bones[bone].parent
 
     if parent is None:
@@ -81,36 +86,43 @@ class Rig:
         # Get rig parameters
         self.palm_rotation_axis = params.palm_rotation_axis
 
-    def generate(self):
-        """ Generate the rig.
-            Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
-
         # Figure out the name for the control bone (remove the last .##)
         last_bone = self.org_bones[-1:][0]
         ctrl_name = re.sub("([0-9]+\.)", "", strip_org(last_bone)[::-1], count=1)[::-1]
 
         # Make control bone
-        ctrl = copy_bone(self.obj, last_bone, ctrl_name)
+        self.ctrl = copy_edit_bone(self.obj, last_bone, ctrl_name)
 
         # Make deformation bones
-        def_bones = []
+        self.def_bones = []
         for bone in self.org_bones:
-            b = copy_bone(self.obj, bone, deformer(strip_org(bone)))
-            def_bones += [b]
+            b = copy_edit_bone(self.obj, bone, deformer(strip_org(bone)))
+            self.def_bones += [b]
 
         # Parenting
         eb = self.obj.data.edit_bones
 
-        for d, b in zip(def_bones, self.org_bones):
+        for d, b in zip(self.def_bones, self.org_bones):
             eb[d].use_connect = False
             eb[d].parent = eb[b]
 
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+
+        """
+        ctrl = self.ctrl
+
+        copy_bone_properties(self.obj, self.org_bones[-1], ctrl)
+        for d, b in zip(self.def_bones, self.org_bones):
+            copy_bone_properties(self.obj, b, d)
+
         # Constraints
-        bpy.ops.object.mode_set(mode='OBJECT')
         pb = self.obj.pose.bones
 
         i = 0
@@ -144,6 +156,11 @@ class Rig:
 
             i += 1
 
+    def widgets(self):
+        """ Create the widgets of the rig.
+        """
+        ctrl = self.ctrl
+
         # Create control widget
         w = create_widget(self.obj, ctrl)
         if w != None:
@@ -19,7 +19,7 @@
 # <pep8 compliant>
 import bpy
 from ....utils       import MetarigError
-from ....utils       import create_widget, copy_bone
+from ....utils       import create_widget
 from ....utils       import strip_org
 from .limb_utils     import *
 from ..super_widgets import create_hand_widget
@@ -28,13 +28,12 @@ from rna_prop_ui     import rna_idprop_ui_prop_get
 def create_arm( cls, bones ):
     org_bones = cls.org_bones
     
-    bpy.ops.object.mode_set(mode='EDIT')
     eb = cls.obj.data.edit_bones
 
     ctrl = get_bone_name( org_bones[2], 'ctrl', 'ik' )
     
     # Create IK arm control
-    ctrl = copy_bone( cls.obj, org_bones[2], ctrl )
+    ctrl = cls.copy_bone( org_bones[2], ctrl )
 
     # clear parent (so that rigify will parent to root) 
     eb[ ctrl ].parent      = None
@@ -43,7 +42,15 @@ def create_arm( cls, bones ):
     # Parent 
     eb[ bones['ik']['mch_target'] ].parent      = eb[ ctrl ]
     eb[ bones['ik']['mch_target'] ].use_connect = False
-    
+
+    bones['ik']['ctrl']['terminal'] = [ ctrl ]
+    bones['terminal'] = { 'ctrl' : ctrl }
+
+    return bones
+
+def setup_arm( cls, bones ):
+    ctrl = bones['terminal']['ctrl']
+
     # Set up constraints
     # Constrain mch target bone to the ik control and mch stretch
    
@@ -101,9 +108,6 @@ def create_arm( cls, bones ):
     drv_modifier.coefficients[0] = 1.0
     drv_modifier.coefficients[1] = -1.0
 
+def create_arm_widgets( cls, bones ):
     # Create hand widget
-    create_hand_widget(cls.obj, ctrl, bone_transform_name=None)
-
-    bones['ik']['ctrl']['terminal'] = [ ctrl ]
-
-    return bones
+    create_hand_widget(cls.obj, bones['terminal']['ctrl'], bone_transform_name=None)
@@ -19,7 +19,7 @@
 # <pep8 compliant>
 import bpy, math
 from ....utils       import MetarigError, connected_children_names
-from ....utils       import create_widget, copy_bone, create_circle_widget
+from ....utils       import create_widget, create_circle_widget
 from ....utils       import strip_org, flip_bone, put_bone
 from rna_prop_ui     import rna_idprop_ui_prop_get
 from ..super_widgets import create_foot_widget, create_ballsocket_widget
@@ -32,12 +32,11 @@ def create_leg( cls, bones ):
 
     bones['ik']['ctrl']['terminal'] = []
     
-    bpy.ops.object.mode_set(mode='EDIT')
     eb = cls.obj.data.edit_bones
 
     # Create toes def bone
     toes_def = get_bone_name( org_bones[-1], 'def' )
-    toes_def = copy_bone( cls.obj, org_bones[-1], toes_def )
+    toes_def = cls.copy_bone( org_bones[-1], toes_def )
 
     eb[ toes_def ].use_connect = False
     eb[ toes_def ].parent      = eb[ bones['def'][-1] ]
@@ -47,7 +46,7 @@ def create_leg( cls, bones ):
 
     # Create IK leg control
     ctrl = get_bone_name( org_bones[2], 'ctrl', 'ik' )
-    ctrl = copy_bone( cls.obj, org_bones[2], ctrl )
+    ctrl = cls.copy_bone( org_bones[2], ctrl )
 
     # clear parent (so that rigify will parent to root) 
     eb[ ctrl ].parent      = None
@@ -55,7 +54,7 @@ def create_leg( cls, bones ):
 
     # Create heel ctrl bone
     heel = get_bone_name( org_bones[2], 'ctrl', 'heel_ik' )
-    heel = copy_bone( cls.obj, org_bones[2], heel )
+    heel = cls.copy_bone( org_bones[2], heel )
     orient_bone( cls, eb[ heel ], 'y', 0.5 )
     eb[ heel ].length = eb[ org_bones[2] ].length / 2
 
@@ -81,7 +80,7 @@ def create_leg( cls, bones ):
 
     # roll1 MCH bone
     roll1_mch = get_bone_name( tmp_heel, 'mch', 'roll' )
-    roll1_mch = copy_bone( cls.obj, org_bones[2], roll1_mch )
+    roll1_mch = cls.copy_bone( org_bones[2], roll1_mch )
 
     # clear parent
     eb[ roll1_mch ].use_connect = False
@@ -91,7 +90,7 @@ def create_leg( cls, bones ):
 
     # Create 2nd roll mch, and two rock mch bones
     roll2_mch = get_bone_name( tmp_heel, 'mch', 'roll' )
-    roll2_mch = copy_bone( cls.obj, org_bones[3], roll2_mch )    
+    roll2_mch = cls.copy_bone( org_bones[3], roll2_mch )    
 
     eb[ roll2_mch ].use_connect = False
     eb[ roll2_mch ].parent      = None
@@ -106,7 +105,7 @@ def create_leg( cls, bones ):
     
     # Rock MCH bones
     rock1_mch = get_bone_name( tmp_heel, 'mch', 'rock' )
-    rock1_mch = copy_bone( cls.obj, tmp_heel, rock1_mch )    
+    rock1_mch = cls.copy_bone( tmp_heel, rock1_mch )    
 
     eb[ rock1_mch ].use_connect = False
     eb[ rock1_mch ].parent      = None    
@@ -115,7 +114,7 @@ def create_leg( cls, bones ):
     eb[ rock1_mch ].length = eb[ tmp_heel ].length / 2
     
     rock2_mch = get_bone_name( tmp_heel, 'mch', 'rock' )
-    rock2_mch = copy_bone( cls.obj, tmp_heel, rock2_mch )
+    rock2_mch = cls.copy_bone( tmp_heel, rock2_mch )
 
     eb[ rock2_mch ].use_connect = False
     eb[ rock2_mch ].parent      = None    
@@ -129,6 +128,46 @@ def create_leg( cls, bones ):
     eb[ rock1_mch ].parent = eb[ rock2_mch ]
     eb[ rock2_mch ].parent = eb[ ctrl ]
 
+    if len( org_bones ) >= 4:
+        # Create toes control bone
+        toes = get_bone_name( org_bones[3], 'ctrl' )
+        toes = cls.copy_bone( org_bones[3], toes )
+
+        eb[ toes ].use_connect = False
+        eb[ toes ].parent      = eb[ org_bones[3] ]
+
+        bones['ik']['ctrl']['terminal'] += [ toes ]
+    else:
+        toes = ''
+
+    bones['ik']['ctrl']['terminal'] += [ heel, ctrl ]
+    bones['terminal'] = {
+        'ctrl'      : ctrl,
+        'heel'      : heel,
+        'tmp_heel'  : tmp_heel,
+        'roll1_mch' : roll1_mch,
+        'roll2_mch' : roll2_mch,
+        'rock1_mch' : rock1_mch,
+        'rock2_mch' : rock2_mch,
+        'toes'      : toes
+    }
+    
+    return bones
+
+def setup_leg( cls, bones ):
+    org_bones = list(
+        [cls.org_bones[0]] + connected_children_names(cls.obj, cls.org_bones[0])
+    )
+
+    ctrl      = bones['terminal']['ctrl']
+    heel      = bones['terminal']['heel']
+    tmp_heel  = bones['terminal']['tmp_heel']
+    roll1_mch = bones['terminal']['roll1_mch']
+    roll2_mch = bones['terminal']['roll2_mch']
+    rock1_mch = bones['terminal']['rock1_mch']
+    rock2_mch = bones['terminal']['rock2_mch']
+    toes      = bones['terminal']['toes']
+
     # Constrain rock and roll MCH bones
     make_constraint( cls, roll1_mch, {
         'constraint'   : 'COPY_ROTATION',
@@ -257,28 +296,12 @@ def create_leg( cls, bones ):
     drv_modifier.coefficients[0] = 1.0
     drv_modifier.coefficients[1] = -1.0
 
-    # Create leg widget
-    create_foot_widget(cls.obj, ctrl, bone_transform_name=None)
-
     # Create heel ctrl locks
     pb[ heel ].lock_location = True, True, True
     pb[ heel ].lock_rotation = False, False, True
     pb[ heel ].lock_scale    = True, True, True
 
-    # Add ballsocket widget to heel
-    create_ballsocket_widget(cls.obj, heel, bone_transform_name=None)
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    eb = cls.obj.data.edit_bones
-
     if len( org_bones ) >= 4:
-        # Create toes control bone
-        toes = get_bone_name( org_bones[3], 'ctrl' )
-        toes = copy_bone( cls.obj, org_bones[3], toes )
-
-        eb[ toes ].use_connect = False
-        eb[ toes ].parent      = eb[ org_bones[3] ]
-        
         # Constrain toes def bones
         make_constraint( cls, bones['def'][-2], {
             'constraint'  : 'DAMPED_TRACK',
@@ -316,12 +339,19 @@ def create_leg( cls, bones ):
         drv_modifier.poly_order      = 1
         drv_modifier.coefficients[0] = 1.0
         drv_modifier.coefficients[1] = -1.0
-   
-        # Create toe circle widget
-        create_circle_widget(cls.obj, toes, radius=0.4, head_tail=0.5)
 
-        bones['ik']['ctrl']['terminal'] += [ toes ]
 
-    bones['ik']['ctrl']['terminal'] += [ heel, ctrl ]
-    
-    return bones
+def create_leg_widgets( cls, bones ):
+    ctrl = bones['terminal']['ctrl']
+    heel = bones['terminal']['heel']
+    toes = bones['terminal']['toes']
+
+    # Create leg widget
+    create_foot_widget(cls.obj, ctrl, bone_transform_name=None)
+
+    # Add ballsocket widget to heel
+    create_ballsocket_widget(cls.obj, heel, bone_transform_name=None)
+
+    if toes:
+        # Create toe circle widget
+        create_circle_widget(cls.obj, toes, radius=0.4, head_tail=0.5)
@@ -21,7 +21,7 @@ def orient_bone( cls, eb, axis, scale = 1.0, reverse = False ):
     eb.roll = 0.0
 
 def make_constraint( cls, bone, constraint ):
-    bpy.ops.object.mode_set(mode = 'OBJECT')
+    # Called from the pose setup stage, outside of edit mode
     pb = cls.obj.pose.bones
 
     owner_pb = pb[bone]
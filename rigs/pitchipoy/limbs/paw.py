@@ -19,7 +19,7 @@
 # <pep8 compliant>
 import bpy
 from ....utils       import MetarigError, connected_children_names
-from ....utils       import create_widget, copy_bone, create_circle_widget
+from ....utils       import create_widget, create_circle_widget
 from ....utils       import strip_org, flip_bone
 from rna_prop_ui     import rna_idprop_ui_prop_get
 from ..super_widgets import create_foot_widget, create_ballsocket_widget
@@ -32,12 +32,11 @@ def create_paw( cls, bones ):
 
     bones['ik']['ctrl'] = []
     
-    bpy.ops.object.mode_set(mode='EDIT')
     eb = cls.obj.data.edit_bones
 
     # Create toes def bone
     toes_def = get_bone_name( org_bones[-1], 'def' )
-    toes_def = copy_bone( cls.obj, org_bones[-1], toes_def )
+    toes_def = cls.copy_bone( org_bones[-1], toes_def )
 
     eb[ toes_def ].use_connect = False
     eb[ toes_def ].parent      = eb[ bones['def'][-1] ]
@@ -47,7 +46,7 @@ def create_paw( cls, bones ):
     
     # Create heel control bone
     heel = get_bone_name( org_bones[2], 'ctrl', 'heel_ik' )
-    heel = copy_bone( cls.obj, org_bones[2], heel )
+    heel = cls.copy_bone( org_bones[2], heel )
 
     # clear parent
     eb[ heel ].parent      = None
@@ -55,7 +54,7 @@ def create_paw( cls, bones ):
 
     # Create IK paw control
     ctrl = get_bone_name( org_bones[2], 'ctrl', 'ik' )
-    ctrl = copy_bone( cls.obj, org_bones[2], ctrl )
+    ctrl = cls.copy_bone( org_bones[2], ctrl )
 
     # clear parent (so that rigify will parent to root) 
     eb[ ctrl ].parent      = None
@@ -75,6 +74,48 @@ def create_paw( cls, bones ):
     orient_bone( cls, eb[ ctrl ], 'y', reverse = True )
     eb[ ctrl ].length = l
 
+    if len( org_bones ) >= 4:
+        # Create toes control bone
+        toes = get_bone_name( org_bones[3], 'ctrl' )
+        toes = cls.copy_bone( org_bones[3], toes )
+
+        eb[ toes ].use_connect = False
+        eb[ toes ].parent      = eb[ org_bones[3] ]
+        
+        # Create toes mch bone
+        toes_mch = get_bone_name( org_bones[3], 'mch' )
+        toes_mch = cls.copy_bone( org_bones[3], toes_mch )
+
+        eb[ toes_mch ].use_connect = False
+        eb[ toes_mch ].parent      = eb[ ctrl ]
+
+        eb[ toes_mch ].length /= 4
+
+        bones['ik']['ctrl']['terminal'] += [ toes ]
+    else:
+        toes     = ''
+        toes_mch = ''
+
+    bones['ik']['ctrl']['terminal'] += [ heel, ctrl ]
+    bones['terminal'] = {
+        'ctrl'     : ctrl,
+        'heel'     : heel,
+        'toes'     : toes,
+        'toes_mch' : toes_mch
+    }
+
+    return bones
+
+def setup_paw( cls, bones ):
+    org_bones = list(
+        [cls.org_bones[0]] + connected_children_names(cls.obj, cls.org_bones[0])
+    )
+
+    ctrl     = bones['terminal']['ctrl']
+    heel     = bones['terminal']['heel']
+    toes     = bones['terminal']['toes']
+    toes_mch = bones['terminal']['toes_mch']
+
     # Set up constraints
     # Constrain mch target bone to the ik control and mch stretch
    
@@ -134,35 +175,10 @@ def create_paw( cls, bones ):
     drv_modifier.coefficients[0] = 1.0
     drv_modifier.coefficients[1] = -1.0
 
-    # Create paw widget
-    create_foot_widget(cls.obj, ctrl, bone_transform_name=None)
-
     # Create heel ctrl locks
     pb[ heel ].lock_location = True, True, True
 
-    # Add ballsocket widget to heel
-    create_ballsocket_widget(cls.obj, heel, bone_transform_name=None)
-
-    bpy.ops.object.mode_set(mode='EDIT')
-    eb = cls.obj.data.edit_bones
-
     if len( org_bones ) >= 4:
-        # Create toes control bone
-        toes = get_bone_name( org_bones[3], 'ctrl' )
-        toes = copy_bone( cls.obj, org_bones[3], toes )
-
-        eb[ toes ].use_connect = False
-        eb[ toes ].parent      = eb[ org_bones[3] ]
-        
-        # Create toes mch bone
-        toes_mch = get_bone_name( org_bones[3], 'mch' )
-        toes_mch = copy_bone( cls.obj, org_bones[3], toes_mch )
-
-        eb[ toes_mch ].use_connect = False
-        eb[ toes_mch ].parent      = eb[ ctrl ]
-
-        eb[ toes_mch ].length /= 4
-        
         # Constrain 4th ORG to toes MCH bone
         make_constraint( cls, org_bones[3], {
             'constraint'  : 'COPY_TRANSFORMS',
@@ -206,12 +222,19 @@ def create_paw( cls, bones ):
         drv_modifier.poly_order      = 1
         drv_modifier.coefficients[0] = 1.0
         drv_modifier.coefficients[1] = -1.0
-   
-        # Create toe circle widget
-        create_circle_widget(cls.obj, toes, radius=0.4, head_tail=0.5)
 
-        bones['ik']['ctrl']['terminal'] += [ toes ]
 
-    bones['ik']['ctrl']['terminal'] += [ heel, ctrl ]
+def create_paw_widgets( cls, bones ):
+    ctrl = bones['terminal']['ctrl']
+    heel = bones['terminal']['heel']
+    toes = bones['terminal']['toes']
 
-    return bones
+    # Create paw widget
+    create_foot_widget(cls.obj, ctrl, bone_transform_name=None)
+
+    # Add ballsocket widget to heel
+    create_ballsocket_widget(cls.obj, heel, bone_transform_name=None)
+
+    if toes:
+        # Create toe circle widget
+        create_circle_widget(cls.obj, toes, radius=0.4, head_tail=0.5)
@@ -1,11 +1,11 @@
 import bpy, re
-from   .arm            import create_arm
-from   .leg            import create_leg
-from   .paw            import create_paw
+from   .arm            import create_arm, setup_arm, create_arm_widgets
+from   .leg            import create_leg, setup_leg, create_leg_widgets
+from   .paw            import create_paw, setup_paw, create_paw_widgets
 from   .ui             import create_script
 from   .limb_utils     import *
 from   mathutils       import Vector
-from   ....utils       import copy_bone, flip_bone, put_bone, create_cube_widget
+from   ....utils       import copy_edit_bone, copy_bone_properties, flip_bone, put_bone, create_cube_widget
 from   ....utils       import strip_org, make_deformer_name, create_widget
 from   ....utils       import create_circle_widget, create_sphere_widget
 from   ....utils       import MetarigError, make_mechanism_name, org
@@ -39,22 +39,30 @@ class Rig:
         else:
             self.fk_layers = None
 
+    def copy_bone( self, bone_name, assign_name = '' ):
+        # Bone properties are copied over in the pose setup stage
+        bone_name_2 = copy_edit_bone( self.obj, bone_name, assign_name )
+        self.copied_bones.append( ( bone_name, bone_name_2 ) )
+        return bone_name_2
+
     def create_parent( self ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         name = get_bone_name( strip_org( org_bones[0] ), 'mch', 'parent' )
 
-        mch = copy_bone( self.obj, org_bones[0], name )
+        mch = self.copy_bone( org_bones[0], name )
         orient_bone( self, eb[mch], 'y' )
         eb[ mch ].length = eb[ org_bones[0] ].length / 4
 
         eb[ mch ].parent = eb[ org_bones[0] ].parent
         
         eb[ mch ].roll = 0.0
-        
+
+        return mch
+
+    def setup_parent( self, mch ):
         # Constraints
         make_constraint( self, mch, {
             'constraint'  : 'COPY_ROTATION',
@@ -90,12 +98,9 @@ class Rig:
         var.targets[0].data_path = pb[ mch ].path_from_id() + \
                                    '[' + '"' + name + '"' + ']'
 
-        return mch
-
     def create_tweak( self ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         tweaks         = {}        
@@ -109,11 +114,11 @@ class Rig:
                 for j in range( self.segments ):
                     # MCH
                     name = get_bone_name( strip_org(org), 'mch', 'tweak' )
-                    mch = copy_bone( self.obj, org, name )
+                    mch = self.copy_bone( org, name )
                     
                     # CTRL
                     name = get_bone_name( strip_org(org), 'ctrl', 'tweak' )
-                    ctrl = copy_bone( self.obj, org, name )
+                    ctrl = self.copy_bone( org, name )
                     
                     eb[ mch  ].length /= self.segments
                     eb[ ctrl ].length /= self.segments
@@ -133,7 +138,7 @@ class Rig:
 
             else: # Last limb bone - is not subdivided  
                 name = get_bone_name( strip_org(org), 'mch', 'tweak' )      
-                mch = copy_bone( self.obj, org_bones[i-1], name )
+                mch = self.copy_bone( org_bones[i-1], name )
                 eb[ mch ].length = eb[org].length / 4
                 put_bone(
                     self.obj, 
@@ -142,7 +147,7 @@ class Rig:
                 )                        
  
                 ctrl = get_bone_name( strip_org(org), 'ctrl', 'tweak' )
-                ctrl = copy_bone( self.obj, org, ctrl )
+                ctrl = self.copy_bone( org, ctrl )
                 eb[ ctrl ].length = eb[org].length / 2 
 
                 tweaks['mch']  += [ mch  ]
@@ -157,6 +162,9 @@ class Rig:
             eb[ mch  ].length /= 4
             eb[ ctrl ].length /= 2
 
+        return tweaks
+
+    def setup_tweak( self, tweaks ):
         # Contraints
         for i,b in enumerate( tweaks['mch'] ):
             first  = 0
@@ -196,24 +204,23 @@ class Rig:
                     'subtarget'   : tweaks['ctrl'][ dt_target_idx ],
                 })
 
-        # Ctrl bones Locks and Widgets
+        # Ctrl bones Locks
         pb = self.obj.pose.bones
         for t in tweaks['ctrl']:
             pb[t].lock_rotation = True, False, True
             pb[t].lock_scale    = False, True, False
 
-            create_sphere_widget(self.obj, t, bone_transform_name=None)
-            
             if self.tweak_layers:
                 pb[t].bone.layers = self.tweak_layers 
-        
-        return tweaks
+
+    def create_tweak_widgets( self, tweaks ):
+        for t in tweaks['ctrl']:
+            create_sphere_widget(self.obj, t, bone_transform_name=None)
 
 
     def create_def( self, tweaks ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         def_bones = []
@@ -222,7 +229,7 @@ class Rig:
                 # Create segments if specified
                 for j in range( self.segments ):
                     name = get_bone_name( strip_org(org), 'def' )
-                    def_name = copy_bone( self.obj, org, name )
+                    def_name = self.copy_bone( org, name )
                     
                     eb[ def_name ].length /= self.segments
 
@@ -234,7 +241,7 @@ class Rig:
                     def_bones += [ def_name ]
             else:
                 name     = get_bone_name( strip_org(org), 'def' )
-                def_name = copy_bone( self.obj, org, name )
+                def_name = self.copy_bone( org, name )
                 def_bones.append( def_name )
 
         # Parent deform bones
@@ -243,6 +250,18 @@ class Rig:
                 eb[b].parent      = eb[ def_bones[i-1] ] # to previous
                 eb[b].use_connect = True
 
+        # Create bbone segments
+        for bone in def_bones[:-1]:
+            eb[bone].bbone_segments = self.bbones
+
+        eb[ def_bones[0]  ].bbone_in  = 0.0
+        eb[ def_bones[-2] ].bbone_out = 0.0
+        eb[ def_bones[-1] ].bbone_in  = 0.0
+        eb[ def_bones[-1] ].bbone_out = 0.0
+
+        return def_bones
+
+    def setup_def( self, def_bones, tweaks ):
         # Constraint def to tweaks
         for d,t in zip(def_bones, tweaks):
             tidx = tweaks.index(t)
@@ -263,16 +282,6 @@ class Rig:
                     'subtarget'   : tweaks[ tidx + 1 ],
                 })
 
-        # Create bbone segments
-        for bone in def_bones[:-1]:
-            self.obj.data.bones[bone].bbone_segments = self.bbones
-
-        self.obj.data.bones[ def_bones[0]  ].bbone_in  = 0.0
-        self.obj.data.bones[ def_bones[-2] ].bbone_out = 0.0
-        self.obj.data.bones[ def_bones[-1] ].bbone_in  = 0.0
-        self.obj.data.bones[ def_bones[-1] ].bbone_out = 0.0
-
-
         # Rubber hose drivers
         pb = self.obj.pose.bones
         for i,t in enumerate( tweaks[1:-1] ):
@@ -312,14 +321,11 @@ class Rig:
                 var.targets[0].id = self.obj
                 var.targets[0].data_path = pb[tweaks[d]].path_from_id() + \
                                            '[' + '"' + name + '"' + ']'
-                       
-        return def_bones
         
         
     def create_ik( self, parent ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         ctrl       = get_bone_name( org_bones[0], 'ctrl', 'ik'        )
@@ -327,14 +333,13 @@ class Rig:
         mch_target = get_bone_name( org_bones[0], 'mch',  'ik_target' )
 
         for o, ik in zip( org_bones, [ ctrl, mch_ik, mch_target ] ):
-            bone = copy_bone( self.obj, o, ik )
+            bone = self.copy_bone( o, ik )
 
             if org_bones.index(o) == len( org_bones ) - 1:
                 eb[ bone ].length /= 4
 
         # Create MCH Stretch
-        mch_str = copy_bone( 
-            self.obj, 
+        mch_str = self.copy_bone( 
             org_bones[0],
             get_bone_name( org_bones[0], 'mch', 'ik_stretch' )
         )
@@ -346,7 +351,17 @@ class Rig:
         eb[ mch_str ].parent = eb[ parent ]
         eb[ mch_ik  ].parent = eb[ ctrl   ]
         
-        
+        return { 'ctrl'       : { 'limb' : ctrl }, 
+                 'mch_ik'     : mch_ik, 
+                 'mch_target' : mch_target,
+                 'mch_str'    : mch_str
+        }
+
+    def setup_ik( self, ik ):
+        ctrl       = ik['ctrl']['limb']
+        mch_ik     = ik['mch_ik']
+        mch_target = ik['mch_target']
+
         make_constraint( self, mch_ik, {
             'constraint'  : 'IK',
             'subtarget'   : mch_target,
@@ -362,32 +377,27 @@ class Rig:
             if axis != self.rot_axis:
                setattr( pb[ mch_ik ], 'lock_ik_' + axis, True )
 
-        # Locks and Widget
+        # Locks
         pb[ ctrl ].lock_rotation = True, False, True
-        create_ikarrow_widget( self.obj, ctrl, bone_transform_name=None )
-        
-        return { 'ctrl'       : { 'limb' : ctrl }, 
-                 'mch_ik'     : mch_ik, 
-                 'mch_target' : mch_target,
-                 'mch_str'    : mch_str
-        }
+
+    def create_ik_widgets( self, ik ):
+        create_ikarrow_widget( self.obj, ik['ctrl']['limb'], bone_transform_name=None )
     
 
     def create_fk( self, parent ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         ctrls = []        
 
         for o in org_bones:
-            bone = copy_bone( self.obj, o, get_bone_name( o, 'ctrl', 'fk' ) )
+            bone = self.copy_bone( o, get_bone_name( o, 'ctrl', 'fk' ) )
             ctrls.append( bone )
  
         # MCH
-        mch = copy_bone( 
-            self.obj, org_bones[-1], get_bone_name( o, 'mch', 'fk' )
+        mch = self.copy_bone( 
+            org_bones[-1], get_bone_name( o, 'mch', 'fk' )
         )
 
         eb[ mch ].length /= 4
@@ -400,30 +410,36 @@ class Rig:
         eb[ mch      ].parent      = eb[ ctrls[1] ]
         eb[ mch      ].use_connect = True
 
+        return { 'ctrl' : ctrls, 'mch' : mch }
+
+    def setup_fk( self, fk ):
+        ctrls = fk['ctrl']
+        mch   = fk['mch']
+
         # Constrain MCH's scale to root
         make_constraint( self, mch, {
             'constraint'  : 'COPY_SCALE',
             'subtarget'   : 'root'
         })
         
-        # Locks and widgets
+        # Locks
         pb = self.obj.pose.bones
         pb[ ctrls[2] ].lock_location = True, True, True
 
-        create_limb_widget( self.obj, ctrls[0] )
-        create_limb_widget( self.obj, ctrls[1] )
-
-        create_circle_widget(self.obj, ctrls[2], radius=0.4, head_tail=0.0)
-
         for c in ctrls:
             if self.fk_layers:
                 pb[c].bone.layers = self.fk_layers
 
-        return { 'ctrl' : ctrls, 'mch' : mch }
+    def create_fk_widgets( self, fk ):
+        ctrls = fk['ctrl']
+
+        create_limb_widget( self.obj, ctrls[0] )
+        create_limb_widget( self.obj, ctrls[1] )
+
+        create_circle_widget(self.obj, ctrls[2], radius=0.4, head_tail=0.0)
         
 
-    def org_parenting_and_switch( self, org, ik, fk, parent ):
-        bpy.ops.object.mode_set(mode ='EDIT')
+    def org_parenting( self, org ):
         eb = self.obj.data.edit_bones
         # re-parent ORGs in a connected chain
         for i,o in enumerate(org):
@@ -432,7 +448,7 @@ class Rig:
                 if i <= 2:
                     eb[o].use_connect = True
 
-        bpy.ops.object.mode_set(mode ='OBJECT')
+    def create_ikfk_switch( self, org, ik, fk, parent ):
         pb = self.obj.pose.bones
         pb_parent = pb[ parent ]
 
@@ -479,9 +495,25 @@ class Rig:
         elif limb_type == 'paw':
             return create_paw( self, bones )
 
+    def setup_terminal( self, limb_type, bones ):
+        if   limb_type == 'arm':
+            setup_arm( self, bones )
+        elif limb_type == 'leg':
+            setup_leg( self, bones )
+        elif limb_type == 'paw':
+            setup_paw( self, bones )
+
+    def create_terminal_widgets( self, limb_type, bones ):
+        if   limb_type == 'arm':
+            create_arm_widgets( self, bones )
+        elif limb_type == 'leg':
+            create_leg_widgets( self, bones )
+        elif limb_type == 'paw':
+            create_paw_widgets( self, bones )
+
 
-    def generate( self ):
-        bpy.ops.object.mode_set(mode ='EDIT')
+    def edit_bones( self ):
+        self.copied_bones = []
         eb = self.obj.data.edit_bones
 
         # Clear parents for org bones
@@ -498,11 +530,38 @@ class Rig:
         bones['ik']     = self.create_ik(  bones['parent']        )
         bones['fk']     = self.create_fk(  bones['parent']        )
 
-        self.org_parenting_and_switch( 
+        # The terminal adds its own deform bones to the chain
+        self.def_bones = list( bones['def'] )
+
+        self.org_parenting( self.org_bones )
+
+        self.bones = self.create_terminal( self.limb_type, bones )
+
+    def pose_setup( self ):
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties( self.obj, bone_1, bone_2 )
+
+        bones = self.bones
+
+        self.setup_parent( bones['parent'] )
+        self.setup_tweak( bones['tweak'] )
+        self.setup_def( self.def_bones, bones['tweak']['ctrl'] )
+        self.setup_ik( bones['ik'] )
+        self.setup_fk( bones['fk'] )
+
+        self.create_ikfk_switch( 
             self.org_bones, bones['ik'], bones['fk']['ctrl'], bones['parent'] 
         )
 
-        bones = self.create_terminal( self.limb_type, bones )
+        self.setup_terminal( self.limb_type, bones )
+
+    def widgets( self ):
+        bones = self.bones
+
+        self.create_tweak_widgets( bones['tweak'] )
+        self.create_ik_widgets( bones['ik'] )
+        self.create_fk_widgets( bones['fk'] )
+        self.create_terminal_widgets( self.limb_type, bones )
         
         return [ create_script( bones ) ]
         
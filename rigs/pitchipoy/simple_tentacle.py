@@ -1,5 +1,5 @@
 import bpy
-from ...utils    import copy_bone
+from ...utils    import copy_edit_bone, copy_bone_properties
 from ...utils    import strip_org, make_deformer_name, connected_children_names
 from ...utils    import make_mechanism_name, put_bone, create_sphere_widget
 from ...utils    import create_widget, create_circle_widget
@@ -28,33 +28,32 @@ class Rig:
      
     def make_controls( self ):
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         org_bones = self.org_bones
 
         ctrl_chain = []
         for i in range( len( org_bones ) ):
             name = org_bones[i]
 
-            ctrl_bone  = copy_bone(
+            ctrl_bone  = copy_edit_bone(
                 self.obj, 
                 name, 
                 strip_org(name)
             )
 
             ctrl_chain.append( ctrl_bone )
+            self.copied_bones.append( ( name, ctrl_bone ) )
+            
+        return ctrl_chain
 
-        # Make widgets
-        bpy.ops.object.mode_set(mode ='OBJECT')
+
+    def make_control_widgets( self, ctrl_chain ):
 
         for ctrl in ctrl_chain:
             create_circle_widget(self.obj, ctrl, radius=0.3, head_tail=0.5)
-            
-        return ctrl_chain
 
 
     def make_tweaks( self ):
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         org_bones = self.org_bones
 
@@ -66,7 +65,7 @@ class Rig:
             else:
                 name = org_bones[i]
 
-            tweak_bone = copy_bone(
+            tweak_bone = copy_edit_bone(
                 self.obj, 
                 name, 
                 "tweak_" + strip_org(name)
@@ -81,13 +80,14 @@ class Rig:
                 put_bone( self.obj, tweak_bone, eb[ org_bones[-1]].tail )
         
             tweak_chain.append( tweak_bone )
+            self.copied_bones.append( ( name, tweak_bone ) )
+            
+        return tweak_chain   
 
-        # Make widgets
-        bpy.ops.object.mode_set(mode = 'OBJECT')
 
-        for tweak in tweak_chain:
-            create_sphere_widget( self.obj, tweak )
+    def setup_tweaks( self, tweak_chain ):
 
+        for tweak in tweak_chain:
             tweak_pb = self.obj.pose.bones[ tweak ]
 
             # Set locks
@@ -99,36 +99,41 @@ class Rig:
                 tweak_pb.lock_rotation   = (True, True, True)
                 tweak_pb.lock_scale      = (True, True, True)
 
+
+    def make_tweak_widgets( self, tweak_chain ):
+
+        for tweak in tweak_chain:
+            create_sphere_widget( self.obj, tweak )
+
+            tweak_pb = self.obj.pose.bones[ tweak ]
+
             # Set up tweak bone layers
             if self.tweak_layers:
                 tweak_pb.bone.layers = self.tweak_layers
-            
-        return tweak_chain   
 
 
     def make_deform( self ):
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         org_bones = self.org_bones
 
         def_chain = []
         for i in range( len( org_bones ) ):
             name = org_bones[i]
 
-            def_bone  = copy_bone(
+            def_bone  = copy_edit_bone(
                 self.obj, 
                 name, 
                 make_deformer_name(strip_org(name))
             )
 
             def_chain.append( def_bone )
+            self.copied_bones.append( ( name, def_bone ) )
             
         return def_chain
 
 
     def parent_bones( self, all_bones ):
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         org_bones = self.org_bones
         eb        = self.obj.data.edit_bones
 
@@ -162,7 +167,6 @@ class Rig:
     
     def make_constraints( self, all_bones ):
         
-        bpy.ops.object.mode_set(mode ='OBJECT')
         org_bones = self.org_bones
         pb        = self.obj.pose.bones
         
@@ -200,8 +204,7 @@ class Rig:
 
             
 
-    def generate(self):
-        bpy.ops.object.mode_set(mode ='EDIT')
+    def edit_bones(self):
         eb = self.obj.data.edit_bones
 
         # Clear all initial parenting
@@ -210,18 +213,30 @@ class Rig:
             eb[ bone ].use_connect = False
         
         # Creating all bones
+        self.copied_bones = []
+
         ctrl_chain  = self.make_controls()
         tweak_chain = self.make_tweaks()
         def_chain   = self.make_deform()
 
-        all_bones = {
+        self.all_bones = {
             'control' : ctrl_chain,
             'tweak'   : tweak_chain,
             'deform'  : def_chain
         }
-            
-        self.make_constraints( all_bones )
-        self.parent_bones( all_bones )
+
+        self.parent_bones( self.all_bones )
+
+    def pose_setup(self):
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties( self.obj, bone_1, bone_2 )
+
+        self.setup_tweaks( self.all_bones['tweak'] )
+        self.make_constraints( self.all_bones )
+
+    def widgets(self):
+        self.make_control_widgets( self.all_bones['control'] )
+        self.make_tweak_widgets( self.all_bones['tweak'] )
 
 
 def add_parameters(params):
@@ -20,7 +20,7 @@
 
 import bpy
 
-from ...utils import copy_bone
+from ...utils import copy_edit_bone, copy_bone_properties
 from ...utils import strip_org, make_deformer_name
 from ...utils import create_bone_widget, create_circle_widget
 
@@ -42,50 +42,55 @@ class Rig:
         self.make_widget  = params.make_widget
         self.make_deform  = params.make_deform
 
-    def generate(self):
-        """ Generate the rig.
-            Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
+        eb = self.obj.data.edit_bones
 
         # Make a control bone (copy of original).
         if self.make_control:
-            bone = copy_bone(self.obj, self.org_bone, self.org_name)
+            self.ctrl_bone = copy_edit_bone(self.obj, self.org_bone, self.org_name)
 
         # Make a deformation bone (copy of original, child of original).
         if self.make_deform:
-            def_bone = copy_bone(self.obj, self.org_bone, make_deformer_name(self.org_name))
-
-        # Get edit bones
-        eb = self.obj.data.edit_bones
-        # UNUSED
-        # if self.make_control:
-        #     bone_e = eb[bone]
-        if self.make_deform:
-            def_bone_e = eb[def_bone]
+            self.def_bone = copy_edit_bone(self.obj, self.org_bone, make_deformer_name(self.org_name))
 
-        # Parent
-        if self.make_deform:
+            # Parent
+            def_bone_e = eb[self.def_bone]
             def_bone_e.use_connect = False
             def_bone_e.parent = eb[self.org_bone]
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
+            Do NOT modify any of the original bones, except for adding constraints.
+
+        """
         pb = self.obj.pose.bones
 
+        if self.make_control:
+            copy_bone_properties(self.obj, self.org_bone, self.ctrl_bone)
+        if self.make_deform:
+            copy_bone_properties(self.obj, self.org_bone, self.def_bone)
+
         if self.make_control:
             # Constrain the original bone.
             con = pb[self.org_bone].constraints.new('COPY_TRANSFORMS')
             con.name = "copy_transforms"
             con.target = self.obj
-            con.subtarget = bone
+            con.subtarget = self.ctrl_bone
 
+    def widgets(self):
+        """ Create the widgets of the rig.
+        """
+        if self.make_control:
             # Create control widget
             if self.make_widget:
-                create_circle_widget(self.obj, bone, radius = 0.5 )
+                create_circle_widget(self.obj, self.ctrl_bone, radius = 0.5 )
             else:
-                create_bone_widget(self.obj, bone, radius = 0.5 )
+                create_bone_widget(self.obj, self.ctrl_bone, radius = 0.5 )
+
 
 def add_parameters(params):
     """ Add the parameters of this rig type to the
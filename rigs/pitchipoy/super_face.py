@@ -1,11 +1,11 @@
 import bpy, re
 from   mathutils      import Vector
-from   ...utils       import copy_bone, flip_bone
+from   ...utils       import copy_edit_bone, copy_bone_properties, flip_bone
 from   ...utils       import org, strip_org, make_deformer_name, connected_children_names, make_mechanism_name
 from   ...utils       import create_circle_widget, create_sphere_widget, create_widget, create_cube_widget
 from   ...utils       import MetarigError
 from   rna_prop_ui    import rna_idprop_ui_prop_get
-from   .super_widgets import create_face_widget, create_eye_widget, create_eyes_widget, create_ear_widget, create_jaw_widget, create_teeth_widget
+from   .super_widgets import create_face_widget, create_eye_widget, create_eyes_widget, create_ear_widget, create_jaw_widget, create_teeth_widget, create_square_widget
 
 
 script = """
@@ -67,11 +67,16 @@ class Rig:
         right = sorted( [ name for name in bones if re.search( right_pattern, name ) ] )        
 
         return left, right
+
+    def copy_bone( self, bone_name, assign_name = '' ):
+        # Bone properties are copied over in the pose setup stage
+        bone_name_2 = copy_edit_bone( self.obj, bone_name, assign_name )
+        self.copied_bones.append( ( bone_name, bone_name_2 ) )
+        return bone_name_2
         
     def create_deformation( self ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         def_bones = []
@@ -80,7 +85,7 @@ class Rig:
                 continue
 
             def_name = make_deformer_name( strip_org( org ) )
-            def_name = copy_bone( self.obj, org, def_name )
+            def_name = self.copy_bone( org, def_name )
             def_bones.append( def_name )
 
             eb[def_name].use_connect = False
@@ -110,7 +115,6 @@ class Rig:
         org_bones = self.org_bones
 
         ## create control bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         # eyes ctrls
@@ -123,9 +127,9 @@ class Rig:
         eyeL_ctrl_name = strip_org( bones['eyes'][0] )
         eyeR_ctrl_name = strip_org( bones['eyes'][1] )
         
-        eyeL_ctrl_name = copy_bone( self.obj, bones['eyes'][0],  eyeL_ctrl_name )
-        eyeR_ctrl_name = copy_bone( self.obj, bones['eyes'][1],  eyeR_ctrl_name )
-        eyes_ctrl_name = copy_bone( self.obj, bones['eyes'][0], 'eyes'          )
+        eyeL_ctrl_name = self.copy_bone( bones['eyes'][0],  eyeL_ctrl_name )
+        eyeR_ctrl_name = self.copy_bone( bones['eyes'][1],  eyeR_ctrl_name )
+        eyes_ctrl_name = self.copy_bone( bones['eyes'][0], 'eyes'          )
         
         eyeL_ctrl_e = eb[ eyeL_ctrl_name ]
         eyeR_ctrl_e = eb[ eyeR_ctrl_name ]
@@ -141,8 +145,7 @@ class Rig:
         ## Widget for transforming the both eyes
         eye_master_names = []
         for bone in bones['eyes']:
-            eye_master = copy_bone( 
-                self.obj, 
+            eye_master = self.copy_bone( 
                 bone,  
                 'master_' + strip_org(bone)
             )
@@ -150,7 +153,7 @@ class Rig:
             eye_master_names.append( eye_master )
                 
         ## turbo: adding a master nose for transforming the whole nose
-        master_nose = copy_bone(self.obj, 'ORG-nose.004', 'nose_master')
+        master_nose = self.copy_bone('ORG-nose.004', 'nose_master')
         eb[master_nose].tail[:] = \
             eb[master_nose].head + Vector([0, self.face_length / -4, 0])
         
@@ -158,12 +161,12 @@ class Rig:
         earL_name = strip_org( bones['ears'][0] )
         earR_name = strip_org( bones['ears'][1] )
         
-        earL_ctrl_name = copy_bone( self.obj, org( bones['ears'][0] ), earL_name )
-        earR_ctrl_name = copy_bone( self.obj, org( bones['ears'][1] ), earR_name )
+        earL_ctrl_name = self.copy_bone( org( bones['ears'][0] ), earL_name )
+        earR_ctrl_name = self.copy_bone( org( bones['ears'][1] ), earR_name )
 
         # jaw ctrl
         jaw_ctrl_name = strip_org( bones['jaw'][2] ) + '_master'
-        jaw_ctrl_name = copy_bone( self.obj, bones['jaw'][2], jaw_ctrl_name )
+        jaw_ctrl_name = self.copy_bone( bones['jaw'][2], jaw_ctrl_name )
 
         jawL_org_e = eb[ bones['jaw'][0] ]
         jawR_org_e = eb[ bones['jaw'][1] ]
@@ -175,20 +178,40 @@ class Rig:
         teethT_name = strip_org( bones['teeth'][0] )
         teethB_name = strip_org( bones['teeth'][1] )
         
-        teethT_ctrl_name = copy_bone( self.obj, org( bones['teeth'][0] ), teethT_name )
-        teethB_ctrl_name = copy_bone( self.obj, org( bones['teeth'][1] ), teethB_name )
+        teethT_ctrl_name = self.copy_bone( org( bones['teeth'][0] ), teethT_name )
+        teethB_ctrl_name = self.copy_bone( org( bones['teeth'][1] ), teethB_name )
         
         # tongue ctrl
         tongue_org  = bones['tongue'].pop()
         tongue_name = strip_org( tongue_org ) + '_master'
         
-        tongue_ctrl_name = copy_bone( self.obj, tongue_org, tongue_name )
+        tongue_ctrl_name = self.copy_bone( tongue_org, tongue_name )
         
         flip_bone( self.obj, tongue_ctrl_name )
-        
-        ## Assign widgets
-        bpy.ops.object.mode_set(mode ='OBJECT')
-        
+
+        return { 
+            'eyes'   : [ 
+                eyeL_ctrl_name, 
+                eyeR_ctrl_name, 
+                eyes_ctrl_name,
+            ] + eye_master_names,
+            'ears'   : [ earL_ctrl_name, earR_ctrl_name     ],
+            'jaw'    : [ jaw_ctrl_name                      ],
+            'teeth'  : [ teethT_ctrl_name, teethB_ctrl_name ],
+            'tongue' : [ tongue_ctrl_name                   ],
+            'nose'   : [ master_nose                        ]
+            }
+
+
+    def create_ctrl_widgets( self, ctrls ):
+        eyeL_ctrl_name, eyeR_ctrl_name, eyes_ctrl_name = ctrls['eyes'][:3]
+        eye_master_names = ctrls['eyes'][3:]
+        earL_ctrl_name, earR_ctrl_name = ctrls['ears']
+        jaw_ctrl_name = ctrls['jaw'][0]
+        teethT_ctrl_name, teethB_ctrl_name = ctrls['teeth']
+        tongue_ctrl_name = ctrls['tongue'][0]
+        master_nose = ctrls['nose'][0]
+
         # Assign each eye widgets
         create_eye_widget( self.obj, eyeL_ctrl_name )
         create_eye_widget( self.obj, eyeR_ctrl_name )
@@ -216,26 +239,12 @@ class Rig:
         
         # Assign tongue widget ( using the jaw widget )
         create_jaw_widget( self.obj, tongue_ctrl_name )
-
-        return { 
-            'eyes'   : [ 
-                eyeL_ctrl_name, 
-                eyeR_ctrl_name, 
-                eyes_ctrl_name,
-            ] + eye_master_names,
-            'ears'   : [ earL_ctrl_name, earR_ctrl_name     ],
-            'jaw'    : [ jaw_ctrl_name                      ],
-            'teeth'  : [ teethT_ctrl_name, teethB_ctrl_name ],
-            'tongue' : [ tongue_ctrl_name                   ],
-            'nose'   : [ master_nose                        ]
-            }
             
 
     def create_tweak( self, bones, uniques, tails ):
         org_bones = self.org_bones
 
         ## create tweak bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         tweaks = []
@@ -248,7 +257,7 @@ class Rig:
             if bone in list( uniques.keys() ):
                 tweak_name = uniques[bone]
 
-            tweak_name = copy_bone( self.obj, bone, tweak_name )
+            tweak_name = self.copy_bone( bone, tweak_name )
             eb[ tweak_name ].use_connect = False
             eb[ tweak_name ].parent      = None
 
@@ -260,11 +269,11 @@ class Rig:
             # create tail bone
             if bone in tails:
                 if 'lip.T.L.001' in bone:
-                    tweak_name = copy_bone( self.obj, bone,  'lips.L' )
+                    tweak_name = self.copy_bone( bone,  'lips.L' )
                 elif 'lip.T.R.001' in bone:
-                    tweak_name = copy_bone( self.obj, bone,  'lips.R' )
+                    tweak_name = self.copy_bone( bone,  'lips.R' )
                 else:
-                    tweak_name = copy_bone( self.obj, bone,  tweak_name )
+                    tweak_name = self.copy_bone( bone,  tweak_name )
 
                 eb[ tweak_name ].use_connect = False
                 eb[ tweak_name ].parent      = None
@@ -274,8 +283,11 @@ class Rig:
                     eb[ tweak_name ].head + Vector(( 0, 0, self.face_length / 7 ))
                 
                 tweaks.append( tweak_name )
-            
-        bpy.ops.object.mode_set(mode ='OBJECT')
+
+        return { 'all' : tweaks }
+
+
+    def create_tweak_widgets( self, tweaks ):
         pb = self.obj.pose.bones
         
         primary_tweaks = [
@@ -287,7 +299,7 @@ class Rig:
             "nose.002", "nose.L.001", "nose.R.001"
         ]
         
-        for bone in tweaks:
+        for bone in tweaks['all']:
             if bone in primary_tweaks:
                 if self.primary_layers:
                     pb[bone].bone.layers = self.primary_layers
@@ -296,8 +308,6 @@ class Rig:
                 if self.secondary_layers:
                     pb[bone].bone.layers = self.secondary_layers
                 create_face_widget( self.obj, bone )
-                    
-        return { 'all' : tweaks }
 
 
     def all_controls( self ):
@@ -347,7 +357,6 @@ class Rig:
 
     def create_mch( self, jaw_ctrl, tongue_ctrl ):
         org_bones = self.org_bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         # Create eyes mch bones
@@ -357,13 +366,13 @@ class Rig:
 
         for eye in eyes:
             mch_name = make_mechanism_name( strip_org( eye ) )
-            mch_name = copy_bone( self.obj, eye, mch_name )
+            mch_name = self.copy_bone( eye, mch_name )
             eb[ mch_name ].use_connect = False
             eb[ mch_name ].parent      = None
 
             mch_bones[ strip_org( eye ) ].append( mch_name )
 
-            mch_name = copy_bone( self.obj, eye, mch_name )
+            mch_name = self.copy_bone( eye, mch_name )
             eb[ mch_name ].use_connect = False
             eb[ mch_name ].parent      = None
 
@@ -377,7 +386,7 @@ class Rig:
         
         mch_name = 'eyes_parent'
         mch_name = make_mechanism_name( mch_name )
-        mch_name = copy_bone( self.obj, face, mch_name )
+        mch_name = self.copy_bone( face, mch_name )
         eb[ mch_name ].use_connect = False
         eb[ mch_name ].parent      = None
         
@@ -396,7 +405,7 @@ class Rig:
         for i in range( 2 ):
             for bone in all_lids[i]:
                 mch_name = make_mechanism_name( strip_org( bone ) )
-                mch_name = copy_bone( self.obj, eyes[i], mch_name  )
+                mch_name = self.copy_bone( eyes[i], mch_name  )
 
                 eb[ mch_name ].use_connect = False
                 eb[ mch_name ].parent      = None
@@ -415,7 +424,7 @@ class Rig:
             else:
                 mch_name = make_mechanism_name( jaw_ctrl )
 
-            mch_name = copy_bone( self.obj, jaw_ctrl, mch_name  )
+            mch_name = self.copy_bone( jaw_ctrl, mch_name  )
 
             eb[ mch_name ].use_connect = False
             eb[ mch_name ].parent      = None
@@ -431,7 +440,7 @@ class Rig:
         # create mch bones for all tongue org_bones except the first one
         for bone in sorted([ org for org in org_bones if 'tongue' in org ])[1:]:
             mch_name = make_mechanism_name( strip_org( bone ) )
-            mch_name = copy_bone( self.obj, tongue_ctrl, mch_name )
+            mch_name = self.copy_bone( tongue_ctrl, mch_name )
 
             eb[ mch_name ].use_connect = False
             eb[ mch_name ].parent      = None
@@ -442,7 +451,6 @@ class Rig:
         
     def parent_bones( self, all_bones, tweak_unique ):
         org_bones = self.org_bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         face_name = [ bone for bone in org_bones if 'face' in bone ].pop()
@@ -622,7 +630,6 @@ class Rig:
         
     def make_constraits( self, constraint_type, bone, subtarget, influence = 1 ):
         org_bones = self.org_bones
-        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
 
         owner_pb = pb[bone]
@@ -893,9 +900,8 @@ class Rig:
             factor -= 1
 
 
-    def drivers_and_props( self, all_bones ):
+    def props( self, all_bones ):
         
-        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
         
         jaw_ctrl  = all_bones['ctrls']['jaw'][0]
@@ -916,6 +922,17 @@ class Rig:
             prop["soft_min"]    = 0.0
             prop["soft_max"]    = 1.0
             prop["description"] = prop_name
+
+        return jaw_prop, eyes_prop
+
+    def drivers( self ):
+        all_bones = self.all_bones
+        pb = self.obj.pose.bones
+
+        jaw_ctrl  = all_bones['ctrls']['jaw'][0]
+        eyes_ctrl = all_bones['ctrls']['eyes'][2]
+
+        jaw_prop, eyes_prop = self.jaw_prop, self.eyes_prop
         
         # Jaw drivers
         mch_jaws = all_bones['mch']['jaw'][1:-1]
@@ -942,12 +959,9 @@ class Rig:
         var.type = "SINGLE_PROP"
         var.targets[0].id = self.obj
         var.targets[0].data_path = pb[ eyes_ctrl ].path_from_id() + '['+ '"' + eyes_prop + '"' + ']'
-        
-        return jaw_prop, eyes_prop
 
     def create_bones(self):
         org_bones = self.org_bones
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         # Clear parents for org bones
@@ -971,14 +985,31 @@ class Rig:
             }, tweak_unique
 
 
-    def generate(self):
-        
+    def edit_bones(self):
+        self.copied_bones = []
+
         all_bones, tweak_unique = self.create_bones()
+
+        # parent_bones() consumes some of the ctrl lists, keep a copy for the widgets
+        self.ctrls = { key : list( bones ) for key, bones in all_bones['ctrls'].items() }
+
         self.parent_bones( all_bones, tweak_unique )
-        self.constraints( all_bones )
-        jaw_prop, eyes_prop = self.drivers_and_props( all_bones )
 
-        
+        self.all_bones = all_bones
+
+    def pose_setup(self):
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties( self.obj, bone_1, bone_2 )
+
+        self.constraints( self.all_bones )
+        self.jaw_prop, self.eyes_prop = self.props( self.all_bones )
+
+    def widgets(self):
+        all_bones = self.all_bones
+
+        self.create_ctrl_widgets( self.ctrls )
+        self.create_tweak_widgets( all_bones['tweaks'] )
+
         # Create UI
         all_controls = []
         all_controls += [ bone for bone in [ bgroup for bgroup in [ all_bones['ctrls'][group] for group in list( all_bones['ctrls'].keys() ) ] ] ]
@@ -994,11 +1025,11 @@ class Rig:
             controls_string, 
             all_bones['ctrls']['jaw'][0],
             all_bones['ctrls']['eyes'][2],
-            jaw_prop,
-            eyes_prop )
+            self.jaw_prop,
+            self.eyes_prop )
             ]
-        
-        
+
+
 def add_parameters(params):
     """ Add the parameters of this rig type to the
         RigifyParameters PropertyGroup
@@ -2364,25 +2395,3 @@ def create_sample(obj):
         bone.select_head = True
         bone.select_tail = True
         arm.edit_bones.active = bone
-        
-def create_square_widget(rig, bone_name, size=1.0, bone_transform_name=None):
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [
-            (  0.5 * size, -2.9802322387695312e-08 * size,  0.5 * size ), 
-            ( -0.5 * size, -2.9802322387695312e-08 * size,  0.5 * size ), 
-            (  0.5 * size,  2.9802322387695312e-08 * size, -0.5 * size ), 
-            ( -0.5 * size,  2.9802322387695312e-08 * size, -0.5 * size ), 
-        ]
-
-        edges = [(0, 1), (2, 3), (0, 2), (3, 1) ]
-        faces = []
-
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
-        mesh.update()
-        return obj
-    else:
-        return None
-
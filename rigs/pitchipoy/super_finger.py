@@ -1,6 +1,6 @@
 import bpy
 from mathutils import Vector
-from ...utils import copy_bone, flip_bone
+from ...utils import copy_edit_bone, copy_bone_properties, flip_bone
 from ...utils import strip_org, make_deformer_name, connected_children_names, make_mechanism_name
 from ...utils import create_circle_widget, create_sphere_widget, create_widget
 from ...utils import MetarigError
@@ -24,11 +24,17 @@ class Rig:
             raise MetarigError("RIGIFY ERROR: Bone '%s': listen bro, that finger rig jusaint put tugetha rite. A little hint, use more than one bone!!" % (strip_org(bone_name)))            
 
 
-    def generate(self):
+    def copy_bone(self, bone_name, assign_name=''):
+        # Bone properties are copied over in pose_setup()
+        new_name = copy_edit_bone(self.obj, bone_name, assign_name)
+        self.copied_bones += [(bone_name, new_name)]
+        return new_name
+
+    def edit_bones(self):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
+        self.copied_bones = []
         
         # Bone name lists
         ctrl_chain    = []
@@ -42,7 +48,7 @@ class Rig:
         
         suffix = temp_name[-2:]
         master_name      = temp_name[:-5] + "_master" + suffix
-        master_name      = copy_bone( self.obj, org_name, master_name )
+        master_name      = self.copy_bone( org_name, master_name )
         ctrl_bone_master = eb[ master_name ]
         
         ## Parenting bug fix ??
@@ -63,20 +69,20 @@ class Rig:
             ctrl_name = strip_org(name)
             
             # Create control bones
-            ctrl_bone   = copy_bone( self.obj, name, ctrl_name )
+            ctrl_bone   = self.copy_bone( name, ctrl_name )
             ctrl_bone_e = eb[ ctrl_name ]
             
             # Create deformation bones
             def_name  = make_deformer_name( ctrl_name )
-            def_bone  = copy_bone( self.obj, name, def_name )
+            def_bone  = self.copy_bone( name, def_name )
 
             # Create mechanism bones
             mch_name  = make_mechanism_name( ctrl_name )
-            mch_bone  = copy_bone( self.obj, name, mch_name )
+            mch_bone  = self.copy_bone( name, mch_name )
             
             # Create mechanism driver bones
             drv_name  = make_mechanism_name(ctrl_name) + "_drv"
-            mch_bone_drv    = copy_bone(self.obj, name, drv_name)
+            mch_bone_drv    = self.copy_bone(name, drv_name)
             mch_bone_drv_e  = eb[drv_name]
             
             # Adding to lists
@@ -130,15 +136,31 @@ class Rig:
                 mch_bone_e.use_connect = False
                 
         # Creating tip conrtol bone 
-        tip_name      = copy_bone( self.obj, org_bones[-1], temp_name )
+        tip_name      = self.copy_bone( org_bones[-1], temp_name )
         ctrl_bone_tip = eb[ tip_name ]
         flip_bone( self.obj, tip_name )
         ctrl_bone_tip.length /= 2
 
         ctrl_bone_tip.parent = eb[ctrl_chain[-1]]
 
-        bpy.ops.object.mode_set(mode ='OBJECT')
-        
+        self.master_name   = master_name
+        self.tip_name      = tip_name
+        self.ctrl_chain    = ctrl_chain
+        self.def_chain     = def_chain
+        self.mch_chain     = mch_chain
+        self.mch_drv_chain = mch_drv_chain
+
+    def pose_setup(self):
+        master_name   = self.master_name
+        tip_name      = self.tip_name
+        ctrl_chain    = self.ctrl_chain
+        def_chain     = self.def_chain
+        mch_chain     = self.mch_chain
+        mch_drv_chain = self.mch_drv_chain
+
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+
         pb = self.obj.pose.bones
         
         # Setting pose bones locks
@@ -222,8 +244,18 @@ class Rig:
                 con.subtarget    = master_name
                 con.target_space = 'LOCAL'
                 con.owner_space  = 'LOCAL'
-            
-            else:
+
+            # Setting bone curvature setting
+            def_bone = self.obj.data.bones[deform]
+
+            def_bone.bbone_segments = 8
+
+    def drivers(self):
+        pb = self.obj.pose.bones
+        pb_master = pb[self.master_name]
+
+        for mch_drv, deform in zip(self.mch_drv_chain, self.def_chain):
+            if self.mch_drv_chain.index(mch_drv) != 0:
                 # Match axis to expression
                 options = {
                     "X"  : { "axis" : 0,
@@ -250,12 +282,11 @@ class Rig:
                 drv_var.name                 = 'sy'
                 drv_var.type                 = "SINGLE_PROP"
                 drv_var.targets[0].id        = self.obj
-                drv_var.targets[0].data_path = pb[master_name].path_from_id() + '.scale.y'
+                drv_var.targets[0].data_path = pb[self.master_name].path_from_id() + '.scale.y'
                 
-            # Setting bone curvature setting, costum property, and drivers
+            # Curvature drivers
             def_bone = self.obj.data.bones[deform]
 
-            def_bone.bbone_segments = 8
             drv = def_bone.driver_add("bbone_in").driver # Ease in
 
             drv.type='SUM'
@@ -274,7 +305,12 @@ class Rig:
             drv_var.targets[0].id = self.obj
             drv_var.targets[0].data_path = pb_master.path_from_id() + '["finger_curve"]'
 
-            
+    def widgets(self):
+        master_name = self.master_name
+        tip_name    = self.tip_name
+        ctrl_chain  = self.ctrl_chain
+
+        for ctrl in ctrl_chain:
             # Assigning shapes to control bones
             create_circle_widget(self.obj, ctrl, radius=0.3, head_tail=0.5)
             
@@ -1,6 +1,6 @@
 import bpy
 from mathutils import Vector
-from ...utils import copy_bone, flip_bone, put_bone, org
+from ...utils import copy_edit_bone, copy_bone_properties, flip_bone, put_bone, org
 from ...utils import strip_org, make_deformer_name, connected_children_names 
 from ...utils import create_circle_widget, create_sphere_widget, create_widget
 from ...utils import MetarigError, make_mechanism_name, create_cube_widget
@@ -107,24 +107,30 @@ class Rig:
             eb.tail[:] = eb.head + tail_vec
 
 
+    def copy_bone( self, bone_name, assign_name = '' ):
+        # Bone properties are copied over in the pose setup stage
+        bone_name_2 = copy_edit_bone( self.obj, bone_name, assign_name )
+        self.copied_bones.append( ( bone_name, bone_name_2 ) )
+        return bone_name_2
+
+
     def create_pivot( self, pivot ):
         """ Create the pivot control and mechanism bones """
         org_bones  = self.org_bones
         pivot_name = org_bones[pivot-1]
 
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         # Create torso control bone    
         torso_name = 'torso'
-        ctrl_name  = copy_bone(self.obj, pivot_name, torso_name)
+        ctrl_name  = self.copy_bone(pivot_name, torso_name)
         ctrl_eb    = eb[ ctrl_name ]
         
         self.orient_bone( ctrl_eb, 'y', self.spine_length / 2.5 )
         
         # Create mch_pivot
         mch_name = make_mechanism_name( 'pivot' )
-        mch_name = copy_bone(self.obj, ctrl_name, mch_name)
+        mch_name = self.copy_bone(ctrl_name, mch_name)
         mch_eb   = eb[ mch_name ]
         
         mch_eb.length /= 4
@@ -142,13 +148,12 @@ class Rig:
     def create_deform( self ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         def_bones = []
         for org in org_bones:
             def_name = make_deformer_name( strip_org( org ) )
-            def_name = copy_bone( self.obj, org, def_name )
+            def_name = self.copy_bone( org, def_name )
             def_bones.append( def_name )
         
         return def_bones
@@ -157,33 +162,32 @@ class Rig:
     def create_neck( self, neck_bones ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         # Create neck control
-        neck    = copy_bone( self.obj, org(neck_bones[0]), 'neck' )
+        neck    = self.copy_bone( org(neck_bones[0]), 'neck' )
         neck_eb = eb[ neck ]
 
         # Neck spans all neck bones (except head)
         neck_eb.tail[:] = eb[ org(neck_bones[-1]) ].head
 
         # Create head control
-        head = copy_bone( self.obj, org(neck_bones[-1]), 'head' )
+        head = self.copy_bone( org(neck_bones[-1]), 'head' )
 
         # MCH bones
         # Neck MCH stretch
-        mch_str = copy_bone( self.obj, neck, make_mechanism_name('STR-neck') )
+        mch_str = self.copy_bone( neck, make_mechanism_name('STR-neck') )
 
         # Neck MCH rotation
-        mch_neck = copy_bone( 
-            self.obj, neck, make_mechanism_name('ROT-neck')
+        mch_neck = self.copy_bone( 
+            neck, make_mechanism_name('ROT-neck')
         )
 
         self.orient_bone( eb[mch_neck], 'y', self.spine_length / 10 )
 
         # Head MCH rotation
-        mch_head = copy_bone( 
-            self.obj, head, make_mechanism_name('ROT-head')
+        mch_head = self.copy_bone( 
+            head, make_mechanism_name('ROT-head')
         )
 
         self.orient_bone( eb[mch_head], 'y', self.spine_length / 10 )
@@ -192,7 +196,7 @@ class Rig:
 
         # Intermediary bones
         for b in neck_bones[1:-1]: # All except 1st neck and (last) head
-            mch_name = copy_bone( self.obj, org(b), make_mechanism_name(b) )
+            mch_name = self.copy_bone( org(b), make_mechanism_name(b) )
             eb[mch_name].length /= 4
 
             mch += [ mch_name ]
@@ -200,7 +204,7 @@ class Rig:
         # Tweak bones
         for b in neck_bones[:-1]: # All except last bone
             twk_name = "tweak_" + b
-            twk_name = copy_bone( self.obj, org(b), twk_name )            
+            twk_name = self.copy_bone( org(b), twk_name )            
             
             eb[twk_name].length /= 2
 
@@ -220,18 +224,17 @@ class Rig:
     def create_chest( self, chest_bones ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         # get total spine length
         
         # Create chest control bone
-        chest = copy_bone( self.obj, org( chest_bones[0] ), 'chest' )
+        chest = self.copy_bone( org( chest_bones[0] ), 'chest' )
         self.orient_bone( eb[chest], 'y', self.spine_length / 3 )
 
         # create chest mch_wgt
-        mch_wgt = copy_bone( 
-            self.obj, org( chest_bones[-1] ), 
+        mch_wgt = self.copy_bone( 
+            org( chest_bones[-1] ), 
             make_mechanism_name( 'WGT-chest' ) 
         )
         
@@ -239,11 +242,11 @@ class Rig:
         twk,mch = [],[]
         
         for b in chest_bones:
-            mch_name = copy_bone( self.obj, org(b), make_mechanism_name(b) )
+            mch_name = self.copy_bone( org(b), make_mechanism_name(b) )
             self.orient_bone( eb[mch_name], 'y', self.spine_length / 10 )
 
             twk_name = "tweak_" + b
-            twk_name = copy_bone( self.obj, org(b), twk_name )
+            twk_name = self.copy_bone( org(b), twk_name )
             eb[twk_name].length /= 2
 
             mch += [ mch_name ]
@@ -260,11 +263,10 @@ class Rig:
     def create_hips( self, hip_bones ):
         org_bones = self.org_bones
         
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         
         # Create hips control bone
-        hips = copy_bone( self.obj, org( hip_bones[-1] ), 'hips' )
+        hips = self.copy_bone( org( hip_bones[-1] ), 'hips' )
         self.orient_bone( 
             eb[hips], 
             'y', 
@@ -273,21 +275,21 @@ class Rig:
         )
 
         # create hips mch_wgt
-        mch_wgt = copy_bone( 
-            self.obj, org( hip_bones[0] ), 
+        mch_wgt = self.copy_bone( 
+            org( hip_bones[0] ), 
             make_mechanism_name( 'WGT-hips' ) 
         )
 
         # Create mch and tweak bones
         twk,mch = [],[]
         for b in hip_bones:
-            mch_name = copy_bone( self.obj, org(b), make_mechanism_name(b) )
+            mch_name = self.copy_bone( org(b), make_mechanism_name(b) )
             self.orient_bone( 
                 eb[mch_name], 'y', self.spine_length / 10, reverse = True 
             )
 
             twk_name = "tweak_" + b
-            twk_name = copy_bone( self.obj, org( b ), twk_name )
+            twk_name = self.copy_bone( org( b ), twk_name )
             
             eb[twk_name].length /= 2
 
@@ -309,7 +311,6 @@ class Rig:
     def parent_bones( self, bones ):
         org_bones = self.org_bones
 
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
  
         # Parent deform bones
@@ -397,7 +398,6 @@ class Rig:
 
 
     def make_constraint( self, bone, constraint ):
-        bpy.ops.object.mode_set(mode = 'OBJECT')
         pb = self.obj.pose.bones
 
         owner_pb     = pb[bone]
@@ -497,7 +497,6 @@ class Rig:
 
             
     def create_drivers( self, bones ):
-        bpy.ops.object.mode_set(mode ='OBJECT')
         pb = self.obj.pose.bones
         
         # Setting the torso's props
@@ -540,30 +539,38 @@ class Rig:
             drv_modifier.coefficients[1] = -1.0
 
     
-    def locks_and_widgets( self, bones ):
-        bpy.ops.object.mode_set(mode ='OBJECT')
-        pb = self.obj.pose.bones
+    def bbone_segments( self, bones ):
+        eb = self.obj.data.edit_bones
 
         # deform bones bbone segements
         for bone in bones['def'][:-1]:
-            self.obj.data.bones[bone].bbone_segments = 8
+            eb[bone].bbone_segments = 8
+
+        eb[ bones['def'][0]  ].bbone_in  = 0.0
+        eb[ bones['def'][-2] ].bbone_out = 0.0
 
-        self.obj.data.bones[ bones['def'][0]  ].bbone_in  = 0.0
-        self.obj.data.bones[ bones['def'][-2] ].bbone_out = 0.0
 
-        # Locks
+    def get_tweaks( self, bones ):
         tweaks =  bones['neck']['tweak'] + bones['chest']['tweak']
         tweaks += bones['hips']['tweak']
         
         if 'tail' in bones.keys():
             tweaks += bones['tail']['tweak']
 
+        return tweaks
+
+
+    def locks( self, bones ):
+        pb = self.obj.pose.bones
+
         # Tweak bones locks
-        for bone in tweaks:
+        for bone in self.get_tweaks( bones ):
             pb[bone].lock_rotation = True, False, True
             pb[bone].lock_scale    = False, True, False
 
-        # Widgets
+
+    def create_widgets( self, bones ):
+        pb = self.obj.pose.bones
 
         # Assigning a widget to torso bone
         create_cube_widget(
@@ -614,14 +621,14 @@ class Rig:
         pb[ bones['hips']['ctrl'] ].custom_shape_transform = hips_widget_loc
 
         # Assigning widgets to tweak bones and layers
-        for bone in tweaks:
+        for bone in self.get_tweaks( bones ):
             create_sphere_widget(self.obj, bone, bone_transform_name=None)
             
             if self.tweak_layers:
                 pb[bone].bone.layers = self.tweak_layers        
 
 
-    def generate( self ):
+    def edit_bones( self ):
     
         # Torso Rig Anatomy:
         # Neck: all bones above neck point, last bone is head
@@ -629,9 +636,10 @@ class Rig:
         # Lower torso: all bones below pivot until tail point
         # Tail: all bones below tail point
 
+        self.copied_bones = []
+
         bone_chains = self.build_bone_structure()
 
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         # Clear parents for org bones
@@ -659,15 +667,25 @@ class Rig:
             if tail_bones:
                 bones['tail'] = self.create_tail( tail_bones )
 
-            # TEST
-            bpy.ops.object.mode_set(mode ='EDIT')
-            eb = self.obj.data.edit_bones
+            self.parent_bones(   bones )
+            self.bbone_segments( bones )
+
+            self.bones = bones
+
+
+    def pose_setup( self ):
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties( self.obj, bone_1, bone_2 )
+
+        self.constrain_bones( self.bones )
+        self.create_drivers(  self.bones )
+        self.locks(           self.bones )
+
 
-            self.parent_bones(      bones )
-            self.constrain_bones(   bones )
-            self.create_drivers(    bones )
-            self.locks_and_widgets( bones )
+    def widgets( self ):
+        bones = self.bones
 
+        self.create_widgets( bones )
 
         controls =  [ bones['neck']['ctrl'],  bones['neck']['ctrl_neck'] ]
         controls += [ bones['chest']['ctrl'], bones['hips']['ctrl']      ]
@@ -1,9 +1,10 @@
 import bpy
-from ...utils    import copy_bone
+from ...utils    import copy_edit_bone, copy_bone_properties
 from ...utils    import strip_org, make_deformer_name, connected_children_names
 from ...utils    import make_mechanism_name, put_bone, create_sphere_widget
 from ...utils    import create_widget, create_circle_widget
 from ...utils    import MetarigError
+from .super_widgets import create_square_widget
 from rna_prop_ui import rna_idprop_ui_prop_get
 
 script = """
@@ -33,25 +34,29 @@ class Rig:
             )
 
 
+    def copy_bone( self, bone_name, assign_name = '' ):
+        # Bone properties are copied over in the pose setup stage
+        bone_name_2 = copy_edit_bone( self.obj, bone_name, assign_name )
+        self.copied_bones.append( ( bone_name, bone_name_2 ) )
+        return bone_name_2
+
+
     def make_mch( self ):
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
 
         org_bones  = self.org_bones
-        mch_parent = self.obj.data.bones[ org_bones[0] ].parent
+        mch_parent = eb[ org_bones[0] ].parent
         
         mch_parent_name = mch_parent.name  # Storing the mch parent's name
         
         if not mch_parent:
             mch_parent = self.obj.data.edit_bones[ org_bones[0] ]
-            mch_bone = copy_bone(
-                self.obj, 
+            mch_bone = self.copy_bone(
                 mch_parent_name,
                 make_mechanism_name( strip_org( org_bones[0] ) )
             )
         else:
-            mch_bone = copy_bone(
-                self.obj, 
+            mch_bone = self.copy_bone(
                 mch_parent_name,
                 make_mechanism_name( strip_org( org_bones[0] ) )
             )  
@@ -59,57 +64,43 @@ class Rig:
             put_bone( self.obj, mch_bone, eb[ mch_parent_name ].tail )
         
         eb[ mch_bone ].length /= 4 # reduce length to fourth of original
+
+        # Kept for the constraints, which are made after the org bones
+        # have been reparented to the tweaks
+        self.mch_parent_name = mch_parent_name
         
         return mch_bone
         
 
     def make_master( self ):
-        bpy.ops.object.mode_set(mode ='EDIT')
-
         org_bones = self.org_bones
         
-        master_bone = copy_bone(
-            self.obj, 
+        master_bone = self.copy_bone(
             org_bones[0], 
             "master_" + strip_org( org_bones[0] )
         )        
 
-        # Make widgets
-        bpy.ops.object.mode_set(mode ='OBJECT')        
-
-        create_square_widget( self.obj, master_bone )
-        
         return master_bone
 
         
     def make_controls( self ):
-        bpy.ops.object.mode_set(mode ='EDIT')
-
         org_bones = self.org_bones
 
         ctrl_chain = []
         for i in range( len( org_bones ) ):
             name = org_bones[i]
 
-            ctrl_bone  = copy_bone(
-                self.obj, 
+            ctrl_bone  = self.copy_bone(
                 name, 
                 strip_org(name)
             )
 
             ctrl_chain.append( ctrl_bone )
 
-        # Make widgets
-        bpy.ops.object.mode_set(mode ='OBJECT')
-
-        for ctrl in ctrl_chain:
-            create_circle_widget(self.obj, ctrl, radius=0.3, head_tail=0.5)
-            
         return ctrl_chain
 
 
     def make_tweaks( self ):
-        bpy.ops.object.mode_set(mode ='EDIT')
         eb = self.obj.data.edit_bones
         org_bones = self.org_bones
 
@@ -121,8 +112,7 @@ class Rig:
             else:
                 name = org_bones[i]
 
-            tweak_bone = copy_bone(
-                self.obj, 
+            tweak_bone = self.copy_bone(
                 name, 
                 "tweak_" + strip_org(name)
             )
@@ -137,41 +127,17 @@ class Rig:
         
             tweak_chain.append( tweak_bone )
 
-        # Make widgets
-        bpy.ops.object.mode_set(mode = 'OBJECT')
-
-        for tweak in tweak_chain:
-            create_sphere_widget( self.obj, tweak )
-
-            tweak_pb = self.obj.pose.bones[ tweak ]
-
-            # Set locks
-            if tweak_chain.index( tweak ) != len( tweak_chain ) - 1:
-                tweak_pb.lock_rotation = (True, False, True)
-                tweak_pb.lock_scale    = (False, True, False)
-            else:
-                tweak_pb.lock_rotation_w = True
-                tweak_pb.lock_rotation   = (True, True, True)
-                tweak_pb.lock_scale      = (True, True, True)
-
-            # Set up tweak bone layers
-            if self.tweak_layers:
-                tweak_pb.bone.layers = self.tweak_layers
-            
         return tweak_chain   
 
 
     def make_deform( self ):
-        bpy.ops.object.mode_set(mode ='EDIT')
-
         org_bones = self.org_bones
 
         def_chain = []
         for i in range( len( org_bones ) ):
             name = org_bones[i]
 
-            def_bone  = copy_bone(
-                self.obj, 
+            def_bone  = self.copy_bone(
                 name, 
                 make_deformer_name(strip_org(name))
             )
@@ -182,8 +148,6 @@ class Rig:
 
 
     def parent_bones( self, all_bones ):
-        bpy.ops.object.mode_set(mode ='EDIT')
-
         org_bones = self.org_bones
         eb        = self.obj.data.edit_bones
 
@@ -203,6 +167,7 @@ class Rig:
 
         # Parent control bones
         # ctrls_n_parent = [ all_bones['master'] ] + all_bones['control']
+        ctrls_n_parent = [ all_bones['mch'] ] + all_bones['control']
 
         for bone in ctrls_n_parent[1:]:
             previous_index    = ctrls_n_parent.index( bone ) - 1
@@ -231,28 +196,42 @@ class Rig:
             eb[ org ].parent = eb[ tweak ]                
         
     
-    def make_constraints( self, all_bones ):
-        bpy.ops.object.mode_set(mode ='OBJECT')
+    def make_tweak_locks( self, all_bones ):
+        tweak_chain = all_bones['tweak']
 
+        for tweak in tweak_chain:
+            tweak_pb = self.obj.pose.bones[ tweak ]
+
+            # Set locks
+            if tweak_chain.index( tweak ) != len( tweak_chain ) - 1:
+                tweak_pb.lock_rotation = (True, False, True)
+                tweak_pb.lock_scale    = (False, True, False)
+            else:
+                tweak_pb.lock_rotation_w = True
+                tweak_pb.lock_rotation   = (True, True, True)
+                tweak_pb.lock_scale      = (True, True, True)
+
+
+    def make_constraints( self, all_bones ):
         org_bones = self.org_bones
         pb        = self.obj.pose.bones
         
         ## MCH bone constraints
-        if pb[ org_bones[0] ].parent:
+        if self.mch_parent_name:
             mch_pb = pb[ all_bones['mch'] ]
 
             con           = mch_pb.constraints.new('COPY_LOCATION')
             con.target    = self.obj
-            con.subtarget = pb[ org_bones[0] ].parent.name
+            con.subtarget = self.mch_parent_name
             con.head_tail = 1.0
 
             con           = mch_pb.constraints.new('COPY_ROTATION')
             con.target    = self.obj
-            con.subtarget = pb[ org_bones[0] ].parent.name
+            con.subtarget = self.mch_parent_name
             
             con           = mch_pb.constraints.new('COPY_SCALE')
             con.target    = self.obj
-            con.subtarget = pb[ org_bones[0] ].parent.name
+            con.subtarget = self.mch_parent_name
 
             """            
             # Setting the MCH prop
@@ -318,8 +297,22 @@ class Rig:
                     con.owner_space  = 'LOCAL'
             
 
-    def generate(self):
-        bpy.ops.object.mode_set(mode ='EDIT')
+    def make_widgets( self, all_bones ):
+        # create_square_widget( self.obj, all_bones['master'] )
+
+        for ctrl in all_bones['control']:
+            create_circle_widget(self.obj, ctrl, radius=0.3, head_tail=0.5)
+
+        for tweak in all_bones['tweak']:
+            create_sphere_widget( self.obj, tweak )
+
+            # Set up tweak bone layers
+            if self.tweak_layers:
+                self.obj.pose.bones[ tweak ].bone.layers = self.tweak_layers
+
+
+    def edit_bones(self):
+        self.copied_bones = []
         eb = self.obj.data.edit_bones
 
         # Clear all initial parenting
@@ -334,7 +327,7 @@ class Rig:
         tweak_chain = self.make_tweaks()
         def_chain   = self.make_deform()
 
-        all_bones = {
+        self.all_bones = {
             'mch'     : mch,
             # 'master'  : master,
             'control' : ctrl_chain,
@@ -342,8 +335,19 @@ class Rig:
             'deform'  : def_chain
         }
             
-        self.make_constraints( all_bones )
-        self.parent_bones( all_bones )
+        self.parent_bones( self.all_bones )
+
+
+    def pose_setup(self):
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties( self.obj, bone_1, bone_2 )
+
+        self.make_tweak_locks( self.all_bones )
+        self.make_constraints( self.all_bones )
+
+
+    def widgets(self):
+        self.make_widgets( self.all_bones )
 
         """
         # Create UI
@@ -414,27 +418,6 @@ def parameters_ui(layout, params):
         row.prop(params, "tweak_layers", index=i, toggle=True, text="")    
 
 
-def create_square_widget(rig, bone_name, size=1.0, bone_transform_name=None):
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [
-            (  0.5 * size, -2.9802322387695312e-08 * size,  0.5 * size ), 
-            ( -0.5 * size, -2.9802322387695312e-08 * size,  0.5 * size ), 
-            (  0.5 * size,  2.9802322387695312e-08 * size, -0.5 * size ), 
-            ( -0.5 * size,  2.9802322387695312e-08 * size, -0.5 * size ), 
-        ]
-
-        edges = [(0, 1), (2, 3), (0, 2), (3, 1) ]
-        faces = []
-
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, faces)
-        mesh.update()
-        mesh.update()
-        return obj
-    else:
-        return None
-
 def create_sample(obj): 
     # generated by rigify.utils.write_metarig
 
@@ -30,7 +30,7 @@ from mathutils import Vector
 from rna_prop_ui import rna_idprop_ui_prop_get
 
 from ..utils import MetarigError
-from ..utils import copy_bone, new_bone, flip_bone, put_bone
+from ..utils import copy_edit_bone, copy_bone_properties, new_edit_bone, flip_bone, put_bone
 from ..utils import connected_children_names
 from ..utils import strip_org, make_mechanism_name, make_deformer_name
 from ..utils import create_circle_widget, create_cube_widget
@@ -81,23 +81,27 @@ class Rig:
         if len(self.org_bones) <= 1:
             raise MetarigError("RIGIFY ERROR: Bone '%s': input to rig type must be a chain of 2 or more bones" % (strip_org(bone_name)))
 
-    def gen_deform(self):
-        """ Generate the deformation rig.
+    def deform_edit_bones(self):
+        """ Create the deformation bones.
 
         """
-        for name in self.org_bones:
-            bpy.ops.object.mode_set(mode='EDIT')
-            eb = self.obj.data.edit_bones
+        eb = self.obj.data.edit_bones
 
+        self.def_bones = []
+        for name in self.org_bones:
             # Create deform bone
-            bone_e = eb[copy_bone(self.obj, name)]
+            bone_e = eb[copy_edit_bone(self.obj, name)]
 
             # Change its name
             bone_e.name = make_deformer_name(strip_org(name))
-            bone_name = bone_e.name
+            self.def_bones += [bone_e.name]
 
-            # Leave edit mode
-            bpy.ops.object.mode_set(mode='OBJECT')
+    def deform_pose_setup(self):
+        """ Constrain the deformation bones to the original bones.
+
+        """
+        for name, bone_name in zip(self.org_bones, self.def_bones):
+            copy_bone_properties(self.obj, name, bone_name)
 
             # Get the pose bone
             bone = self.obj.pose.bones[bone_name]
@@ -108,12 +112,12 @@ class Rig:
             con.target = self.obj
             con.subtarget = name
 
-    def gen_control(self):
-        """ Generate the control rig.
+    def control_edit_bones(self):
+        """ Create the control, flex and reverse chain bones.
 
         """
-        bpy.ops.object.mode_set(mode='EDIT')
         eb = self.obj.data.edit_bones
+        self.copied_bones = []
         #-------------------------
         # Get rest slide position
         a = self.pivot_rest * len(self.org_bones)
@@ -132,25 +136,24 @@ class Rig:
         # Create control bones
         controls = []
         for i in self.control_indices:
-            name = copy_bone(self.obj, self.org_bones[i], strip_org(self.org_bones[i]))
+            name = copy_edit_bone(self.obj, self.org_bones[i], strip_org(self.org_bones[i]))
             controls += [name]
+            self.copied_bones += [(self.org_bones[i], name)]
 
         # Create control parents
         control_parents = []
         for i in self.control_indices[1:-1]:
-            name = new_bone(self.obj, make_mechanism_name("par_" + strip_org(self.org_bones[i])))
+            name = new_edit_bone(self.obj, make_mechanism_name("par_" + strip_org(self.org_bones[i])))
             control_parents += [name]
 
         # Create sub-control bones
         subcontrols = []
         for i in self.control_indices:
-            name = new_bone(self.obj, make_mechanism_name("sub_" + strip_org(self.org_bones[i])))
+            name = new_edit_bone(self.obj, make_mechanism_name("sub_" + strip_org(self.org_bones[i])))
             subcontrols += [name]
 
         # Create main control bone
-        main_control = new_bone(self.obj, self.params.spine_main_control_name)
-
-        eb = self.obj.data.edit_bones
+        main_control = new_edit_bone(self.obj, self.params.spine_main_control_name)
 
         # Parent the main control
         eb[main_control].use_connect = False
@@ -184,89 +187,22 @@ class Rig:
             put_bone(self.obj, par_name, pivot_rest_pos)
             eb[par_name].length = eb[name].length / 2
 
-        #-----------------------------------------
-        # Control bone constraints and properties
-        bpy.ops.object.mode_set(mode='OBJECT')
-        pb = self.obj.pose.bones
-
-        # Lock control locations
-        for name in controls:
-            bone = pb[name]
-            bone.lock_location = True, True, True
-
         # Main control doesn't use local location
-        pb[main_control].bone.use_local_location = False
-
-        # Intermediate controls follow hips and spine
-        for name, par_name, i in zip(controls[1:-1], control_parents, self.control_indices[1:-1]):
-            bone = pb[par_name]
-
-            # Custom bend_alpha property
-            prop = rna_idprop_ui_prop_get(pb[name], "bend_alpha", create=True)
-            pb[name]["bend_alpha"] = i / (len(self.org_bones) - 1)  # set bend alpha
-            prop["min"] = 0.0
-            prop["max"] = 1.0
-            prop["soft_min"] = 0.0
-            prop["soft_max"] = 1.0
-
-            # Custom auto_rotate
-            prop = rna_idprop_ui_prop_get(pb[name], "auto_rotate", create=True)
-            pb[name]["auto_rotate"] = 1.0
-            prop["min"] = 0.0
-            prop["max"] = 1.0
-            prop["soft_min"] = 0.0
-            prop["soft_max"] = 1.0
-
-            # Constraints
-            con1 = bone.constraints.new('COPY_TRANSFORMS')
-            con1.name = "copy_transforms"
-            con1.target = self.obj
-            con1.subtarget = subcontrols[0]
-
-            con2 = bone.constraints.new('COPY_TRANSFORMS')
-            con2.name = "copy_transforms"
-            con2.target = self.obj
-            con2.subtarget = subcontrols[-1]
-
-            # Drivers
-            fcurve = con1.driver_add("influence")
-            driver = fcurve.driver
-            driver.type = 'AVERAGE'
-            var = driver.variables.new()
-            var.name = "auto"
-            var.targets[0].id_type = 'OBJECT'
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[name].path_from_id() + '["auto_rotate"]'
-
-            fcurve = con2.driver_add("influence")
-            driver = fcurve.driver
-            driver.type = 'SCRIPTED'
-            driver.expression = "alpha * auto"
-            var = driver.variables.new()
-            var.name = "alpha"
-            var.targets[0].id_type = 'OBJECT'
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[name].path_from_id() + '["bend_alpha"]'
-            var = driver.variables.new()
-            var.name = "auto"
-            var.targets[0].id_type = 'OBJECT'
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = pb[name].path_from_id() + '["auto_rotate"]'
+        eb[main_control].use_local_location = False
 
         #-------------------------
         # Create flex spine chain
-        bpy.ops.object.mode_set(mode='EDIT')
         flex_bones = []
         flex_subs = []
         prev_bone = None
         for b in self.org_bones:
             # Create bones
-            bone = copy_bone(self.obj, b, make_mechanism_name(strip_org(b) + ".flex"))
-            sub = new_bone(self.obj, make_mechanism_name(strip_org(b) + ".flex_s"))
+            bone = copy_edit_bone(self.obj, b, make_mechanism_name(strip_org(b) + ".flex"))
+            sub = new_edit_bone(self.obj, make_mechanism_name(strip_org(b) + ".flex_s"))
             flex_bones += [bone]
             flex_subs += [sub]
+            self.copied_bones += [(b, bone)]
 
-            eb = self.obj.data.edit_bones
             bone_e = eb[bone]
             sub_e = eb[sub]
 
@@ -291,14 +227,13 @@ class Rig:
         # Create reverse spine chain
 
         # Create bones/parenting/positioning
-        bpy.ops.object.mode_set(mode='EDIT')
         rev_bones = []
         prev_bone = None
         for b in zip(flex_bones, self.org_bones):
             # Create bones
-            bone = copy_bone(self.obj, b[1], make_mechanism_name(strip_org(b[1]) + ".reverse"))
+            bone = copy_edit_bone(self.obj, b[1], make_mechanism_name(strip_org(b[1]) + ".reverse"))
             rev_bones += [bone]
-            eb = self.obj.data.edit_bones
+            self.copied_bones += [(b[1], bone)]
             bone_e = eb[bone]
 
             # Parenting
@@ -316,9 +251,71 @@ class Rig:
 
             prev_bone = bone
 
-        # Constraints
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.main_control = main_control
+        self.controls = controls
+        self.control_parents = control_parents
+        self.subcontrols = subcontrols
+        self.flex_bones = flex_bones
+        self.flex_subs = flex_subs
+        self.rev_bones = rev_bones
+
+    def control_pose_setup(self):
+        """ Set up the properties and constraints of the control rig.
+
+        """
+        main_control = self.main_control
+        controls = self.controls
+        subcontrols = self.subcontrols
+        flex_subs = self.flex_subs
+        rev_bones = self.rev_bones
+
+        for bone_1, bone_2 in self.copied_bones:
+            copy_bone_properties(self.obj, bone_1, bone_2)
+
+        #-----------------------------------------
+        # Control bone constraints and properties
         pb = self.obj.pose.bones
+
+        # Lock control locations
+        for name in controls:
+            bone = pb[name]
+            bone.lock_location = True, True, True
+
+        # Intermediate controls follow hips and spine
+        self.par_constraints = []
+        for name, par_name, i in zip(controls[1:-1], self.control_parents, self.control_indices[1:-1]):
+            bone = pb[par_name]
+
+            # Custom bend_alpha property
+            prop = rna_idprop_ui_prop_get(pb[name], "bend_alpha", create=True)
+            pb[name]["bend_alpha"] = i / (len(self.org_bones) - 1)  # set bend alpha
+            prop["min"] = 0.0
+            prop["max"] = 1.0
+            prop["soft_min"] = 0.0
+            prop["soft_max"] = 1.0
+
+            # Custom auto_rotate
+            prop = rna_idprop_ui_prop_get(pb[name], "auto_rotate", create=True)
+            pb[name]["auto_rotate"] = 1.0
+            prop["min"] = 0.0
+            prop["max"] = 1.0
+            prop["soft_min"] = 0.0
+            prop["soft_max"] = 1.0
+
+            # Constraints
+            con1 = bone.constraints.new('COPY_TRANSFORMS')
+            con1.name = "copy_transforms"
+            con1.target = self.obj
+            con1.subtarget = subcontrols[0]
+
+            con2 = bone.constraints.new('COPY_TRANSFORMS')
+            con2.name = "copy_transforms"
+            con2.target = self.obj
+            con2.subtarget = subcontrols[-1]
+
+            self.par_constraints += [(name, par_name, con1.name, con2.name)]
+
+        # Reverse chain constraints
         prev_bone = None
         for bone in rev_bones:
             bone_p = pb[bone]
@@ -335,10 +332,7 @@ class Rig:
 
         #----------------------------------------
         # Constrain original bones to flex spine
-        bpy.ops.object.mode_set(mode='OBJECT')
-        pb = self.obj.pose.bones
-
-        for obone, fbone in zip(self.org_bones, flex_bones):
+        for obone, fbone in zip(self.org_bones, self.flex_bones):
             con = pb[obone].constraints.new('COPY_TRANSFORMS')
             con.name = "copy_transforms"
             con.target = self.obj
@@ -346,7 +340,6 @@ class Rig:
 
         #---------------------------
         # Create pivot slide system
-        pb = self.obj.pose.bones
         bone_p = pb[self.org_bones[0]]
         main_control_p = pb[main_control]
 
@@ -365,35 +358,20 @@ class Rig:
         con.subtarget = rev_bones[0]
 
         # Slide constraints
+        self.slide_constraints = []
         i = 1
-        tot = len(rev_bones)
         for rb in rev_bones:
             con = bone_p.constraints.new('COPY_LOCATION')
             con.name = "slide." + str(i)
             con.target = self.obj
             con.subtarget = rb
             con.head_tail = 1.0
-
-            # Driver
-            fcurve = con.driver_add("influence")
-            driver = fcurve.driver
-            var = driver.variables.new()
-            driver.type = 'AVERAGE'
-            var.name = "slide"
-            var.targets[0].id_type = 'OBJECT'
-            var.targets[0].id = self.obj
-            var.targets[0].data_path = main_control_p.path_from_id() + '["pivot_slide"]'
-            mod = fcurve.modifiers[0]
-            mod.poly_order = 1
-            mod.coefficients[0] = 1 - i
-            mod.coefficients[1] = tot
+            self.slide_constraints += [con.name]
 
             i += 1
 
         #----------------------------------
         # Constrain flex spine to controls
-        bpy.ops.object.mode_set(mode='OBJECT')
-        pb = self.obj.pose.bones
 
         # Constrain the bones that correspond exactly to the controls
         for i, name in zip(self.control_indices, subcontrols):
@@ -403,6 +381,7 @@ class Rig:
             con.subtarget = name
 
         # Constrain the bones in-between the controls
+        self.flex_constraints = []
         for i, j, name1, name2 in zip(self.control_indices, self.control_indices[1:], subcontrols, subcontrols[1:]):
             if (i + 1) < j:
                 for n in range(i + 1, j):
@@ -425,19 +404,88 @@ class Rig:
                     con.target = self.obj
                     con.subtarget = name2
 
-                    # Driver
-                    fcurve = con.driver_add("influence")
-                    driver = fcurve.driver
-                    var = driver.variables.new()
-                    driver.type = 'AVERAGE'
-                    var.name = "alpha"
-                    var.targets[0].id_type = 'OBJECT'
-                    var.targets[0].id = self.obj
-                    var.targets[0].data_path = bone.path_from_id() + '["bend_alpha"]'
-
-        #-------------
-        # Final stuff
-        bpy.ops.object.mode_set(mode='OBJECT')
+                    self.flex_constraints += [(flex_subs[n], con.name)]
+
+    def control_drivers(self):
+        """ Create the drivers of the control rig.
+
+        """
+        pb = self.obj.pose.bones
+
+        # Intermediate controls follow hips and spine
+        for name, par_name, con1_name, con2_name in self.par_constraints:
+            bone = pb[par_name]
+            con1 = bone.constraints[con1_name]
+            con2 = bone.constraints[con2_name]
+
+            fcurve = con1.driver_add("influence")
+            driver = fcurve.driver
+            driver.type = 'AVERAGE'
+            var = driver.variables.new()
+            var.name = "auto"
+            var.targets[0].id_type = 'OBJECT'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = pb[name].path_from_id() + '["auto_rotate"]'
+
+            fcurve = con2.driver_add("influence")
+            driver = fcurve.driver
+            driver.type = 'SCRIPTED'
+            driver.expression = "alpha * auto"
+            var = driver.variables.new()
+            var.name = "alpha"
+            var.targets[0].id_type = 'OBJECT'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = pb[name].path_from_id() + '["bend_alpha"]'
+            var = driver.variables.new()
+            var.name = "auto"
+            var.targets[0].id_type = 'OBJECT'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = pb[name].path_from_id() + '["auto_rotate"]'
+
+        # Pivot slide
+        bone_p = pb[self.org_bones[0]]
+        main_control_p = pb[self.main_control]
+
+        i = 1
+        tot = len(self.rev_bones)
+        for con_name in self.slide_constraints:
+            con = bone_p.constraints[con_name]
+
+            fcurve = con.driver_add("influence")
+            driver = fcurve.driver
+            var = driver.variables.new()
+            driver.type = 'AVERAGE'
+            var.name = "slide"
+            var.targets[0].id_type = 'OBJECT'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = main_control_p.path_from_id() + '["pivot_slide"]'
+            mod = fcurve.modifiers[0]
+            mod.poly_order = 1
+            mod.coefficients[0] = 1 - i
+            mod.coefficients[1] = tot
+
+            i += 1
+
+        # Flex spine bend
+        for name, con_name in self.flex_constraints:
+            bone = pb[name]
+            con = bone.constraints[con_name]
+
+            fcurve = con.driver_add("influence")
+            driver = fcurve.driver
+            var = driver.variables.new()
+            driver.type = 'AVERAGE'
+            var.name = "alpha"
+            var.targets[0].id_type = 'OBJECT'
+            var.targets[0].id = self.obj
+            var.targets[0].data_path = bone.path_from_id() + '["bend_alpha"]'
+
+    def control_widgets(self):
+        """ Create the control widgets and set up the control appearance.
+
+        """
+        main_control = self.main_control
+        controls = self.controls
         pb = self.obj.pose.bones
 
         # Control appearance
@@ -463,19 +511,33 @@ class Rig:
         # Layers
         pb[main_control].bone.layers = pb[self.org_bones[0]].bone.layers
 
-        return [main_control] + controls
+    def edit_bones(self):
+        """ Create the bones of the rig.
+            Do NOT modify any of the original bones.
 
-    def generate(self):
-        """ Generate the rig.
+        """
+        self.deform_edit_bones()
+        self.control_edit_bones()
+
+    def pose_setup(self):
+        """ Set up the pose bones and constraints of the rig.
             Do NOT modify any of the original bones, except for adding constraints.
-            The main armature should be selected and active before this is called.
 
         """
-        self.gen_deform()
-        controls = self.gen_control()
+        self.deform_pose_setup()
+        self.control_pose_setup()
+
+    def drivers(self):
+        self.control_drivers()
+
+    def widgets(self):
+        """ Create the widgets of the rig, and return the ui script.
+
+        """
+        self.control_widgets()
 
-        controls_string = ", ".join(["'" + x + "'" for x in controls[1:]])
-        return [script % (controls[0], controls_string)]
+        controls_string = ", ".join(["'" + x + "'" for x in self.controls])
+        return [script % (self.main_control, controls_string)]
 
 
 def add_parameters(params):
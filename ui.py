@@ -19,14 +19,65 @@
 # <pep8 compliant>
 
 import bpy
-from bpy.props import StringProperty
+from bpy.props import StringProperty, BoolProperty
 
-from .utils import get_rig_type, MetarigError
-from .utils import write_metarig, write_widget
+from .utils import get_rig_type, load_module, MetarigError
+from .utils import write_metarig, write_metarig_json, write_widget
+from . import utils
 from . import rig_lists
 from . import generate
 
 
+# The rig list and collection the rig types list was last filled for.
+RIG_TYPES_FILTER = None
+
+# The parameters_ui() function of each rig type that has been drawn, or None
+# for rig types without one.
+PARAMETERS_UI = {}
+
+
+def update_rig_types(id_store, collection_name):
+    """ Fills the window manager's list of rig types with the rig types of a
+        collection ("All" for all of them, "None" for the ones that aren't
+        in a collection).  Does nothing if it is already filled for it.
+    """
+    global RIG_TYPES_FILTER
+
+    if collection_name == "All":
+        rig_types = rig_lists.rig_list
+    elif collection_name == "None":
+        rig_types = [r for r in rig_lists.rig_list if "." not in r]
+    else:
+        rig_types = [r for r in rig_lists.rig_list if r.startswith(collection_name + '.')]
+
+    # The list is also checked in case it was replaced, e.g. by loading a file.
+    rig_filter = (id(rig_lists.rig_list), collection_name)
+    if rig_filter == RIG_TYPES_FILTER and len(id_store.rigify_types) == len(rig_types):
+        return
+
+    for i in range(0, len(id_store.rigify_types)):
+        id_store.rigify_types.remove(0)
+    for r in rig_types:
+        a = id_store.rigify_types.add()
+        a.name = r
+    RIG_TYPES_FILTER = rig_filter
+
+
+def get_parameters_ui(rig_name):
+    """ Returns the parameters_ui() function of a rig type, or None if it has
+        none.  Raises ImportError if the rig type doesn't exist.
+        The rig type is only imported the first time, or if it might have
+        changed in developer mode.
+    """
+    if rig_name not in rig_lists.manifest["rigs"]:
+        raise ImportError("No rig type named '%s'" % rig_name)
+    if not rig_lists.manifest["rigs"][rig_name]["parameters_ui"]:
+        return None
+    if rig_name not in PARAMETERS_UI or utils.DEV_RELOAD:
+        PARAMETERS_UI[rig_name] = get_rig_type(rig_name).parameters_ui
+    return PARAMETERS_UI[rig_name]
+
+
 class DATA_PT_rigify_buttons(bpy.types.Panel):
     bl_label = "Rigify Buttons"
     bl_space_type = 'PROPERTIES'
@@ -51,25 +102,14 @@ class DATA_PT_rigify_buttons(bpy.types.Panel):
         id_store = C.window_manager
 
         if obj.mode in {'POSE', 'OBJECT'}:
-            layout.operator("pose.rigify_generate", text="Generate")
+            row = layout.row(align=True)
+            row.operator("pose.rigify_generate", text="Generate")
+            props = row.operator("pose.rigify_generate", text="Full Rebuild")
+            props.full_rebuild = True
         elif obj.mode == 'EDIT':
             # Build types list
             collection_name = str(id_store.rigify_collection).replace(" ", "")
-
-            for i in range(0, len(id_store.rigify_types)):
-                id_store.rigify_types.remove(0)
-
-            for r in rig_lists.rig_list:
-                # collection = r.split('.')[0]  # UNUSED
-                if collection_name == "All":
-                    a = id_store.rigify_types.add()
-                    a.name = r
-                elif r.startswith(collection_name + '.'):
-                    a = id_store.rigify_types.add()
-                    a.name = r
-                elif (collection_name == "None") and ("." not in r):
-                    a = id_store.rigify_types.add()
-                    a.name = r
+            update_rig_types(id_store, collection_name)
 
             ## Rig collection field
             #row = layout.row()
@@ -157,20 +197,7 @@ class BONE_PT_rigify_buttons(bpy.types.Panel):
         layout = self.layout
 
         # Build types list
-        for i in range(0, len(id_store.rigify_types)):
-            id_store.rigify_types.remove(0)
-
-        for r in rig_lists.rig_list:
-            # collection = r.split('.')[0]  # UNUSED
-            if collection_name == "All":
-                a = id_store.rigify_types.add()
-                a.name = r
-            elif r.startswith(collection_name + '.'):
-                a = id_store.rigify_types.add()
-                a.name = r
-            elif collection_name == "None" and len(r.split('.')) == 1:
-                a = id_store.rigify_types.add()
-                a.name = r
+        update_rig_types(id_store, collection_name)
 
         # Rig type field
         row = layout.row()
@@ -179,23 +206,20 @@ class BONE_PT_rigify_buttons(bpy.types.Panel):
         # Rig type parameters / Rig type non-exist alert
         if rig_name != "":
             try:
-                rig = get_rig_type(rig_name)
-                rig.Rig
+                parameters_ui = get_parameters_ui(rig_name)
             except (ImportError, AttributeError):
                 row = layout.row()
                 box = row.box()
                 box.label(text="ALERT: type \"%s\" does not exist!" % rig_name)
             else:
-                try:
-                    rig.parameters_ui
-                except AttributeError:
+                if parameters_ui is None:
                     col = layout.column()
                     col.label(text="No options")
                 else:
                     col = layout.column()
                     col.label(text="Options:")
                     box = layout.box()
-                    rig.parameters_ui(box, bone.rigify_parameters)
+                    parameters_ui(box, bone.rigify_parameters)
 
 
 class VIEW3D_PT_tools_rigify_dev(bpy.types.Panel):
@@ -214,11 +238,16 @@ class VIEW3D_PT_tools_rigify_dev(bpy.types.Panel):
                 r = self.layout.row()
                 r.operator("armature.rigify_encode_metarig", text="Encode Metarig to Python")
                 r = self.layout.row()
+                r.operator("armature.rigify_encode_metarig_json", text="Encode Metarig to JSON")
+                r = self.layout.row()
                 r.operator("armature.rigify_encode_metarig_sample", text="Encode Sample to Python")
 
             if context.mode == 'EDIT_MESH':
                 r = self.layout.row()
-                r.operator("mesh.rigify_encode_mesh_widget", text="Encode Mesh Widget to Python")
+                r.operator("mesh.rigify_encode_mesh_widget", text="Encode Mesh Widget")
+
+        r = self.layout.row()
+        r.prop(context.window_manager, "rigify_dev_reload")
 
 #~ class INFO_MT_armature_metarig_add(bpy.types.Menu):
     #~ bl_idname = "INFO_MT_armature_metarig_add"
@@ -279,14 +308,24 @@ class Generate(bpy.types.Operator):
     bl_label = "Rigify Generate Rig"
     bl_options = {'UNDO'}
 
+    full_rebuild = BoolProperty(
+            name="Full Rebuild",
+            description="Rebuild the whole rig, instead of only the parts of it that changed",
+            default=False,
+            )
+    profile_path = StringProperty(
+            name="Profile Path",
+            description="Profile the generation, and write the results to this path (with .json and .trace.json appended)",
+            subtype='FILE_PATH',
+            )
+
     def execute(self, context):
-        import imp
-        imp.reload(generate)
+        load_module(".generate")  # Reloads it if changed, in developer mode
 
         use_global_undo = context.user_preferences.edit.use_global_undo
         context.user_preferences.edit.use_global_undo = False
         try:
-            generate.generate_rig(context, context.object)
+            generate.generate_rig(context, context.object, self.full_rebuild, self.profile_path)
         except MetarigError as rig_exception:
             rigify_report_exception(self, rig_exception)
         finally:
@@ -354,6 +393,33 @@ class EncodeMetarig(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class EncodeMetarigJSON(bpy.types.Operator):
+    """ Writes the selected metarig in Rigify's compact metarig format.
+    """
+    bl_idname = "armature.rigify_encode_metarig_json"
+    bl_label = "Rigify Encode Metarig to JSON"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(self, context):
+        return context.mode == 'EDIT_ARMATURE'
+
+    def execute(self, context):
+        name = "metarig.json"
+
+        if name in bpy.data.texts:
+            text_block = bpy.data.texts[name]
+            text_block.clear()
+        else:
+            text_block = bpy.data.texts.new(name)
+
+        text = write_metarig_json(context.active_object, layers=True)
+        text_block.write(text)
+        bpy.ops.object.mode_set(mode='EDIT')
+
+        return {'FINISHED'}
+
+
 class EncodeMetarigSample(bpy.types.Operator):
     """ Creates Python code that will generate the selected metarig
         as a sample.
@@ -383,7 +449,7 @@ class EncodeMetarigSample(bpy.types.Operator):
 
 
 class EncodeWidget(bpy.types.Operator):
-    """ Creates Python code that will generate the selected metarig.
+    """ Writes the mesh being edited as a widget shape.
     """
     bl_idname = "mesh.rigify_encode_mesh_widget"
     bl_label = "Rigify Encode Widget"
@@ -394,7 +460,7 @@ class EncodeWidget(bpy.types.Operator):
         return context.mode == 'EDIT_MESH'
 
     def execute(self, context):
-        name = "widget.py"
+        name = "widget.json"
 
         if name in bpy.data.texts:
             text_block = bpy.data.texts[name]
@@ -402,6 +468,8 @@ class EncodeWidget(bpy.types.Operator):
         else:
             text_block = bpy.data.texts.new(name)
 
+        # The mesh data is only up to date outside of edit mode.
+        bpy.ops.object.mode_set(mode='OBJECT')
         text = write_widget(context.active_object)
         text_block.write(text)
         bpy.ops.object.mode_set(mode='EDIT')
@@ -422,6 +490,7 @@ def register():
     bpy.utils.register_class(Generate)
     bpy.utils.register_class(Sample)
     bpy.utils.register_class(EncodeMetarig)
+    bpy.utils.register_class(EncodeMetarigJSON)
     bpy.utils.register_class(EncodeMetarigSample)
     bpy.utils.register_class(EncodeWidget)
     #space_info.INFO_MT_armature_add.append(ui.menu_func)
@@ -436,5 +505,6 @@ def unregister():
     bpy.utils.unregister_class(Generate)
     bpy.utils.unregister_class(Sample)
     bpy.utils.unregister_class(EncodeMetarig)
+    bpy.utils.unregister_class(EncodeMetarigJSON)
     bpy.utils.unregister_class(EncodeMetarigSample)
     bpy.utils.unregister_class(EncodeWidget)
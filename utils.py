@@ -19,11 +19,17 @@
 # <pep8 compliant>
 
 import bpy
+import os
+import sys
 import imp
+import json
+import base64
+import hashlib
 import importlib
 import math
 import random
 import time
+from array import array
 from mathutils import Vector, Matrix
 from rna_prop_ui import rna_idprop_ui_prop_get
 
@@ -37,9 +43,34 @@ WGT_PREFIX = "WGT-"  # Prefix for widget objects
 ROOT_NAME = "root"   # Name of the root bone.
 
 WGT_LAYERS = [x == 19 for x in range(0, 20)]  # Widgets go on the last scene layer.
+MAX_NAME_LENGTH = 63  # Object names are limited to 63 characters.
+
+# The widget objects created or reused by create_widget() during the current
+# generation, by bone name, and the other way around by object name.
+WIDGET_REGISTRY = {}
+WIDGET_BONES = {}
+
+# The library meshes of the widget shapes used so far in the current
+# generation, by shape.  See get_widget_mesh().
+WIDGET_MESHES = {}
+
+# The file the shapes of the common widgets are stored in, and the shapes of
+# the widget shape files loaded so far, by path.  See load_widget_shapes().
+WIDGET_SHAPES_PATH = os.path.join(os.path.dirname(__file__), "widgets.json")
+WIDGET_SHAPE_FILES = {}
+WIDGET_SHAPES_VERSION = 1  # Version of the widget shape file format
+
+# The topology of the original bones of the rig being generated, if any.
+TOPOLOGY = None
 
 MODULE_NAME = "rigify"  # Windows/Mac blender is weird, so __package__ doesn't work
 
+# The names of the parameters each rig type adds to RigifyParameters.
+RIG_PARAMETERS = {}
+
+# Whether rig and metarig modules are reloaded when their files change.
+DEV_RELOAD = False
+
 
 #=======================================================================
 # Error handling
@@ -123,14 +154,23 @@ def new_bone(obj, bone_name):
     """ Adds a new bone to the given armature object.
         Returns the resulting bone's name.
     """
+    name = new_edit_bone(obj, bone_name)
+    bpy.ops.object.mode_set(mode='OBJECT')
+    bpy.ops.object.mode_set(mode='EDIT')
+    return name
+
+
+def new_edit_bone(obj, bone_name):
+    """ Adds a new bone to the given armature object, without leaving
+        edit mode.
+        Returns the resulting bone's name.
+    """
     if obj == bpy.context.active_object and bpy.context.mode == 'EDIT_ARMATURE':
         edit_bone = obj.data.edit_bones.new(bone_name)
         name = edit_bone.name
         edit_bone.head = (0, 0, 0)
         edit_bone.tail = (0, 1, 0)
         edit_bone.roll = 0
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.mode_set(mode='EDIT')
         return name
     else:
         raise MetarigError("Can't add new bone '%s' outside of edit mode" % bone_name)
@@ -168,6 +208,21 @@ def copy_bone(obj, bone_name, assign_name=''):
     """ Makes a copy of the given bone in the given armature object.
         Returns the resulting bone's name.
     """
+    bone_name_2 = copy_edit_bone(obj, bone_name, assign_name)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    copy_bone_properties(obj, bone_name, bone_name_2)
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    return bone_name_2
+
+
+def copy_edit_bone(obj, bone_name, assign_name=''):
+    """ Makes a copy of the given bone in the given armature object,
+        without leaving edit mode.  Only the edit bone is copied: the pose
+        bone properties can be copied afterwards with copy_bone_properties().
+        Returns the resulting bone's name.
+    """
     #if bone_name not in obj.data.bones:
     if bone_name not in obj.data.edit_bones:
         raise MetarigError("copy_bone(): bone '%s' not found, cannot copy it" % bone_name)
@@ -178,7 +233,6 @@ def copy_bone(obj, bone_name, assign_name=''):
         # Copy the edit bone
         edit_bone_1 = obj.data.edit_bones[bone_name]
         edit_bone_2 = obj.data.edit_bones.new(assign_name)
-        bone_name_1 = bone_name
         bone_name_2 = edit_bone_2.name
 
         edit_bone_2.parent = edit_bone_1.parent
@@ -200,46 +254,51 @@ def copy_bone(obj, bone_name, assign_name=''):
         edit_bone_2.bbone_in = edit_bone_1.bbone_in
         edit_bone_2.bbone_out = edit_bone_1.bbone_out
 
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-        # Get the pose bones
-        pose_bone_1 = obj.pose.bones[bone_name_1]
-        pose_bone_2 = obj.pose.bones[bone_name_2]
-
-        # Copy pose bone attributes
-        pose_bone_2.rotation_mode = pose_bone_1.rotation_mode
-        pose_bone_2.rotation_axis_angle = tuple(pose_bone_1.rotation_axis_angle)
-        pose_bone_2.rotation_euler = tuple(pose_bone_1.rotation_euler)
-        pose_bone_2.rotation_quaternion = tuple(pose_bone_1.rotation_quaternion)
-
-        pose_bone_2.lock_location = tuple(pose_bone_1.lock_location)
-        pose_bone_2.lock_scale = tuple(pose_bone_1.lock_scale)
-        pose_bone_2.lock_rotation = tuple(pose_bone_1.lock_rotation)
-        pose_bone_2.lock_rotation_w = pose_bone_1.lock_rotation_w
-        pose_bone_2.lock_rotations_4d = pose_bone_1.lock_rotations_4d
-
-        # Copy custom properties
-        for key in pose_bone_1.keys():
-            if key != "_RNA_UI" \
-            and key != "rigify_parameters" \
-            and key != "rigify_type":
-                prop1 = rna_idprop_ui_prop_get(pose_bone_1, key, create=False)
-                prop2 = rna_idprop_ui_prop_get(pose_bone_2, key, create=True)
-                pose_bone_2[key] = pose_bone_1[key]
-                for key in prop1.keys():
-                    prop2[key] = prop1[key]
-
-        bpy.ops.object.mode_set(mode='EDIT')
-
         return bone_name_2
     else:
         raise MetarigError("Cannot copy bones outside of edit mode")
 
 
+def copy_bone_properties(obj, bone_name_1, bone_name_2):
+    """ Copies the pose bone properties (rotation mode, transforms, locks
+        and custom properties) of one bone to another.
+        Must be called outside of edit mode.
+    """
+    if obj.mode == 'EDIT':
+        raise MetarigError("Cannot copy bone properties in edit mode")
+
+    # Get the pose bones
+    pose_bone_1 = obj.pose.bones[bone_name_1]
+    pose_bone_2 = obj.pose.bones[bone_name_2]
+
+    # Copy pose bone attributes
+    pose_bone_2.rotation_mode = pose_bone_1.rotation_mode
+    pose_bone_2.rotation_axis_angle = tuple(pose_bone_1.rotation_axis_angle)
+    pose_bone_2.rotation_euler = tuple(pose_bone_1.rotation_euler)
+    pose_bone_2.rotation_quaternion = tuple(pose_bone_1.rotation_quaternion)
+
+    pose_bone_2.lock_location = tuple(pose_bone_1.lock_location)
+    pose_bone_2.lock_scale = tuple(pose_bone_1.lock_scale)
+    pose_bone_2.lock_rotation = tuple(pose_bone_1.lock_rotation)
+    pose_bone_2.lock_rotation_w = pose_bone_1.lock_rotation_w
+    pose_bone_2.lock_rotations_4d = pose_bone_1.lock_rotations_4d
+
+    # Copy custom properties
+    for key in pose_bone_1.keys():
+        if key != "_RNA_UI" \
+        and key != "rigify_parameters" \
+        and key != "rigify_type":
+            prop1 = rna_idprop_ui_prop_get(pose_bone_1, key, create=False)
+            prop2 = rna_idprop_ui_prop_get(pose_bone_2, key, create=True)
+            pose_bone_2[key] = pose_bone_1[key]
+            for key in prop1.keys():
+                prop2[key] = prop1[key]
+
+
 def flip_bone(obj, bone_name):
     """ Flips an edit bone.
     """
-    if bone_name not in obj.data.bones:
+    if bone_name not in obj.data.edit_bones:
         raise MetarigError("flip_bone(): bone '%s' not found, cannot copy it" % bone_name)
 
     if obj == bpy.context.active_object and bpy.context.mode == 'EDIT_ARMATURE':
@@ -256,7 +315,7 @@ def flip_bone(obj, bone_name):
 def put_bone(obj, bone_name, pos):
     """ Places a bone at the given position.
     """
-    if bone_name not in obj.data.bones:
+    if bone_name not in obj.data.edit_bones:
         raise MetarigError("put_bone(): bone '%s' not found, cannot move it" % bone_name)
 
     if obj == bpy.context.active_object and bpy.context.mode == 'EDIT_ARMATURE':
@@ -280,14 +339,37 @@ def make_nonscaling_child(obj, bone_name, location, child_name_postfix=""):
     if bone_name not in obj.data.bones:
         raise MetarigError("make_nonscaling_child(): bone '%s' not found, cannot copy it" % bone_name)
 
+    child, intermediate_parent = make_nonscaling_child_edit_bones(obj, bone_name, location, child_name_postfix)
+
+    # Object mode
+    bpy.ops.object.mode_set(mode='OBJECT')
+    copy_bone_properties(obj, bone_name, child)
+    copy_bone_properties(obj, bone_name, intermediate_parent)
+    constrain_nonscaling_child(obj, child, intermediate_parent)
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    return child
+
+
+def make_nonscaling_child_edit_bones(obj, bone_name, location, child_name_postfix=""):
+    """ Creates the bones of a non-scaling child of the named bone (see
+        make_nonscaling_child()), without leaving edit mode.  Both bones are
+        copies of the named bone, whose pose bone properties can be copied
+        afterwards with copy_bone_properties(), and the child still needs
+        to be constrained with constrain_nonscaling_child().
+        Returns the names of the child and of its intermediate parent.
+    """
+    if bone_name not in obj.data.edit_bones:
+        raise MetarigError("make_nonscaling_child(): bone '%s' not found, cannot copy it" % bone_name)
+
     if obj == bpy.context.active_object and bpy.context.mode == 'EDIT_ARMATURE':
         # Create desired names for bones
         name1 = make_mechanism_name(strip_org(insert_before_lr(bone_name, child_name_postfix + "_ns_ch")))
         name2 = make_mechanism_name(strip_org(insert_before_lr(bone_name, child_name_postfix + "_ns_intr")))
 
         # Create bones
-        child = copy_bone(obj, bone_name, name1)
-        intermediate_parent = copy_bone(obj, bone_name, name2)
+        child = copy_edit_bone(obj, bone_name, name1)
+        intermediate_parent = copy_edit_bone(obj, bone_name, name2)
 
         # Get edit bones
         eb = obj.data.edit_bones
@@ -308,26 +390,27 @@ def make_nonscaling_child(obj, bone_name, location, child_name_postfix=""):
         put_bone(obj, child, location)
         put_bone(obj, intermediate_parent, location)
 
-        # Object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-        pb = obj.pose.bones
+        return child, intermediate_parent
+    else:
+        raise MetarigError("Cannot make nonscaling child outside of edit mode")
 
-        # Add constraints
-        con = pb[child].constraints.new('COPY_LOCATION')
-        con.name = "parent_loc"
-        con.target = obj
-        con.subtarget = intermediate_parent
 
-        con = pb[child].constraints.new('COPY_ROTATION')
-        con.name = "parent_loc"
-        con.target = obj
-        con.subtarget = intermediate_parent
+def constrain_nonscaling_child(obj, child, intermediate_parent):
+    """ Adds the constraints that make a bone created with
+        make_nonscaling_child_edit_bones() follow its intermediate parent.
+        Must be called outside of edit mode.
+    """
+    pb = obj.pose.bones
 
-        bpy.ops.object.mode_set(mode='EDIT')
+    con = pb[child].constraints.new('COPY_LOCATION')
+    con.name = "parent_loc"
+    con.target = obj
+    con.subtarget = intermediate_parent
 
-        return child
-    else:
-        raise MetarigError("Cannot make nonscaling child outside of edit mode")
+    con = pb[child].constraints.new('COPY_ROTATION')
+    con.name = "parent_loc"
+    con.target = obj
+    con.subtarget = intermediate_parent
 
 
 #=============================================
@@ -354,34 +437,173 @@ def obj_to_bone(obj, rig, bone_name):
     obj.scale = (bone.length * scl_avg), (bone.length * scl_avg), (bone.length * scl_avg)
 
 
-def create_widget(rig, bone_name, bone_transform_name=None):
+def clear_widget_registry():
+    """ Forgets the widgets created so far.  Called at the start of every
+        rig generation.
+    """
+    WIDGET_REGISTRY.clear()
+    WIDGET_BONES.clear()
+    WIDGET_MESHES.clear()
+
+
+def get_bone_widget(scene, bone_name):
+    """ Returns the widget object for a bone, or None if it has none.
+        Widgets created during the current generation are found by bone,
+        and others by their name.
+    """
+    if bone_name in WIDGET_REGISTRY:
+        return WIDGET_REGISTRY[bone_name]
+
+    # Object names are truncated, so a widget found by name may really be
+    # the widget of another bone whose name starts the same.
+    obj = scene.objects.get(widget_name(bone_name))
+    if obj is not None and obj.name in WIDGET_BONES:
+        return None
+    return obj
+
+
+def widget_name(bone_name):
+    """ Returns the name of the widget object of a bone.
+    """
+    return (WGT_PREFIX + bone_name)[:MAX_NAME_LENGTH]
+
+
+def get_widget_mesh(shape):
+    """ Returns the library mesh shared by all widgets of the given shape,
+        which is a tuple of the shape's name and parameters, e.g.
+        ("circle", radius).  An empty mesh is made if there is none yet.
+    """
+    shape = tuple(float(x) if type(x) in (int, float) else x for x in shape)
+    key = repr(shape)
+    mesh = WIDGET_MESHES.get(key)
+    if mesh is None:
+        name = "%s%s-%s" % (WGT_PREFIX, shape[0], hashlib.sha1(key.encode("utf-8")).hexdigest()[:8])
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None or mesh.get("rigify_shape") != key:
+            mesh = bpy.data.meshes.new(name)
+            mesh["rigify_shape"] = key
+        WIDGET_MESHES[key] = mesh
+    return mesh
+
+
+def pack_array(typecode, values):
+    """ Packs a sequence of numbers into a string, as little endian 32 bit
+        floats (typecode 'f') or integers (typecode 'i').
+    """
+    values = array(typecode, values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def unpack_array(typecode, text):
+    """ Returns the array of numbers packed into a string by pack_array().
+    """
+    values = array(typecode)
+    values.frombytes(base64.b64decode(text.encode("ascii")))
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def load_widget_shapes(path=WIDGET_SHAPES_PATH):
+    """ Returns the shapes of a widget shape file, by name.  Each shape is a
+        tuple of flat arrays: the vertex coordinates, the vertex indices of
+        the edges, the vertex indices of the faces and the sizes of the faces.
+        Each file is only read once.
+    """
+    shapes = WIDGET_SHAPE_FILES.get(path)
+    if shapes is None:
+        with open(path) as f:
+            data = json.load(f)
+        shapes = {}
+        for name, shape in data["shapes"].items():
+            shapes[name] = (
+                unpack_array('f', shape["verts"]),
+                unpack_array('i', shape.get("edges", "")),
+                unpack_array('i', shape.get("faces", "")),
+                unpack_array('i', shape.get("face_sizes", "")),
+                )
+        WIDGET_SHAPE_FILES[path] = shapes
+    return shapes
+
+
+def get_widget_shape(name, scale=(1.0, 1.0, 1.0), offset=(0.0, 0.0, 0.0), path=WIDGET_SHAPES_PATH):
+    """ Returns a shape of a widget shape file (see load_widget_shapes()),
+        with its vertices scaled and then offset along each axis.
+    """
+    verts, edges, faces, face_sizes = load_widget_shapes(path)[name]
+    if tuple(scale) != (1.0, 1.0, 1.0) or tuple(offset) != (0.0, 0.0, 0.0):
+        verts = array('f', verts)
+        for axis in range(3):
+            s = scale[axis]
+            o = offset[axis]
+            verts[axis::3] = array('f', [v * s + o for v in verts[axis::3]])
+    return verts, edges, faces, face_sizes
+
+
+def fill_widget_mesh(mesh, verts, edges, faces=(), face_sizes=()):
+    """ Fills an empty mesh with a widget shape given as flat arrays, as
+        returned by get_widget_shape().
+    """
+    mesh.vertices.add(len(verts) // 3)
+    mesh.vertices.foreach_set("co", verts)
+    if len(edges) > 0:
+        mesh.edges.add(len(edges) // 2)
+        mesh.edges.foreach_set("vertices", edges)
+    if len(face_sizes) > 0:
+        loop_starts = array('i', face_sizes)
+        total = 0
+        for i, size in enumerate(face_sizes):
+            loop_starts[i] = total
+            total += size
+        mesh.loops.add(len(faces))
+        mesh.loops.foreach_set("vertex_index", faces)
+        mesh.polygons.add(len(face_sizes))
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        mesh.polygons.foreach_set("loop_total", face_sizes)
+    mesh.update(calc_edges=len(face_sizes) > 0)
+
+
+def create_widget(rig, bone_name, bone_transform_name=None, shape=None):
     """ Creates an empty widget object for a bone, and returns the object.
+        If a shape is given (see get_widget_mesh()), the object uses the
+        library mesh of that shape, which only needs to be filled in if it
+        has no vertices yet.
     """
     if bone_transform_name == None:
         bone_transform_name = bone_name
 
-    obj_name = WGT_PREFIX + bone_name
+    obj_name = widget_name(bone_name)
     scene = bpy.context.scene
 
-    # Check if it already exists in the scene
-    if obj_name in scene.objects:
+    # Check if it already exists in the scene.  Another bone's widget may
+    # have the same (truncated) name, in which case a new one is needed.
+    obj = scene.objects.get(obj_name)
+    if obj is not None and WIDGET_BONES.get(obj.name, bone_name) == bone_name:
         # Move object to bone position, in case it changed
-        obj = scene.objects[obj_name]
         obj_to_bone(obj, rig, bone_transform_name)
+        WIDGET_REGISTRY[bone_name] = obj
+        WIDGET_BONES[obj.name] = bone_name
 
         return None
     else:
         # Delete object if it exists in blend data but not scene data.
         # This is necessary so we can then create the object without
         # name conflicts.
-        if obj_name in bpy.data.objects:
+        if obj is None and obj_name in bpy.data.objects:
             bpy.data.objects[obj_name].user_clear()
             bpy.data.objects.remove(bpy.data.objects[obj_name])
 
         # Create mesh object
-        mesh = bpy.data.meshes.new(obj_name)
+        if shape is None:
+            mesh = bpy.data.meshes.new(obj_name)
+        else:
+            mesh = get_widget_mesh(shape)
         obj = bpy.data.objects.new(obj_name, mesh)
         scene.objects.link(obj)
+        WIDGET_REGISTRY[bone_name] = obj
+        WIDGET_BONES[obj.name] = bone_name
 
         # Move object to bone position and set layers
         obj_to_bone(obj, rig, bone_transform_name)
@@ -395,11 +617,9 @@ def create_widget(rig, bone_name, bone_transform_name=None):
 def create_line_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a basic line widget, a line that spans the length of the bone.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        mesh = obj.data
-        mesh.from_pydata([(0, 0, 0), (0, 1, 0)], [(0, 1)], [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("line",))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("line"))
 
 
 def create_circle_widget(rig, bone_name, radius=1.0, head_tail=0.0, with_line=False, bone_transform_name=None):
@@ -407,94 +627,62 @@ def create_circle_widget(rig, bone_name, radius=1.0, head_tail=0.0, with_line=Fa
         radius: the radius of the circle
         head_tail: where along the length of the bone the circle is (0.0=head, 1.0=tail)
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        v = [(0.7071068286895752, 2.980232238769531e-07, -0.7071065306663513), (0.8314696550369263, 2.980232238769531e-07, -0.5555699467658997), (0.9238795042037964, 2.682209014892578e-07, -0.3826831877231598), (0.9807852506637573, 2.5331974029541016e-07, -0.19509011507034302), (1.0, 2.365559055306221e-07, 1.6105803979371558e-07), (0.9807853698730469, 2.2351741790771484e-07, 0.19509044289588928), (0.9238796234130859, 2.086162567138672e-07, 0.38268351554870605), (0.8314696550369263, 1.7881393432617188e-07, 0.5555704236030579), (0.7071068286895752, 1.7881393432617188e-07, 0.7071070075035095), (0.5555702447891235, 1.7881393432617188e-07, 0.8314698934555054), (0.38268327713012695, 1.7881393432617188e-07, 0.923879861831665), (0.19509008526802063, 1.7881393432617188e-07, 0.9807855486869812), (-3.2584136988589307e-07, 1.1920928955078125e-07, 1.000000238418579), (-0.19509072601795197, 1.7881393432617188e-07, 0.9807854294776917), (-0.3826838731765747, 1.7881393432617188e-07, 0.9238795638084412), (-0.5555707216262817, 1.7881393432617188e-07, 0.8314695358276367), (-0.7071071863174438, 1.7881393432617188e-07, 0.7071065902709961), (-0.8314700126647949, 1.7881393432617188e-07, 0.5555698871612549), (-0.923879861831665, 2.086162567138672e-07, 0.3826829195022583), (-0.9807853698730469, 2.2351741790771484e-07, 0.1950896978378296), (-1.0, 2.365559907957504e-07, -7.290432222362142e-07), (-0.9807850122451782, 2.5331974029541016e-07, -0.195091113448143), (-0.9238790273666382, 2.682209014892578e-07, -0.38268423080444336), (-0.831468939781189, 2.980232238769531e-07, -0.5555710196495056), (-0.7071058750152588, 2.980232238769531e-07, -0.707107424736023), (-0.555569052696228, 2.980232238769531e-07, -0.8314701318740845), (-0.38268208503723145, 2.980232238769531e-07, -0.923879861831665), (-0.19508881866931915, 2.980232238769531e-07, -0.9807853102684021), (1.6053570561780361e-06, 2.980232238769531e-07, -0.9999997615814209), (0.19509197771549225, 2.980232238769531e-07, -0.9807847142219543), (0.3826850652694702, 2.980232238769531e-07, -0.9238786101341248), (0.5555717945098877, 2.980232238769531e-07, -0.8314683437347412)]
-        verts = [(a[0] * radius, head_tail, a[2] * radius) for a in v]
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("circle", radius, head_tail, with_line))
+    if obj != None and len(obj.data.vertices) == 0:
+        verts, edges, faces, face_sizes = get_widget_shape("circle", (radius, 0.0, radius), (0.0, head_tail, 0.0))
         if with_line:
-            edges = [(28, 12), (0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9), (9, 10), (10, 11), (11, 12), (12, 13), (13, 14), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (21, 22), (22, 23), (23, 24), (24, 25), (25, 26), (26, 27), (27, 28), (28, 29), (29, 30), (30, 31), (0, 31)]
-        else:
-            edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9), (9, 10), (10, 11), (11, 12), (12, 13), (13, 14), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (21, 22), (22, 23), (23, 24), (24, 25), (25, 26), (26, 27), (27, 28), (28, 29), (29, 30), (30, 31), (0, 31)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
-        return obj
-    else:
-        return None
+            edges = array('i', (28, 12)) + edges
+        fill_widget_mesh(obj.data, verts, edges)
+    return obj
 
 
 def create_cube_widget(rig, bone_name, radius=0.5, bone_transform_name=None):
     """ Creates a basic cube widget.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        r = radius
-        verts = [(r, r, r), (r, -r, r), (-r, -r, r), (-r, r, r), (r, r, -r), (r, -r, -r), (-r, -r, -r), (-r, r, -r)]
-        edges = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4), (0, 4), (1, 5), (2, 6), (3, 7)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("cube", radius))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("cube", (radius, radius, radius)))
 
 
 def create_sphere_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a basic sphere widget, three pependicular overlapping circles.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(0.3535533845424652, 0.3535533845424652, 0.0), (0.4619397521018982, 0.19134171307086945, 0.0), (0.5, -2.1855694143368964e-08, 0.0), (0.4619397521018982, -0.19134175777435303, 0.0), (0.3535533845424652, -0.3535533845424652, 0.0), (0.19134174287319183, -0.4619397521018982, 0.0), (7.549790126404332e-08, -0.5, 0.0), (-0.1913416087627411, -0.46193981170654297, 0.0), (-0.35355329513549805, -0.35355350375175476, 0.0), (-0.4619397521018982, -0.19134178757667542, 0.0), (-0.5, 5.962440319251527e-09, 0.0), (-0.4619397222995758, 0.1913418024778366, 0.0), (-0.35355326533317566, 0.35355350375175476, 0.0), (-0.19134148955345154, 0.46193987131118774, 0.0), (3.2584136988589307e-07, 0.5, 0.0), (0.1913420855998993, 0.46193960309028625, 0.0), (7.450580596923828e-08, 0.46193960309028625, 0.19134199619293213), (5.9254205098113744e-08, 0.5, 2.323586443253589e-07), (4.470348358154297e-08, 0.46193987131118774, -0.1913415789604187), (2.9802322387695312e-08, 0.35355350375175476, -0.3535533547401428), (2.9802322387695312e-08, 0.19134178757667542, -0.46193981170654297), (5.960464477539063e-08, -1.1151834122813398e-08, -0.5000000596046448), (5.960464477539063e-08, -0.1913418024778366, -0.46193984150886536), (5.960464477539063e-08, -0.35355350375175476, -0.3535533845424652), (7.450580596923828e-08, -0.46193981170654297, -0.19134166836738586), (9.348272556053416e-08, -0.5, 1.624372103492533e-08), (1.043081283569336e-07, -0.4619397521018982, 0.19134168326854706), (1.1920928955078125e-07, -0.3535533845424652, 0.35355329513549805), (1.1920928955078125e-07, -0.19134174287319183, 0.46193966269493103), (1.1920928955078125e-07, -4.7414250303745575e-09, 0.49999991059303284), (1.1920928955078125e-07, 0.19134172797203064, 0.46193966269493103), (8.940696716308594e-08, 0.3535533845424652, 0.35355329513549805), (0.3535534739494324, 0.0, 0.35355329513549805), (0.1913418173789978, -2.9802322387695312e-08, 0.46193966269493103), (8.303572940349113e-08, -5.005858838558197e-08, 0.49999991059303284), (-0.19134165346622467, -5.960464477539063e-08, 0.46193966269493103), (-0.35355329513549805, -8.940696716308594e-08, 0.35355329513549805), (-0.46193963289260864, -5.960464477539063e-08, 0.19134168326854706), (-0.49999991059303284, -5.960464477539063e-08, 1.624372103492533e-08), (-0.4619397521018982, -2.9802322387695312e-08, -0.19134166836738586), (-0.3535534143447876, -2.9802322387695312e-08, -0.3535533845424652), (-0.19134171307086945, 0.0, -0.46193984150886536), (7.662531942287387e-08, 9.546055501630235e-09, -0.5000000596046448), (0.19134187698364258, 5.960464477539063e-08, -0.46193981170654297), (0.3535535931587219, 5.960464477539063e-08, -0.3535533547401428), (0.4619399905204773, 5.960464477539063e-08, -0.1913415789604187), (0.5000000596046448, 5.960464477539063e-08, 2.323586443253589e-07), (0.4619396924972534, 2.9802322387695312e-08, 0.19134199619293213)]
-        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9), (9, 10), (10, 11), (11, 12), (12, 13), (13, 14), (14, 15), (0, 15), (16, 31), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (21, 22), (22, 23), (23, 24), (24, 25), (25, 26), (26, 27), (27, 28), (28, 29), (29, 30), (30, 31), (32, 33), (33, 34), (34, 35), (35, 36), (36, 37), (37, 38), (38, 39), (39, 40), (40, 41), (41, 42), (42, 43), (43, 44), (44, 45), (45, 46), (46, 47), (32, 47)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("sphere",))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("sphere"))
 
 
 def create_limb_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a basic limb widget, a line that spans the length of the
         bone, with a circle around the center.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(-1.1920928955078125e-07, 1.7881393432617188e-07, 0.0), (3.5762786865234375e-07, 1.0000004768371582, 0.0), (0.1767769455909729, 0.5000001192092896, 0.17677664756774902), (0.20786768198013306, 0.5000001192092896, 0.1388925313949585), (0.23097014427185059, 0.5000001192092896, 0.09567084908485413), (0.24519658088684082, 0.5000001192092896, 0.048772573471069336), (0.2500002384185791, 0.5000001192092896, -2.545945676502015e-09), (0.24519658088684082, 0.5000001192092896, -0.048772573471069336), (0.23097014427185059, 0.5000001192092896, -0.09567084908485413), (0.20786768198013306, 0.5000001192092896, -0.13889259099960327), (0.1767769455909729, 0.5000001192092896, -0.1767767071723938), (0.13889282941818237, 0.5000001192092896, -0.20786744356155396), (0.09567105770111084, 0.5000001192092896, -0.23096990585327148), (0.04877278208732605, 0.5000001192092896, -0.24519634246826172), (1.7279069197684294e-07, 0.5000000596046448, -0.25), (-0.0487724244594574, 0.5000001192092896, -0.24519634246826172), (-0.09567070007324219, 0.5000001192092896, -0.2309698462486267), (-0.13889241218566895, 0.5000001192092896, -0.20786738395690918), (-0.17677652835845947, 0.5000001192092896, -0.17677664756774902), (-0.20786726474761963, 0.5000001192092896, -0.13889244198799133), (-0.23096972703933716, 0.5000001192092896, -0.09567070007324219), (-0.24519610404968262, 0.5000001192092896, -0.04877239465713501), (-0.2499997615814209, 0.5000001192092896, 2.1997936983098043e-07), (-0.24519598484039307, 0.5000001192092896, 0.04877282679080963), (-0.23096948862075806, 0.5000001192092896, 0.09567108750343323), (-0.20786696672439575, 0.5000001192092896, 0.1388927698135376), (-0.1767762303352356, 0.5000001192092896, 0.17677688598632812), (-0.13889199495315552, 0.5000001192092896, 0.2078675627708435), (-0.09567028284072876, 0.5000001192092896, 0.23097002506256104), (-0.048771947622299194, 0.5000001192092896, 0.24519634246826172), (6.555903269145347e-07, 0.5000001192092896, 0.25), (0.04877324402332306, 0.5000001192092896, 0.24519622325897217), (0.09567153453826904, 0.5000001192092896, 0.23096966743469238), (0.13889318704605103, 0.5000001192092896, 0.20786714553833008)]
-        edges = [(0, 1), (2, 3), (4, 3), (5, 4), (5, 6), (6, 7), (8, 7), (8, 9), (10, 9), (10, 11), (11, 12), (13, 12), (14, 13), (14, 15), (16, 15), (16, 17), (17, 18), (19, 18), (19, 20), (21, 20), (21, 22), (22, 23), (24, 23), (25, 24), (25, 26), (27, 26), (27, 28), (29, 28), (29, 30), (30, 31), (32, 31), (32, 33), (2, 33)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("limb",))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("limb"))
 
 
 def create_bone_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a basic bone widget, a simple obolisk-esk shape.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(0.04, 1.0, -0.04), (0.1, 0.0, -0.1), (-0.1, 0.0, -0.1), (-0.04, 1.0, -0.04), (0.04, 1.0, 0.04), (0.1, 0.0, 0.1), (-0.1, 0.0, 0.1), (-0.04, 1.0, 0.04)]
-        edges = [(1, 2), (0, 1), (0, 3), (2, 3), (4, 5), (5, 6), (6, 7), (4, 7), (1, 5), (0, 4), (2, 6), (3, 7)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("bone",))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("bone"))
 
 
 def create_compass_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a compass-shaped widget.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(0.0, 1.2000000476837158, 0.0), (0.19509032368659973, 0.9807852506637573, 0.0), (0.3826834559440613, 0.9238795042037964, 0.0), (0.5555702447891235, 0.8314695954322815, 0.0), (0.7071067690849304, 0.7071067690849304, 0.0), (0.8314696550369263, 0.5555701851844788, 0.0), (0.9238795042037964, 0.3826834261417389, 0.0), (0.9807852506637573, 0.19509035348892212, 0.0), (1.2000000476837158, 7.549790126404332e-08, 0.0), (0.9807853102684021, -0.19509020447731018, 0.0), (0.9238795638084412, -0.38268327713012695, 0.0), (0.8314696550369263, -0.5555701851844788, 0.0), (0.7071067690849304, -0.7071067690849304, 0.0), (0.5555701851844788, -0.8314696550369263, 0.0), (0.38268327713012695, -0.9238796234130859, 0.0), (0.19509008526802063, -0.9807853102684021, 0.0), (-3.2584136988589307e-07, -1.2999999523162842, 0.0), (-0.19509072601795197, -0.9807851910591125, 0.0), (-0.3826838731765747, -0.9238793253898621, 0.0), (-0.5555707216262817, -0.8314692974090576, 0.0), (-0.7071072459220886, -0.707106351852417, 0.0), (-0.8314700126647949, -0.5555696487426758, 0.0), (-0.923879861831665, -0.3826826810836792, 0.0), (-0.9807854294776917, -0.1950894594192505, 0.0), (-1.2000000476837158, 9.655991561885457e-07, 0.0), (-0.980785071849823, 0.1950913518667221, 0.0), (-0.923879086971283, 0.38268446922302246, 0.0), (-0.831468939781189, 0.5555712580680847, 0.0), (-0.7071058750152588, 0.707107663154602, 0.0), (-0.5555691123008728, 0.8314703702926636, 0.0), (-0.38268208503723145, 0.9238801002502441, 0.0), (-0.19508881866931915, 0.9807855486869812, 0.0)]
-        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9), (9, 10), (10, 11), (11, 12), (12, 13), (13, 14), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (21, 22), (22, 23), (23, 24), (24, 25), (25, 26), (26, 27), (27, 28), (28, 29), (29, 30), (30, 31), (0, 31)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("compass",))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("compass"))
 
 
 def create_root_widget(rig, bone_name, bone_transform_name=None):
     """ Creates a widget for the root bone.
     """
-    obj = create_widget(rig, bone_name, bone_transform_name)
-    if obj != None:
-        verts = [(0.7071067690849304, 0.7071067690849304, 0.0), (0.7071067690849304, -0.7071067690849304, 0.0), (-0.7071067690849304, 0.7071067690849304, 0.0), (-0.7071067690849304, -0.7071067690849304, 0.0), (0.8314696550369263, 0.5555701851844788, 0.0), (0.8314696550369263, -0.5555701851844788, 0.0), (-0.8314696550369263, 0.5555701851844788, 0.0), (-0.8314696550369263, -0.5555701851844788, 0.0), (0.9238795042037964, 0.3826834261417389, 0.0), (0.9238795042037964, -0.3826834261417389, 0.0), (-0.9238795042037964, 0.3826834261417389, 0.0), (-0.9238795042037964, -0.3826834261417389, 0.0), (0.9807852506637573, 0.19509035348892212, 0.0), (0.9807852506637573, -0.19509035348892212, 0.0), (-0.9807852506637573, 0.19509035348892212, 0.0), (-0.9807852506637573, -0.19509035348892212, 0.0), (0.19509197771549225, 0.9807849526405334, 0.0), (0.19509197771549225, -0.9807849526405334, 0.0), (-0.19509197771549225, 0.9807849526405334, 0.0), (-0.19509197771549225, -0.9807849526405334, 0.0), (0.3826850652694702, 0.9238788485527039, 0.0), (0.3826850652694702, -0.9238788485527039, 0.0), (-0.3826850652694702, 0.9238788485527039, 0.0), (-0.3826850652694702, -0.9238788485527039, 0.0), (0.5555717945098877, 0.8314685821533203, 0.0), (0.5555717945098877, -0.8314685821533203, 0.0), (-0.5555717945098877, 0.8314685821533203, 0.0), (-0.5555717945098877, -0.8314685821533203, 0.0), (0.19509197771549225, 1.2807848453521729, 0.0), (0.19509197771549225, -1.2807848453521729, 0.0), (-0.19509197771549225, 1.2807848453521729, 0.0), (-0.19509197771549225, -1.2807848453521729, 0.0), (1.280785322189331, 0.19509035348892212, 0.0), (1.280785322189331, -0.19509035348892212, 0.0), (-1.280785322189331, 0.19509035348892212, 0.0), (-1.280785322189331, -0.19509035348892212, 0.0), (0.3950919806957245, 1.2807848453521729, 0.0), (0.3950919806957245, -1.2807848453521729, 0.0), (-0.3950919806957245, 1.2807848453521729, 0.0), (-0.3950919806957245, -1.2807848453521729, 0.0), (1.280785322189331, 0.39509034156799316, 0.0), (1.280785322189331, -0.39509034156799316, 0.0), (-1.280785322189331, 0.39509034156799316, 0.0), (-1.280785322189331, -0.39509034156799316, 0.0), (0.0, 1.5807849168777466, 0.0), (0.0, -1.5807849168777466, 0.0), (1.5807852745056152, 0.0, 0.0), (-1.5807852745056152, 0.0, 0.0)]
-        edges = [(0, 4), (1, 5), (2, 6), (3, 7), (4, 8), (5, 9), (6, 10), (7, 11), (8, 12), (9, 13), (10, 14), (11, 15), (16, 20), (17, 21), (18, 22), (19, 23), (20, 24), (21, 25), (22, 26), (23, 27), (0, 24), (1, 25), (2, 26), (3, 27), (16, 28), (17, 29), (18, 30), (19, 31), (12, 32), (13, 33), (14, 34), (15, 35), (28, 36), (29, 37), (30, 38), (31, 39), (32, 40), (33, 41), (34, 42), (35, 43), (36, 44), (37, 45), (38, 44), (39, 45), (40, 46), (41, 46), (42, 47), (43, 47)]
-        mesh = obj.data
-        mesh.from_pydata(verts, edges, [])
-        mesh.update()
+    obj = create_widget(rig, bone_name, bone_transform_name, shape=("root",))
+    if obj != None and len(obj.data.vertices) == 0:
+        fill_widget_mesh(obj.data, *get_widget_shape("root"))
 
 
 #=============================================
@@ -623,41 +811,298 @@ def align_bone_z_axis(obj, bone, vec):
         bone_e.roll += angle * 2
 
 
+#=============================================
+# Armature topology
+#=============================================
+
+class BoneTopology:
+    """ The parent/child relationships of a set of bones, indexed by name so
+        that traversals don't need to look bones up in the armature.
+
+        During generation, the topology of the rig's original bones is built
+        once from the metarig, and is available from get_topology() and as
+        the "topology" attribute of every rig.  It describes the "ORG-" bones
+        as they are in the metarig, which is how rig types see them when they
+        are initialized.
+    """
+    def __init__(self, obj, bones, rename=None):
+        self.obj = obj
+        self.names = []
+        self.index = {}
+        self.parent = {}
+        self.children = {}
+        self.connected = set()
+        self.depth = {}
+        self._chains = {}
+
+        for bone in bones:
+            name = bone.name if rename is None else rename(bone.name)
+            self.index[name] = len(self.names)
+            self.names += [name]
+            self.children[name] = []
+            if bone.parent is None:
+                self.parent[name] = None
+            else:
+                self.parent[name] = bone.parent.name if rename is None else rename(bone.parent.name)
+            if bone.use_connect:
+                self.connected.add(name)
+
+        for name in self.names:
+            parent = self.parent[name]
+            if parent is not None:
+                self.children[parent] += [name]
+
+        for name in self.names:
+            self._find_depth(name)
+
+    def _find_depth(self, name):
+        # Walks up to the nearest bone whose depth is known, and fills in the
+        # depths on the way back down.
+        path = []
+        while name is not None and name not in self.depth:
+            path += [name]
+            name = self.parent[name]
+        depth = -1 if name is None else self.depth[name]
+        for name in reversed(path):
+            depth += 1
+            self.depth[name] = depth
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def sorted_names(self):
+        """ Returns the bone names in root-most to leaf-most order, and
+            alphabetically among bones at the same depth.
+        """
+        return sorted(self.names, key=lambda name: (self.depth[name], name))
+
+    def connected_children(self, name):
+        """ Returns the names of the bones that form a single connected chain
+            below the given bone.  See connected_children_names().
+        """
+        chain = self._chains.get(name)
+        if chain is None:
+            chain = []
+            bone = name
+            while True:
+                connects = [child for child in self.children[bone] if child in self.connected]
+                if len(connects) != 1:
+                    break
+                bone = connects[0]
+                chain += [bone]
+            self._chains[name] = chain
+        return list(chain)
+
+    def has_connected_children(self, name):
+        for child in self.children[name]:
+            if child in self.connected:
+                return True
+        return False
+
+    def siblings(self, name):
+        """ Returns the names of the other children of the bone's parent.
+        """
+        parent = self.parent[name]
+        if parent is None:
+            return []
+        return [child for child in self.children[parent] if child != name]
+
+
+def set_topology(topology):
+    """ Sets the topology that get_topology() returns, or clears it if
+        topology is None.
+    """
+    global TOPOLOGY
+    TOPOLOGY = topology
+
+
+def get_topology(obj, bone_name=None):
+    """ Returns the topology of the original bones of obj, if it is the rig
+        being generated, and None otherwise.
+        If a bone name is given, None is also returned if the bone isn't one
+        of the original bones.
+    """
+    if TOPOLOGY is None or TOPOLOGY.obj != obj:
+        return None
+    if bone_name is not None and bone_name not in TOPOLOGY:
+        return None
+    return TOPOLOGY
+
+
 #=============================================
 # Misc
 #=============================================
 
+# The properties copy_attributes() copies, for each type of struct it has seen.
+COPY_PROPERTIES = {}
+
+# Property types that foreach_get() and foreach_set() can copy.
+BULK_PROPERTY_TYPES = {'BOOLEAN', 'INT', 'FLOAT'}
+
+
+def get_copy_properties(struct):
+    """ Returns the (name, type, array length) of every property of an RNA
+        struct that copy_attributes() copies, in alphabetical order.
+        These are found from the struct's RNA once per struct type.
+    """
+    key = (type(struct), struct.bl_rna.identifier)
+    if key not in COPY_PROPERTIES:
+        props = []
+        for prop in struct.bl_rna.properties:
+            name = prop.identifier
+            if not prop.is_readonly \
+            and prop.type != 'COLLECTION' \
+            and not name.startswith("error_") \
+            and name != "group" \
+            and name != "is_valid" \
+            and name != "rna_type":
+                props += [(name, prop.type, getattr(prop, "array_length", 0))]
+        props.sort()
+        COPY_PROPERTIES[key] = props
+    return COPY_PROPERTIES[key]
+
+
 def copy_attributes(a, b):
-    keys = dir(a)
-    for key in keys:
-        if not key.startswith("_") \
-        and not key.startswith("error_") \
-        and key != "group" \
-        and key != "is_valid" \
-        and key != "rna_type" \
-        and key != "bl_rna":
-            try:
-                setattr(b, key, getattr(a, key))
-            except AttributeError:
-                pass
+    """ Copies all the writable properties of RNA struct a to b.
+    """
+    if not hasattr(a, "bl_rna"):
+        # Not an RNA struct, so find its attributes the slow way.
+        for key in dir(a):
+            if not key.startswith("_"):
+                try:
+                    setattr(b, key, getattr(a, key))
+                except AttributeError:
+                    pass
+        return
+
+    for name, prop_type, length in get_copy_properties(a):
+        try:
+            setattr(b, name, getattr(a, name))
+        except AttributeError:
+            pass
+
+
+def copy_collection_attributes(a, b):
+    """ Copies the properties of every item of RNA collection a to the item
+        of collection b at the same index, like copy_attributes() does.
+        Numeric properties are copied for all items at once.
+    """
+    if len(a) != len(b):
+        raise MetarigError("copy_collection_attributes(): collections differ in length")
+    if len(a) == 0:
+        return
+
+    for name, prop_type, length in get_copy_properties(a[0]):
+        if prop_type in BULK_PROPERTY_TYPES:
+            values = [0] * (len(a) * max(length, 1))
+            a.foreach_get(name, values)
+            b.foreach_set(name, values)
+        else:
+            for item_a, item_b in zip(a, b):
+                try:
+                    setattr(item_b, name, getattr(item_a, name))
+                except AttributeError:
+                    pass
+
+
+def set_dev_reload(enabled):
+    """ Turns developer mode module reloading on or off.  See load_module().
+    """
+    global DEV_RELOAD
+    DEV_RELOAD = enabled
+
+
+def get_module_mtime(module):
+    try:
+        return os.path.getmtime(module.__file__)
+    except (AttributeError, TypeError, OSError):
+        return None
+
+
+def reload_changed_modules(module):
+    """ Reloads a module and its loaded submodules if their files changed
+        since they were loaded.  Submodules are reloaded first, so that the
+        module picks up their new versions.
+        Returns the module.
+    """
+    prefix = module.__name__ + "."
+    submodules = [m for name, m in sys.modules.items() if name.startswith(prefix) and m is not None]
+    submodules.sort(key=lambda m: -m.__name__.count("."))
+
+    changed = False
+    for m in submodules + [module]:
+        mtime = get_module_mtime(m)
+        loaded = getattr(m, "_rigify_mtime", None)
+        if (loaded is not None and loaded != mtime) or (m is module and changed):
+            m = imp.reload(m)
+            changed = True
+        m._rigify_mtime = mtime
+    return module
+
+
+def load_module(name):
+    """ Imports a module of Rigify by its name relative to the package, and
+        returns it.
+        Normally a module is only loaded once.  In developer mode (see
+        set_dev_reload()) it is reloaded whenever its file, or the file of
+        one of its submodules, has changed since it was loaded.
+    """
+    module = sys.modules.get(MODULE_NAME + name)
+    if module is None:
+        module = importlib.import_module(name, package=MODULE_NAME)
+        reload_changed_modules(module)  # Remember when it was loaded
+    elif DEV_RELOAD:
+        reload_changed_modules(module)
+    return module
 
 
 def get_rig_type(rig_type):
     """ Fetches a rig module by name, and returns it.
     """
-    name = ".%s.%s" % (RIG_DIR, rig_type)
-    submod = importlib.import_module(name, package=MODULE_NAME)
-    imp.reload(submod)
-    return submod
+    return load_module(".%s.%s" % (RIG_DIR, rig_type))
 
 
 def get_metarig_module(metarig_name):
     """ Fetches a rig module by name, and returns it.
     """
-    name = ".%s.%s" % (METARIG_DIR, metarig_name)
-    submod = importlib.import_module(name, package=MODULE_NAME)
-    imp.reload(submod)
-    return submod
+    return load_module(".%s.%s" % (METARIG_DIR, metarig_name))
+
+
+def create_metarig(obj, metarig_name):
+    """ Adds the bones of a metarig from the metarigs directory to an
+        armature object.  A metarig is either a .json file written by
+        write_metarig_json(), or a python module with a create() function.
+    """
+    path = os.path.join(os.path.dirname(__file__), METARIG_DIR, metarig_name + ".json")
+    if os.path.isfile(path):
+        with open(path) as f:
+            create_metarig_from_json(obj, f.read())
+    else:
+        get_metarig_module(metarig_name).create(obj)
+
+
+def set_rig_parameter_names(rig_type, names):
+    """ Records the names of the parameters a rig type adds to
+        RigifyParameters.  If names is None, they are unknown.
+    """
+    if names is None:
+        RIG_PARAMETERS.pop(rig_type, None)
+    else:
+        RIG_PARAMETERS[rig_type] = list(names)
+
+
+def get_rig_parameter_names(params, rig_type):
+    """ Returns the names of the parameters in params that belong to the
+        given rig type.  If the rig type's parameters are unknown, the names
+        of all the parameters are returned.
+    """
+    rig_type = rig_type.replace(" ", "")
+    if rig_type == "":
+        return []
+    if rig_type in RIG_PARAMETERS:
+        return RIG_PARAMETERS[rig_type]
+    return [prop for prop in dir(params)
+            if not prop.startswith("_") and not prop.startswith("bl_") and prop != "rna_type"]
 
 
 def connected_children_names(obj, bone_name):
@@ -665,6 +1110,10 @@ def connected_children_names(obj, bone_name):
         connected chain starting with the given bone as a parent.
         If there is a connected branch, the list stops there.
     """
+    topology = get_topology(obj, bone_name)
+    if topology is not None:
+        return topology.connected_children(bone_name)
+
     bone = obj.data.bones[bone_name]
     names = []
 
@@ -784,7 +1233,10 @@ def write_metarig(obj, layers=False, func_name="create"):
         if layers:
             code.append("    pbone.bone.layers = %s" % str(list(pbone.bone.layers)))
         # Rig type parameters
+        param_names = get_rig_parameter_names(pbone.rigify_parameters, pbone.rigify_type)
         for param_name in pbone.rigify_parameters.keys():
+            if param_name not in param_names:
+                continue
             param = getattr(pbone.rigify_parameters, param_name)
             if str(type(param)) == "<class 'bpy_prop_array'>":
                 param = list(param)
@@ -828,48 +1280,244 @@ def write_metarig(obj, layers=False, func_name="create"):
     return "\n".join(code)
 
 
-def write_widget(obj):
-    """ Write a mesh object as a python script for widget use.
+METARIG_FORMAT_VERSION = 1  # Version of the format written by write_metarig_json()
+
+
+def write_metarig_json(obj, layers=False):
+    """ Write a metarig in Rigify's compact metarig format, which
+        create_metarig_from_json() reads.  It has the same information as
+        write_metarig(), but as one array per bone property instead of
+        python statements.
+    """
+    arm = obj.data
+    data = {"version": METARIG_FORMAT_VERSION}
+
+    # Rigify layer layout info
+    if layers and len(arm.rigify_layers) > 0:
+        data["rigify_layers"] = [[l.name, l.row] for l in arm.rigify_layers]
+
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    # write parents first
+    bones = [(len(bone.parent_recursive), bone.name) for bone in arm.edit_bones]
+    bones.sort(key=lambda item: item[0])
+    bones = [item[1] for item in bones]
+    index = {name: i for i, name in enumerate(bones)}
+
+    parents = []
+    use_connect = []
+    head = []
+    tail = []
+    roll = []
+    for bone_name in bones:
+        bone = arm.edit_bones[bone_name]
+        parents += [index[bone.parent.name] if bone.parent else -1]
+        use_connect += [bone.use_connect]
+        head += [round(v, 4) for v in bone.head]
+        tail += [round(v, 4) for v in bone.tail]
+        roll += [round(bone.roll, 4)]
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Rig type and other pose properties
+    rigify_type = []
+    rotation_mode = []
+    lock_location = []
+    lock_rotation = []
+    lock_rotation_w = []
+    lock_scale = []
+    bone_layers = []
+    parameters = []
+    for bone_name in bones:
+        pbone = obj.pose.bones[bone_name]
+        rigify_type += [pbone.rigify_type]
+        rotation_mode += [pbone.rotation_mode]
+        lock_location += list(pbone.lock_location)
+        lock_rotation += list(pbone.lock_rotation)
+        lock_rotation_w += [pbone.lock_rotation_w]
+        lock_scale += list(pbone.lock_scale)
+        if layers:
+            bone_layers += [[i for i, layer in enumerate(pbone.bone.layers) if layer]]
+
+        # Rig type parameters
+        params = {}
+        param_names = get_rig_parameter_names(pbone.rigify_parameters, pbone.rigify_type)
+        for param_name in pbone.rigify_parameters.keys():
+            if param_name not in param_names:
+                continue
+            param = getattr(pbone.rigify_parameters, param_name)
+            if str(type(param)) == "<class 'bpy_prop_array'>":
+                param = list(param)
+            params[param_name] = param
+        parameters += [params]
+
+    data["bones"] = {
+        "names": bones,
+        "parents": parents,
+        "use_connect": use_connect,
+        "head": head,
+        "tail": tail,
+        "roll": roll,
+        "rigify_type": rigify_type,
+        "rotation_mode": rotation_mode,
+        "lock_location": lock_location,
+        "lock_rotation": lock_rotation,
+        "lock_rotation_w": lock_rotation_w,
+        "lock_scale": lock_scale,
+        "parameters": parameters,
+        }
+
+    # Set appropriate layers visible
+    if layers:
+        data["bones"]["layers"] = bone_layers
+        data["layers"] = sorted(set(i for bone in bone_layers for i in bone))
+
+    # One line per array keeps the file compact, but still diffable.
+    lines = ["{"]
+    for key in sorted(data):
+        if key == "bones":
+            lines += ['"bones": {']
+            lines += [",\n".join("  %s: %s" % (json.dumps(k), json.dumps(v, sort_keys=True)) for k, v in sorted(data["bones"].items()))]
+            lines += ['},']
+        else:
+            lines += ["%s: %s," % (json.dumps(key), json.dumps(data[key]))]
+    lines[-1] = lines[-1].rstrip(",")
+    lines += ["}"]
+    return "\n".join(lines) + "\n"
+
+
+def set_bone_arrays(collection, attr, indices, values, size=1):
+    """ Sets a property of some of the items of a bone collection at once.
+        values has the values for the items at the given indices of the
+        collection, one after the other, size values per item.
+    """
+    if not values:
+        return
+    array = [type(values[0])()] * (len(collection) * size)
+    collection.foreach_get(attr, array)
+    for j, i in enumerate(indices):
+        array[i * size:i * size + size] = values[j * size:j * size + size]
+    collection.foreach_set(attr, array)
+
+
+def create_metarig_from_json(obj, text):
+    """ Adds the bones of a metarig written by write_metarig_json() to the
+        armature object.  All bones are created in one edit session, and
+        their positions and settings are set in bulk.
+    """
+    data = json.loads(text)
+    bones = data["bones"]
+    count = len(bones["names"])
+    arm = obj.data
+
+    bpy.ops.object.mode_set(mode='EDIT')
+
+    for layer_name, row in data.get("rigify_layers", []):
+        layer = arm.rigify_layers.add()
+        layer.name = layer_name
+        layer.row = row
+
+    # New edit bones are added at the end of the armature's bones.
+    first = len(arm.edit_bones)
+    edit_bones = [arm.edit_bones.new(name) for name in bones["names"]]
+    for bone, parent in zip(edit_bones, bones["parents"]):
+        if parent >= 0:
+            bone.parent = edit_bones[parent]
+    # The names can change, if the armature already had bones by those names.
+    names = [bone.name for bone in edit_bones]
+
+    indices = range(first, first + count)
+    set_bone_arrays(arm.edit_bones, "head", indices, bones["head"], 3)
+    set_bone_arrays(arm.edit_bones, "tail", indices, bones["tail"], 3)
+    set_bone_arrays(arm.edit_bones, "roll", indices, bones["roll"])
+    set_bone_arrays(arm.edit_bones, "use_connect", indices, bones["use_connect"])
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Pose bones and bones aren't in the same order as the edit bones.
+    pose_index = {pbone.name: i for i, pbone in enumerate(obj.pose.bones)}
+    indices = [pose_index[name] for name in names]
+    set_bone_arrays(obj.pose.bones, "lock_location", indices, bones["lock_location"], 3)
+    set_bone_arrays(obj.pose.bones, "lock_rotation", indices, bones["lock_rotation"], 3)
+    set_bone_arrays(obj.pose.bones, "lock_rotation_w", indices, bones["lock_rotation_w"])
+    set_bone_arrays(obj.pose.bones, "lock_scale", indices, bones["lock_scale"], 3)
+    if "layers" in bones:
+        bone_index = {bone.name: i for i, bone in enumerate(arm.bones)}
+        layers = [i in bone for bone in bones["layers"] for i in range(32)]
+        set_bone_arrays(arm.bones, "layers", [bone_index[name] for name in names], layers, 32)
+
+    # Strings and enums can't be set in bulk, so only the ones that aren't
+    # the default are set one by one.
+    for name, rig_type, rotation_mode, params in zip(names, bones["rigify_type"], bones["rotation_mode"], bones["parameters"]):
+        pbone = obj.pose.bones[name]
+        if rig_type:
+            pbone.rigify_type = rig_type
+        if rotation_mode != pbone.rotation_mode:
+            pbone.rotation_mode = rotation_mode
+        for param_name, value in params.items():
+            try:
+                setattr(pbone.rigify_parameters, param_name, value)
+            except AttributeError:
+                pass
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    select = [False] * len(arm.edit_bones)
+    select[first:] = [True] * count
+    for attr in ("select", "select_head", "select_tail"):
+        arm.edit_bones.foreach_set(attr, select)
+    if count:
+        arm.edit_bones.active = arm.edit_bones[names[-1]]
+
+    # Set appropriate layers visible
+    if "layers" in data:
+        arm.layers = [(x in data["layers"]) for x in range(len(arm.layers))]
+
+
+def write_widget_shapes(shapes):
+    """ Write widget shapes in the format load_widget_shapes() reads.
+        shapes is a dictionary of shapes by name, each a dictionary of the
+        shape's arrays packed with pack_array().
+    """
+    lines = ["{", '"shapes": {']
+    lines += [",\n".join("  %s: %s" % (json.dumps(name), json.dumps(shapes[name], sort_keys=True)) for name in sorted(shapes))]
+    lines += ["},", '"version": %d' % WIDGET_SHAPES_VERSION, "}"]
+    return "\n".join(lines) + "\n"
+
+
+def write_widget(obj, name=None):
+    """ Write a mesh object as a widget shape file with a single shape,
+        named after the object unless a name is given.  The shape can then be
+        added to a widget shape file, and used with get_widget_shape().
     """
-    script = ""
-    script += "def create_thing_widget(rig, bone_name, size=1.0, bone_transform_name=None):\n"
-    script += "    obj = create_widget(rig, bone_name, bone_transform_name)\n"
-    script += "    if obj != None:\n"
+    mesh = obj.data
+    if name is None:
+        name = obj.name
 
-    # Vertices
-    if len(obj.data.vertices) > 0:
-        script += "        verts = ["
-        for v in obj.data.vertices:
-            script += "(" + str(v.co[0]) + "*size, " + str(v.co[1]) + "*size, " + str(v.co[2]) + "*size), "
-        script += "]\n"
+    verts = [0.0] * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", verts)
+    shape = {"verts": pack_array('f', verts)}
 
     # Edges
-    if len(obj.data.edges) > 0:
-        script += "        edges = ["
-        for e in obj.data.edges:
-            script += "(" + str(e.vertices[0]) + ", " + str(e.vertices[1]) + "), "
-        script += "]\n"
-
-    # Faces
-    if len(obj.data.polygons) > 0:
-        script += "        faces = ["
-        for f in obj.data.polygons:
-            script += "("
-            for v in f.vertices:
-                script += str(v) + ", "
-            script += "), "
-        script += "]\n"
-
-    # Build mesh
-    script += "\n        mesh = obj.data\n"
-    script += "        mesh.from_pydata(verts, edges, faces)\n"
-    script += "        mesh.update()\n"
-    script += "        mesh.update()\n"
-    script += "        return obj\n"
-    script += "    else:\n"
-    script += "        return None\n"
-
-    return script
+    if len(mesh.edges) > 0:
+        edges = [0] * (len(mesh.edges) * 2)
+        mesh.edges.foreach_get("vertices", edges)
+        shape["edges"] = pack_array('i', edges)
+
+    # Faces, with their loops in polygon order
+    if len(mesh.polygons) > 0:
+        loops = [0] * len(mesh.loops)
+        mesh.loops.foreach_get("vertex_index", loops)
+        loop_starts = [0] * len(mesh.polygons)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        face_sizes = [0] * len(mesh.polygons)
+        mesh.polygons.foreach_get("loop_total", face_sizes)
+        faces = []
+        for start, size in zip(loop_starts, face_sizes):
+            faces += loops[start:start + size]
+        shape["faces"] = pack_array('i', faces)
+        shape["face_sizes"] = pack_array('i', face_sizes)
+
+    return write_widget_shapes({name: shape})
 
 
 def random_id(length=8):